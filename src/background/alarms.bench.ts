@@ -0,0 +1,134 @@
+/**
+ * LingoRecall AI - Review Alarm Scheduling Benchmark
+ * 对比旧版每小时轮询与 nextDue 精确调度在 30 天模拟使用下的 Service Worker 唤醒次数与 Badge 滞后
+ *
+ * 使用模型：每天 0-2 次阅读，每次 20 分钟内保存 3-8 个词，其中连续 7 天不使用；
+ * 词汇按 REVIEW_INTERVALS 依次到期（假设到期后及时复习）。
+ * Badge 滞后 = 词汇到期到 Badge 计数更新之间的时间。
+ * 另测 nextDue 每次重新设定所需的 byNextReviewAt 首键查询（20k 词库，fake-indexeddb）。
+ *
+ * 运行: npm run bench
+ *
+ * @module background/alarms.bench
+ */
+
+import 'fake-indexeddb/auto';
+import { bench, describe } from 'vitest';
+import { ALARM_PERIOD_MINUTES, NEXT_DUE_GRANULARITY_MS } from './alarms';
+import { getDatabase, getNextDueAt, STORES } from '../shared/storage/db';
+import { DAY_MS, REVIEW_INTERVALS } from '../shared/utils/ebbinghaus';
+
+const HORIZON_DAYS = 30;
+const IDLE_DAYS: [number, number] = [12, 19];
+const LEGACY_POLL_MS = 60 * 60 * 1000;
+const MINUTE_MS = 60 * 1000;
+const WORD_COUNT = 20_000;
+
+/** 确定性伪随机数（LCG），保证每次运行的数据集一致 */
+function createRandom(seed: number) {
+  let state = seed;
+  return (max: number) => {
+    state = (state * 1664525 + 1013904223) % 4294967296;
+    return state % max;
+  };
+}
+
+/**
+ * 生成模拟期内全部到期时间
+ */
+function createDueTimes(): number[] {
+  const random = createRandom(42);
+  const dueTimes: number[] = [];
+
+  for (let day = 0; day < HORIZON_DAYS; day++) {
+    if (day >= IDLE_DAYS[0] && day < IDLE_DAYS[1]) {
+      continue;
+    }
+    const sessions = random(3);
+    for (let s = 0; s < sessions; s++) {
+      const sessionStart = day * DAY_MS + (8 + random(15)) * 60 * MINUTE_MS;
+      const words = 3 + random(6);
+      for (let w = 0; w < words; w++) {
+        let dueAt = sessionStart + random(20) * MINUTE_MS;
+        for (const interval of REVIEW_INTERVALS) {
+          dueAt += interval * DAY_MS;
+          if (dueAt < HORIZON_DAYS * DAY_MS) {
+            dueTimes.push(dueAt);
+          }
+        }
+      }
+    }
+  }
+
+  return dueTimes.sort((a, b) => a - b);
+}
+
+interface ScheduleResult {
+  wakeups: number;
+  meanLagMinutes: number;
+  maxLagMinutes: number;
+}
+
+function summarize(wakeups: number, lags: number[]): ScheduleResult {
+  const total = lags.reduce((sum, lag) => sum + lag, 0);
+  return {
+    wakeups,
+    meanLagMinutes: Math.round((total / Math.max(1, lags.length) / MINUTE_MS) * 10) / 10,
+    maxLagMinutes: Math.round((Math.max(0, ...lags) / MINUTE_MS) * 10) / 10,
+  };
+}
+
+/**
+ * 旧版：固定周期轮询，每次都唤醒 Worker
+ */
+function simulatePolling(dueTimes: number[]): ScheduleResult {
+  const horizon = HORIZON_DAYS * DAY_MS;
+  const lags = dueTimes.map((dueAt) => Math.ceil(dueAt / LEGACY_POLL_MS) * LEGACY_POLL_MS - dueAt);
+  return summarize(Math.floor(horizon / LEGACY_POLL_MS), lags);
+}
+
+/**
+ * 新版：nextDue 在（取整后的）到期时间触发，外加周期兜底
+ */
+function simulateNextDue(dueTimes: number[]): ScheduleResult {
+  const horizon = HORIZON_DAYS * DAY_MS;
+  const fireTimes = dueTimes.map((dueAt) => Math.ceil(dueAt / NEXT_DUE_GRANULARITY_MS) * NEXT_DUE_GRANULARITY_MS);
+  const lags = dueTimes.map((dueAt, i) => fireTimes[i] - dueAt);
+  const safetyNet = Math.floor(horizon / (ALARM_PERIOD_MINUTES * MINUTE_MS));
+  return summarize(new Set(fireTimes).size + safetyNet, lags);
+}
+
+async function seedWords(): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readwrite');
+    const store = tx.objectStore(STORES.words);
+    const now = Date.now();
+    for (let i = 0; i < WORD_COUNT; i++) {
+      store.put({
+        id: `word-${i}`,
+        text: `word${i}`,
+        createdAt: now - i * MINUTE_MS,
+        nextReviewAt: now + (i - WORD_COUNT / 2) * MINUTE_MS,
+        tagIds: [],
+      });
+    }
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+const dueTimes = createDueTimes();
+const polling = simulatePolling(dueTimes);
+const nextDue = simulateNextDue(dueTimes);
+
+console.log(`[LingoRecall bench] ${dueTimes.length} due events over ${HORIZON_DAYS} days`);
+console.table({ 'hourly polling': polling, 'nextDue + safety net': nextDue });
+
+await seedWords();
+
+describe(`re-arm cost (${WORD_COUNT} words)`, () => {
+  bench('getNextDueAt (first byNextReviewAt key after now)', async () => {
+    await getNextDueAt();
+  });
+});
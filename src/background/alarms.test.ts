@@ -9,16 +9,21 @@ import { describe, it, expect, beforeEach, vi, afterEach } from 'vitest';
 import {
   REVIEW_CHECK_ALARM,
   ALARM_PERIOD_MINUTES,
+  NEXT_DUE_ALARM,
+  NEXT_DUE_GRANULARITY_MS,
   setupReviewAlarm,
+  scheduleNextDueAlarm,
   handleReviewAlarm,
   checkAndUpdateBadge,
 } from './alarms';
+import { getNextDueAt } from '../shared/storage/db';
 
 // Mock chrome API
 const mockChrome = {
   alarms: {
     clear: vi.fn().mockResolvedValue(true),
     create: vi.fn(),
+    get: vi.fn().mockResolvedValue(undefined),
     onAlarm: {
       addListener: vi.fn(),
     },
@@ -29,9 +34,12 @@ const mockChrome = {
   },
 };
 
-// Mock countDueWords
+// Mock countDueWords / reconcileReviewStats
 vi.mock('../shared/storage/db', () => ({
   countDueWords: vi.fn().mockResolvedValue(0),
+  reconcileReviewStats: vi.fn().mockResolvedValue(false),
+  getNextDueAt: vi.fn().mockResolvedValue(null),
+  REVIEW_STATS_RECONCILE_INTERVAL: 6 * 60 * 60 * 1000,
 }));
 
 // Apply chrome mock globally
@@ -55,8 +63,8 @@ describe('alarms', () => {
       expect(REVIEW_CHECK_ALARM).toBe('reviewCheck');
     });
 
-    it('should define ALARM_PERIOD_MINUTES as 60', () => {
-      expect(ALARM_PERIOD_MINUTES).toBe(60);
+    it('should define ALARM_PERIOD_MINUTES as 360 (safety net only)', () => {
+      expect(ALARM_PERIOD_MINUTES).toBe(360);
     });
   });
 
@@ -80,17 +88,27 @@ describe('alarms', () => {
       );
     });
 
-    it('should set alarm period to 60 minutes', async () => {
+    it('should set alarm period to 360 minutes', async () => {
       await setupReviewAlarm();
 
       expect(mockChrome.alarms.create).toHaveBeenCalledWith(
         expect.any(String),
         expect.objectContaining({
-          periodInMinutes: 60,
+          periodInMinutes: 360,
         })
       );
     });
 
+    it('should also arm the next-due alarm', async () => {
+      vi.mocked(getNextDueAt).mockResolvedValueOnce(NEXT_DUE_GRANULARITY_MS * 10);
+
+      await setupReviewAlarm();
+
+      expect(mockChrome.alarms.create).toHaveBeenCalledWith(NEXT_DUE_ALARM, {
+        when: NEXT_DUE_GRANULARITY_MS * 10,
+      });
+    });
+
     it('should set initial delay to 1 minute', async () => {
       await setupReviewAlarm();
 
@@ -103,6 +121,41 @@ describe('alarms', () => {
     });
   });
 
+  // ============================================================
+  // scheduleNextDueAlarm Tests
+  // ============================================================
+
+  describe('scheduleNextDueAlarm', () => {
+    it('should clear the alarm when nothing is upcoming', async () => {
+      vi.mocked(getNextDueAt).mockResolvedValueOnce(null);
+
+      expect(await scheduleNextDueAlarm()).toBeNull();
+      expect(mockChrome.alarms.clear).toHaveBeenCalledWith(NEXT_DUE_ALARM);
+      expect(mockChrome.alarms.create).not.toHaveBeenCalled();
+    });
+
+    it('should round the due time up to the granularity', async () => {
+      vi.mocked(getNextDueAt).mockResolvedValueOnce(NEXT_DUE_GRANULARITY_MS * 3 + 1);
+
+      const when = await scheduleNextDueAlarm();
+
+      expect(when).toBe(NEXT_DUE_GRANULARITY_MS * 4);
+      expect(mockChrome.alarms.create).toHaveBeenCalledWith(NEXT_DUE_ALARM, { when });
+    });
+
+    it('should not recreate an alarm already set for the same time', async () => {
+      vi.mocked(getNextDueAt).mockResolvedValueOnce(NEXT_DUE_GRANULARITY_MS * 2);
+      mockChrome.alarms.get.mockResolvedValueOnce({
+        name: NEXT_DUE_ALARM,
+        scheduledTime: NEXT_DUE_GRANULARITY_MS * 2,
+      });
+
+      await scheduleNextDueAlarm();
+
+      expect(mockChrome.alarms.create).not.toHaveBeenCalled();
+    });
+  });
+
   // ============================================================
   // handleReviewAlarm Tests (AC: #2)
   // ============================================================
@@ -123,6 +176,34 @@ describe('alarms', () => {
       expect(countDueWords).toHaveBeenCalled();
     });
 
+    it('should reconcile review stats at most once per interval', async () => {
+      const alarm: chrome.alarms.Alarm = {
+        name: REVIEW_CHECK_ALARM,
+        scheduledTime: Date.now(),
+      };
+
+      const { reconcileReviewStats, REVIEW_STATS_RECONCILE_INTERVAL } = await import('../shared/storage/db');
+
+      await handleReviewAlarm(alarm);
+
+      expect(reconcileReviewStats).toHaveBeenCalledWith(REVIEW_STATS_RECONCILE_INTERVAL);
+    });
+
+    it('should update the badge and re-arm when the next-due alarm fires', async () => {
+      const alarm: chrome.alarms.Alarm = {
+        name: NEXT_DUE_ALARM,
+        scheduledTime: Date.now(),
+      };
+
+      const { countDueWords, reconcileReviewStats } = await import('../shared/storage/db');
+
+      await handleReviewAlarm(alarm);
+
+      expect(countDueWords).toHaveBeenCalled();
+      expect(getNextDueAt).toHaveBeenCalled();
+      expect(reconcileReviewStats).not.toHaveBeenCalled();
+    });
+
     it('should not call checkAndUpdateBadge for other alarms', async () => {
       const alarm: chrome.alarms.Alarm = {
         name: 'otherAlarm',
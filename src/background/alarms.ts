@@ -2,28 +2,42 @@
  * LingoRecall AI - Alarms Module
  * Story 3.1 实现 - chrome.alarms 定时检查
  *
- * 使用 chrome.alarms API 实现定时检查待复习词汇
- * AC#2: 每小时触发一次定时检查
+ * 使用 chrome.alarms API 在词汇到期时更新 Badge
+ * - nextDue: 单次 Alarm，定在 byNextReviewAt 中下一个到期时间；保存 / 复习 / 删除后重新设定
+ * - reviewCheck: 周期兜底，核对复习聚合并补设 nextDue
  *
  * @module background/alarms
  */
 
 import { checkAndUpdateBadge } from './badge';
+import { getNextDueAt, reconcileReviewStats, REVIEW_STATS_RECONCILE_INTERVAL } from '../shared/storage/db';
 
 // ============================================================
 // Constants
 // ============================================================
 
 /**
- * 复习检查 Alarm 名称
+ * 复习检查 Alarm 名称（周期兜底）
  */
 export const REVIEW_CHECK_ALARM = 'reviewCheck';
 
 /**
- * Alarm 触发间隔（分钟）
- * AC#2: 每小时触发一次定时检查
+ * 兜底检查间隔（分钟）
+ * 到期提醒由 nextDue 负责，这里只兜底 Alarm 丢失与聚合漂移，与聚合核对间隔一致
  */
-export const ALARM_PERIOD_MINUTES = 60;
+export const ALARM_PERIOD_MINUTES = 6 * 60;
+
+/**
+ * 下一个到期时间 Alarm 名称
+ */
+export const NEXT_DUE_ALARM = 'nextDue';
+
+/**
+ * nextDue 的时间粒度
+ * 触发时间向上取整到该粒度，同一时段内先后到期的词汇（一次阅读中连续保存的词）共用一次唤醒；
+ * Badge 最多因此滞后这么久
+ */
+export const NEXT_DUE_GRANULARITY_MS = 5 * 60 * 1000;
 
 // ============================================================
 // Alarm Setup
@@ -31,7 +45,7 @@ export const ALARM_PERIOD_MINUTES = 60;
 
 /**
  * 设置复习检查 Alarm
- * AC#2: 每小时触发一次定时检查 (chrome.alarms)
+ * AC#2: 周期兜底检查，并按下一个到期时间设定 nextDue (chrome.alarms)
  *
  * @returns Promise<void>
  */
@@ -39,13 +53,56 @@ export async function setupReviewAlarm(): Promise<void> {
   // 清除旧 Alarm（如果存在）
   await chrome.alarms.clear(REVIEW_CHECK_ALARM);
 
-  // 创建新 Alarm，每 60 分钟触发
+  // 创建兜底 Alarm，每 ALARM_PERIOD_MINUTES 分钟触发
   chrome.alarms.create(REVIEW_CHECK_ALARM, {
     periodInMinutes: ALARM_PERIOD_MINUTES,
     delayInMinutes: 1, // 首次延迟 1 分钟触发
   });
 
   console.log(`[LingoRecall] Review alarm created: ${REVIEW_CHECK_ALARM}, period: ${ALARM_PERIOD_MINUTES} minutes`);
+
+  await scheduleNextDueAlarm();
+}
+
+/**
+ * 按下一个到期时间（重新）设定 nextDue Alarm
+ * 没有未到期词汇时清除；目标时间未变时不重建
+ *
+ * @returns Promise<number | null> 设定的触发时间，已清除时为 null
+ */
+export async function scheduleNextDueAlarm(): Promise<number | null> {
+  const nextDueAt = await getNextDueAt();
+
+  if (nextDueAt === null) {
+    await chrome.alarms.clear(NEXT_DUE_ALARM);
+    console.log('[LingoRecall] No upcoming reviews, next-due alarm cleared');
+    return null;
+  }
+
+  const when = Math.ceil(nextDueAt / NEXT_DUE_GRANULARITY_MS) * NEXT_DUE_GRANULARITY_MS;
+  const existing = await chrome.alarms.get(NEXT_DUE_ALARM);
+  if (existing?.scheduledTime === when) {
+    return when;
+  }
+
+  chrome.alarms.create(NEXT_DUE_ALARM, { when });
+  console.log(`[LingoRecall] Next-due alarm set: ${new Date(when).toISOString()}`);
+  return when;
+}
+
+/**
+ * 复习状态变化后刷新 Badge 并重新设定 nextDue
+ * 供保存、复习、删除等写入后调用
+ *
+ * @returns Promise<void>
+ */
+export async function refreshReviewSchedule(): Promise<void> {
+  await Promise.all([
+    checkAndUpdateBadge(),
+    scheduleNextDueAlarm().catch((error) => {
+      console.error('[LingoRecall] Failed to schedule next-due alarm:', error);
+    }),
+  ]);
 }
 
 // ============================================================
@@ -60,15 +117,33 @@ export async function setupReviewAlarm(): Promise<void> {
  * @returns Promise<void>
  */
 export async function handleReviewAlarm(alarm: chrome.alarms.Alarm): Promise<void> {
+  if (alarm.name === NEXT_DUE_ALARM) {
+    // 相对目标时间的延迟即 Badge 在到期之后的滞后（不含取整粒度）
+    console.log(`[LingoRecall] Next-due alarm fired, lag: ${Date.now() - alarm.scheduledTime}ms`);
+    try {
+      await refreshReviewSchedule();
+    } catch (error) {
+      console.error('[LingoRecall] Failed to refresh review schedule on alarm:', error);
+    }
+    return;
+  }
+
   if (alarm.name !== REVIEW_CHECK_ALARM) {
     return;
   }
 
   console.log(`[LingoRecall] Review alarm triggered: ${alarm.name}`);
 
-  // 避免 Badge 更新异常导致未处理的 Promise 拒绝
+  // 复习聚合按间隔核对一次，修正绕过写入 API 的改动
+  try {
+    await reconcileReviewStats(REVIEW_STATS_RECONCILE_INTERVAL);
+  } catch (error) {
+    console.error('[LingoRecall] Failed to reconcile review stats on alarm:', error);
+  }
+
+  // 避免 Badge 更新异常导致未处理的 Promise 拒绝；同时补设可能丢失的 nextDue
   try {
-    await checkAndUpdateBadge();
+    await refreshReviewSchedule();
   } catch (error) {
     console.error('[LingoRecall] Failed to update badge on alarm:', error);
   }
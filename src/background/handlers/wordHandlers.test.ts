@@ -9,6 +9,7 @@ import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { handleReviewWord } from './wordHandlers';
 import * as storage from '../../shared/storage';
 import * as badge from '../badge';
+import * as alarms from '../alarms';
 import { DAY_MS, REVIEW_INTERVALS } from '../../shared/utils/ebbinghaus';
 import { ErrorCode } from '../../shared/types/errors';
 
@@ -22,6 +23,10 @@ vi.mock('../badge', () => ({
   checkAndUpdateBadge: vi.fn(),
 }));
 
+vi.mock('../alarms', () => ({
+  scheduleNextDueAlarm: vi.fn().mockResolvedValue(null),
+}));
+
 describe('wordHandlers', () => {
   describe('handleReviewWord', () => {
     const mockWord = {
@@ -98,6 +103,22 @@ describe('wordHandlers', () => {
         await vi.runAllTimersAsync();
         expect(badge.checkAndUpdateBadge).toHaveBeenCalled();
       });
+
+      it('should re-arm the next-due alarm', async () => {
+        vi.mocked(storage.getWordById).mockResolvedValue({
+          success: true,
+          data: mockWord,
+        });
+        vi.mocked(storage.updateWord).mockResolvedValue({ success: true });
+        vi.mocked(badge.checkAndUpdateBadge).mockResolvedValue();
+
+        await handleReviewWord({
+          wordId: 'test-word-id',
+          result: 'remembered',
+        });
+
+        expect(alarms.scheduleNextDueAlarm).toHaveBeenCalled();
+      });
     });
 
     describe('when user forgets the word (AC2)', () => {
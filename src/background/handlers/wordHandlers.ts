@@ -11,6 +11,7 @@ import type { Response, ReviewWordPayload, ReviewWordResult, WordRecord } from '
 import { getWordById, updateWord } from '../../shared/storage';
 import { calculateNextReview } from '../../shared/utils/ebbinghaus';
 import { checkAndUpdateBadge } from '../badge';
+import { scheduleNextDueAlarm } from '../alarms';
 import { ErrorCode } from '../../shared/types/errors';
 
 /**
@@ -67,6 +68,10 @@ export async function handleReviewWord(
     checkAndUpdateBadge().catch((error) => {
       console.error('[LingoRecall] Failed to update badge after review:', error);
     });
+    // 复习后该词汇移到新的到期时间，重新设定 nextDue
+    scheduleNextDueAlarm().catch((error) => {
+      console.error('[LingoRecall] Failed to schedule next-due alarm after review:', error);
+    });
 
     // 5. 返回更新后的词汇记录
     const updatedWord: WordRecord = {
@@ -13,20 +13,37 @@
 
 import {
   MessageTypes,
+  PortNames,
   registerHandler,
+  registerStreamHandler,
   initMessageRouter,
   type Response,
+  type AnalyzeWordPartial,
   type SaveWordPayload,
   type GetWordsPayload,
+  type GetWordsResult,
+  type SearchWordsPayload,
+  type SearchWordsResult,
+  type WordDetail,
+  type GetWordDetailPayload,
   type UpdateWordPayload,
   type DeleteWordPayload,
+  type BatchUpdateWordsPayload,
+  type BatchDeleteWordsPayload,
+  type BatchWordsResult,
+  type BatchProgress,
   type WordRecord,
   type JumpToSourcePayload,
   type JumpToSourceResult,
   type ReviewWordPayload,
   type ReviewWordResult,
+  type GetReviewForecastPayload,
+  type ReviewForecast,
   type TranslatePageSegmentPayload,
   type TranslatePageSegmentResult,
+  type TranslatedSegment,
+  type LookupTranslationMemoryPayload,
+  type LookupTranslationMemoryResult,
   type TestLocalConnectionPayload,
   type TestLocalConnectionResult,
   type GetLocalModelsPayload,
@@ -44,16 +61,30 @@ import { handleJumpToSource } from './handlers/navigationHandlers';
 import { handleReviewWord } from './handlers/wordHandlers';
 
 // Story 3.1: Ebbinghaus review scheduling
-import { setupReviewAlarm, handleReviewAlarm, checkAndUpdateBadge } from './alarms';
+// 词汇摘要读穿缓存（随变更推送修补）
+import { getCachedWordList } from './wordCache';
+
+import {
+  setupReviewAlarm,
+  handleReviewAlarm,
+  checkAndUpdateBadge,
+  scheduleNextDueAlarm,
+  refreshReviewSchedule,
+} from './alarms';
 
 import {
   analyzeWordUnified,
   translateBatchUnified,
   buildAIConfig,
+  getModelIdentity,
   type AnalyzeWordRequest,
   type AIAnalysisResult,
+  type AnalysisPartialCallback,
+  type BatchSegmentCallback,
 } from '../services/aiService';
 import { validateApiKey as validateGeminiApiKey } from '../services/geminiService';
+import { warmupCache } from '../services/analysisCache';
+import { lookupTranslationMemory, rememberTranslations } from '../services/translationMemory';
 
 import { ErrorCode } from '../shared/types/errors';
 import { matchesBlacklist } from '../shared/utils/urlMatcher';
@@ -63,16 +94,46 @@ import { STORAGE_KEYS, getSettings, getApiKey } from '../shared/storage/config';
 import {
   getDatabase,
   saveWord,
-  getAllWords,
+  getWordsPage,
+  projectWord,
+  needsWordDetails,
+  getWordDetail,
   updateWord as updateWordService,
   deleteWord as deleteWordService,
   searchWords,
   getDueWords,
   countDueWords,
+  getReviewForecast,
+  reconcileReviewStats,
+  REVIEW_STATS_RECONCILE_INTERVAL,
+  runPendingBackfills,
+  runPendingTagCascades,
+  batchUpdateWords,
+  batchDeleteWords,
 } from '../shared/storage';
 
 console.log('[LingoRecall] Service worker started');
 
+// Worker 每次唤醒都从 IndexedDB 回填分析缓存（异步，不阻塞消息处理）
+warmupCache().catch((error) => {
+  console.warn('[LingoRecall] Analysis cache warmup failed:', error);
+});
+
+// 数据库升级后的数据回填分批执行，Worker 被回收后下次唤醒从断点继续
+runPendingBackfills().catch((error) => {
+  console.warn('[LingoRecall] Schema backfill failed:', error);
+});
+
+// 删除标签后未完成的词汇清理同样从断点继续
+runPendingTagCascades().catch((error) => {
+  console.warn('[LingoRecall] Tag cascade failed:', error);
+});
+
+// 复习聚合不存在时建立，超过核对间隔时用索引计数核对
+reconcileReviewStats(REVIEW_STATS_RECONCILE_INTERVAL).catch((error) => {
+  console.warn('[LingoRecall] Review stats reconcile failed:', error);
+});
+
 // ============================================================
 // Performance Optimization: Config Cache
 // 配置缓存，避免每次请求都读取 storage
@@ -153,13 +214,17 @@ chrome.storage.onChanged.addListener((changes, areaName) => {
 // ============================================================
 
 /**
- * ANALYZE_WORD handler
  * 分析选中的词汇，调用 AI API 获取语境分析结果
  * Story 1.6 实现
  * 支持 Gemini 和 OpenAI 兼容 API
+ *
+ * @param payload - 分析请求
+ * @param onPartial - 可选：流式推送中间结果（由 ANALYZE_WORD_STREAM 端口使用）
  */
-registerHandler(MessageTypes.ANALYZE_WORD, async (message): Promise<Response<AIAnalysisResult>> => {
-  const payload = message.payload as AnalyzeWordRequest;
+async function handleAnalyzeWord(
+  payload: AnalyzeWordRequest,
+  onPartial?: AnalysisPartialCallback
+): Promise<Response<AIAnalysisResult>> {
   const startTime = performance.now();
   console.log('[LingoRecall] ANALYZE_WORD:', payload.text);
 
@@ -195,7 +260,7 @@ registerHandler(MessageTypes.ANALYZE_WORD, async (message): Promise<Response<AIA
     const aiConfig = buildAIConfig(settings, apiKey);
 
     // 调用统一 AI 服务
-    const result = await analyzeWordUnified(payload, aiConfig);
+    const result = await analyzeWordUnified(payload, aiConfig, onPartial);
 
     return {
       success: true,
@@ -267,8 +332,25 @@ registerHandler(MessageTypes.ANALYZE_WORD, async (message): Promise<Response<AIA
       },
     };
   }
+}
+
+/**
+ * ANALYZE_WORD handler
+ * 一次性返回完整分析结果
+ */
+registerHandler(MessageTypes.ANALYZE_WORD, async (message): Promise<Response<AIAnalysisResult>> => {
+  return handleAnalyzeWord(message.payload as AnalyzeWordRequest);
 });
 
+/**
+ * ANALYZE_WORD_STREAM port
+ * 流式分析：meaning 一出现就推送 PARTIAL，完成后发送与 ANALYZE_WORD 相同结构的 DONE
+ */
+registerStreamHandler<typeof MessageTypes.ANALYZE_WORD, AnalyzeWordPartial>(
+  PortNames.ANALYZE_WORD_STREAM,
+  (payload, emit) => handleAnalyzeWord(payload as AnalyzeWordRequest, emit)
+);
+
 /**
  * SAVE_WORD handler
  * 保存词汇到 IndexedDB
@@ -280,6 +362,14 @@ registerHandler(MessageTypes.SAVE_WORD, async (message): Promise<Response<{ id:
 
   try {
     const result = await saveWord(payload);
+
+    // 新词汇可能早于当前 nextDue（例如此前没有任何未到期词汇）
+    if (result.success) {
+      scheduleNextDueAlarm().catch((error) => {
+        console.error('[LingoRecall] Failed to schedule next-due alarm after save:', error);
+      });
+    }
+
     return result;
   } catch (error) {
     console.error('[LingoRecall] SAVE_WORD error:', error);
@@ -297,19 +387,23 @@ registerHandler(MessageTypes.SAVE_WORD, async (message): Promise<Response<{ id:
  * GET_WORDS handler
  * 获取词汇列表
  * Story 2.2 使用 - 返回所有词汇
+ * 支持 keyset 分页（cursor → nextCursor）与字段投影（fields）
  */
-registerHandler(MessageTypes.GET_WORDS, async (message): Promise<Response<WordRecord[]>> => {
+registerHandler(MessageTypes.GET_WORDS, async (message): Promise<Response<GetWordsResult>> => {
   const payload = message.payload as GetWordsPayload;
   console.log('[LingoRecall] GET_WORDS:', payload);
 
   try {
     // 如果有搜索查询，使用 searchWords
     if (payload?.searchQuery) {
-      const result = await searchWords(payload.searchQuery);
+      const result = await searchWords(payload.searchQuery, { details: needsWordDetails(payload.fields) });
       if (result.success && result.data) {
         return {
           success: true,
-          data: result.data.words,
+          data: {
+            words: result.data.words.map((word) => projectWord(word, payload.fields)),
+            nextCursor: null,
+          },
         };
       }
       return {
@@ -318,13 +412,16 @@ registerHandler(MessageTypes.GET_WORDS, async (message): Promise<Response<WordRe
       };
     }
 
-    // 否则获取所有词汇
-    const result = await getAllWords({
+    // 否则按排序索引分页获取
+    return await getWordsPage({
       limit: payload?.limit,
       offset: payload?.offset,
+      sortBy: payload?.sortBy,
+      sortOrder: payload?.sortOrder,
+      cursor: payload?.cursor,
+      fields: payload?.fields,
+      tagIds: payload?.tagIds,
     });
-
-    return result;
   } catch (error) {
     console.error('[LingoRecall] GET_WORDS error:', error);
     return {
@@ -337,6 +434,54 @@ registerHandler(MessageTypes.GET_WORDS, async (message): Promise<Response<WordRe
   }
 });
 
+/**
+ * SEARCH_WORDS handler
+ * 倒排索引检索词汇，匹配列表与词库总数一次返回（搜索框不再额外请求全部词汇计数）
+ * 列表只需要摘要，冷字段由 GET_WORD_DETAIL 按需读取；空关键词（整个词库）直接读 Worker 内缓存
+ */
+registerHandler(MessageTypes.SEARCH_WORDS, async (message): Promise<Response<SearchWordsResult>> => {
+  const payload = message.payload as SearchWordsPayload;
+
+  if (!payload?.query?.trim()) {
+    try {
+      const words = await getCachedWordList(
+        payload?.sortBy === 'text' ? 'text' : 'createdAt',
+        payload?.sortOrder
+      );
+      return {
+        success: true,
+        data: { words, matchCount: words.length, totalCount: words.length },
+      };
+    } catch (error) {
+      console.warn('[LingoRecall] Word cache unavailable, reading from IndexedDB:', error);
+    }
+  }
+
+  return searchWords(payload?.query ?? '', {
+    sortBy: payload?.sortBy,
+    sortOrder: payload?.sortOrder,
+    details: false,
+  });
+});
+
+/**
+ * GET_WORD_DETAIL handler
+ * 读取单个词汇的冷字段（例句、上下文），供详情面板与跳转原文使用
+ */
+registerHandler(MessageTypes.GET_WORD_DETAIL, async (message): Promise<Response<WordDetail>> => {
+  const payload = message.payload as GetWordDetailPayload;
+  if (!payload?.id) {
+    return {
+      success: false,
+      error: {
+        code: ErrorCode.INVALID_INPUT,
+        message: '缺少词汇 ID',
+      },
+    };
+  }
+  return getWordDetail(payload.id);
+});
+
 /**
  * GET_DUE_WORDS handler
  * 获取待复习词汇
@@ -389,6 +534,31 @@ registerHandler(MessageTypes.GET_DUE_COUNT, async (): Promise<Response<number>>
   }
 });
 
+/**
+ * GET_REVIEW_FORECAST handler
+ * 已到期数量与未来逐日到期数量，直接读取复习聚合
+ */
+registerHandler(MessageTypes.GET_REVIEW_FORECAST, async (message): Promise<Response<ReviewForecast>> => {
+  const payload = message.payload as GetReviewForecastPayload | undefined;
+
+  try {
+    const forecast = await getReviewForecast(payload?.days);
+    return {
+      success: true,
+      data: forecast,
+    };
+  } catch (error) {
+    console.error('[LingoRecall] GET_REVIEW_FORECAST error:', error);
+    return {
+      success: false,
+      error: {
+        code: ErrorCode.STORAGE_ERROR,
+        message: error instanceof Error ? error.message : '获取复习预测失败',
+      },
+    };
+  }
+});
+
 /**
  * UPDATE_WORD handler
  * 更新词汇记录
@@ -402,10 +572,10 @@ registerHandler(MessageTypes.UPDATE_WORD, async (message): Promise<Response<void
   try {
     const result = await updateWordService(payload.id, payload.updates);
 
-    // Story 3.2 - AC#4: 复习完成后实时更新 Badge
-    // 异步更新 Badge，不阻塞响应返回
+    // Story 3.2 - AC#4: 复习完成后实时更新 Badge，并重新设定 nextDue
+    // 异步执行，不阻塞响应返回
     if (result.success && payload.updates.nextReviewAt !== undefined) {
-      checkAndUpdateBadge().catch((error) => {
+      refreshReviewSchedule().catch((error) => {
         console.error('[LingoRecall] Failed to update badge after word update:', error);
       });
     }
@@ -434,6 +604,14 @@ registerHandler(MessageTypes.DELETE_WORD, async (message): Promise<Response<void
 
   try {
     const result = await deleteWordService(payload.id);
+
+    // 删除的可能是已到期词汇或当前 nextDue 对应的词汇
+    if (result.success) {
+      refreshReviewSchedule().catch((error) => {
+        console.error('[LingoRecall] Failed to update badge after word delete:', error);
+      });
+    }
+
     return result;
   } catch (error) {
     console.error('[LingoRecall] DELETE_WORD error:', error);
@@ -447,6 +625,81 @@ registerHandler(MessageTypes.DELETE_WORD, async (message): Promise<Response<void
   }
 });
 
+/**
+ * 批量更新词汇（BATCH_UPDATE_WORDS 与其流式端口共用）
+ */
+async function handleBatchUpdateWords(
+  payload: BatchUpdateWordsPayload,
+  onProgress?: (progress: BatchProgress) => void
+): Promise<Response<BatchWordsResult>> {
+  console.log('[LingoRecall] BATCH_UPDATE_WORDS:', payload.ids.length, 'words');
+
+  const result = await batchUpdateWords(
+    payload.ids,
+    { updates: payload.updates, addTagIds: payload.addTagIds, removeTagIds: payload.removeTagIds },
+    onProgress
+  );
+
+  if (result.success && payload.updates?.nextReviewAt !== undefined) {
+    refreshReviewSchedule().catch((error) => {
+      console.error('[LingoRecall] Failed to update badge after batch update:', error);
+    });
+  }
+
+  return result;
+}
+
+/**
+ * 批量删除词汇（BATCH_DELETE_WORDS 与其流式端口共用）
+ */
+async function handleBatchDeleteWords(
+  payload: BatchDeleteWordsPayload,
+  onProgress?: (progress: BatchProgress) => void
+): Promise<Response<BatchWordsResult>> {
+  console.log('[LingoRecall] BATCH_DELETE_WORDS:', payload.ids.length, 'words');
+
+  const result = await batchDeleteWords(payload.ids, onProgress);
+
+  // 删除的词汇可能包含待复习词汇
+  if (result.success) {
+    refreshReviewSchedule().catch((error) => {
+      console.error('[LingoRecall] Failed to update badge after batch delete:', error);
+    });
+  }
+
+  return result;
+}
+
+/**
+ * BATCH_UPDATE_WORDS handler
+ * 批量更新词汇（批量添加/移除标签等），每个分块一个事务
+ */
+registerHandler(MessageTypes.BATCH_UPDATE_WORDS, async (message): Promise<Response<BatchWordsResult>> => {
+  return handleBatchUpdateWords(message.payload as BatchUpdateWordsPayload);
+});
+
+/**
+ * BATCH_DELETE_WORDS handler
+ * 批量删除词汇，每个分块一个事务
+ */
+registerHandler(MessageTypes.BATCH_DELETE_WORDS, async (message): Promise<Response<BatchWordsResult>> => {
+  return handleBatchDeleteWords(message.payload as BatchDeleteWordsPayload);
+});
+
+/**
+ * BATCH_UPDATE_WORDS_STREAM / BATCH_DELETE_WORDS_STREAM ports
+ * 每个分块事务提交后推送 PARTIAL 进度，完成后发送与非流式消息相同结构的 DONE
+ */
+registerStreamHandler<typeof MessageTypes.BATCH_UPDATE_WORDS, BatchProgress>(
+  PortNames.BATCH_UPDATE_WORDS_STREAM,
+  (payload, emit) => handleBatchUpdateWords(payload as BatchUpdateWordsPayload, emit)
+);
+
+registerStreamHandler<typeof MessageTypes.BATCH_DELETE_WORDS, BatchProgress>(
+  PortNames.BATCH_DELETE_WORDS_STREAM,
+  (payload, emit) => handleBatchDeleteWords(payload as BatchDeleteWordsPayload, emit)
+);
+
 /**
  * JUMP_TO_SOURCE handler
  * 跳转到词汇原文页面
@@ -470,12 +723,16 @@ registerHandler(MessageTypes.REVIEW_WORD, async (message): Promise<Response<Revi
 });
 
 /**
- * TRANSLATE_PAGE_SEGMENT handler
  * 批量翻译页面文本段落
  * 用于全页翻译功能
+ *
+ * @param payload - 批量翻译请求
+ * @param onSegment - 可选：逐条推送已生成的译文（由 TRANSLATE_PAGE_SEGMENT_STREAM 端口使用）
  */
-registerHandler(MessageTypes.TRANSLATE_PAGE_SEGMENT, async (message): Promise<Response<TranslatePageSegmentResult>> => {
-  const payload = message.payload as TranslatePageSegmentPayload;
+async function handleTranslatePageSegment(
+  payload: TranslatePageSegmentPayload,
+  onSegment?: BatchSegmentCallback
+): Promise<Response<TranslatePageSegmentResult>> {
   console.log('[LingoRecall] TRANSLATE_PAGE_SEGMENT:', payload.texts.length, 'texts');
 
   try {
@@ -521,10 +778,19 @@ registerHandler(MessageTypes.TRANSLATE_PAGE_SEGMENT, async (message): Promise<Re
     console.log('[LingoRecall] TRANSLATE_PAGE_SEGMENT: Starting translation to', targetLanguage, 'with', payload.texts.length, 'texts');
 
     // 调用批量翻译服务
-    const translations = await translateBatchUnified(payload.texts, targetLanguage, aiConfig);
+    const translations = await translateBatchUnified(
+      payload.texts,
+      targetLanguage,
+      aiConfig,
+      onSegment,
+      payload.priority === 'background' ? 'background' : 'visible'
+    );
 
     console.log('[LingoRecall] TRANSLATE_PAGE_SEGMENT: Translation completed, got', translations.length, 'results');
 
+    // 写入翻译记忆（不阻塞响应）
+    void rememberTranslations(payload.texts, translations, targetLanguage, getModelIdentity(aiConfig));
+
     return {
       success: true,
       data: { translations },
@@ -565,6 +831,58 @@ registerHandler(MessageTypes.TRANSLATE_PAGE_SEGMENT, async (message): Promise<Re
       },
     };
   }
+}
+
+/**
+ * TRANSLATE_PAGE_SEGMENT handler
+ * 一次性返回整批译文
+ */
+registerHandler(MessageTypes.TRANSLATE_PAGE_SEGMENT, async (message): Promise<Response<TranslatePageSegmentResult>> => {
+  return handleTranslatePageSegment(message.payload as TranslatePageSegmentPayload);
+});
+
+/**
+ * TRANSLATE_PAGE_SEGMENT_STREAM port
+ * 流式批量翻译：每条译文生成完毕即推送 PARTIAL，完成后发送与 TRANSLATE_PAGE_SEGMENT 相同结构的 DONE
+ */
+registerStreamHandler<typeof MessageTypes.TRANSLATE_PAGE_SEGMENT, TranslatedSegment>(
+  PortNames.TRANSLATE_PAGE_SEGMENT_STREAM,
+  (payload, emit) => handleTranslatePageSegment(
+    payload as TranslatePageSegmentPayload,
+    (index, translation) => emit({ index, translation })
+  )
+);
+
+/**
+ * LOOKUP_TRANSLATION_MEMORY handler
+ * 全页翻译分批前批量查询翻译记忆，只把未命中的片段交给 TRANSLATE_PAGE_SEGMENT
+ */
+registerHandler(MessageTypes.LOOKUP_TRANSLATION_MEMORY, async (message): Promise<Response<LookupTranslationMemoryResult>> => {
+  const payload = message.payload as LookupTranslationMemoryPayload;
+
+  try {
+    const { settings, apiKey } = await getCachedConfig();
+    const aiConfig = buildAIConfig(settings, apiKey);
+    const targetLanguage = payload.targetLanguage || settings.targetLanguage || 'zh-CN';
+
+    const translations = await lookupTranslationMemory(payload.texts, targetLanguage, getModelIdentity(aiConfig));
+    const hitCount = translations.filter((translation) => translation !== null).length;
+    console.log(`[LingoRecall] LOOKUP_TRANSLATION_MEMORY: ${hitCount}/${payload.texts.length} hits`);
+
+    return {
+      success: true,
+      data: { translations },
+    };
+  } catch (error) {
+    console.error('[LingoRecall] LOOKUP_TRANSLATION_MEMORY error:', error);
+    return {
+      success: false,
+      error: {
+        code: ErrorCode.STORAGE_ERROR,
+        message: error instanceof Error ? error.message : '查询翻译记忆失败',
+      },
+    };
+  }
 });
 
 // ============================================================
@@ -1126,9 +1444,9 @@ chrome.runtime.onInstalled.addListener(async (details) => {
 chrome.runtime.onStartup.addListener(async () => {
   console.log('[LingoRecall] Extension started (browser opened)');
 
-  // Story 3.1 - AC2: 检查待复习词汇并更新 Badge
+  // Story 3.1 - AC2: 检查待复习词汇并更新 Badge；浏览器重启后补设 nextDue
   try {
-    await checkAndUpdateBadge();
+    await refreshReviewSchedule();
     console.log('[LingoRecall] Badge updated on startup');
   } catch (error) {
     console.error('[LingoRecall] Failed to update badge on startup:', error);
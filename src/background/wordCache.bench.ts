@@ -0,0 +1,98 @@
+/**
+ * LingoRecall AI - Mutation-to-UI Latency Benchmark
+ * 修改一个词汇后词库列表反映修改所需的时间（5k 词库，fake-indexeddb）：
+ * - 旧版：写入后重新发送 SEARCH_WORDS，从 IndexedDB 读出全部摘要并跨消息边界复制整个列表
+ * - 缓存：写入后重新读取，但列表来自 Service Worker 内缓存（仍复制整个列表）
+ * - 变更推送：写入提交后收到一条增量，只复制该词汇并就地修补本地列表
+ *
+ * 跨消息边界的复制用 structuredClone 模拟。
+ *
+ * 运行: npm run bench
+ *
+ * @module background/wordCache.bench
+ */
+
+import 'fake-indexeddb/auto';
+import { bench, describe } from 'vitest';
+import { getCachedWordList } from './wordCache';
+import { getDatabase, STORES, toWordSummary, toWordDetail } from '../shared/storage/db';
+import { searchWords, updateWord } from '../shared/storage/wordService';
+import { subscribeChanges, patchWordList } from '../shared/storage/changeFeed';
+import type { WordRecord, WordSummary } from '../shared/messaging';
+
+const WORD_COUNT = 5_000;
+const TARGET_ID = 'word-002500';
+
+async function seedWords(): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction([STORES.words, STORES.wordDetails], 'readwrite');
+    const store = tx.objectStore(STORES.words);
+    const detailStore = tx.objectStore(STORES.wordDetails);
+    for (let i = 0; i < WORD_COUNT; i++) {
+      const word: WordRecord = {
+        id: `word-${String(i).padStart(6, '0')}`,
+        text: `word${i}`,
+        meaning: `第 ${i} 个词的释义，包含若干中文说明`,
+        pronunciation: '/wɜːd/',
+        partOfSpeech: 'noun',
+        exampleSentence: `This sentence uses word${i} in context.`,
+        sourceUrl: `https://example.com/articles/${i % 500}`,
+        sourceTitle: 'An Example Article Title',
+        xpath: `/html/body/main/article/p[${i % 40}]`,
+        textOffset: i % 300,
+        contextBefore: 'This sentence uses ',
+        contextAfter: ' in context.',
+        createdAt: 1_700_000_000_000 + i * 1000,
+        nextReviewAt: 1_700_000_000_000 + i * 500,
+        reviewCount: i % 7,
+        easeFactor: 2.5,
+        interval: 1,
+        tagIds: i % 3 === 0 ? ['tag-a'] : [],
+      };
+      store.put(toWordSummary(word));
+      detailStore.put(toWordDetail(word));
+    }
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+await seedWords();
+
+/** 页面持有的列表 */
+let uiList: WordSummary[] = structuredClone(await getCachedWordList());
+let patching = false;
+let revision = 0;
+
+subscribeChanges((changes) => {
+  if (patching) {
+    // 增量跨上下文到达页面时同样经过一次复制
+    uiList = patchWordList(uiList, structuredClone(changes), { project: (word) => word });
+  }
+});
+
+function nextMeaning(): string {
+  revision++;
+  return `释义修订 ${revision}`;
+}
+
+describe(`mutation-to-UI latency (${WORD_COUNT} words)`, () => {
+  bench('legacy: update + SEARCH_WORDS reload from IndexedDB', async () => {
+    patching = false;
+    await updateWord(TARGET_ID, { meaning: nextMeaning() });
+    const result = await searchWords('', { details: false });
+    uiList = structuredClone(result.data!.words);
+  });
+
+  bench('cached: update + reload from worker cache', async () => {
+    patching = false;
+    await updateWord(TARGET_ID, { meaning: nextMeaning() });
+    uiList = structuredClone(await getCachedWordList());
+  });
+
+  bench('change feed: update + patch from delta', async () => {
+    patching = true;
+    await updateWord(TARGET_ID, { meaning: nextMeaning() });
+  });
+});
@@ -0,0 +1,124 @@
+/**
+ * LingoRecall AI - Word Cache Tests
+ * Service Worker 词汇摘要缓存：首次读取加载、之后按变更推送修补
+ *
+ * @module background/wordCache.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import 'fake-indexeddb/auto';
+import { getCachedWordList, clearWordCache } from './wordCache';
+import { getDatabase, deleteDatabase, closeDatabase, STORES } from '../shared/storage/db';
+import { saveWord, updateWord, deleteWord } from '../shared/storage/wordService';
+import { createTag, deleteTag } from '../shared/storage/tagStore';
+import type { SaveWordPayload } from '../shared/messaging';
+
+const PAYLOAD: SaveWordPayload = {
+  text: 'context',
+  meaning: '语境',
+  pronunciation: '',
+  partOfSpeech: 'noun',
+  exampleSentence: 'The context matters.',
+  sourceUrl: 'https://example.com',
+  sourceTitle: 'Example',
+  xpath: '/html/body/p[1]',
+  textOffset: 0,
+  contextBefore: 'The ',
+  contextAfter: ' matters.',
+};
+
+let clock = 1_700_000_000_000;
+
+/** 保存词汇，createdAt 依次递增 */
+async function saveText(text: string): Promise<string> {
+  clock += 1000;
+  const spy = vi.spyOn(Date, 'now').mockReturnValue(clock);
+  try {
+    const result = await saveWord({ ...PAYLOAD, text, xpath: `/html/body/p[@id="${text}"]` });
+    return result.data!.id;
+  } finally {
+    spy.mockRestore();
+  }
+}
+
+/** 绕过存储层直接删除（不发布变更） */
+async function deleteSilently(id: string): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readwrite');
+    tx.objectStore(STORES.words).delete(id);
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+describe('wordCache', () => {
+  beforeEach(async () => {
+    clearWordCache();
+    await deleteDatabase();
+  });
+
+  afterEach(() => {
+    clearWordCache();
+    closeDatabase();
+  });
+
+  it('首次读取后从内存返回（不再读取 IndexedDB）', async () => {
+    const id = await saveText('alpha');
+
+    expect((await getCachedWordList()).map((word) => word.id)).toEqual([id]);
+
+    await deleteSilently(id);
+    expect((await getCachedWordList()).map((word) => word.id)).toEqual([id]);
+  });
+
+  it('只缓存摘要', async () => {
+    await saveText('alpha');
+
+    const [word] = await getCachedWordList();
+    expect(word).not.toHaveProperty('exampleSentence');
+  });
+
+  it('按变更推送修补：新增、修改、删除', async () => {
+    const alpha = await saveText('alpha');
+    await getCachedWordList();
+
+    const beta = await saveText('beta');
+    await updateWord(alpha, { meaning: '阿尔法' });
+
+    let words = await getCachedWordList();
+    expect(words.map((word) => word.id)).toEqual([beta, alpha]);
+    expect(words[1].meaning).toBe('阿尔法');
+
+    await deleteWord(beta);
+    words = await getCachedWordList();
+    expect(words.map((word) => word.id)).toEqual([alpha]);
+  });
+
+  it('删除标签时从缓存词汇中移除该标签', async () => {
+    const tag = await createTag({ name: '学术', color: '#3B82F6' });
+    const id = await saveText('alpha');
+    await updateWord(id, { tagIds: [tag.data!.id] });
+    await getCachedWordList();
+
+    await deleteTag(tag.data!.id);
+
+    const [word] = await getCachedWordList();
+    expect(word.tagIds).toEqual([]);
+  });
+
+  it('支持按文本与升序排序', async () => {
+    await saveText('beta');
+    await saveText('alpha');
+
+    expect((await getCachedWordList('text', 'asc')).map((word) => word.text)).toEqual(['alpha', 'beta']);
+    expect((await getCachedWordList('createdAt', 'asc')).map((word) => word.text)).toEqual(['beta', 'alpha']);
+  });
+
+  it('并发读取共用一次加载', async () => {
+    await saveText('alpha');
+
+    const [first, second] = await Promise.all([getCachedWordList(), getCachedWordList()]);
+    expect(first).toBe(second);
+  });
+});
@@ -0,0 +1,162 @@
+/**
+ * LingoRecall AI - Service Worker Word Cache
+ * Service Worker 内的词汇摘要读穿缓存
+ *
+ * 词库列表（SEARCH_WORDS 空关键词）首次读取时从 IndexedDB 加载全部摘要，之后直接从内存返回；
+ * 缓存按变更推送逐条修补，包括其他上下文发布的变更（如 Popup 内删除标签）。
+ * Worker 被回收后缓存随之清空，下次读取重新加载。
+ *
+ * @module background/wordCache
+ */
+
+import type { WordSummary } from '../shared/messaging';
+import { getWordsPage, subscribeChanges, toWordSummary, type StorageChange } from '../shared/storage';
+
+// ============================================================
+// State
+// ============================================================
+
+/** 全部词汇摘要，未加载时为 null */
+let words: Map<string, WordSummary> | null = null;
+
+let loadPromise: Promise<Map<string, WordSummary>> | null = null;
+
+/** 加载期间收到的变更，加载完成后补上 */
+let pendingChanges: StorageChange[] = [];
+
+/** 已排序的列表（按 `${sortBy}:${sortOrder}`），任何变更后清空 */
+const sortedLists = new Map<string, WordSummary[]>();
+
+let unsubscribe: (() => void) | null = null;
+
+/** 清空缓存时递增，丢弃清空前发起的加载 */
+let generation = 0;
+
+// ============================================================
+// Change Handling
+// ============================================================
+
+function applyChanges(changes: StorageChange[]): void {
+  if (!words) {
+    if (loadPromise) {
+      pendingChanges.push(...changes);
+    }
+    return;
+  }
+
+  for (const change of changes) {
+    switch (change.type) {
+      case 'word:add':
+      case 'word:update':
+        words.set(change.word.id, change.word);
+        break;
+      case 'word:delete':
+        words.delete(change.id);
+        break;
+      case 'tag:delete':
+        for (const word of words.values()) {
+          if (word.tagIds?.includes(change.id)) {
+            words.set(word.id, { ...word, tagIds: word.tagIds.filter((tagId) => tagId !== change.id) });
+          }
+        }
+        break;
+      default:
+        break;
+    }
+  }
+  sortedLists.clear();
+}
+
+/**
+ * 加载全部摘要（并发调用共用一次加载）
+ */
+function loadWords(): Promise<Map<string, WordSummary>> {
+  if (words) {
+    return Promise.resolve(words);
+  }
+
+  if (!unsubscribe) {
+    unsubscribe = subscribeChanges(applyChanges);
+  }
+
+  if (!loadPromise) {
+    const loadGeneration = generation;
+    pendingChanges = [];
+    loadPromise = getWordsPage({ details: false })
+      .then((result) => {
+        if (!result.success || !result.data) {
+          throw new Error(result.error?.message || '加载词汇失败');
+        }
+
+        // 冷字段回填完成前的旧记录仍内联冷字段，缓存中只保留摘要
+        const loaded = new Map<string, WordSummary>();
+        for (const word of result.data.words as WordSummary[]) {
+          loaded.set(word.id, toWordSummary(word));
+        }
+        if (loadGeneration !== generation) {
+          return loaded;
+        }
+        words = loaded;
+
+        const queued = pendingChanges;
+        pendingChanges = [];
+        applyChanges(queued);
+        console.log(`[LingoRecall] Word cache loaded: ${loaded.size} words`);
+        return loaded;
+      })
+      .finally(() => {
+        if (loadGeneration === generation) {
+          loadPromise = null;
+        }
+      });
+  }
+  return loadPromise;
+}
+
+// ============================================================
+// Public API
+// ============================================================
+
+/**
+ * 获取全部词汇摘要（已排序）
+ * 返回的数组为缓存本身，调用方不得修改
+ *
+ * @param sortBy 排序字段，与 searchWords 空关键词一致
+ * @param sortOrder 排序方向
+ * @returns Promise<WordSummary[]>
+ */
+export async function getCachedWordList(
+  sortBy: 'createdAt' | 'text' = 'createdAt',
+  sortOrder: 'asc' | 'desc' = 'desc'
+): Promise<WordSummary[]> {
+  const all = await loadWords();
+  const key = `${sortBy}:${sortOrder}`;
+
+  let list = sortedLists.get(key);
+  if (!list) {
+    const direction = sortOrder === 'asc' ? 1 : -1;
+    list = [...all.values()].sort((a, b) => {
+      // createdAt 相同时按 ID 排列，与 byCreatedAt 索引的遍历顺序一致
+      const order =
+        sortBy === 'text'
+          ? a.text.localeCompare(b.text)
+          : a.createdAt - b.createdAt || (a.id < b.id ? -1 : a.id > b.id ? 1 : 0);
+      return order * direction;
+    });
+    sortedLists.set(key, list);
+  }
+  return list;
+}
+
+/**
+ * 清空缓存并取消订阅（数据库被删除或测试之间）
+ */
+export function clearWordCache(): void {
+  generation++;
+  unsubscribe?.();
+  unsubscribe = null;
+  words = null;
+  loadPromise = null;
+  pendingChanges = [];
+  sortedLists.clear();
+}
@@ -50,6 +50,8 @@ interface AnalysisPopupProps {
   onClose: () => void;
   /** 是否为翻译模式（可选，可从 result.mode 推断） */
   isTranslateMode?: boolean;
+  /** 流式输出中：已显示部分字段，其余字段仍在生成 */
+  isStreaming?: boolean;
 }
 
 /** 弹窗宽度 - 单词模式 */
@@ -150,6 +152,17 @@ const styles: Record<string, CSSProperties> = {
     fontSize: tokens.fontSize.sm,
     color: tokens.colors.textSecondary,
   },
+  streamingSpinner: {
+    width: '14px',
+    height: '14px',
+    marginTop: '5px',
+    marginRight: tokens.spacing.sm,
+    border: `2px solid ${tokens.colors.border}`,
+    borderTopColor: tokens.colors.primary,
+    borderRadius: '50%',
+    animation: 'lingorecall-spin 0.8s linear infinite',
+    flexShrink: 0,
+  },
   closeButton: {
     width: '24px',
     height: '24px',
@@ -311,6 +324,7 @@ export function AnalysisPopup({
   onSave,
   onClose,
   isTranslateMode: isTranslateModeProp,
+  isStreaming = false,
 }: AnalysisPopupProps) {
   const { t } = useTranslation();
   const [opacity, setOpacity] = useState(0);
@@ -341,7 +355,7 @@ export function AnalysisPopup({
    * 处理保存，防止重复点击
    */
   const handleSave = async () => {
-    if (isSaving) return;
+    if (isSaving || isStreaming) return;
     setIsSaving(true);
     try {
       await onSave();
@@ -374,6 +388,7 @@ export function AnalysisPopup({
               <div style={styles.pronunciation}>{result.pronunciation}</div>
             )}
           </div>
+          {isStreaming && <div style={styles.streamingSpinner} />}
           <button
             style={{
               ...styles.closeButton,
@@ -421,13 +436,13 @@ export function AnalysisPopup({
                   : isHoveringSave
                     ? tokens.colors.successHover
                     : tokens.colors.success,
-                opacity: isSaving ? 0.7 : 1,
-                cursor: isSaving ? 'not-allowed' : 'pointer',
+                opacity: isSaving || isStreaming ? 0.7 : 1,
+                cursor: isSaving || isStreaming ? 'not-allowed' : 'pointer',
               }}
               onClick={handleSave}
-              onMouseEnter={() => !isSaving && setIsHoveringSave(true)}
+              onMouseEnter={() => !isSaving && !isStreaming && setIsHoveringSave(true)}
               onMouseLeave={() => setIsHoveringSave(false)}
-              disabled={isSaving}
+              disabled={isSaving || isStreaming}
               title={isSaving ? t('common.saving') : t('analysis.saveWord')}
             >
               {isSaving ? (
@@ -61,6 +61,10 @@ export interface PageTranslationState {
   progress: number;
   /** 总数 */
   total: number;
+  /** 视口附近已完成的单元数（渐进翻译） */
+  visibleProgress?: number;
+  /** 视口附近需要翻译的单元数（渐进翻译） */
+  visibleTotal?: number;
   /** 是否显示翻译内容 */
   showingTranslation: boolean;
 }
@@ -216,6 +220,8 @@ export function ShadowApp({ state, callbacks = {} }: ShadowAppProps): React.Reac
       state={pageTranslation.state}
       progress={pageTranslation.progress}
       total={pageTranslation.total}
+      visibleProgress={pageTranslation.visibleProgress}
+      visibleTotal={pageTranslation.visibleTotal}
       showingTranslation={pageTranslation.showingTranslation}
       onToggle={handleToggleTranslation}
       onRestore={handleRestoreOriginal}
@@ -278,6 +284,7 @@ export function ShadowApp({ state, callbacks = {} }: ShadowAppProps): React.Reac
   }
 
   // Analysis result available - show popup (Story 1.6)
+  // 流式输出时 isAnalyzing 仍为 true，弹窗先显示已到达的字段
   if (analysisResult) {
     return (
       <>
@@ -288,6 +295,7 @@ export function ShadowApp({ state, callbacks = {} }: ShadowAppProps): React.Reac
           selectedText={selectedText}
           onSave={handleSave}
           onClose={handleClose}
+          isStreaming={isAnalyzing}
         />
         {toastElement}
       </>
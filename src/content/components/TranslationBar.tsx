@@ -23,6 +23,10 @@ export interface TranslationBarProps {
   progress: number;
   /** 总数 */
   total: number;
+  /** 视口附近已完成的单元数（渐进翻译） */
+  visibleProgress?: number;
+  /** 视口附近需要翻译的单元数（渐进翻译） */
+  visibleTotal?: number;
   /** 是否显示翻译内容 */
   showingTranslation: boolean;
   /** 切换原文/译文回调 */
@@ -41,6 +45,8 @@ export const TranslationBar: React.FC<TranslationBarProps> = ({
   state,
   progress,
   total,
+  visibleProgress = 0,
+  visibleTotal = 0,
   showingTranslation,
   onToggle,
   onRestore,
@@ -53,7 +59,10 @@ export const TranslationBar: React.FC<TranslationBarProps> = ({
   // 计算进度百分比
   const percentage = total > 0 ? Math.round((progress / total) * 100) : 0;
   const isFullyTranslated = state === 'translated' && (total === 0 || progress >= total);
-  const isPartiallyTranslated = state === 'translated' && total > 0 && progress < total;
+  // 渐进翻译：视口区域已完成（状态已是 translated），其余内容仍在后台补翻
+  const isBackgroundTranslating = state === 'translated' && visibleTotal > 0 && total > 0 && progress < total;
+  const isPartiallyTranslated = state === 'translated' && !isBackgroundTranslating && total > 0 && progress < total;
+  const isVisibleCompleted = state === 'translating' && visibleTotal > 0 && visibleProgress >= visibleTotal;
 
   // 翻译完成后自动最小化
   useEffect(() => {
@@ -98,7 +107,9 @@ export const TranslationBar: React.FC<TranslationBarProps> = ({
                 {total === 0
                   ? t('pageTranslation.analyzing', 'Analyzing page...')
                   : percentage < 100
-                    ? `${t('pageTranslation.translating', 'Translating')} ${progress}/${total} (${percentage}%)`
+                    ? isVisibleCompleted
+                      ? `${t('pageTranslation.visibleCompleted', 'Visible area translated')} · ${progress}/${total} (${percentage}%)`
+                      : `${t('pageTranslation.translating', 'Translating')} ${progress}/${total} (${percentage}%)`
                     : t('pageTranslation.applying', 'Applying translations...')
                 }
               </span>
@@ -106,9 +117,11 @@ export const TranslationBar: React.FC<TranslationBarProps> = ({
           )}
           {state === 'translated' && (
             <span style={styles.statusText}>
-              {isPartiallyTranslated
-                ? `${t('pageTranslation.partialCompleted', 'Partially translated')} (${progress}/{total})`
-                : `${t('pageTranslation.completed', 'Translation complete')} (${progress}/${total})`}
+              {isBackgroundTranslating
+                ? `${t('pageTranslation.visibleCompleted', 'Visible area translated')} · ${progress}/${total} (${percentage}%)`
+                : isPartiallyTranslated
+                  ? `${t('pageTranslation.partialCompleted', 'Partially translated')} (${progress}/{total})`
+                  : `${t('pageTranslation.completed', 'Translation complete')} (${progress}/${total})`}
             </span>
           )}
           {state === 'error' && (
@@ -118,8 +131,8 @@ export const TranslationBar: React.FC<TranslationBarProps> = ({
           )}
         </div>
 
-        {/* 进度条 */}
-        {state === 'translating' && (
+        {/* 进度条（含后台补翻） */}
+        {(state === 'translating' || isBackgroundTranslating) && (
           <div style={styles.progressBar}>
             <div
               style={{
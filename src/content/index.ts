@@ -12,12 +12,15 @@
 
 import {
   MessageTypes,
+  PortNames,
   registerHandler,
   initContentMessageListener,
   sendMessage,
+  sendMessageWithStream,
   type HighlightTextPayload,
   type HighlightWordPayload,
   type AnalyzeWordResult,
+  type AnalyzeWordPartial,
   type SettingsChangedPayload,
   type AnalysisMode,
 } from '../shared/messaging';
@@ -33,6 +36,7 @@ import {
   hideUI,
   showLoading,
   showResult,
+  showPartialResult,
   showError,
   showToast,
   dismissToast,
@@ -273,7 +277,12 @@ let currentSettings: Settings = { ...DEFAULT_SETTINGS, blacklistUrls: [...DEFAUL
 /**
  * 记录最近一次整页翻译的进度，避免切换原文/译文时把顶部状态条重置成 0/0。
  */
-let lastPageTranslationProgress: { progress: number; total: number } = {
+let lastPageTranslationProgress: {
+  progress: number;
+  total: number;
+  visibleProgress?: number;
+  visibleTotal?: number;
+} = {
   progress: 0,
   total: 0,
 };
@@ -730,15 +739,40 @@ async function handleAnalyze(): Promise<void> {
     ? `${sourceLocation.contextBefore}${currentSelection.text}${sourceLocation.contextAfter}`
     : getSelectionContext(currentSelection.range);
 
+  const selection = currentSelection;
+  const startTime = performance.now();
+  let firstTokenLogged = false;
+
   try {
-    // Send message to service worker with analysis mode
-    const response = await sendMessage(MessageTypes.ANALYZE_WORD, {
-      text: currentSelection.text,
-      context,
-      url: window.location.href,
-      xpath: sourceLocation?.xpath || '',
-      mode,
-    });
+    // 流式请求：meaning 一到就展示，音标/用法随后补齐
+    const response = await sendMessageWithStream(
+      PortNames.ANALYZE_WORD_STREAM,
+      MessageTypes.ANALYZE_WORD,
+      {
+        text: selection.text,
+        context,
+        url: window.location.href,
+        xpath: sourceLocation?.xpath || '',
+        mode,
+      },
+      (partial: AnalyzeWordPartial) => {
+        // 分析期间用户已换了选区，丢弃旧请求的中间结果
+        if (currentSelection !== selection || !partial.meaning) {
+          return;
+        }
+        if (!firstTokenLogged) {
+          firstTokenLogged = true;
+          console.log(`[LingoRecall] First visible token in ${(performance.now() - startTime).toFixed(0)}ms`);
+        }
+        showPartialResult({
+          meaning: partial.meaning,
+          pronunciation: partial.pronunciation ?? '',
+          partOfSpeech: partial.partOfSpeech ?? '',
+          usage: partial.usage ?? '',
+          mode,
+        });
+      }
+    );
 
     if (response.success && response.data) {
       currentAnalysisResult = response.data;
@@ -945,7 +979,14 @@ async function handleFullPageTranslation(): Promise<void> {
     : currentSettings.targetLanguage;
 
   try {
-    const result = await translatePage(targetLanguage as import('../shared/types/settings').TargetLanguage);
+    const result = await translatePage(targetLanguage as import('../shared/types/settings').TargetLanguage, {
+      tokenBudget: currentSettings.batchTokenBudgets?.[currentSettings.aiProvider],
+    });
+
+    if (result.cancelled) {
+      // 用户已恢复原文或页面已导航，无需提示
+      return;
+    }
 
     if (result.success) {
       if (result.translatedCount > 0) {
@@ -1031,8 +1072,7 @@ function handleToggleTranslation(): void {
   // Update UI state
   updatePageTranslation({
     state: 'translated',
-    progress: lastPageTranslationProgress.progress,
-    total: lastPageTranslationProgress.total,
+    ...lastPageTranslationProgress,
     showingTranslation: isShowingTranslation(),
   });
 }
@@ -1302,12 +1342,19 @@ async function init(): Promise<void> {
   });
 
   // Set up page translation progress callback
-  setProgressCallback((progress, total, state) => {
-    lastPageTranslationProgress = { progress, total };
+  setProgressCallback((progress, total, state, detail) => {
+    lastPageTranslationProgress = {
+      progress,
+      total,
+      visibleProgress: detail?.visibleProgress,
+      visibleTotal: detail?.visibleTotal,
+    };
     updatePageTranslation({
       state,
       progress,
       total,
+      visibleProgress: detail?.visibleProgress,
+      visibleTotal: detail?.visibleTotal,
       showingTranslation: isShowingTranslation(),
     });
   });
@@ -0,0 +1,117 @@
+/**
+ * LingoRecall AI - Incremental Reapply Benchmark
+ * 在 50k 节点的合成页面上，对比旧版“每次变化都全量遍历 body”与增量扫描新增子树
+ *
+ * 运行: npm run bench
+ *
+ * @module content/mutationRoots.bench
+ */
+
+import { bench, describe } from 'vitest';
+import { collectMutationRoots, reduceToMinimalRoots, walkTextNodes } from './mutationRoots';
+
+const SKIP_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'CODE', 'PRE']);
+const TRANSLATED_ATTR = 'data-lingorecall-translated';
+
+/** 每个条目 10 个节点（5 个元素 + 5 个文本），5000 条约 50k 节点 */
+const ITEM_COUNT = 5_000;
+/** 一次无限滚动追加的条目数 */
+const APPENDED_COUNT = 20;
+
+const skipElement = (element: Element) =>
+  SKIP_TAGS.has(element.tagName) || element.hasAttribute(TRANSLATED_ATTR);
+const acceptText = (node: Text) => Boolean(node.textContent?.trim());
+const isOwnNode = (node: Node) => {
+  const element = node.nodeType === Node.ELEMENT_NODE ? (node as Element) : node.parentElement;
+  return Boolean(element?.hasAttribute(TRANSLATED_ATTR));
+};
+
+function createItem(i: number): HTMLElement {
+  const item = document.createElement('article');
+  item.innerHTML =
+    `<h3>Title ${i}</h3><p>Paragraph <a href="#">link ${i}</a> tail</p>` +
+    `<code>const x = ${i};</code>`;
+  return item;
+}
+
+const feed = document.createElement('main');
+for (let i = 0; i < ITEM_COUNT; i++) {
+  feed.appendChild(createItem(i));
+}
+document.body.appendChild(feed);
+
+/**
+ * 旧版实现：遍历整个 body，每个文本节点回溯全部祖先检查是否应跳过
+ */
+function legacyFullScan(): number {
+  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, {
+    acceptNode: (node: Text) => {
+      let ancestor: Element | null = node.parentElement;
+      while (ancestor) {
+        if (skipElement(ancestor)) {
+          return NodeFilter.FILTER_REJECT;
+        }
+        ancestor = ancestor.parentElement;
+      }
+      return acceptText(node) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT;
+    },
+  });
+  let count = 0;
+  while (walker.nextNode()) {
+    count++;
+  }
+  return count;
+}
+
+/** 追加一页条目并构造对应的 MutationRecord */
+function appendPage(): MutationRecord[] {
+  const records: MutationRecord[] = [];
+  for (let i = 0; i < APPENDED_COUNT; i++) {
+    const item = createItem(ITEM_COUNT + i);
+    feed.appendChild(item);
+    records.push({ type: 'childList', addedNodes: [item], target: feed } as unknown as MutationRecord);
+  }
+  return records;
+}
+
+function removePage(records: MutationRecord[]): void {
+  records.forEach((record) => (record.addedNodes[0] as Element).remove());
+}
+
+describe(`reapply after appending ${APPENDED_COUNT} items to a ${ITEM_COUNT * 10}-node page`, () => {
+  let records: MutationRecord[] = [];
+
+  bench(
+    'legacy: full body rescan with per-node ancestor walk',
+    () => {
+      legacyFullScan();
+    },
+    {
+      setup: () => { records = appendPage(); },
+      teardown: () => removePage(records),
+    }
+  );
+
+  bench(
+    'pruned walker over the full body',
+    () => {
+      walkTextNodes([document.body], { skipElement, acceptText });
+    },
+    {
+      setup: () => { records = appendPage(); },
+      teardown: () => removePage(records),
+    }
+  );
+
+  bench(
+    'incremental: minimal roots from mutation records',
+    () => {
+      const roots = reduceToMinimalRoots(collectMutationRoots(records, isOwnNode));
+      walkTextNodes(roots, { skipElement, acceptText });
+    },
+    {
+      setup: () => { records = appendPage(); },
+      teardown: () => removePage(records),
+    }
+  );
+});
@@ -0,0 +1,93 @@
+/**
+ * LingoRecall AI - Incremental Mutation Scanning Tests
+ *
+ * @module content/mutationRoots.test
+ */
+
+import { describe, it, expect, afterEach } from 'vitest';
+import { collectMutationRoots, reduceToMinimalRoots, walkTextNodes } from './mutationRoots';
+
+const OWN_ATTR = 'data-own';
+
+const isOwnNode = (node: Node) => {
+  const element = node.nodeType === Node.ELEMENT_NODE ? (node as Element) : node.parentElement;
+  return Boolean(element?.hasAttribute(OWN_ATTR));
+};
+
+const filter = {
+  skipElement: (element: Element) => element.tagName === 'SCRIPT' || element.hasAttribute(OWN_ATTR),
+  acceptText: (node: Text) => Boolean(node.textContent?.trim()),
+};
+
+function childList(...addedNodes: Node[]): MutationRecord {
+  return { type: 'childList', addedNodes, target: document.body } as unknown as MutationRecord;
+}
+
+function characterData(target: Node): MutationRecord {
+  return { type: 'characterData', addedNodes: [], target } as unknown as MutationRecord;
+}
+
+describe('mutationRoots', () => {
+  afterEach(() => {
+    document.body.innerHTML = '';
+  });
+
+  describe('collectMutationRoots', () => {
+    it('collects added nodes and characterData targets', () => {
+      const added = document.createElement('div');
+      const text = document.createTextNode('changed');
+      const comment = document.createComment('ignored');
+
+      const roots = collectMutationRoots([childList(added, comment), characterData(text)], isOwnNode);
+
+      expect([...roots]).toEqual([added, text]);
+    });
+
+    it('ignores nodes written by the extension itself', () => {
+      const wrapper = document.createElement('span');
+      wrapper.setAttribute(OWN_ATTR, 'true');
+      const wrappedText = document.createTextNode('译文');
+      wrapper.appendChild(wrappedText);
+
+      const roots = collectMutationRoots([childList(wrapper, wrappedText), characterData(wrappedText)], isOwnNode);
+
+      expect(roots.size).toBe(0);
+    });
+  });
+
+  describe('reduceToMinimalRoots', () => {
+    it('keeps only the outermost connected roots', () => {
+      document.body.innerHTML = '<ul><li><b>a</b></li><li>b</li></ul><p>c</p>';
+      const [ul, firstItem, bold, paragraph] = ['ul', 'li', 'b', 'p'].map(
+        (selector) => document.querySelector(selector)!
+      );
+      const detached = document.createElement('div');
+
+      const roots = reduceToMinimalRoots([bold, firstItem, ul, paragraph.firstChild!, detached]);
+
+      expect(roots).toEqual([ul, paragraph.firstChild]);
+    });
+  });
+
+  describe('walkTextNodes', () => {
+    it('walks only the given subtrees and prunes skipped elements', () => {
+      document.body.innerHTML =
+        '<p>outside</p><section><p>one</p><script>code</script><span data-own><em>own</em></span><p>two</p></section>';
+      const section = document.querySelector('section')!;
+
+      const texts = walkTextNodes([section], filter).map((node) => node.textContent);
+
+      expect(texts).toEqual(['one', 'two']);
+    });
+
+    it('skips roots inside a skipped ancestor', () => {
+      document.body.innerHTML = '<span data-own><b>inside</b></span><p>plain</p>';
+      const inside = document.querySelector('b')!;
+      const plain = document.querySelector('p')!.firstChild!;
+
+      const texts = walkTextNodes([inside, plain], filter).map((node) => node.textContent);
+
+      expect(texts).toEqual(['plain']);
+    });
+  });
+});
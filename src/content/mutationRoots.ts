@@ -0,0 +1,155 @@
+/**
+ * LingoRecall AI - Incremental Mutation Scanning
+ * 增量 DOM 扫描：只遍历 MutationObserver 报告的新增/变化子树
+ *
+ * 无限滚动的 SPA 会持续插入节点，每次都从 document.body 重新遍历是 O(页面) 的开销。
+ * 这里把 MutationRecord 收敛为最小子树根集合，并在遍历时整棵剪掉应跳过的子树，
+ * 使一次重新应用的开销只与变化部分的大小成正比。
+ *
+ * @module content/mutationRoots
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 文本遍历过滤器 */
+export interface TextWalkFilter {
+  /** 元素是否应跳过（返回 true 时整棵子树都不遍历） */
+  skipElement(element: Element): boolean;
+  /** 文本节点是否需要收集 */
+  acceptText(node: Text): boolean;
+}
+
+// ============================================================
+// Mutation Roots
+// ============================================================
+
+/**
+ * 从 MutationRecord 中收集变化的子树根
+ * - childList：新增的元素/文本节点
+ * - characterData：内容变化的文本节点
+ *
+ * @param records - MutationObserver 回调收到的记录
+ * @param isOwnNode - 扩展自身写入产生的节点返回 true，这些变化会被忽略
+ * @param roots - 收集目标（防抖期间跨多次回调累积）
+ */
+export function collectMutationRoots(
+  records: Iterable<MutationRecord>,
+  isOwnNode: (node: Node) => boolean,
+  roots: Set<Node> = new Set()
+): Set<Node> {
+  for (const record of records) {
+    if (record.type === 'childList') {
+      for (const added of record.addedNodes) {
+        if (
+          (added.nodeType === Node.ELEMENT_NODE || added.nodeType === Node.TEXT_NODE) &&
+          !isOwnNode(added)
+        ) {
+          roots.add(added);
+        }
+      }
+    } else if (record.type === 'characterData') {
+      if (!isOwnNode(record.target)) {
+        roots.add(record.target);
+      }
+    }
+  }
+  return roots;
+}
+
+/**
+ * 收敛为最小子树根：去掉已脱离文档的节点，以及祖先也在集合中的节点
+ * 每个节点只向上检查一次祖先链，开销为 O(节点数 × 深度)
+ */
+export function reduceToMinimalRoots(nodes: Iterable<Node>): Node[] {
+  const candidates = new Set<Node>();
+  for (const node of nodes) {
+    if (node.isConnected) {
+      candidates.add(node);
+    }
+  }
+
+  const roots: Node[] = [];
+  for (const node of candidates) {
+    let ancestor = node.parentNode;
+    while (ancestor && !candidates.has(ancestor)) {
+      ancestor = ancestor.parentNode;
+    }
+    if (!ancestor) {
+      roots.push(node);
+    }
+  }
+  return roots;
+}
+
+// ============================================================
+// Subtree Walking
+// ============================================================
+
+/**
+ * 遍历若干子树，收集需要处理的文本节点
+ * - 子树根的祖先链各检查一次（结果在本次遍历内缓存）
+ * - 子树内被跳过的元素直接剪枝，不再对每个文本节点回溯祖先
+ *
+ * @param roots - 子树根（元素或文本节点），应先经 reduceToMinimalRoots 去重
+ * @param filter - 跳过/收集规则
+ * @returns 按子树顺序排列的文本节点
+ */
+export function walkTextNodes(roots: Iterable<Node>, filter: TextWalkFilter): Text[] {
+  const textNodes: Text[] = [];
+  const skipCache = new Map<Element, boolean>();
+
+  const isSkipped = (element: Element): boolean => {
+    let skipped = skipCache.get(element);
+    if (skipped === undefined) {
+      skipped = filter.skipElement(element);
+      skipCache.set(element, skipped);
+    }
+    return skipped;
+  };
+
+  const insideSkippedElement = (node: Node): boolean => {
+    let element = node.nodeType === Node.ELEMENT_NODE ? (node as Element) : node.parentElement;
+    while (element) {
+      if (isSkipped(element)) {
+        return true;
+      }
+      element = element.parentElement;
+    }
+    return false;
+  };
+
+  for (const root of roots) {
+    if (insideSkippedElement(root)) {
+      continue;
+    }
+
+    if (root.nodeType === Node.TEXT_NODE) {
+      if (filter.acceptText(root as Text)) {
+        textNodes.push(root as Text);
+      }
+      continue;
+    }
+
+    const walker = document.createTreeWalker(
+      root,
+      NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT,
+      {
+        acceptNode: (node: Node) => {
+          if (node.nodeType === Node.ELEMENT_NODE) {
+            return isSkipped(node as Element) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_SKIP;
+          }
+          return filter.acceptText(node as Text) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT;
+        },
+      }
+    );
+
+    let node: Node | null;
+    while ((node = walker.nextNode())) {
+      textNodes.push(node as Text);
+    }
+  }
+
+  return textNodes;
+}
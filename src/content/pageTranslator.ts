@@ -5,6 +5,9 @@
  * - Option+A 快捷键触发
  * - 智能文本节点提取
  * - 分段批量翻译
+ * - 持久化翻译记忆（跨页面复用重复片段，只翻译未命中的部分）
+ * - 视口优先的渐进翻译（可见区域先完成，其余随滚动或空闲时补翻）
+ * - 流式逐段应用（批次生成过程中每条译文一到就回写 DOM）
  * - 原文/译文切换
  * - 翻译进度指示
  *
@@ -13,26 +16,58 @@
 
 import {
   MessageTypes,
+  PortNames,
   sendMessage,
+  sendMessageWithStream,
   type TranslatePageSegmentPayload,
   type TranslatePageSegmentResult,
+  type TranslatedSegment,
+  type TranslationPriority,
+  type LookupTranslationMemoryResult,
 } from '../shared/messaging';
 import { ErrorCode } from '../shared/types/errors';
-import type { TargetLanguage } from '../shared/types/settings';
+import {
+  DEFAULT_BATCH_TOKEN_BUDGETS,
+  DEFAULT_SETTINGS,
+  type BatchTokenBudget,
+  type TargetLanguage,
+} from '../shared/types/settings';
+import { packByTokenBudget } from '../shared/utils/tokenBudget';
+import { runAdaptiveSchedule, type TaskErrorKind } from '../shared/utils/adaptiveScheduler';
+import { createViewportQueue } from './viewportQueue';
+import { collectMutationRoots, reduceToMinimalRoots, walkTextNodes } from './mutationRoots';
 import i18n from '../i18n';
 
 // ============================================================
 // Constants
 // ============================================================
 
-/** 每批翻译的最大文本数量（减小以避免超时） */
-const BATCH_SIZE = 10;
+/** 每批翻译的最大文本数量（实际批次大小由 token 预算决定，这里只是上限） */
+const BATCH_SIZE = 40;
 
-/** 并发请求数量（设为1避免触发速率限制） */
+/** 初始并发请求数量（从 1 开始，由调度器按延迟和 429 自适应增减） */
 const CONCURRENT_BATCHES = 1;
 
-/** 批次间延迟（毫秒），避免触发速率限制 */
-const BATCH_DELAY_MS = 1500;
+/** 最大并发请求数量 */
+const MAX_CONCURRENT_BATCHES = 4;
+
+/** 单批目标延迟（毫秒），超过则视为拥塞并收缩并发窗口 */
+const TARGET_BATCH_LATENCY_MS = 15000;
+
+/** 两次派发之间的最小间隔（毫秒），避免突发请求触发速率限制 */
+const BATCH_DELAY_MS = 500;
+
+/** 视口预取范围：视口上下各扩展一屏 */
+const VIEWPORT_ROOT_MARGIN = '100% 0px 100% 0px';
+
+/** 等待初始可见性计算的最长时间（毫秒） */
+const VIEWPORT_INITIAL_TIMEOUT_MS = 500;
+
+/** 空闲补翻：等待浏览器空闲的最长时间（毫秒） */
+const IDLE_TRANSLATION_TIMEOUT_MS = 2000;
+
+/** 空闲补翻：每轮最多处理的文本节点数 */
+const IDLE_PLANS_PER_ROUND = BATCH_SIZE * 2;
 
 /** 单个文本的最大字符数（超过则截断） */
 const MAX_TEXT_LENGTH = 2000;
@@ -99,8 +134,21 @@ interface TextNodeInfo {
 /** 翻译状态 */
 export type TranslationState = 'idle' | 'translating' | 'translated' | 'error';
 
+/** 翻译进度细节（渐进模式下区分视口区域与整页） */
+export interface TranslationProgressDetail {
+  /** 视口附近已完成的单元数 */
+  visibleProgress: number;
+  /** 视口附近需要翻译的单元数 */
+  visibleTotal: number;
+}
+
 /** 翻译进度回调 */
-export type ProgressCallback = (progress: number, total: number, state: TranslationState) => void;
+export type ProgressCallback = (
+  progress: number,
+  total: number,
+  state: TranslationState,
+  detail?: TranslationProgressDetail
+) => void;
 
 /** 翻译结果 */
 export interface TranslationResult {
@@ -109,6 +157,8 @@ export interface TranslationResult {
   totalCount: number;
   partial?: boolean;
   completedAll?: boolean;
+  /** 翻译过程中恢复了原文或发生了导航，结果已作废 */
+  cancelled?: boolean;
   error?: string;
 }
 
@@ -163,6 +213,12 @@ let reapplyDebounceTimer: ReturnType<typeof setTimeout> | null = null;
 /** 防抖延迟（毫秒）*/
 const REAPPLY_DEBOUNCE_MS = 100;
 
+/** 防抖期间累积的变化子树根 */
+const pendingReapplyRoots = new Set<Node>();
+
+/** 当前翻译任务编号，恢复原文 / SPA 导航时递增，使进行中的渐进翻译失效 */
+let translationRunId = 0;
+
 /** 记录当前页面 URL，用于检测 SPA 导航 */
 let currentPageUrl: string = '';
 
@@ -251,6 +307,9 @@ function checkAndClearOnNavigation(): boolean {
  * 用于 SPA 导航时，DOM 已被框架替换，只需清除内存状态
  */
 function clearTranslationStateOnly(): void {
+  // 使进行中的渐进翻译失效
+  translationRunId++;
+
   // 清空内存中的 Map 和注册表
   translatedNodes.clear();
   translationRegistry.clear();
@@ -292,15 +351,17 @@ function addToRegistry(originalText: string, translatedText: string): void {
 
 /**
  * 重新应用翻译到新渲染的 DOM 元素
- * 遍历页面查找已在注册表中的文本并应用翻译
+ * 在给定子树（默认整页）中查找已在注册表中的文本并应用翻译
+ *
+ * @param roots - 需要扫描的子树根，MutationObserver 只传入新增/变化的部分
  */
-function reapplyTranslationsFromRegistry(): void {
+function reapplyTranslationsFromRegistry(roots?: Iterable<Node>): void {
   if (currentState !== 'translated' || !showingTranslation) {
     return;
   }
 
-  // 提取所有可翻译的文本节点
-  const textNodes = extractTextNodesForReapply();
+  // 提取可翻译的文本节点
+  const textNodes = extractTextNodesForReapply(roots);
   let reappliedCount = 0;
 
   textNodes.forEach((nodeInfo) => {
@@ -346,7 +407,7 @@ function applyTranslationDirect(
   wrapper.setAttribute(TRANSLATED_ATTR, 'true');
   wrapper.setAttribute(ORIGINAL_TEXT_ATTR, originalText);
   wrapper.setAttribute(TRANSLATED_TEXT_ATTR, translatedText);
-  wrapper.setAttribute(TRANSLATION_STATE_ATTR, 'showing-translation');
+  wrapper.setAttribute(TRANSLATION_STATE_ATTR, showingTranslation ? 'showing-translation' : 'showing-original');
   wrapper.classList.add(TRANSLATED_CLASS);
   wrapper.style.cursor = 'pointer';
   wrapper.title = i18n.t('pageTranslation.clickToToggle', 'Click to toggle original/translation');
@@ -355,8 +416,10 @@ function applyTranslationDirect(
   node.parentNode?.insertBefore(wrapper, node);
   wrapper.appendChild(node);
 
-  // 更新文本内容为翻译结果
-  node.textContent = translatedText;
+  // 更新文本内容为翻译结果（后台补翻期间用户已切回原文时保持原文）
+  if (showingTranslation) {
+    node.textContent = translatedText;
+  }
 
   // 添加点击切换功能
   wrapper.addEventListener('click', (e) => {
@@ -378,59 +441,49 @@ function applyTranslationDirect(
 }
 
 /**
- * 提取文本节点用于重新应用（不跳过已翻译的，因为我们需要检查它们）
+ * 更新已应用的译文（流式译文与最终结果不一致时修正）
+ * 原地修改现有 span 包装器，不重复包装；用户已切回原文的元素只更新属性
  */
-function extractTextNodesForReapply(root: Element = document.body): TextNodeInfo[] {
-  const textNodes: TextNodeInfo[] = [];
-
-  const walker = document.createTreeWalker(
-    root,
-    NodeFilter.SHOW_TEXT,
-    {
-      acceptNode: (node: Text) => {
-        const parent = node.parentElement;
-
-        if (!parent) {
-          return NodeFilter.FILTER_REJECT;
-        }
-
-        // 跳过已经标记的元素
-        if (parent.hasAttribute(TRANSLATED_ATTR)) {
-          return NodeFilter.FILTER_REJECT;
-        }
-
-        // 检查父元素及其祖先是否应该跳过
-        let ancestor: Element | null = parent;
-        while (ancestor) {
-          if (shouldSkipElement(ancestor)) {
-            return NodeFilter.FILTER_REJECT;
-          }
-          ancestor = ancestor.parentElement;
-        }
-
-        const text = node.textContent || '';
-        if (!shouldTranslateText(text)) {
-          return NodeFilter.FILTER_REJECT;
-        }
+function updateAppliedTranslation(nodeInfo: TextNodeInfo, translatedText: string): void {
+  const { node, originalText } = nodeInfo;
 
-        return NodeFilter.FILTER_ACCEPT;
-      },
-    }
-  );
+  addToRegistry(originalText, translatedText);
+  translatedNodes.set(node, {
+    original: originalText,
+    translated: translatedText,
+  });
 
-  let node: Text | null;
-  while ((node = walker.nextNode() as Text | null)) {
-    const parent = node.parentElement;
-    if (parent) {
-      textNodes.push({
-        node,
-        originalText: node.textContent || '',
-        parentElement: parent,
-      });
+  const wrapper = node.parentElement;
+  if (wrapper?.hasAttribute(TRANSLATED_ATTR)) {
+    wrapper.setAttribute(TRANSLATED_TEXT_ATTR, translatedText);
+    if (wrapper.getAttribute(TRANSLATION_STATE_ATTR) === 'showing-original') {
+      return;
     }
   }
+  node.textContent = translatedText;
+}
 
-  return textNodes;
+/**
+ * 提取文本节点用于重新应用
+ * 只遍历给定子树；已翻译的包装器与应跳过的元素整棵剪枝
+ */
+function extractTextNodesForReapply(roots: Iterable<Node> = [document.body]): TextNodeInfo[] {
+  return walkTextNodes(roots, {
+    skipElement: shouldSkipElement,
+    acceptText: (node) => Boolean(node.parentElement) && shouldTranslateText(node.textContent || ''),
+  }).map((node) => ({
+    node,
+    originalText: node.textContent || '',
+    parentElement: node.parentElement as HTMLElement,
+  }));
+}
+
+/**
+ * 判断变化节点是否由扩展自身写入产生（翻译包装器、包装器内的文本替换与切换）
+ */
+function isOwnMutationNode(node: Node): boolean {
+  const element = node.nodeType === Node.ELEMENT_NODE ? (node as Element) : node.parentElement;
+  return Boolean(element?.hasAttribute(TRANSLATED_ATTR));
 }
 
 /**
@@ -451,23 +504,15 @@ function startMutationObserver(): void {
       return; // 已导航到新页面，不再重新应用翻译
     }
 
-    // 检查是否有相关的 DOM 变化
-    let hasRelevantChanges = false;
-
-    for (const mutation of mutations) {
-      if (mutation.type === 'childList' && mutation.addedNodes.length > 0) {
-        // 检查添加的节点是否包含文本内容
-        for (const addedNode of mutation.addedNodes) {
-          if (addedNode.nodeType === Node.ELEMENT_NODE || addedNode.nodeType === Node.TEXT_NODE) {
-            hasRelevantChanges = true;
-            break;
-          }
-        }
-      }
-      if (hasRelevantChanges) break;
+    if (currentState !== 'translated' || !showingTranslation) {
+      pendingReapplyRoots.clear();
+      return;
     }
 
-    if (hasRelevantChanges && currentState === 'translated' && showingTranslation) {
+    // 只记录新增/变化的子树根，扩展自身的写入不触发重新应用
+    collectMutationRoots(mutations, isOwnMutationNode, pendingReapplyRoots);
+
+    if (pendingReapplyRoots.size > 0) {
       // 使用防抖，避免频繁重新应用
       if (reapplyDebounceTimer) {
         clearTimeout(reapplyDebounceTimer);
@@ -477,14 +522,17 @@ function startMutationObserver(): void {
         if (checkAndClearOnNavigation()) {
           return;
         }
-        reapplyTranslationsFromRegistry();
+        const roots = reduceToMinimalRoots(pendingReapplyRoots);
+        pendingReapplyRoots.clear();
         reapplyDebounceTimer = null;
+        reapplyTranslationsFromRegistry(roots);
       }, REAPPLY_DEBOUNCE_MS);
     }
   });
 
   mutationObserver.observe(document.body, {
     childList: true,
+    characterData: true,
     subtree: true,
   });
 
@@ -505,6 +553,7 @@ function stopMutationObserver(): void {
     clearTimeout(reapplyDebounceTimer);
     reapplyDebounceTimer = null;
   }
+  pendingReapplyRoots.clear();
 }
 
 // ============================================================
@@ -739,18 +788,30 @@ function extractTextNodes(root: Element = document.body): TextNodeInfo[] {
 
 /**
  * 批量翻译文本
+ * 提供 onSegment 时通过流式端口请求，每条译文生成完毕即回调
+ * priority 决定 Service Worker 派发队列中的优先级，视口外批次让位于视口内批次与单词分析
  */
 async function translateBatch(
   texts: string[],
-  targetLanguage?: TargetLanguage
+  targetLanguage?: TargetLanguage,
+  onSegment?: (segment: TranslatedSegment) => void,
+  priority: TranslationPriority = 'visible'
 ): Promise<string[]> {
   try {
     const payload: TranslatePageSegmentPayload = {
       texts,
       targetLanguage,
+      priority,
     };
 
-    const response = await sendMessage(MessageTypes.TRANSLATE_PAGE_SEGMENT, payload);
+    const response = onSegment
+      ? await sendMessageWithStream(
+          PortNames.TRANSLATE_PAGE_SEGMENT_STREAM,
+          MessageTypes.TRANSLATE_PAGE_SEGMENT,
+          payload,
+          onSegment
+        )
+      : await sendMessage(MessageTypes.TRANSLATE_PAGE_SEGMENT, payload);
 
     if (response.success && response.data) {
       return (response.data as TranslatePageSegmentResult).translations;
@@ -809,6 +870,79 @@ async function translateBatch(
   }
 }
 
+/**
+ * 节点的所有分片都已翻译时返回合并后的译文，否则返回 null
+ */
+function getCompletedTranslation(plan: TranslationPlan, targetLanguage?: TargetLanguage): string | null {
+  if (plan.translatedSegments.length !== plan.segments.length) {
+    return null;
+  }
+
+  if (plan.translatedSegments.some((segment) => typeof segment !== 'string' || segment.length === 0)) {
+    return null;
+  }
+
+  const translatedText = plan.segments.length === 1
+    ? plan.translatedSegments[0]
+    : joinTranslatedSegments(plan.translatedSegments, targetLanguage);
+
+  return translatedText || null;
+}
+
+/**
+ * 对批次错误分类，决定调度器是否重试
+ */
+function classifyBatchError(error: unknown): TaskErrorKind {
+  const normalized = (error instanceof Error ? error.message : String(error)).toUpperCase();
+
+  if (normalized.includes('EXTENSION_CONTEXT_INVALIDATED') || normalized.includes('API_KEY')) {
+    return 'fatal';
+  }
+
+  if (
+    normalized.includes('RATE_LIMIT') ||
+    normalized.includes('CIRCUIT_OPEN') ||
+    normalized.includes('429') ||
+    normalized.includes('RESOURCE_EXHAUSTED')
+  ) {
+    return 'rate_limit';
+  }
+
+  if (
+    normalized.includes('TIMEOUT') ||
+    normalized.includes('NETWORK') ||
+    normalized.includes('FETCH')
+  ) {
+    return 'transient';
+  }
+
+  return 'permanent';
+}
+
+/**
+ * 批量查询后台翻译记忆
+ * 查询失败时按全部未命中处理，不影响正常翻译流程
+ */
+async function lookupMemoryTranslations(
+  texts: string[],
+  targetLanguage?: TargetLanguage
+): Promise<(string | null)[]> {
+  if (texts.length === 0) {
+    return [];
+  }
+
+  try {
+    const response = await sendMessage(MessageTypes.LOOKUP_TRANSLATION_MEMORY, { texts, targetLanguage });
+    if (response.success && response.data) {
+      return (response.data as LookupTranslationMemoryResult).translations;
+    }
+  } catch (error) {
+    console.warn('[LingoRecall PageTranslator] Translation memory lookup failed:', error);
+  }
+
+  return texts.map(() => null);
+}
+
 /**
  * 应用翻译到文本节点
  */
@@ -909,11 +1043,22 @@ export function isPageTranslated(): boolean {
   return document.querySelectorAll(`[${TRANSLATED_ATTR}]`).length > 0;
 }
 
+/**
+ * 全页翻译选项
+ */
+export interface TranslatePageOptions {
+  /** 单批请求的 token 预算（默认使用默认 Provider 的预算） */
+  tokenBudget?: BatchTokenBudget;
+  /** 渐进模式：视口附近优先，其余随滚动或空闲时翻译（默认开启） */
+  progressive?: boolean;
+}
+
 /**
  * 翻译整个页面
  */
 export async function translatePage(
-  targetLanguage?: TargetLanguage
+  targetLanguage?: TargetLanguage,
+  options: TranslatePageOptions = {}
 ): Promise<TranslationResult> {
   // 防止重复翻译
   if (currentState === 'translating') {
@@ -926,6 +1071,7 @@ export async function translatePage(
   }
 
   currentState = 'translating';
+  const runId = ++translationRunId;
   progressCallback?.(0, 0, 'translating');
 
   try {
@@ -954,152 +1100,291 @@ export async function translatePage(
     // 进度条展示 AI 实际要处理的单元数，比“节点数”更真实。
     progressCallback?.(0, totalUnitCount, 'translating');
 
-    // 将所有翻译单元分成批次
-    const batches: { batch: TranslationUnit[]; texts: string[]; startIndex: number }[] = [];
-    for (let i = 0; i < units.length; i += BATCH_SIZE) {
-      const batch = units.slice(i, i + BATCH_SIZE);
-      const texts = batch.map((unit) => unit.text);
-      batches.push({ batch, texts, startIndex: i });
+    // 先查询翻译记忆，命中的单元直接填入译文，只把未命中的单元发给 AI
+    const memoryTranslations = await lookupMemoryTranslations(
+      units.map((unit) => unit.text),
+      targetLanguage
+    );
+    const pendingUnits: TranslationUnit[] = [];
+    units.forEach((unit, index) => {
+      const remembered = memoryTranslations[index];
+      if (remembered) {
+        plans[unit.planIndex].translatedSegments[unit.segmentIndex] = remembered;
+      } else {
+        pendingUnits.push(unit);
+      }
+    });
+    const memoryHitCount = totalUnitCount - pendingUnits.length;
+    if (memoryHitCount > 0) {
+      console.log(`[LingoRecall PageTranslator] Translation memory hits: ${memoryHitCount}/${totalUnitCount} units`);
+      progressCallback?.(memoryHitCount, totalUnitCount, 'translating');
     }
 
-    console.log(`[LingoRecall PageTranslator] Split into ${batches.length} batches, processing ${CONCURRENT_BATCHES} at a time`);
-
-    let processedUnitCount = 0;
-    // 连续失败计数器（用于自适应中止）
-    let consecutiveFailures = 0;
-    // 自适应批次延迟（失败后翻倍）
-    let adaptiveBatchDelay = BATCH_DELAY_MS;
-    let abortedError: string | undefined;
-
-    // 顺序处理批次（避免速率限制）
-    for (let i = 0; i < batches.length; i += CONCURRENT_BATCHES) {
-      const concurrentBatches = batches.slice(i, i + CONCURRENT_BATCHES);
-      let batchHandled = false;
-      let batchRetryCount = 0;
-
-      while (!batchHandled) {
-        try {
-          // 发送翻译请求（CONCURRENT_BATCHES=1 时为顺序执行）
-          const translationPromises = concurrentBatches.map(({ texts }) =>
-            translateBatch(texts, targetLanguage)
-          );
-
-          // 等待请求完成
-          const translationResults = await Promise.all(translationPromises);
+    // 未命中的单元按计划分组，视口优先调度以计划（DOM 节点）为单位
+    const pendingUnitsByPlan = plans.map<TranslationUnit[]>(() => []);
+    pendingUnits.forEach((unit) => pendingUnitsByPlan[unit.planIndex].push(unit));
+    const pendingPlanIndexes = plans
+      .map((_, planIndex) => planIndex)
+      .filter((planIndex) => pendingUnitsByPlan[planIndex].length > 0);
+    const collectUnits = (positions: number[]) =>
+      positions.flatMap((position) => pendingUnitsByPlan[pendingPlanIndexes[position]]);
+
+    const tokenBudget = options.tokenBudget ?? DEFAULT_BATCH_TOKEN_BUDGETS[DEFAULT_SETTINGS.aiProvider];
+    /** 已回写的计划及其回写时的译文（流式译文可能被最终结果修正） */
+    const appliedPlans = new Map<number, string>();
+    let translatedCount = 0;
 
-          // 成功：重置连续失败计数和自适应延迟
-          consecutiveFailures = 0;
-          adaptiveBatchDelay = BATCH_DELAY_MS;
+    // 节点的所有分片都齐了就立即回写 DOM，不等待整页完成
+    const applyReadyPlans = (planIndexes: Iterable<number>) => {
+      if (runId !== translationRunId) {
+        return;
+      }
+      for (const planIndex of planIndexes) {
+        if (appliedPlans.has(planIndex)) {
+          continue;
+        }
+        const plan = plans[planIndex];
+        const translatedText = getCompletedTranslation(plan, targetLanguage);
+        if (translatedText === null) {
+          continue;
+        }
+        appliedPlans.set(planIndex, translatedText);
+        // 后台补翻期间 MutationObserver 可能已按注册表包装过该节点
+        if (plan.nodeInfo.node.parentElement?.hasAttribute(TRANSLATED_ATTR)) {
+          continue;
+        }
+        if (normalizeText(translatedText) !== normalizeText(plan.nodeInfo.originalText)) {
+          applyTranslation(plan.nodeInfo, translatedText);
+          translatedCount++;
+        }
+      }
+    };
 
-          // 只先缓存译文，等整个节点所有分片都齐了再一次性回写 DOM。
-          concurrentBatches.forEach(({ batch }, batchIndex) => {
-            const translations = translationResults[batchIndex];
-            batch.forEach((unit, index) => {
-              plans[unit.planIndex].translatedSegments[unit.segmentIndex] = translations[index];
-            });
-            processedUnitCount += batch.length;
-          });
+    // 批次最终结果到达后，修正与流式译文不一致的已回写节点
+    const reconcileAppliedPlans = (planIndexes: Iterable<number>) => {
+      if (runId !== translationRunId) {
+        return;
+      }
+      for (const planIndex of planIndexes) {
+        const appliedText = appliedPlans.get(planIndex);
+        const plan = plans[planIndex];
+        const translatedText = getCompletedTranslation(plan, targetLanguage);
+        if (appliedText === undefined || translatedText === null || translatedText === appliedText) {
+          continue;
+        }
+        appliedPlans.set(planIndex, translatedText);
+
+        const originalText = normalizeText(plan.nodeInfo.originalText);
+        const wasTranslated = normalizeText(appliedText) !== originalText;
+        const isTranslated = normalizeText(translatedText) !== originalText;
+        if (wasTranslated && isTranslated) {
+          updateAppliedTranslation(plan.nodeInfo, translatedText);
+        } else if (isTranslated) {
+          applyTranslation(plan.nodeInfo, translatedText);
+          translatedCount++;
+        }
+      }
+    };
 
-          batchHandled = true;
-        } catch (batchError) {
-          const batchErrorMessage = batchError instanceof Error ? batchError.message : String(batchError);
-          const normalizedError = batchErrorMessage.toUpperCase();
-          console.error(`[LingoRecall PageTranslator] Batch ${i / CONCURRENT_BATCHES + 1} failed:`, batchErrorMessage);
+    // 翻译记忆命中的节点直接回写
+    applyReadyPlans(plans.keys());
 
-          if (normalizedError.includes('EXTENSION_CONTEXT_INVALIDATED')) {
-            abortedError = '扩展已更新，请刷新页面后重试';
-            break;
-          }
+    let processedUnitCount = memoryHitCount;
+    let visibleProgress = 0;
+    let visibleTotal = 0;
+    // 连续失败计数器（用于自适应中止）
+    let consecutiveFailures = 0;
+    let concurrency = CONCURRENT_BATCHES;
+    const scheduleTotals = { completed: 0, failed: 0, retries: 0, peakConcurrency: 0 };
 
-          if (normalizedError.includes('API_KEY')) {
-            abortedError = 'API Key 无效，请检查设置';
-            break;
-          }
+    const reportProgress = () => {
+      if (runId !== translationRunId) {
+        return;
+      }
+      // 视口区域完成后状态已是 translated，后台补翻的进度随之上报
+      progressCallback?.(processedUnitCount, totalUnitCount, currentState, { visibleProgress, visibleTotal });
+    };
 
-          const isRateLimitError =
-            normalizedError.includes('RATE_LIMIT') ||
-            normalizedError.includes('CIRCUIT_OPEN') ||
-            normalizedError.includes('429') ||
-            normalizedError.includes('RESOURCE_EXHAUSTED');
-
-          const isTransientError =
-            isRateLimitError ||
-            normalizedError.includes('TIMEOUT') ||
-            normalizedError.includes('NETWORK') ||
-            normalizedError.includes('FETCH');
-
-          if (isTransientError && batchRetryCount < MAX_BATCH_RETRIES) {
-            batchRetryCount++;
-            const retryDelay = isRateLimitError
-              ? RATE_LIMIT_RETRY_DELAY_MS
-              : Math.max(adaptiveBatchDelay, TRANSIENT_ERROR_RETRY_DELAY_MS);
-            console.warn(
-              `[LingoRecall PageTranslator] Retrying batch ${i / CONCURRENT_BATCHES + 1} ` +
-              `in ${retryDelay}ms (${batchRetryCount}/${MAX_BATCH_RETRIES})`
-            );
-            await new Promise((resolve) => setTimeout(resolve, retryDelay));
-            continue;
-          }
+    /**
+     * 翻译一轮单元：按 token 预算装箱，再交给滑动窗口调度器
+     * 并发窗口跨轮次保留，避免每轮都从 1 重新爬升
+     */
+    const translateRound = async (
+      roundUnits: TranslationUnit[],
+      isVisibleRound: boolean,
+      priority: TranslationPriority
+    ) => {
+      const batches = packByTokenBudget(roundUnits, (unit) => unit.text, tokenBudget, {
+        maxItems: BATCH_SIZE,
+        targetLanguage,
+      }).map((batch) => ({ batch, texts: batch.map((unit) => unit.text) }));
+
+      console.log(
+        `[LingoRecall PageTranslator] Packed ${roundUnits.length} ${isVisibleRound ? 'visible' : 'deferred'} units ` +
+        `into ${batches.length} batches (budget: ${tokenBudget.maxInputTokens} in / ` +
+        `${tokenBudget.maxOutputTokens} out tokens), concurrency ${concurrency}-${MAX_CONCURRENT_BATCHES}`
+      );
 
-          // 非致命失败会被统计为 partial；同一时间保持少量重试，避免长文一开始就彻底放弃。
-          consecutiveFailures++;
-          adaptiveBatchDelay = Math.min(adaptiveBatchDelay * 2, 12000);
+      // 滑动窗口调度：任一批次完成立即派发下一批，并发数按延迟和 429 自适应调整
+      const schedule = await runAdaptiveSchedule(
+        batches,
+        async ({ batch, texts }) => {
+          // 流式译文一到就回写所在节点，不等整批完成
+          const streamed = new Map<number, string>();
+          const translations = await translateBatch(
+            texts,
+            targetLanguage,
+            ({ index, translation }) => {
+              const unit = batch[index];
+              if (!unit || runId !== translationRunId) {
+                return;
+              }
+              streamed.set(index, translation);
+              plans[unit.planIndex].translatedSegments[unit.segmentIndex] = translation;
+              applyReadyPlans([unit.planIndex]);
+            },
+            priority
+          );
+          batch.forEach((unit, index) => {
+            // 整批解析失败（如输出触顶）时最终结果回退为原文，保留已完整到达的流式译文
+            const streamedText = streamed.get(index);
+            plans[unit.planIndex].translatedSegments[unit.segmentIndex] =
+              translations[index] === texts[index] && streamedText !== undefined
+                ? streamedText
+                : translations[index];
+          });
+          const planIndexes = batch.map((unit) => unit.planIndex);
+          reconcileAppliedPlans(planIndexes);
+          applyReadyPlans(planIndexes);
+        },
+        {
+          initialConcurrency: concurrency,
+          minConcurrency: 1,
+          maxConcurrency: MAX_CONCURRENT_BATCHES,
+          targetLatencyMs: TARGET_BATCH_LATENCY_MS,
+          maxRetries: MAX_BATCH_RETRIES,
+          minDispatchIntervalMs: BATCH_DELAY_MS,
+          classifyError: classifyBatchError,
+          getRetryDelayMs: (kind) =>
+            kind === 'rate_limit' ? RATE_LIMIT_RETRY_DELAY_MS : TRANSIENT_ERROR_RETRY_DELAY_MS,
+          onTaskComplete: ({ batch }) => {
+            consecutiveFailures = 0;
+            processedUnitCount += batch.length;
+            if (isVisibleRound) {
+              visibleProgress += batch.length;
+            }
+            reportProgress();
+          },
+          onTaskFailed: (_task, error, kind) => {
+            const errorMessage = error instanceof Error ? error.message : String(error);
+            console.error('[LingoRecall PageTranslator] Batch failed:', errorMessage);
+
+            if (kind === 'fatal') {
+              return errorMessage.toUpperCase().includes('API_KEY')
+                ? 'API Key 无效，请检查设置'
+                : '扩展已更新，请刷新页面后重试';
+            }
+
+            // 非致命失败会被统计为 partial；连续失败说明网络不稳定，放弃剩余批次。
+            consecutiveFailures++;
+
+            if (kind === 'rate_limit') {
+              return '请求过于频繁，剩余内容未完成翻译';
+            }
+
+            if (consecutiveFailures >= 2) {
+              console.warn(`[LingoRecall PageTranslator] ${consecutiveFailures} consecutive batch failures, aborting remaining batches`);
+              return '网络不稳定，剩余内容未完成翻译';
+            }
+
+            return undefined;
+          },
+        }
+      );
 
-          if (isRateLimitError) {
-            abortedError = '请求过于频繁，剩余内容未完成翻译';
-            break;
-          }
+      concurrency = Math.max(1, Math.floor(schedule.finalConcurrency));
+      scheduleTotals.completed += schedule.completed;
+      scheduleTotals.failed += schedule.failed;
+      scheduleTotals.retries += schedule.retries;
+      scheduleTotals.peakConcurrency = Math.max(scheduleTotals.peakConcurrency, schedule.peakConcurrency);
+      return schedule.abortedReason;
+    };
 
-          if (consecutiveFailures >= 2) {
-            abortedError = '网络不稳定，剩余内容未完成翻译';
-            console.warn(`[LingoRecall PageTranslator] ${consecutiveFailures} consecutive batch failures, aborting remaining batches`);
-            break;
+    // 渐进模式：视口附近的节点先翻译，其余节点随滚动或空闲时补翻
+    const viewportQueue = options.progressive === false
+      ? null
+      : createViewportQueue(
+          pendingPlanIndexes.map((planIndex) => plans[planIndex].nodeInfo.parentElement),
+          {
+            rootMargin: VIEWPORT_ROOT_MARGIN,
+            initialTimeoutMs: VIEWPORT_INITIAL_TIMEOUT_MS,
+            idleTimeoutMs: IDLE_TRANSLATION_TIMEOUT_MS,
           }
+        );
+    const initialPositions = viewportQueue
+      ? await viewportQueue.initial()
+      : pendingPlanIndexes.map((_, position) => position);
+
+    const visibleUnits = collectUnits(initialPositions);
+    visibleTotal = visibleUnits.length;
+    reportProgress();
+
+    const visibleStartedAt = performance.now();
+    let abortedError = await translateRound(visibleUnits, true, 'visible');
+    if (viewportQueue) {
+      console.log(
+        `[LingoRecall PageTranslator] Visible region (${visibleTotal} units) done in ` +
+        `${(performance.now() - visibleStartedAt).toFixed(0)}ms`
+      );
+    }
 
-          // 当前批次放弃，继续后续批次，最终会显示为 partial。
-          batchHandled = true;
-        }
-      }
+    // 视口区域已完成：页面即视为已翻译（可切换、恢复原文），其余节点在后台继续补翻
+    if (viewportQueue?.hasPending() && !abortedError && runId === translationRunId && translatedCount > 0) {
+      currentState = 'translated';
+      showingTranslation = true;
+      startMutationObserver();
+      reportProgress();
+    }
 
-      if (abortedError) {
+    while (viewportQueue && !abortedError && runId === translationRunId && viewportQueue.hasPending()) {
+      const reason = await viewportQueue.waitForVisibleOrIdle();
+      if (runId !== translationRunId) {
         break;
       }
-
-      // 更新进度
-      progressCallback?.(processedUnitCount, totalUnitCount, 'translating');
-
-      // 批次间延迟（使用自适应延迟），避免触发 API 速率限制
-      if (i + CONCURRENT_BATCHES < batches.length) {
-        await new Promise((resolve) => setTimeout(resolve, adaptiveBatchDelay));
-      }
+      const positions = reason === 'visible'
+        ? viewportQueue.takeVisible()
+        : viewportQueue.takeNext(IDLE_PLANS_PER_ROUND);
+      // 滚动进入视口的节点仍按视口内优先级派发
+      abortedError = await translateRound(collectUnits(positions), false, reason === 'visible' ? 'visible' : 'background');
     }
+    viewportQueue?.disconnect();
 
-    let translatedCount = 0;
-    plans.forEach((plan) => {
-      if (plan.translatedSegments.length !== plan.segments.length) {
-        return;
-      }
-
-      if (plan.translatedSegments.some((segment) => typeof segment !== 'string' || segment.length === 0)) {
-        return;
-      }
-
-      const translatedText = plan.segments.length === 1
-        ? plan.translatedSegments[0]
-        : joinTranslatedSegments(plan.translatedSegments, targetLanguage);
+    console.log(
+      `[LingoRecall PageTranslator] Scheduler finished: ${scheduleTotals.completed} ok, ` +
+      `${scheduleTotals.failed} failed, ${scheduleTotals.retries} retries, ` +
+      `peak concurrency ${scheduleTotals.peakConcurrency}`
+    );
 
-      if (translatedText && normalizeText(translatedText) !== normalizeText(plan.nodeInfo.originalText)) {
-        applyTranslation(plan.nodeInfo, translatedText);
-        translatedCount++;
-      }
-    });
+    // 翻译过程中用户恢复了原文或发生了 SPA 导航，放弃本次结果
+    if (runId !== translationRunId) {
+      return {
+        success: false,
+        translatedCount,
+        totalCount: totalNodeCount,
+        cancelled: true,
+        error: 'Translation cancelled',
+      };
+    }
 
     const completedAll = !abortedError && processedUnitCount === totalUnitCount;
 
     // 判断翻译是否有实际成果
     if (translatedCount > 0) {
-      currentState = 'translated';
-      showingTranslation = true;
+      // 视口区域完成时已切换为 translated 的，保留用户在后台补翻期间的原文/译文切换
+      if (currentState !== 'translated') {
+        currentState = 'translated';
+        showingTranslation = true;
+      }
       progressCallback?.(
         completedAll ? totalUnitCount : processedUnitCount,
         totalUnitCount,
@@ -1108,7 +1393,7 @@ export async function translatePage(
 
       // 启动 MutationObserver 监听 DOM 变化，以便在 SPA 重新渲染时重新应用翻译
       startMutationObserver();
-    } else if (consecutiveFailures > 0 || abortedError) {
+    } else if (scheduleTotals.failed > 0 || abortedError) {
       // 所有批次都失败了，没有任何翻译成功
       currentState = 'error';
       progressCallback?.(processedUnitCount, totalUnitCount, 'error');
@@ -1237,7 +1522,8 @@ export function restoreOriginal(): void {
     }
   });
 
-  // 清空内存中的 Map 和注册表
+  // 清空内存中的 Map 和注册表，并使进行中的渐进翻译失效
+  translationRunId++;
   translatedNodes.clear();
   translationRegistry.clear();
   currentState = 'idle';
@@ -462,6 +462,22 @@ export function showResult(result: AnalysisResult): void {
   });
 }
 
+/**
+ * Show partial analysis result while streaming
+ * Keeps isAnalyzing so the popup knows remaining fields are still on the way
+ *
+ * @param result - Partial analysis result (meaning first, other fields filled in later)
+ */
+export function showPartialResult(result: AnalysisResult): void {
+  clearHideTimeout();
+  updateUI({
+    isAnalyzing: true,
+    analysisResult: result,
+    analysisError: null,
+    isClosing: false,
+  });
+}
+
 /**
  * Show analysis error
  * Keeps current selection position for retry
@@ -618,6 +634,7 @@ if (isDev) {
     showButton,
     showLoading,
     showResult,
+    showPartialResult,
     hideUI,
     showToast,
     dismissToast,
@@ -0,0 +1,90 @@
+/**
+ * LingoRecall AI - Viewport Queue Tests
+ *
+ * @module content/viewportQueue.test
+ */
+
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { createViewportQueue } from './viewportQueue';
+
+const options = { rootMargin: '0px', initialTimeoutMs: 50, idleTimeoutMs: 10 };
+
+/** 可手动触发回调的 IntersectionObserver 替身 */
+class FakeIntersectionObserver {
+  static instance: FakeIntersectionObserver | null = null;
+  observed = new Set<Element>();
+
+  constructor(private callback: (entries: Array<{ target: Element; isIntersecting: boolean }>) => void) {
+    FakeIntersectionObserver.instance = this;
+  }
+
+  observe(element: Element) {
+    this.observed.add(element);
+  }
+
+  unobserve(element: Element) {
+    this.observed.delete(element);
+  }
+
+  disconnect() {
+    this.observed.clear();
+  }
+
+  trigger(visible: Element[]) {
+    this.callback(visible.map((target) => ({ target, isIntersecting: true })));
+  }
+}
+
+describe('createViewportQueue', () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    FakeIntersectionObserver.instance = null;
+  });
+
+  it('treats everything as visible without IntersectionObserver', async () => {
+    vi.stubGlobal('IntersectionObserver', undefined);
+    const elements = [document.createElement('p'), document.createElement('p')];
+    const queue = createViewportQueue(elements, options);
+
+    await expect(queue.initial()).resolves.toEqual([0, 1]);
+    expect(queue.hasPending()).toBe(false);
+  });
+
+  it('returns the initially visible indexes and defers the rest', async () => {
+    vi.stubGlobal('IntersectionObserver', FakeIntersectionObserver);
+    const [a, b, c] = ['p', 'p', 'p'].map((tag) => document.createElement(tag));
+    // 两个条目共享同一元素
+    const queue = createViewportQueue([a, b, b, c], options);
+
+    FakeIntersectionObserver.instance!.trigger([b]);
+
+    await expect(queue.initial()).resolves.toEqual([1, 2]);
+    expect(queue.hasPending()).toBe(true);
+    expect(queue.takeNext(1)).toEqual([0]);
+  });
+
+  it('queues entries that scroll into view later', async () => {
+    vi.stubGlobal('IntersectionObserver', FakeIntersectionObserver);
+    const [a, b] = ['p', 'p'].map((tag) => document.createElement(tag));
+    const queue = createViewportQueue([a, b], options);
+
+    FakeIntersectionObserver.instance!.trigger([a]);
+    await queue.initial();
+
+    const waiting = queue.waitForVisibleOrIdle();
+    FakeIntersectionObserver.instance!.trigger([b]);
+
+    await expect(waiting).resolves.toBe('visible');
+    expect(queue.takeVisible()).toEqual([1]);
+    expect(queue.hasPending()).toBe(false);
+  });
+
+  it('falls back to an empty initial set when the observer never fires', async () => {
+    vi.stubGlobal('IntersectionObserver', FakeIntersectionObserver);
+    const queue = createViewportQueue([document.createElement('p')], options);
+
+    await expect(queue.initial()).resolves.toEqual([]);
+    await expect(queue.waitForVisibleOrIdle()).resolves.toBe('idle');
+    expect(queue.takeNext(10)).toEqual([0]);
+  });
+});
@@ -0,0 +1,184 @@
+/**
+ * LingoRecall AI - Viewport Priority Queue
+ * 全页翻译的视口优先调度
+ *
+ * 用 IntersectionObserver 判断哪些文本位于视口附近：
+ * - 首次回调给出初始可见集合，优先翻译
+ * - 之后滚动进入视口的条目排入可见队列
+ * - 流水线空闲时（requestIdleCallback）按文档顺序补翻剩余条目
+ *
+ * 不支持 IntersectionObserver 的环境下，所有条目都视为初始可见。
+ *
+ * @module content/viewportQueue
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 视口队列配置 */
+export interface ViewportQueueOptions {
+  /** IntersectionObserver rootMargin（视口外预取范围） */
+  rootMargin: string;
+  /** 等待初始可见性计算的最长时间（后台标签页可能不触发回调） */
+  initialTimeoutMs: number;
+  /** 等待浏览器空闲的最长时间 */
+  idleTimeoutMs: number;
+}
+
+/** 视口队列 */
+export interface ViewportQueue {
+  /** 等待初始可见性计算，返回位于视口附近的条目索引（升序） */
+  initial(): Promise<number[]>;
+  /** 是否还有未取出的条目 */
+  hasPending(): boolean;
+  /** 等待新条目进入视口，或浏览器空闲 */
+  waitForVisibleOrIdle(): Promise<'visible' | 'idle'>;
+  /** 取出已进入视口、尚未处理的条目索引 */
+  takeVisible(): number[];
+  /** 按文档顺序取出至多 limit 个尚未处理的条目索引 */
+  takeNext(limit: number): number[];
+  /** 停止观察 */
+  disconnect(): void;
+}
+
+// ============================================================
+// Factory
+// ============================================================
+
+/**
+ * 创建视口优先队列
+ *
+ * @param elements - 每个条目对应的元素（索引即条目编号，多个条目可共享同一元素）
+ * @param options - 配置
+ */
+export function createViewportQueue(elements: Element[], options: ViewportQueueOptions): ViewportQueue {
+  const pending = new Set<number>(elements.map((_, index) => index));
+  const visibleQueue: number[] = [];
+  let notifyVisible: (() => void) | null = null;
+
+  // 不支持 IntersectionObserver：全部视为可见
+  if (typeof IntersectionObserver === 'undefined' || elements.length === 0) {
+    const all = Array.from(pending);
+    pending.clear();
+    return {
+      initial: () => Promise.resolve(all),
+      hasPending: () => false,
+      waitForVisibleOrIdle: () => Promise.resolve('idle'),
+      takeVisible: () => [],
+      takeNext: () => [],
+      disconnect: () => {},
+    };
+  }
+
+  const indexesByElement = new Map<Element, number[]>();
+  elements.forEach((element, index) => {
+    const indexes = indexesByElement.get(element);
+    if (indexes) {
+      indexes.push(index);
+    } else {
+      indexesByElement.set(element, [index]);
+    }
+  });
+
+  let initialDone = false;
+  let resolveInitial!: (indexes: number[]) => void;
+  const initialPromise = new Promise<number[]>((resolve) => {
+    resolveInitial = resolve;
+  });
+
+  const observer = new IntersectionObserver(
+    (entries) => {
+      const newlyVisible: number[] = [];
+      for (const entry of entries) {
+        if (!entry.isIntersecting) {
+          continue;
+        }
+        observer.unobserve(entry.target);
+        for (const index of indexesByElement.get(entry.target) ?? []) {
+          if (pending.delete(index)) {
+            newlyVisible.push(index);
+          }
+        }
+      }
+      newlyVisible.sort((a, b) => a - b);
+
+      if (!initialDone) {
+        initialDone = true;
+        resolveInitial(newlyVisible);
+        return;
+      }
+
+      if (newlyVisible.length > 0) {
+        visibleQueue.push(...newlyVisible);
+        notifyVisible?.();
+      }
+    },
+    { rootMargin: options.rootMargin }
+  );
+
+  indexesByElement.forEach((_, element) => observer.observe(element));
+
+  // 后台标签页不渲染时回调可能迟迟不来，超时后按"无初始可见"处理，交给空闲补翻
+  setTimeout(() => {
+    if (!initialDone) {
+      initialDone = true;
+      resolveInitial([]);
+    }
+  }, options.initialTimeoutMs);
+
+  return {
+    initial: () => initialPromise,
+
+    hasPending: () => pending.size > 0 || visibleQueue.length > 0,
+
+    waitForVisibleOrIdle(): Promise<'visible' | 'idle'> {
+      if (visibleQueue.length > 0) {
+        return Promise.resolve('visible');
+      }
+
+      return new Promise((resolve) => {
+        let settled = false;
+        const settle = (reason: 'visible' | 'idle') => {
+          if (settled) {
+            return;
+          }
+          settled = true;
+          notifyVisible = null;
+          resolve(reason);
+        };
+
+        notifyVisible = () => settle('visible');
+
+        if (typeof requestIdleCallback === 'function') {
+          requestIdleCallback(() => settle('idle'), { timeout: options.idleTimeoutMs });
+        } else {
+          setTimeout(() => settle('idle'), options.idleTimeoutMs);
+        }
+      });
+    },
+
+    takeVisible(): number[] {
+      return visibleQueue.splice(0, visibleQueue.length);
+    },
+
+    takeNext(limit: number): number[] {
+      const taken: number[] = [];
+      for (const index of pending) {
+        if (taken.length >= limit) {
+          break;
+        }
+        taken.push(index);
+      }
+      taken.forEach((index) => pending.delete(index));
+      return taken;
+    },
+
+    disconnect(): void {
+      observer.disconnect();
+      notifyVisible = null;
+      pending.clear();
+      visibleQueue.length = 0;
+    },
+  };
+}
@@ -0,0 +1,110 @@
+/**
+ * LingoRecall AI - useBatchWordActions Hook
+ * 批量标签 / 批量删除
+ *
+ * 通过 BATCH_UPDATE_WORDS / BATCH_DELETE_WORDS 一次提交全部选中词汇，
+ * Service Worker 按分块事务处理并经流式端口推送进度
+ *
+ * @module hooks/useBatchWordActions
+ */
+
+import { useState, useCallback } from 'react';
+import {
+  MessageTypes,
+  PortNames,
+  sendMessageWithStream,
+  type BatchProgress,
+  type BatchWordsResult,
+  type Response,
+} from '../shared/messaging';
+
+/**
+ * Hook 返回类型
+ */
+export interface UseBatchWordActionsResult {
+  /** 是否正在处理 */
+  isProcessing: boolean;
+  /** 当前进度，未处理时为 null */
+  progress: BatchProgress | null;
+  /** 为词汇添加标签（与各自现有标签合并） */
+  addTags: (wordIds: string[], tagIds: string[]) => Promise<BatchWordsResult | null>;
+  /** 删除词汇 */
+  deleteWords: (wordIds: string[]) => Promise<BatchWordsResult | null>;
+}
+
+/** 批量操作超时：大词库下可能需要处理数千条记录 */
+const BATCH_TIMEOUT = 120000;
+
+/**
+ * 批量词汇操作 Hook
+ *
+ * @returns UseBatchWordActionsResult
+ */
+export function useBatchWordActions(): UseBatchWordActionsResult {
+  const [isProcessing, setIsProcessing] = useState(false);
+  const [progress, setProgress] = useState<BatchProgress | null>(null);
+
+  /**
+   * 执行批量请求，失败时返回 null
+   */
+  const run = useCallback(
+    async (
+      request: (onProgress: (progress: BatchProgress) => void) => Promise<Response<BatchWordsResult>>
+    ): Promise<BatchWordsResult | null> => {
+      setIsProcessing(true);
+      setProgress(null);
+      try {
+        const response = await request(setProgress);
+        if (response.success && response.data) {
+          return response.data;
+        }
+        console.error('[LingoRecall] Batch operation failed:', response.error);
+        return null;
+      } catch (err) {
+        console.error('[LingoRecall] Batch operation error:', err);
+        return null;
+      } finally {
+        setIsProcessing(false);
+        setProgress(null);
+      }
+    },
+    []
+  );
+
+  const addTags = useCallback(
+    (wordIds: string[], tagIds: string[]) =>
+      run((onProgress) =>
+        sendMessageWithStream(
+          PortNames.BATCH_UPDATE_WORDS_STREAM,
+          MessageTypes.BATCH_UPDATE_WORDS,
+          { ids: wordIds, addTagIds: tagIds },
+          onProgress,
+          BATCH_TIMEOUT
+        )
+      ),
+    [run]
+  );
+
+  const deleteWords = useCallback(
+    (wordIds: string[]) =>
+      run((onProgress) =>
+        sendMessageWithStream(
+          PortNames.BATCH_DELETE_WORDS_STREAM,
+          MessageTypes.BATCH_DELETE_WORDS,
+          { ids: wordIds },
+          onProgress,
+          BATCH_TIMEOUT
+        )
+      ),
+    [run]
+  );
+
+  return {
+    isProcessing,
+    progress,
+    addTags,
+    deleteWords,
+  };
+}
+
+export default useBatchWordActions;
@@ -3,12 +3,14 @@
  * Story 3.3 实现 - 获取待复习词汇数量
  *
  * 用于在词库界面显示待复习数量 Badge
+ * 加载一次后按变更推送增减（保存、复习、删除词汇），不再重复请求
  *
  * @module hooks/useDueCount
  */
 
 import { useState, useEffect, useCallback } from 'react';
 import { MessageTypes, sendMessage } from '../shared/messaging';
+import { subscribeChanges, dueCountDelta } from '../shared/storage/changeFeed';
 
 /**
  * Hook 返回类型
@@ -65,6 +67,16 @@ export function useDueCount(): UseDueCountResult {
     fetchDueCount();
   }, [fetchDueCount]);
 
+  // 词汇变更：按变更前后的复习时间增减
+  useEffect(() => {
+    return subscribeChanges((changes) => {
+      const delta = dueCountDelta(changes);
+      if (delta !== 0) {
+        setDueCount((prev) => Math.max(0, prev + delta));
+      }
+    });
+  }, []);
+
   return {
     dueCount,
     isLoading,
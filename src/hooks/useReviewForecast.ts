@@ -0,0 +1,60 @@
+/**
+ * LingoRecall AI - useReviewForecast Hook
+ * 获取未来若干天的复习预测
+ *
+ * 数据来自 Service Worker 维护的复习聚合，不扫描词库
+ *
+ * @module hooks/useReviewForecast
+ */
+
+import { useState, useEffect, useCallback } from 'react';
+import { MessageTypes, sendMessage, type ReviewForecast } from '../shared/messaging';
+
+/**
+ * Hook 返回类型
+ */
+export interface UseReviewForecastResult {
+  /** 复习预测，加载失败时为 null */
+  forecast: ReviewForecast | null;
+  /** 是否正在加载 */
+  isLoading: boolean;
+  /** 刷新预测 */
+  refresh: () => Promise<void>;
+}
+
+/**
+ * 复习预测 Hook
+ *
+ * @param days 预测天数（含今天），默认由 Service Worker 决定（30 天）
+ * @returns UseReviewForecastResult
+ */
+export function useReviewForecast(days?: number): UseReviewForecastResult {
+  const [forecast, setForecast] = useState<ReviewForecast | null>(null);
+  const [isLoading, setIsLoading] = useState(true);
+
+  const fetchForecast = useCallback(async () => {
+    setIsLoading(true);
+    try {
+      const response = await sendMessage(MessageTypes.GET_REVIEW_FORECAST, { days });
+      setForecast(response.success && response.data ? response.data : null);
+    } catch (err) {
+      console.error('[LingoRecall] useReviewForecast error:', err);
+      setForecast(null);
+    } finally {
+      setIsLoading(false);
+    }
+  }, [days]);
+
+  // 初始加载
+  useEffect(() => {
+    fetchForecast();
+  }, [fetchForecast]);
+
+  return {
+    forecast,
+    isLoading,
+    refresh: fetchForecast,
+  };
+}
+
+export default useReviewForecast;
@@ -8,15 +8,19 @@ import type { WordRecord } from '../shared/messaging';
 
 vi.mock('../shared/messaging', () => ({
   sendMessage: vi.fn(),
-  MessageTypes: { GET_WORDS: 'GET_WORDS' },
+  MessageTypes: { SEARCH_WORDS: 'SEARCH_WORDS' },
 }));
 
 const sendMessageMock = vi.mocked(sendMessage);
 
+function searchResponse(words: WordRecord[], totalCount = words.length) {
+  return { success: true, data: { words, matchCount: words.length, totalCount } };
+}
+
 describe('useSearch', () => {
   beforeEach(() => {
     vi.useFakeTimers();
-    sendMessageMock.mockResolvedValue({ success: true, data: [] });
+    sendMessageMock.mockResolvedValue(searchResponse([]));
   });
 
   afterEach(() => {
@@ -51,8 +55,9 @@ describe('useSearch', () => {
       await Promise.resolve();
     });
 
-    expect(sendMessageMock).toHaveBeenNthCalledWith(1, MessageTypes.GET_WORDS, { searchQuery: 'alpha' });
-    expect(sendMessageMock).toHaveBeenNthCalledWith(2, MessageTypes.GET_WORDS, {});
+    // 匹配结果与总数一次返回，不再额外请求全部词汇
+    expect(sendMessageMock).toHaveBeenCalledTimes(1);
+    expect(sendMessageMock).toHaveBeenCalledWith(MessageTypes.SEARCH_WORDS, { query: 'alpha' });
   });
 
   it('initializes with empty search query', async () => {
@@ -92,7 +97,7 @@ describe('useSearch', () => {
 
     expect(result.current.searchQuery).toBe('');
     expect(result.current.hasActiveSearch).toBe(false);
-    expect(sendMessageMock).toHaveBeenCalledWith(MessageTypes.GET_WORDS, { searchQuery: '' });
+    expect(sendMessageMock).toHaveBeenCalledWith(MessageTypes.SEARCH_WORDS, { query: '' });
   });
 
   it('updates match and total counts from response', async () => {
@@ -139,7 +144,7 @@ describe('useSearch', () => {
       },
     ];
 
-    sendMessageMock.mockResolvedValue({ success: true, data: mockWords });
+    sendMessageMock.mockResolvedValue(searchResponse(mockWords, 5));
 
     const { result } = renderHook(() => useSearch());
 
@@ -148,7 +153,7 @@ describe('useSearch', () => {
     });
 
     expect(result.current.matchCount).toBe(2);
-    expect(result.current.totalCount).toBe(2);
+    expect(result.current.totalCount).toBe(5);
     expect(result.current.searchResults).toEqual(mockWords);
   });
 
@@ -178,18 +183,19 @@ describe('useSearch', () => {
 
     sendMessageMock.mockClear();
 
-    const resolveFirst: Array<(value: { success: boolean; data: WordRecord[] }) => void> = [];
-    const resolveSecond: Array<(value: { success: boolean; data: WordRecord[] }) => void> = [];
+    type SearchResponse = ReturnType<typeof searchResponse>;
+    const resolveFirst: Array<(value: SearchResponse) => void> = [];
+    const resolveSecond: Array<(value: SearchResponse) => void> = [];
 
     sendMessageMock.mockImplementation((_, payload) => {
-      const queryPayload = payload as { searchQuery?: string };
-      if (queryPayload.searchQuery === 'first') {
+      const queryPayload = payload as { query?: string };
+      if (queryPayload.query === 'first') {
         return new Promise((resolve) => resolveFirst.push(resolve));
       }
-      if (queryPayload.searchQuery === 'second') {
+      if (queryPayload.query === 'second') {
         return new Promise((resolve) => resolveSecond.push(resolve));
       }
-      return Promise.resolve({ success: true, data: [] });
+      return Promise.resolve(searchResponse([]));
     });
 
     act(() => {
@@ -255,12 +261,12 @@ describe('useSearch', () => {
     ];
 
     await act(async () => {
-      resolveSecond[0]({ success: true, data: secondWords });
+      resolveSecond[0](searchResponse(secondWords));
       await Promise.resolve();
     });
 
     await act(async () => {
-      resolveFirst[0]({ success: true, data: firstWords });
+      resolveFirst[0](searchResponse(firstWords));
       await Promise.resolve();
     });
 
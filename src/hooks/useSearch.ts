@@ -3,12 +3,15 @@
  * Story 2.5 实现 - AC1: 实时搜索与防抖
  *
  * 提供搜索状态管理和 300ms 防抖功能
+ * 检索走 Service Worker 的倒排索引（SEARCH_WORDS），匹配结果与词库总数一次返回
+ * 词汇变更由变更推送就地修补，修改或删除后不再重新检索整个词库
  *
  * @module hooks/useSearch
  */
 
 import { useState, useCallback, useRef, useEffect } from 'react';
-import { MessageTypes, sendMessage, type WordRecord } from '../shared/messaging';
+import { MessageTypes, sendMessage, type WordSummary } from '../shared/messaging';
+import { subscribeChanges, patchWordList } from '../shared/storage/changeFeed';
 
 /** 防抖延迟时间（毫秒） */
 const DEBOUNCE_DELAY = 300;
@@ -18,7 +21,7 @@ const DEBOUNCE_DELAY = 300;
  */
 export interface SearchResult {
   /** 匹配的词汇列表 */
-  words: WordRecord[];
+  words: WordSummary[];
   /** 匹配数量 */
   matchCount: number;
   /** 词汇总数 */
@@ -34,7 +37,7 @@ export interface UseSearchReturn {
   /** 设置搜索查询（带防抖） */
   setSearchQuery: (query: string) => void;
   /** 搜索结果列表 */
-  searchResults: WordRecord[] | null;
+  searchResults: WordSummary[] | null;
   /** 匹配数量 */
   matchCount: number;
   /** 词汇总数 */
@@ -71,8 +74,7 @@ export interface UseSearchReturn {
 export function useSearch(): UseSearchReturn {
   // 状态管理
   const [searchQuery, setSearchQueryState] = useState('');
-  const [searchResults, setSearchResults] = useState<WordRecord[] | null>(null);
-  const [matchCount, setMatchCount] = useState(0);
+  const [searchResults, setSearchResults] = useState<WordSummary[] | null>(null);
   const [totalCount, setTotalCount] = useState(0);
   const [isSearching, setIsSearching] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -80,6 +82,8 @@ export function useSearch(): UseSearchReturn {
   // 防抖定时器引用
   const debounceTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const requestIdRef = useRef(0);
+  // 最近一次执行的查询（变更推送按它决定修补方式）
+  const lastQueryRef = useRef('');
 
   /**
    * 执行搜索请求
@@ -88,47 +92,30 @@ export function useSearch(): UseSearchReturn {
   const performSearch = useCallback(async (query: string) => {
     const currentRequestId = requestIdRef.current + 1;
     requestIdRef.current = currentRequestId;
+    lastQueryRef.current = query;
 
     setIsSearching(true);
     setError(null);
 
     try {
       // 发送搜索消息到 Service Worker
-      const response = await sendMessage(MessageTypes.GET_WORDS, {
-        searchQuery: query,
-      });
+      const response = await sendMessage(MessageTypes.SEARCH_WORDS, { query });
 
       if (requestIdRef.current !== currentRequestId) {
         return;
       }
 
       if (response.success && response.data) {
-        const words = response.data;
-        setSearchResults(words);
-        setMatchCount(words.length);
-
-        // 如果没有搜索查询，matchCount 就是 totalCount
-        if (!query.trim()) {
-          setTotalCount(words.length);
-        } else {
-          const totalResponse = await sendMessage(MessageTypes.GET_WORDS, {});
-          if (requestIdRef.current !== currentRequestId) {
-            return;
-          }
-          if (totalResponse.success && totalResponse.data) {
-            setTotalCount(totalResponse.data.length);
-          }
-        }
+        setSearchResults(response.data.words);
+        setTotalCount(response.data.totalCount);
       } else {
         setError(response.error?.message || '搜索失败');
         setSearchResults([]);
-        setMatchCount(0);
       }
     } catch (err) {
       console.error('[LingoRecall] useSearch error:', err);
       setError(err instanceof Error ? err.message : '搜索失败');
       setSearchResults([]);
-      setMatchCount(0);
     } finally {
       if (requestIdRef.current === currentRequestId) {
         setIsSearching(false);
@@ -136,21 +123,6 @@ export function useSearch(): UseSearchReturn {
     }
   }, []);
 
-  /**
-   * 获取总词汇数量
-   * 用于显示 matchCount/totalCount
-   */
-  const fetchTotalCount = useCallback(async () => {
-    try {
-      const response = await sendMessage(MessageTypes.GET_WORDS, {});
-      if (response.success && response.data) {
-        setTotalCount(response.data.length);
-      }
-    } catch (err) {
-      console.error('[LingoRecall] fetchTotalCount error:', err);
-    }
-  }, []);
-
   /**
    * 设置搜索查询（带 300ms 防抖）
    * Story 2.5 - AC1: debounce 300ms
@@ -191,13 +163,35 @@ export function useSearch(): UseSearchReturn {
 
   /**
    * 初始加载
-   * 获取初始数据和总数量
+   * 空查询返回全部词汇，同时得到总数量
    */
   useEffect(() => {
-    // 初始加载所有词汇
     performSearch('');
-    fetchTotalCount();
-  }, [performSearch, fetchTotalCount]);
+  }, [performSearch]);
+
+  /**
+   * 订阅词汇变更
+   * 无关键词时新增词汇直接插到列表开头；有关键词时新增词汇是否匹配交给 Service Worker 判断
+   */
+  useEffect(() => {
+    return subscribeChanges((changes) => {
+      const hasQuery = lastQueryRef.current.trim().length > 0;
+      const added = changes.filter((change) => change.type === 'word:add').length;
+      const removed = changes.filter((change) => change.type === 'word:delete').length;
+
+      if (hasQuery && added > 0) {
+        performSearch(lastQueryRef.current);
+        return;
+      }
+
+      setTotalCount((prev) => Math.max(0, prev + added - removed));
+      setSearchResults((prev) =>
+        prev
+          ? patchWordList(prev, changes, { project: (word) => word, includeAdded: () => !hasQuery })
+          : prev
+      );
+    });
+  }, [performSearch]);
 
   /**
    * 清理定时器
@@ -214,7 +208,7 @@ export function useSearch(): UseSearchReturn {
     searchQuery,
     setSearchQuery,
     searchResults,
-    matchCount,
+    matchCount: searchResults?.length ?? 0,
     totalCount,
     isSearching,
     clearSearch,
@@ -11,8 +11,8 @@ import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import { renderHook, act, waitFor } from '@testing-library/react';
 import 'fake-indexeddb/auto';
 import { useTags } from './useTags';
-import { deleteDatabase } from '../shared/storage/db';
-import { createTag as createTagService } from '../shared/storage';
+import { deleteDatabase, getDatabase, STORES } from '../shared/storage/db';
+import { createTag as createTagService, deleteTag as deleteTagService } from '../shared/storage';
 
 // ============================================================
 // Test Setup
@@ -238,8 +238,19 @@ describe('useTags', () => {
         expect(result.current.isLoading).toBe(false);
       });
 
-      // 直接通过 service 添加标签（绕过 hook）
-      await createTagService({ name: 'External', color: '#3B82F6' });
+      // 直接写入数据库（绕过 service，不发布变更）
+      const db = await getDatabase();
+      await new Promise<void>((resolve, reject) => {
+        const tx = db.transaction(STORES.tags, 'readwrite');
+        tx.objectStore(STORES.tags).put({
+          id: 'external',
+          name: 'External',
+          color: '#3B82F6',
+          createdAt: Date.now(),
+        });
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+      });
 
       // hook 列表应该还是空的
       expect(result.current.tags).toHaveLength(0);
@@ -255,6 +266,46 @@ describe('useTags', () => {
     });
   });
 
+  // ============================================================
+  // Change Feed Tests
+  // ============================================================
+
+  describe('变更推送', () => {
+    it('其他位置创建、删除的标签无需重新加载即可同步', async () => {
+      const { result } = renderHook(() => useTags());
+
+      await waitFor(() => {
+        expect(result.current.isLoading).toBe(false);
+      });
+
+      const created = await createTagService({ name: 'External', color: '#3B82F6' });
+      await waitFor(() => {
+        expect(result.current.tags.map((tag) => tag.name)).toEqual(['External']);
+      });
+
+      await deleteTagService(created.data!.id);
+      await waitFor(() => {
+        expect(result.current.tags).toHaveLength(0);
+      });
+    });
+
+    it('自己的写入与推送合并后不重复', async () => {
+      const { result } = renderHook(() => useTags());
+
+      await waitFor(() => {
+        expect(result.current.isLoading).toBe(false);
+      });
+
+      await act(async () => {
+        await result.current.addTag('学术', '#3B82F6');
+      });
+
+      await waitFor(() => {
+        expect(result.current.tags).toHaveLength(1);
+      });
+    });
+  });
+
   // ============================================================
   // clearError Tests
   // ============================================================
@@ -3,6 +3,8 @@
  * Story 4.4 - Task 3: 标签状态管理 Hook
  *
  * 提供标签的 CRUD 操作和状态管理
+ * 其他页面或 Service Worker 中的标签变更经变更推送合并到本地列表
+ * 删除标签后词汇清理在后台分块进行，进度同样经变更推送更新
  *
  * @module hooks/useTags
  */
@@ -15,7 +17,10 @@ import {
   getAllTags,
   updateTag as updateTagService,
   deleteTag as deleteTagService,
+  getPendingTagCascades,
+  type TagCascadeProgress,
 } from '../shared/storage';
+import { subscribeChanges } from '../shared/storage/changeFeed';
 
 // ============================================================
 // Hook Return Type
@@ -28,6 +33,8 @@ export interface UseTagsReturn {
   isLoading: boolean;
   /** 错误信息 */
   error: string | null;
+  /** 未完成的词汇清理（已删除标签从词汇中移除的进度） */
+  cascades: TagCascadeProgress[];
   /** 创建标签 */
   addTag: (name: string, color: string) => Promise<Response<Tag>>;
   /** 更新标签 */
@@ -40,6 +47,23 @@ export interface UseTagsReturn {
   clearError: () => void;
 }
 
+// ============================================================
+// Helpers
+// ============================================================
+
+/**
+ * 替换同 ID 的标签，不存在时插到开头（最新的在前）
+ */
+function upsertTag(tags: Tag[], tag: Tag): Tag[] {
+  const index = tags.findIndex((item) => item.id === tag.id);
+  if (index === -1) {
+    return [tag, ...tags];
+  }
+  const next = tags.slice();
+  next[index] = tag;
+  return next;
+}
+
 // ============================================================
 // useTags Hook
 // ============================================================
@@ -65,6 +89,7 @@ export function useTags(): UseTagsReturn {
   const [tags, setTags] = useState<Tag[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [cascades, setCascades] = useState<TagCascadeProgress[]>([]);
 
   /**
    * 加载所有标签
@@ -96,6 +121,40 @@ export function useTags(): UseTagsReturn {
     loadTags();
   }, [loadTags]);
 
+  /**
+   * 读取未完成的词汇清理（页面打开前删除的标签）
+   */
+  useEffect(() => {
+    getPendingTagCascades()
+      .then((pending) => {
+        setCascades((prev) => [...prev, ...pending.filter((item) => !prev.some((p) => p.tagId === item.tagId))]);
+      })
+      .catch((err) => {
+        console.warn('[LingoRecall] Failed to load tag cascades:', err);
+      });
+  }, []);
+
+  /**
+   * 订阅标签变更（包括本页面自己的写入，按 ID 合并，不会重复）
+   */
+  useEffect(() => {
+    return subscribeChanges((changes) => {
+      for (const change of changes) {
+        if (change.type === 'tag:put') {
+          setTags((prev) => upsertTag(prev, change.tag));
+        } else if (change.type === 'tag:delete') {
+          setTags((prev) => prev.filter((tag) => tag.id !== change.id));
+        } else if (change.type === 'tag:cascade') {
+          const { tagId, processed, total, done } = change;
+          setCascades((prev) => [
+            ...prev.filter((item) => item.tagId !== tagId),
+            ...(done ? [] : [{ tagId, processed, total }]),
+          ]);
+        }
+      }
+    });
+  }, []);
+
   /**
    * 创建新标签
    * Story 4.4 - AC1
@@ -108,7 +167,7 @@ export function useTags(): UseTagsReturn {
 
       if (result.success && result.data) {
         // 添加到列表开头（最新的在前）
-        setTags((prev) => [result.data!, ...prev]);
+        setTags((prev) => upsertTag(prev, result.data!));
       } else if (result.error) {
         setError(result.error.message);
       }
@@ -130,9 +189,7 @@ export function useTags(): UseTagsReturn {
 
       if (result.success && result.data) {
         // 更新列表中的标签
-        setTags((prev) =>
-          prev.map((tag) => (tag.id === id ? result.data! : tag))
-        );
+        setTags((prev) => upsertTag(prev, result.data!));
       } else if (result.error) {
         setError(result.error.message);
       }
@@ -175,6 +232,7 @@ export function useTags(): UseTagsReturn {
     tags,
     isLoading,
     error,
+    cascades,
     addTag,
     editTag,
     removeTag,
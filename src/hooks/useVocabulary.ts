@@ -3,25 +3,39 @@
  * Story 2.2 实现 - AC1: Popup 词库列表
  *
  * 提供词汇数据获取、删除、刷新功能
+ * 分页使用 Service Worker 返回的 keyset 游标（loadMore），可通过 fields 只取列表需要的字段
+ * 已加载的列表按变更推送修补（修改、删除、标签删除），不再在每次修改后重新拉取
  *
  * @module hooks/useVocabulary
  */
 
-import { useState, useEffect, useCallback } from 'react';
-import { MessageTypes, sendMessage, type WordRecord } from '../shared/messaging';
+import { useState, useEffect, useCallback, useMemo, useRef } from 'react';
+import {
+  MessageTypes,
+  sendMessage,
+  type WordRecordView,
+  type WordField,
+  type WordSortField,
+} from '../shared/messaging';
+import { subscribeChanges, patchWordList } from '../shared/storage/changeFeed';
+import { projectWord } from '../shared/storage/wordService';
 
 /**
  * Hook 返回类型
  */
 export interface UseVocabularyResult {
-  /** 词汇列表 */
-  words: WordRecord[];
+  /** 词汇列表（指定 fields 时只包含投影字段） */
+  words: WordRecordView[];
   /** 是否正在加载 */
   isLoading: boolean;
   /** 错误信息 */
   error: string | null;
-  /** 刷新词汇列表 */
+  /** 刷新词汇列表（回到第一页） */
   refresh: () => Promise<void>;
+  /** 加载下一页并追加到列表 */
+  loadMore: () => Promise<void>;
+  /** 是否还有下一页 */
+  hasMore: boolean;
   /** 删除词汇 */
   deleteWord: (id: string) => Promise<boolean>;
   /** 词汇总数 */
@@ -38,8 +52,14 @@ export interface UseVocabularyResult {
 export function useVocabulary(options?: {
   /** 每页数量限制 */
   limit?: number;
-  /** 偏移量 */
+  /** 偏移量（深分页请使用 loadMore） */
   offset?: number;
+  /** 排序字段 */
+  sortBy?: WordSortField;
+  /** 排序方向 */
+  sortOrder?: 'asc' | 'desc';
+  /** 字段投影：只获取列表需要渲染的字段 */
+  fields?: WordField[];
   /** 搜索查询 */
   searchQuery?: string;
   /** 标签过滤 */
@@ -47,43 +67,74 @@ export function useVocabulary(options?: {
   /** 是否自动加载 */
   autoLoad?: boolean;
 }): UseVocabularyResult {
-  const [words, setWords] = useState<WordRecord[]>([]);
+  const [words, setWords] = useState<WordRecordView[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
-  const [totalCount, setTotalCount] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  // 丢弃查询条件变化后才返回的旧请求
+  const requestIdRef = useRef(0);
 
-  const { limit, offset, searchQuery, tagIds, autoLoad = true } = options || {};
+  const { limit, offset, searchQuery, tagIds, sortBy, sortOrder, fields, autoLoad = true } = options || {};
+
+  // 调用方常传入内联数组，按内容而非引用决定是否重新获取
+  const fieldsKey = fields?.join(',') ?? '';
+  const projection = useMemo(
+    () => (fieldsKey ? (fieldsKey.split(',') as WordField[]) : undefined),
+    [fieldsKey]
+  );
 
   /**
    * 获取词汇列表
+   * 传入 cursor 时获取下一页并追加，否则从第一页重新加载
    */
-  const fetchWords = useCallback(async () => {
-    setIsLoading(true);
-    setError(null);
+  const fetchWords = useCallback(
+    async (cursor?: string) => {
+      const currentRequestId = requestIdRef.current + 1;
+      requestIdRef.current = currentRequestId;
 
-    try {
-      const response = await sendMessage(MessageTypes.GET_WORDS, {
-        limit,
-        offset,
-        searchQuery,
-        tagIds,
-      });
-
-      if (response.success && response.data) {
-        setWords(response.data);
-        setTotalCount(response.data.length);
-      } else {
-        setError(response.error?.message || '获取词汇列表失败');
-        setWords([]);
+      setIsLoading(true);
+      setError(null);
+
+      try {
+        const response = await sendMessage(MessageTypes.GET_WORDS, {
+          limit,
+          offset: cursor ? undefined : offset,
+          searchQuery,
+          tagIds,
+          sortBy,
+          sortOrder,
+          cursor,
+          fields: projection,
+        });
+
+        if (requestIdRef.current !== currentRequestId) {
+          return;
+        }
+
+        if (response.success && response.data) {
+          const page = response.data.words;
+          setWords((prev) => (cursor ? [...prev, ...page] : page));
+          setNextCursor(response.data.nextCursor);
+        } else {
+          setError(response.error?.message || '获取词汇列表失败');
+          if (!cursor) {
+            setWords([]);
+          }
+        }
+      } catch (err) {
+        console.error('[LingoRecall] useVocabulary error:', err);
+        setError(err instanceof Error ? err.message : '未知错误');
+        if (!cursor) {
+          setWords([]);
+        }
+      } finally {
+        if (requestIdRef.current === currentRequestId) {
+          setIsLoading(false);
+        }
       }
-    } catch (err) {
-      console.error('[LingoRecall] useVocabulary error:', err);
-      setError(err instanceof Error ? err.message : '未知错误');
-      setWords([]);
-    } finally {
-      setIsLoading(false);
-    }
-  }, [limit, offset, searchQuery, tagIds]);
+    },
+    [limit, offset, searchQuery, tagIds, sortBy, sortOrder, projection]
+  );
 
   /**
    * 删除词汇
@@ -94,9 +145,8 @@ export function useVocabulary(options?: {
       const response = await sendMessage(MessageTypes.DELETE_WORD, { id });
 
       if (response.success) {
-        // 从本地状态中移除已删除的词汇
+        // 从本地状态中移除已删除的词汇（变更推送到达时不会重复移除）
         setWords((prev) => prev.filter((word) => word.id !== id));
-        setTotalCount((prev) => prev - 1);
         return true;
       } else {
         console.error('[LingoRecall] Delete failed:', response.error);
@@ -115,6 +165,15 @@ export function useVocabulary(options?: {
     await fetchWords();
   }, [fetchWords]);
 
+  /**
+   * 加载下一页
+   */
+  const loadMore = useCallback(async () => {
+    if (nextCursor) {
+      await fetchWords(nextCursor);
+    }
+  }, [fetchWords, nextCursor]);
+
   // 自动加载
   useEffect(() => {
     if (autoLoad) {
@@ -122,13 +181,35 @@ export function useVocabulary(options?: {
     }
   }, [autoLoad, fetchWords]);
 
+  // 新增词汇只在默认视图（最新在前、无搜索与标签筛选、从第一条开始）中直接插到开头
+  const acceptsAdded =
+    !searchQuery &&
+    !tagIds?.length &&
+    !offset &&
+    (sortBy ?? 'createdAt') === 'createdAt' &&
+    (sortOrder ?? 'desc') === 'desc';
+
+  // 订阅词汇变更，就地修补已加载的列表
+  useEffect(() => {
+    return subscribeChanges((changes) => {
+      setWords((prev) =>
+        patchWordList(prev, changes, {
+          project: (word) => projectWord(word, projection),
+          includeAdded: () => acceptsAdded,
+        })
+      );
+    });
+  }, [projection, acceptsAdded]);
+
   return {
     words,
     isLoading,
     error,
     refresh,
+    loadMore,
+    hasMore: nextCursor !== null,
     deleteWord,
-    totalCount,
+    totalCount: words.length,
   };
 }
 
@@ -8,7 +8,7 @@
  */
 
 import { useState, useCallback, useMemo } from 'react';
-import type { WordRecord } from '../shared/messaging/types';
+import type { WordSummary } from '../shared/messaging/types';
 import type { Tag } from '../shared/types/tag';
 
 /**
@@ -26,7 +26,7 @@ export interface VocabularyFilters {
  */
 export interface UseVocabularyFilterReturn {
   /** 筛选后的词汇列表 */
-  filteredWords: WordRecord[];
+  filteredWords: WordSummary[];
   /** 筛选条件 */
   filters: VocabularyFilters;
   /** 当前搜索关键词 */
@@ -55,7 +55,7 @@ export interface UseVocabularyFilterReturn {
  * 检查词汇是否匹配搜索关键词
  * Story 4.5 - AC1: 搜索匹配
  */
-export function matchesKeyword(word: WordRecord, keyword: string): boolean {
+export function matchesKeyword(word: WordSummary, keyword: string): boolean {
   const normalizedKeyword = keyword.toLowerCase().trim();
   if (!normalizedKeyword) return true;
 
@@ -69,7 +69,7 @@ export function matchesKeyword(word: WordRecord, keyword: string): boolean {
  * 检查词汇是否包含所有指定的标签
  * Story 4.5 - AC2: 多标签筛选（AND 逻辑）
  */
-export function matchesTags(word: WordRecord, selectedTagIds: string[]): boolean {
+export function matchesTags(word: WordSummary, selectedTagIds: string[]): boolean {
   if (selectedTagIds.length === 0) return true;
 
   const wordTagIds = word.tagIds || [];
@@ -98,7 +98,7 @@ export function matchesTags(word: WordRecord, selectedTagIds: string[]): boolean
  * ```
  */
 export function useVocabularyFilter(
-  allWords: WordRecord[],
+  allWords: WordSummary[],
   externalKeyword?: string
 ): UseVocabularyFilterReturn {
   // 内部搜索关键词状态（如果没有外部提供）
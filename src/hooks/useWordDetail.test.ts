@@ -0,0 +1,81 @@
+import { renderHook, act, waitFor } from '@testing-library/react';
+import { afterEach, describe, expect, it, vi } from 'vitest';
+
+import { useWordDetail } from './useWordDetail';
+import { sendMessage, MessageTypes } from '../shared/messaging';
+import type { WordSummary } from '../shared/messaging';
+
+vi.mock('../shared/messaging', () => ({
+  sendMessage: vi.fn(),
+  MessageTypes: { GET_WORD_DETAIL: 'GET_WORD_DETAIL' },
+}));
+
+const sendMessageMock = vi.mocked(sendMessage);
+
+const summary: WordSummary = {
+  id: 'word-1',
+  text: 'context',
+  meaning: '语境',
+  pronunciation: '',
+  partOfSpeech: 'noun',
+  sourceUrl: 'https://example.com',
+  sourceTitle: 'Example',
+  xpath: '/html/body/p[1]',
+  textOffset: 0,
+  createdAt: 1700000000000,
+  nextReviewAt: 1700086400000,
+  reviewCount: 0,
+  easeFactor: 2.5,
+  interval: 1,
+  tagIds: [],
+};
+
+const detail = {
+  id: 'word-1',
+  exampleSentence: 'The context matters.',
+  contextBefore: 'The ',
+  contextAfter: ' matters.',
+};
+
+describe('useWordDetail', () => {
+  afterEach(() => {
+    sendMessageMock.mockReset();
+  });
+
+  it('does not fetch until enabled', () => {
+    renderHook(() => useWordDetail(summary, false));
+
+    expect(sendMessageMock).not.toHaveBeenCalled();
+  });
+
+  it('fetches the detail once enabled', async () => {
+    sendMessageMock.mockResolvedValue({ success: true, data: detail });
+
+    const { result } = renderHook(() => useWordDetail(summary, true));
+
+    await waitFor(() => expect(result.current.detail).toEqual(detail));
+    expect(sendMessageMock).toHaveBeenCalledTimes(1);
+    expect(sendMessageMock).toHaveBeenCalledWith(MessageTypes.GET_WORD_DETAIL, { id: 'word-1' });
+  });
+
+  it('uses inline fields without a message', async () => {
+    const { result } = renderHook(() => useWordDetail({ ...summary, ...detail }, true));
+
+    expect(result.current.detail).toEqual(detail);
+    await act(async () => {
+      expect(await result.current.loadDetail()).toEqual(detail);
+    });
+    expect(sendMessageMock).not.toHaveBeenCalled();
+  });
+
+  it('returns null when the lookup fails', async () => {
+    sendMessageMock.mockResolvedValue({ success: false, error: { code: 'NOT_FOUND', message: '词汇不存在' } });
+
+    const { result } = renderHook(() => useWordDetail(summary, false));
+
+    await act(async () => {
+      expect(await result.current.loadDetail()).toBeNull();
+    });
+    expect(result.current.detail).toBeNull();
+  });
+});
@@ -0,0 +1,97 @@
+/**
+ * LingoRecall AI - useWordDetail Hook
+ * 按需读取词汇冷字段（例句、上下文）
+ *
+ * 列表只拿到摘要；展开词卡、打开详情面板或跳转原文时才通过 GET_WORD_DETAIL 读取，
+ * 记录仍内联冷字段时（如 GET_WORDS 完整记录）直接使用，不发消息
+ *
+ * @module hooks/useWordDetail
+ */
+
+import { useState, useEffect, useCallback } from 'react';
+import { MessageTypes, sendMessage, type WordDetail, type WordSummary } from '../shared/messaging';
+
+/**
+ * Hook 返回类型
+ */
+export interface UseWordDetailResult {
+  /** 冷字段，未加载或加载失败时为 null */
+  detail: WordDetail | null;
+  /** 是否正在加载 */
+  isLoading: boolean;
+  /** 立即读取冷字段（已加载时直接返回） */
+  loadDetail: () => Promise<WordDetail | null>;
+}
+
+/**
+ * 摘要中已带齐冷字段时直接取用
+ */
+function inlineDetail(word: WordSummary | null): WordDetail | null {
+  if (
+    !word ||
+    word.exampleSentence === undefined ||
+    word.contextBefore === undefined ||
+    word.contextAfter === undefined
+  ) {
+    return null;
+  }
+  return {
+    id: word.id,
+    exampleSentence: word.exampleSentence,
+    contextBefore: word.contextBefore,
+    contextAfter: word.contextAfter,
+  };
+}
+
+/**
+ * 词汇冷字段 Hook
+ *
+ * @param word 词汇摘要
+ * @param enabled 是否需要冷字段（如词卡展开、面板打开）
+ * @returns UseWordDetailResult
+ */
+export function useWordDetail(word: WordSummary | null, enabled: boolean): UseWordDetailResult {
+  const [fetched, setFetched] = useState<WordDetail | null>(null);
+  const [isLoading, setIsLoading] = useState(false);
+
+  const inline = inlineDetail(word);
+  const wordId = word?.id ?? null;
+  const detail = inline ?? (fetched && fetched.id === wordId ? fetched : null);
+
+  const loadDetail = useCallback(async (): Promise<WordDetail | null> => {
+    if (detail) {
+      return detail;
+    }
+    if (!wordId) {
+      return null;
+    }
+
+    setIsLoading(true);
+    try {
+      const response = await sendMessage(MessageTypes.GET_WORD_DETAIL, { id: wordId });
+      const loaded = response.success && response.data ? response.data : null;
+      setFetched(loaded);
+      return loaded;
+    } catch (err) {
+      console.error('[LingoRecall] useWordDetail error:', err);
+      return null;
+    } finally {
+      setIsLoading(false);
+    }
+  }, [detail, wordId]);
+
+  // 需要时加载一次（切换词汇后重新加载）
+  useEffect(() => {
+    if (enabled && !detail && wordId) {
+      loadDetail();
+    }
+  }, [enabled, detail, wordId, loadDetail]);
+
+  return {
+    detail,
+    isLoading,
+    loadDetail,
+  };
+}
+
+export default useWordDetail;
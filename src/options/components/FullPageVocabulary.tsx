@@ -20,6 +20,7 @@ import { useSearch } from '../../hooks/useSearch';
 import { useDueCount } from '../../hooks/useDueCount';
 import { useTags } from '../../hooks/useTags';
 import { matchesTags } from '../../hooks/useVocabularyFilter';
+import { useBatchWordActions } from '../../hooks/useBatchWordActions';
 import { SearchBar } from '../../popup/components/SearchBar';
 import { SortDropdown, type SortOption, SORT_CONFIG } from '../../popup/components/SortDropdown';
 import { NoResults } from '../../popup/components/NoResults';
@@ -28,9 +29,10 @@ import { HighlightedText } from '../../popup/components/HighlightedText';
 import { TagBadgeList } from '../../popup/components/TagBadge';
 import { BatchActionBar } from '../../popup/components/BatchActionBar';
 import { BatchTagSelector } from '../../popup/components/BatchTagSelector';
+import { ConfirmDialog } from '../../popup/components/ConfirmDialog';
 import { WordDetailDrawer } from './WordDetailDrawer';
 import { MessageTypes } from '../../shared/messaging/types';
-import type { WordRecord } from '../../shared/messaging/types';
+import type { WordSummary } from '../../shared/messaging/types';
 import type { Tag } from '../../shared/types/tag';
 
 /**
@@ -45,7 +47,7 @@ interface FullPageVocabularyProps {
  * 词卡属性接口
  */
 interface WordCardProps {
-  word: WordRecord;
+  word: WordSummary;
   searchKeyword?: string;
   allTags?: Tag[];
   isSelectionMode?: boolean;
@@ -194,7 +196,13 @@ export function FullPageVocabulary({ onStartReview, onOpenSettings }: FullPageVo
   const [isSelectionMode, setIsSelectionMode] = useState(false);
   const [selectedWordIds, setSelectedWordIds] = useState<Set<string>>(new Set());
   const [showBatchTagSelector, setShowBatchTagSelector] = useState(false);
-  const [isBatchProcessing, setIsBatchProcessing] = useState(false);
+  const [showBatchDeleteConfirm, setShowBatchDeleteConfirm] = useState(false);
+  const {
+    isProcessing: isBatchProcessing,
+    progress: batchProgress,
+    addTags: addTagsToWords,
+    deleteWords: deleteWordsInBatch,
+  } = useBatchWordActions();
   const [sortOption, setSortOption] = useState<SortOption>('recent');
 
   // 抽屉状态 - 选中的词汇 ID
@@ -236,14 +244,14 @@ export function FullPageVocabulary({ onStartReview, onOpenSettings }: FullPageVo
           type: 'DELETE_WORD',
           payload: { id },
         });
-        if (response.success) {
-          setSearchQuery(searchQuery);
+        if (!response.success) {
+          console.error('[LingoRecall] Delete failed:', response.error);
         }
       } catch (err) {
         console.error('[LingoRecall] Delete error:', err);
       }
     },
-    [searchQuery, setSearchQuery]
+    []
   );
 
   const handleUpdateWordTags = useCallback(
@@ -267,14 +275,14 @@ export function FullPageVocabulary({ onStartReview, onOpenSettings }: FullPageVo
           type: MessageTypes.UPDATE_WORD,
           payload: { id: wordId, updates: { tagIds: newTagIds } },
         });
-        if (response.success) {
-          setSearchQuery(searchQuery);
+        if (!response.success) {
+          console.error('[LingoRecall] Update word tags failed:', response.error);
         }
       } catch (err) {
         console.error('[LingoRecall] Update word tags error:', err);
       }
     },
-    [searchResults, searchQuery, setSearchQuery]
+    [searchResults]
   );
 
   const handleToggleWordSelection = useCallback((wordId: string) => {
@@ -307,35 +315,26 @@ export function FullPageVocabulary({ onStartReview, onOpenSettings }: FullPageVo
     async (tagIds: string[]) => {
       if (selectedWordIds.size === 0 || tagIds.length === 0) return;
 
-      setIsBatchProcessing(true);
-      try {
-        const updatePromises = Array.from(selectedWordIds).map(async (wordId) => {
-          const word = searchResults?.find((w) => w.id === wordId);
-          if (!word) return;
-
-          const currentTagIds = word.tagIds || [];
-          const mergedTagIds = [...new Set([...currentTagIds, ...tagIds])];
-          if (mergedTagIds.length === currentTagIds.length) return;
-
-          return chrome.runtime.sendMessage({
-            type: MessageTypes.UPDATE_WORD,
-            payload: { id: wordId, updates: { tagIds: mergedTagIds } },
-          });
-        });
+      const result = await addTagsToWords(Array.from(selectedWordIds), tagIds);
+      if (!result || result.succeeded === 0) return;
 
-        await Promise.all(updatePromises);
-        setSearchQuery(searchQuery);
-        setSelectedWordIds(new Set());
-        setIsSelectionMode(false);
-      } catch (err) {
-        console.error('[LingoRecall] Batch add tags error:', err);
-      } finally {
-        setIsBatchProcessing(false);
-      }
+      setSelectedWordIds(new Set());
+      setIsSelectionMode(false);
     },
-    [selectedWordIds, searchResults, searchQuery, setSearchQuery]
+    [selectedWordIds, addTagsToWords]
   );
 
+  const handleBatchDelete = useCallback(async () => {
+    setShowBatchDeleteConfirm(false);
+    if (selectedWordIds.size === 0) return;
+
+    const result = await deleteWordsInBatch(Array.from(selectedWordIds));
+    if (!result || result.succeeded === 0) return;
+
+    setSelectedWordIds(new Set());
+    setIsSelectionMode(false);
+  }, [selectedWordIds, deleteWordsInBatch]);
+
   const sortedWords = useMemo(() => {
     if (!searchResults) return [];
 
@@ -564,9 +563,23 @@ export function FullPageVocabulary({ onStartReview, onOpenSettings }: FullPageVo
         selectedCount={selectedWordIds.size}
         onAddTags={() => setShowBatchTagSelector(true)}
         onClearSelection={handleClearSelection}
+        onDelete={() => setShowBatchDeleteConfirm(true)}
         isProcessing={isBatchProcessing}
+        progress={batchProgress}
       />
 
+      {showBatchDeleteConfirm && (
+        <ConfirmDialog
+          title={t('vocabulary.batch.deleteConfirmTitle')}
+          message={t('vocabulary.batch.deleteConfirmMessage', { count: selectedWordIds.size })}
+          confirmText={t('vocabulary.batch.delete')}
+          cancelText={t('common.cancel')}
+          confirmType="danger"
+          onConfirm={handleBatchDelete}
+          onCancel={() => setShowBatchDeleteConfirm(false)}
+        />
+      )}
+
       <BatchTagSelector
         isOpen={showBatchTagSelector}
         allTags={tags}
@@ -23,14 +23,15 @@ import { useTranslation } from 'react-i18next';
 import { HighlightedText } from '../../popup/components/HighlightedText';
 import { TagBadgeList } from '../../popup/components/TagBadge';
 import { TagSelector, TagSelectorButton } from '../../popup/components/TagSelector';
+import { useWordDetail } from '../../hooks/useWordDetail';
 import { MessageTypes } from '../../shared/messaging/types';
-import type { WordRecord, JumpToSourcePayload } from '../../shared/messaging/types';
+import type { WordSummary, JumpToSourcePayload } from '../../shared/messaging/types';
 import type { Tag } from '../../shared/types/tag';
 import { ErrorCode } from '../../shared/types/errors';
 
 interface WordDetailDrawerProps {
-  /** 当前选中的词汇 */
-  word: WordRecord | null;
+  /** 当前选中的词汇（摘要，例句与上下文按需读取） */
+  word: WordSummary | null;
   /** 关闭抽屉 */
   onClose: () => void;
   /** 删除词汇 */
@@ -80,6 +81,7 @@ export function WordDetailDrawer({
   const [isUpdatingTags, setIsUpdatingTags] = useState(false);
   const [isDeleting, setIsDeleting] = useState(false);
   const [showDeleteConfirm, setShowDeleteConfirm] = useState(false);
+  const { detail, loadDetail } = useWordDetail(word, word !== null);
 
   // 当词汇变化时重置状态
   useEffect(() => {
@@ -133,6 +135,7 @@ export function WordDetailDrawer({
     setShowContextPreview(false);
 
     try {
+      const context = await loadDetail();
       const payload: JumpToSourcePayload = {
         sourceUrl: word.sourceUrl,
         sourceTitle: word.sourceTitle,
@@ -140,8 +143,8 @@ export function WordDetailDrawer({
         textOffset: word.textOffset,
         textLength: word.text.length,
         text: word.text,
-        contextBefore: word.contextBefore,
-        contextAfter: word.contextAfter,
+        contextBefore: context?.contextBefore ?? '',
+        contextAfter: context?.contextAfter ?? '',
       };
 
       const response = await chrome.runtime.sendMessage({
@@ -289,14 +292,14 @@ export function WordDetailDrawer({
             )}
 
             {/* 例句 */}
-            {word.exampleSentence && (
+            {detail?.exampleSentence && (
               <div>
                 <h3 className="text-xs font-semibold text-gray-500 dark:text-gray-400 uppercase mb-2 flex items-center gap-1">
                   <Clock size={12} />
                   {t('vocabulary.example')}
                 </h3>
                 <blockquote className="text-gray-600 dark:text-gray-300 italic border-l-4 border-blue-400 dark:border-blue-500 pl-4 py-2 bg-blue-50/50 dark:bg-blue-900/20 rounded-r-lg">
-                  "{word.exampleSentence}"
+                  "{detail.exampleSentence}"
                 </blockquote>
               </div>
             )}
@@ -328,11 +331,11 @@ export function WordDetailDrawer({
                   {t('vocabulary.inaccessible')}
                 </p>
                 <p className="text-sm text-gray-700 dark:text-gray-300">
-                  <span className="text-gray-500 dark:text-gray-400">...{word.contextBefore}</span>
+                  <span className="text-gray-500 dark:text-gray-400">...{detail?.contextBefore}</span>
                   <mark className="bg-yellow-200 dark:bg-yellow-700 dark:text-yellow-100 px-1 font-semibold rounded">
                     {word.text}
                   </mark>
-                  <span className="text-gray-500 dark:text-gray-400">{word.contextAfter}...</span>
+                  <span className="text-gray-500 dark:text-gray-400">{detail?.contextAfter}...</span>
                 </p>
               </div>
             )}
@@ -12,6 +12,7 @@ import { useAIConfig } from '../../hooks/useAIConfig';
 import { ConfirmDialog } from './ConfirmDialog';
 import { UsageMonitor } from './UsageMonitor';
 import { LocalModelSection } from './LocalModelSection';
+import { RequestLimitsSection } from './RequestLimitsSection';
 import { getSettings, saveSettings } from '../../shared/storage/config';
 import { sendMessage, MessageTypes, type TestApiConnectionResult } from '../../shared/messaging';
 import {
@@ -19,6 +20,7 @@ import {
   DEFAULT_LOCAL_MODEL_CONFIG,
   DEFAULT_OPENAI_COMPATIBLE_CONFIG,
   type AIProviderType,
+  type FallbackProviderSetting,
   type LocalModelConfig,
   type ProviderConfigs,
 } from '../../shared/types/settings';
@@ -69,6 +71,7 @@ export function APIKeySection({
   const [customEndpoint, setCustomEndpoint] = useState('');
   const [customModel, setCustomModel] = useState('');
   const [providerSaving, setProviderSaving] = useState(false);
+  const [fallbackProvider, setFallbackProvider] = useState<FallbackProviderSetting>('none');
   const [localModelConfig, setLocalModelConfig] = useState<LocalModelConfig>({
     ...DEFAULT_LOCAL_MODEL_CONFIG,
   });
@@ -88,6 +91,7 @@ export function APIKeySection({
     getSettings().then((result) => {
       if (result.success && result.data) {
         setAiProvider(result.data.aiProvider);
+        setFallbackProvider(result.data.fallbackProvider);
         setCustomEndpoint(result.data.customApiEndpoint);
         setCustomModel(result.data.customModelName);
         if (result.data.localModelConfig) {
@@ -146,6 +150,18 @@ export function APIKeySection({
     });
   }, [aiProvider, customEndpoint, customModel, localModelConfig, providerConfigs]);
 
+  /**
+   * 处理备用 Provider 切换
+   * 备用 Provider 使用 providerConfigs 中保存的配置
+   */
+  const handleFallbackChange = useCallback(async (value: FallbackProviderSetting) => {
+    setFallbackProvider(value);
+    const result = await saveSettings({ fallbackProvider: value });
+    if (!result.success) {
+      onError?.(result.error?.message ?? t('settings.apiKey.configSaveFailed'));
+    }
+  }, [onError, t]);
+
   /**
    * 保存 Provider 配置
    */
@@ -326,6 +342,28 @@ export function APIKeySection({
         </select>
       </div>
 
+      {/* 备用 Provider（对冲请求与故障切换） */}
+      <div className="space-y-1">
+        <label className="text-xs text-gray-600 dark:text-gray-400">{t('settings.apiKey.fallbackProvider')}</label>
+        <select
+          value={fallbackProvider === aiProvider ? 'none' : fallbackProvider}
+          onChange={(e) => handleFallbackChange(e.target.value as FallbackProviderSetting)}
+          className="w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-md text-sm bg-white dark:bg-gray-800 text-gray-900 dark:text-gray-100 focus:outline-none focus:ring-2 focus:ring-blue-500"
+        >
+          <option value="none">{t('settings.apiKey.fallbackNone')}</option>
+          {/* 只提供不需要 API Key 的本地模型，主 Provider 的 Key 不会发给其他服务 */}
+          {AI_PROVIDER_OPTIONS.filter((opt) => opt.value === 'localhost' && opt.value !== aiProvider).map((opt) => (
+            <option key={opt.value} value={opt.value}>
+              {opt.label}
+            </option>
+          ))}
+        </select>
+        <p className="text-xs text-gray-500 dark:text-gray-400">{t('settings.apiKey.fallbackHint')}</p>
+      </div>
+
+      {/* 当前 Provider 的 token 预算与速率额度 */}
+      <RequestLimitsSection provider={aiProvider} onError={onError} />
+
       {/* 本地模型配置 */}
       {aiProvider === 'localhost' && (
         <LocalModelSection
@@ -8,7 +8,8 @@
  */
 
 import React from 'react';
-import { Tag as TagIcon, X, Loader2 } from 'lucide-react';
+import { Tag as TagIcon, Trash2, X, Loader2 } from 'lucide-react';
+import type { BatchProgress } from '../../shared/messaging';
 
 /**
  * BatchActionBar 属性
@@ -20,13 +21,18 @@ export interface BatchActionBarProps {
   onAddTags: () => void;
   /** 取消选择回调 */
   onClearSelection: () => void;
+  /** 批量删除按钮点击回调（不提供时不显示删除按钮） */
+  onDelete?: () => void;
   /** 是否正在处理 */
   isProcessing?: boolean;
+  /** 处理进度（BATCH_* 流式端口推送） */
+  progress?: BatchProgress | null;
 }
 
 /**
  * 批量操作工具栏组件
  * Story 4.6 - AC4: 批量添加标签
+ * 批量添加标签 / 删除走 BATCH_UPDATE_WORDS / BATCH_DELETE_WORDS，处理中显示分块进度
  *
  * @example
  * ```tsx
@@ -41,7 +47,9 @@ export function BatchActionBar({
   selectedCount,
   onAddTags,
   onClearSelection,
+  onDelete,
   isProcessing = false,
+  progress = null,
 }: BatchActionBarProps): React.ReactElement | null {
   // 没有选中时不显示
   if (selectedCount === 0) return null;
@@ -73,6 +81,20 @@ export function BatchActionBar({
             <span>取消</span>
           </button>
 
+          {/* 批量删除按钮 */}
+          {onDelete && (
+            <button
+              type="button"
+              onClick={onDelete}
+              disabled={isProcessing}
+              className="flex items-center gap-1 px-3 py-1.5 text-sm text-red-600 dark:text-red-400 hover:bg-red-50 dark:hover:bg-red-900/20 rounded-lg transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+              data-testid="batch-delete-button"
+            >
+              <Trash2 size={16} />
+              <span>删除</span>
+            </button>
+          )}
+
           {/* 添加标签按钮 */}
           <button
             type="button"
@@ -84,7 +106,9 @@ export function BatchActionBar({
             {isProcessing ? (
               <>
                 <Loader2 size={16} className="animate-spin" />
-                <span>处理中...</span>
+                <span>
+                  {progress ? `处理中 ${progress.processed}/${progress.total}` : '处理中...'}
+                </span>
               </>
             ) : (
               <>
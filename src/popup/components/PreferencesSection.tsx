@@ -120,6 +120,15 @@ export function PreferencesSection({
           onChange={(checked) => handleSettingChange('skipChineseText', checked)}
           testId="toggle-skip-chinese"
         />
+
+        {/* 已保存单词的后台刷新开关 */}
+        <ToggleSwitch
+          label={t('settings.preferences.refreshSaved')}
+          description={t('settings.preferences.refreshSavedDesc')}
+          checked={settings.refreshSavedAnalyses}
+          onChange={(checked) => handleSettingChange('refreshSavedAnalyses', checked)}
+          testId="toggle-refresh-saved"
+        />
       </div>
 
       {/* AC3: 主题设置 */}
@@ -0,0 +1,66 @@
+import { fireEvent, render, screen, waitFor } from '@testing-library/react';
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { RequestLimitsSection } from './RequestLimitsSection';
+import { DEFAULT_SETTINGS, DEFAULT_BATCH_TOKEN_BUDGETS, DEFAULT_RATE_LIMITS } from '../../shared/types/settings';
+
+const mockGetSettings = vi.fn();
+const mockSaveSettings = vi.fn();
+
+vi.mock('../../shared/storage/config', () => ({
+  getSettings: () => mockGetSettings(),
+  saveSettings: (partial: unknown) => mockSaveSettings(partial),
+}));
+
+describe('RequestLimitsSection', () => {
+  beforeEach(() => {
+    mockGetSettings.mockReset();
+    mockSaveSettings.mockReset();
+    mockGetSettings.mockResolvedValue({
+      success: true,
+      data: {
+        ...DEFAULT_SETTINGS,
+        rateLimits: { ...DEFAULT_SETTINGS.rateLimits, 'openai-compatible': { rpm: 20, tpm: 40000 } },
+      },
+    });
+    mockSaveSettings.mockResolvedValue({ success: true });
+  });
+
+  it('shows the saved limits of the current provider', async () => {
+    render(<RequestLimitsSection provider="openai-compatible" />);
+
+    await waitFor(() => {
+      expect(screen.getByLabelText('Requests per minute')).toHaveValue(20);
+    });
+    expect(screen.getByLabelText('Tokens per minute')).toHaveValue(40000);
+    expect(screen.getByLabelText('Max output tokens per batch')).toHaveValue(
+      DEFAULT_BATCH_TOKEN_BUDGETS['openai-compatible'].maxOutputTokens
+    );
+  });
+
+  it('saves a changed limit on blur', async () => {
+    render(<RequestLimitsSection provider="openai-compatible" />);
+    const rpm = screen.getByLabelText('Requests per minute');
+    await waitFor(() => expect(rpm).toHaveValue(20));
+
+    fireEvent.change(rpm, { target: { value: '5' } });
+    fireEvent.blur(rpm);
+
+    await waitFor(() => expect(mockSaveSettings).toHaveBeenCalledTimes(1));
+    const saved = mockSaveSettings.mock.calls[0][0];
+    expect(saved.rateLimits['openai-compatible']).toEqual({ rpm: 5, tpm: 40000 });
+    expect(saved.rateLimits.gemini).toEqual(DEFAULT_RATE_LIMITS.gemini);
+  });
+
+  it('reverts invalid input without saving', async () => {
+    render(<RequestLimitsSection provider="openai-compatible" />);
+    const maxInput = screen.getByLabelText('Max input tokens per batch');
+    await waitFor(() => expect(screen.getByLabelText('Requests per minute')).toHaveValue(20));
+
+    fireEvent.change(maxInput, { target: { value: '0' } });
+    fireEvent.blur(maxInput);
+
+    expect(mockSaveSettings).not.toHaveBeenCalled();
+    expect(maxInput).toHaveValue(DEFAULT_BATCH_TOKEN_BUDGETS['openai-compatible'].maxInputTokens);
+  });
+});
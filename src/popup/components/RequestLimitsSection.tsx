@@ -0,0 +1,171 @@
+/**
+ * LingoRecall AI - Request Limits Section Component
+ * 当前 Provider 的全页翻译 token 预算与请求速率额度（RPM / TPM）
+ *
+ * @module popup/components/RequestLimitsSection
+ */
+
+import React, { useState, useEffect, useCallback } from 'react';
+import { useTranslation } from 'react-i18next';
+import { Gauge, RotateCcw } from 'lucide-react';
+import { getSettings, saveSettings } from '../../shared/storage/config';
+import {
+  DEFAULT_BATCH_TOKEN_BUDGETS,
+  DEFAULT_RATE_LIMITS,
+  isValidBatchTokenBudget,
+  isValidProviderRateLimit,
+  mergeBatchTokenBudgets,
+  mergeRateLimits,
+  type AIProviderType,
+  type BatchTokenBudget,
+  type BatchTokenBudgets,
+  type ProviderRateLimit,
+  type ProviderRateLimits,
+} from '../../shared/types/settings';
+
+/**
+ * RequestLimitsSection 属性
+ */
+export interface RequestLimitsSectionProps {
+  /** 当前 Provider（只编辑该 Provider 的额度） */
+  provider: AIProviderType;
+  /** 错误回调 */
+  onError?: (error: string) => void;
+}
+
+type LimitField = keyof BatchTokenBudget | keyof ProviderRateLimit;
+
+/** 输入框草稿（字符串，失焦时校验并保存） */
+type LimitDrafts = Record<LimitField, string>;
+
+const LIMIT_FIELDS: LimitField[] = ['maxInputTokens', 'maxOutputTokens', 'rpm', 'tpm'];
+
+function toDrafts(budget: BatchTokenBudget, limit: ProviderRateLimit): LimitDrafts {
+  return {
+    maxInputTokens: String(budget.maxInputTokens),
+    maxOutputTokens: String(budget.maxOutputTokens),
+    rpm: String(limit.rpm),
+    tpm: String(limit.tpm),
+  };
+}
+
+/**
+ * 请求额度配置区域组件
+ * 无效输入（非数字、预算 ≤ 0、额度 < 0）不保存，输入框恢复为已保存的值
+ */
+export function RequestLimitsSection({ provider, onError }: RequestLimitsSectionProps): React.ReactElement {
+  const { t } = useTranslation();
+
+  const [budgets, setBudgets] = useState<BatchTokenBudgets>(() => mergeBatchTokenBudgets(null));
+  const [rateLimits, setRateLimits] = useState<ProviderRateLimits>(() => mergeRateLimits(null));
+  const [drafts, setDrafts] = useState<LimitDrafts>(() =>
+    toDrafts(DEFAULT_BATCH_TOKEN_BUDGETS[provider], DEFAULT_RATE_LIMITS[provider])
+  );
+
+  // 加载已保存的额度
+  useEffect(() => {
+    getSettings().then((result) => {
+      if (result.success && result.data) {
+        setBudgets(mergeBatchTokenBudgets(result.data.batchTokenBudgets));
+        setRateLimits(mergeRateLimits(result.data.rateLimits));
+      }
+    });
+  }, []);
+
+  // Provider 或已保存值变化时同步输入框
+  useEffect(() => {
+    setDrafts(toDrafts(budgets[provider], rateLimits[provider]));
+  }, [provider, budgets, rateLimits]);
+
+  /**
+   * 保存当前 Provider 的预算与额度
+   */
+  const persist = useCallback(
+    async (budget: BatchTokenBudget, limit: ProviderRateLimit) => {
+      const nextBudgets = { ...budgets, [provider]: budget };
+      const nextRateLimits = { ...rateLimits, [provider]: limit };
+      setBudgets(nextBudgets);
+      setRateLimits(nextRateLimits);
+
+      const result = await saveSettings({ batchTokenBudgets: nextBudgets, rateLimits: nextRateLimits });
+      if (!result.success) {
+        onError?.(result.error?.message ?? t('settings.apiKey.configSaveFailed'));
+      }
+    },
+    [budgets, rateLimits, provider, onError, t]
+  );
+
+  /**
+   * 失焦时校验草稿；无变化或无效时恢复输入框
+   */
+  const handleBlur = useCallback(() => {
+    const budget: BatchTokenBudget = {
+      maxInputTokens: Number(drafts.maxInputTokens),
+      maxOutputTokens: Number(drafts.maxOutputTokens),
+    };
+    const limit: ProviderRateLimit = {
+      rpm: Number(drafts.rpm),
+      tpm: Number(drafts.tpm),
+    };
+    const next = { ...budget, ...limit };
+    const current = { ...budgets[provider], ...rateLimits[provider] };
+    const hasEmpty = LIMIT_FIELDS.some((field) => drafts[field].trim() === '');
+    const unchanged = LIMIT_FIELDS.every((field) => next[field] === current[field]);
+
+    if (hasEmpty || unchanged || !isValidBatchTokenBudget(budget) || !isValidProviderRateLimit(limit)) {
+      setDrafts(toDrafts(budgets[provider], rateLimits[provider]));
+      return;
+    }
+    void persist(budget, limit);
+  }, [drafts, budgets, rateLimits, provider, persist]);
+
+  /**
+   * 恢复当前 Provider 的默认额度
+   */
+  const handleReset = useCallback(() => {
+    void persist({ ...DEFAULT_BATCH_TOKEN_BUDGETS[provider] }, { ...DEFAULT_RATE_LIMITS[provider] });
+  }, [provider, persist]);
+
+  return (
+    <div className="space-y-2 p-3 bg-gray-50 dark:bg-gray-800 rounded-md border border-gray-200 dark:border-gray-700">
+      <div className="flex items-center justify-between">
+        <div className="flex items-center gap-2 text-gray-600 dark:text-gray-300">
+          <Gauge className="w-4 h-4" />
+          <span className="text-sm font-medium">{t('settings.apiKey.requestLimits')}</span>
+        </div>
+        <button
+          type="button"
+          onClick={handleReset}
+          className="flex items-center gap-1 text-xs text-gray-500 hover:text-gray-700 dark:text-gray-400 dark:hover:text-gray-200 transition-colors"
+        >
+          <RotateCcw className="w-3 h-3" />
+          <span>{t('settings.apiKey.requestLimitsReset')}</span>
+        </button>
+      </div>
+
+      <div className="grid grid-cols-2 gap-2">
+        {LIMIT_FIELDS.map((field) => (
+          <div key={field} className="space-y-1">
+            <label htmlFor={`request-limit-${field}`} className="text-xs text-gray-600 dark:text-gray-400">
+              {t(`settings.apiKey.${field}`)}
+            </label>
+            <input
+              id={`request-limit-${field}`}
+              type="number"
+              min={field === 'rpm' || field === 'tpm' ? 0 : 1}
+              step={1}
+              value={drafts[field]}
+              onChange={(e) => setDrafts((prev) => ({ ...prev, [field]: e.target.value }))}
+              onBlur={handleBlur}
+              className="w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-md text-sm bg-white dark:bg-gray-900 text-gray-900 dark:text-gray-100 focus:outline-none focus:ring-2 focus:ring-blue-500"
+            />
+          </div>
+        ))}
+      </div>
+
+      <p className="text-xs text-gray-500 dark:text-gray-400">{t('settings.apiKey.requestLimitsHint')}</p>
+    </div>
+  );
+}
+
+export default RequestLimitsSection;
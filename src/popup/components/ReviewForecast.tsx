@@ -0,0 +1,46 @@
+/**
+ * LingoRecall AI - Review Forecast Component
+ * 未来 30 天每日到期数量柱状条
+ *
+ * @module popup/components/ReviewForecast
+ */
+
+import React from 'react';
+import { useTranslation } from 'react-i18next';
+import { useReviewForecast } from '../../hooks/useReviewForecast';
+
+/**
+ * 复习预测
+ * 加载中或无数据时不渲染
+ */
+export function ReviewForecast() {
+  const { t } = useTranslation();
+  const { forecast } = useReviewForecast();
+
+  if (!forecast) {
+    return null;
+  }
+
+  const upcoming = forecast.days.reduce((sum, day) => sum + day.count, 0);
+  const max = Math.max(1, ...forecast.days.map((day) => day.count));
+
+  return (
+    <div className="w-full max-w-xs mb-6" data-testid="review-forecast">
+      <p className="text-sm text-gray-500 dark:text-gray-400 mb-2">
+        {t('review.forecast.upcoming', { count: upcoming, days: forecast.days.length })}
+      </p>
+      <div className="flex items-end gap-px h-12" role="img" aria-label={t('review.forecast.title')}>
+        {forecast.days.map((day) => (
+          <div
+            key={day.date}
+            title={`${day.date}: ${day.count}`}
+            className="flex-1 rounded-sm bg-blue-400 dark:bg-blue-500"
+            style={{ height: `${Math.max(4, (day.count / max) * 100)}%`, opacity: day.count > 0 ? 1 : 0.25 }}
+          />
+        ))}
+      </div>
+    </div>
+  );
+}
+
+export default ReviewForecast;
@@ -10,6 +10,14 @@ vi.mock('../../hooks/useReview', () => ({
   useReview: () => mockUseReview(),
 }));
 
+vi.mock('../../hooks/useReviewForecast', () => ({
+  useReviewForecast: () => ({
+    forecast: { dueCount: 0, days: [{ date: '2024-01-01', count: 0 }, { date: '2024-01-02', count: 3 }] },
+    isLoading: false,
+    refresh: vi.fn(),
+  }),
+}));
+
 const baseWord: WordRecord = {
   id: 'word-1',
   text: 'context',
@@ -64,6 +72,8 @@ describe('ReviewPage', () => {
     // i18n: review.empty.message = "No words due for review"
     expect(screen.getByText('Great!')).toBeInTheDocument();
     expect(screen.getByText('No words due for review')).toBeInTheDocument();
+    // i18n: review.forecast.upcoming = "{{count}} words due in the next {{days}} days"
+    expect(screen.getByText('3 words due in the next 2 days')).toBeInTheDocument();
   });
 
   it('shows progress and current word', () => {
@@ -11,6 +11,7 @@ import React, { useState, useEffect, useCallback } from 'react';
 import { useTranslation } from 'react-i18next';
 import { ReviewCard } from './ReviewCard';
 import { ReviewComplete, type ReviewStats } from './ReviewComplete';
+import { ReviewForecast } from './ReviewForecast';
 import { useReview } from '../../hooks/useReview';
 import type { ReviewResult } from '../../shared/utils/ebbinghaus';
 import type { useToast } from './Toast';
@@ -148,6 +149,7 @@ export function ReviewPage({ onBack, toast }: ReviewPageProps) {
         </span>
         <h2 className="text-xl font-bold text-gray-800 dark:text-gray-100 mb-2">{t('review.empty.title')}</h2>
         <p className="text-gray-500 dark:text-gray-400 mb-6">{t('review.empty.message')}</p>
+        <ReviewForecast />
         <button
           onClick={onBack}
           className="px-6 py-2 bg-blue-500 text-white rounded-lg hover:bg-blue-600 transition-colors"
@@ -25,7 +25,7 @@ import { TagEditModal } from './TagEditModal';
  */
 export function TagManagement(): React.ReactElement {
   const { t } = useTranslation();
-  const { tags, isLoading, error, addTag, editTag, removeTag, clearError } = useTags();
+  const { tags, isLoading, error, cascades, addTag, editTag, removeTag, clearError } = useTags();
 
   // 弹窗状态
   const [isModalOpen, setIsModalOpen] = useState(false);
@@ -149,6 +149,23 @@ export function TagManagement(): React.ReactElement {
         </div>
       )}
 
+      {/* 已删除标签的词汇清理进度 */}
+      {cascades.length > 0 && (
+        <div
+          className="flex items-center gap-2 px-3 py-2 text-sm text-gray-600 dark:text-gray-300 bg-gray-50 dark:bg-gray-900 rounded-md"
+          role="status"
+          data-testid="tag-cascade-progress"
+        >
+          <Loader2 size={14} className="animate-spin" />
+          <span>
+            {t('settings.tags.cascadeProgress', {
+              processed: cascades.reduce((sum, item) => sum + item.processed, 0),
+              total: cascades.reduce((sum, item) => sum + item.total, 0),
+            })}
+          </span>
+        </div>
+      )}
+
       {/* 标签列表 */}
       {tags.length === 0 ? (
         <div className="text-center py-8">
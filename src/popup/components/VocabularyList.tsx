@@ -18,6 +18,8 @@ import { useDueCount } from '../../hooks/useDueCount';
 import { useTags } from '../../hooks/useTags';
 import { useTheme } from '../../hooks/useTheme';
 import { useVocabularyFilter, matchesTags } from '../../hooks/useVocabularyFilter';
+import { useBatchWordActions } from '../../hooks/useBatchWordActions';
+import { useWordDetail } from '../../hooks/useWordDetail';
 import { SearchBar } from './SearchBar';
 import { SortDropdown, type SortOption, SORT_CONFIG } from './SortDropdown';
 import { NoResults } from './NoResults';
@@ -27,8 +29,9 @@ import { TagBadgeList } from './TagBadge';
 import { TagSelector, TagSelectorButton } from './TagSelector';
 import { BatchActionBar } from './BatchActionBar';
 import { BatchTagSelector } from './BatchTagSelector';
+import { ConfirmDialog } from './ConfirmDialog';
 import { MessageTypes } from '../../shared/messaging/types';
-import type { WordRecord, JumpToSourcePayload } from '../../shared/messaging/types';
+import type { WordRecord, WordSummary, JumpToSourcePayload } from '../../shared/messaging/types';
 import type { Tag } from '../../shared/types/tag';
 import { ErrorCode } from '../../shared/types/errors';
 import type { useToast } from './Toast';
@@ -43,7 +46,7 @@ type ToastInstance = ReturnType<typeof useToast>;
  */
 interface VocabularyListProps {
   /** 跳转到原文的回调（可选，如果不提供则使用内置逻辑） */
-  onJumpToSource?: (word: WordRecord) => void;
+  onJumpToSource?: (word: WordSummary) => void;
   /** 开始复习的回调 - Story 3.3 AC1 */
   onStartReview?: () => void;
   /** 打开设置页面的回调 - Story 4.1 */
@@ -85,8 +88,8 @@ function ContextPreview({
  * WordCard 组件属性
  */
 interface WordCardProps {
-  word: WordRecord;
-  onJumpToSource?: (word: WordRecord) => void;
+  word: WordSummary;
+  onJumpToSource?: (word: WordSummary) => void;
   onDelete: (id: string) => void;
   searchKeyword?: string;
   allTags?: Tag[];
@@ -129,6 +132,8 @@ const WordCard = React.memo(function WordCard({
   const [showContextPreview, setShowContextPreview] = useState(false);
   const [showTagSelector, setShowTagSelector] = useState(false);
   const [isUpdatingTags, setIsUpdatingTags] = useState(false);
+  // 例句与上下文不在列表摘要中，展开时读取
+  const { detail, loadDetail } = useWordDetail(word, isExpanded);
 
   const formattedDate = new Date(word.createdAt).toLocaleDateString();
 
@@ -187,6 +192,7 @@ const WordCard = React.memo(function WordCard({
     setShowContextPreview(false);
 
     try {
+      const context = await loadDetail();
       const payload: JumpToSourcePayload = {
         sourceUrl: word.sourceUrl,
         sourceTitle: word.sourceTitle,
@@ -194,8 +200,8 @@ const WordCard = React.memo(function WordCard({
         textOffset: word.textOffset,
         textLength: word.text.length,
         text: word.text,
-        contextBefore: word.contextBefore,
-        contextAfter: word.contextAfter,
+        contextBefore: context?.contextBefore ?? '',
+        contextAfter: context?.contextAfter ?? '',
       };
 
       const response = await chrome.runtime.sendMessage({
@@ -310,13 +316,13 @@ const WordCard = React.memo(function WordCard({
             </div>
           )}
 
-          {word.exampleSentence && (
+          {detail?.exampleSentence && (
             <div>
               <p className="text-xs font-semibold text-gray-400 dark:text-gray-500 uppercase mb-1 flex items-center gap-1">
                 <Clock size={12} /> {t('vocabulary.example')}
               </p>
               <p className="text-sm italic text-gray-600 dark:text-gray-300 border-l-2 border-gray-200 dark:border-gray-600 pl-3">
-                "...{word.exampleSentence}..."
+                "...{detail.exampleSentence}..."
               </p>
             </div>
           )}
@@ -336,9 +342,9 @@ const WordCard = React.memo(function WordCard({
 
           {showContextPreview && (
             <ContextPreview
-              contextBefore={word.contextBefore}
+              contextBefore={detail?.contextBefore ?? ''}
               word={word.text}
-              contextAfter={word.contextAfter}
+              contextAfter={detail?.contextAfter ?? ''}
             />
           )}
 
@@ -538,7 +544,13 @@ export function VocabularyList({
   const [isSelectionMode, setIsSelectionMode] = useState(false);
   const [selectedWordIds, setSelectedWordIds] = useState<Set<string>>(new Set());
   const [showBatchTagSelector, setShowBatchTagSelector] = useState(false);
-  const [isBatchProcessing, setIsBatchProcessing] = useState(false);
+  const [showBatchDeleteConfirm, setShowBatchDeleteConfirm] = useState(false);
+  const {
+    isProcessing: isBatchProcessing,
+    progress: batchProgress,
+    addTags: addTagsToWords,
+    deleteWords: deleteWordsInBatch,
+  } = useBatchWordActions();
 
   const [isExporting, setIsExporting] = useState(false);
 
@@ -604,12 +616,13 @@ export function VocabularyList({
         type: MessageTypes.GET_WORDS,
         payload: {},
       });
-      if (response.success && response.data && response.data.length > 0) {
-        const csv = generateCSV(response.data);
+      const words = response.data?.words;
+      if (response.success && words && words.length > 0) {
+        const csv = generateCSV(words);
         const date = new Date().toISOString().split('T')[0];
         downloadCSV(csv, `lingorecall-vocabulary-${date}.csv`);
-        toast?.success(t('vocabulary.export.success', { count: response.data.length }));
-      } else if (response.success && (!response.data || response.data.length === 0)) {
+        toast?.success(t('vocabulary.export.success', { count: words.length }));
+      } else if (response.success && (!words || words.length === 0)) {
         toast?.info(t('vocabulary.export.empty'));
       } else {
         toast?.error(t('vocabulary.export.failed'));
@@ -641,8 +654,7 @@ export function VocabularyList({
         });
 
         if (response.success) {
-          // 刷新搜索结果
-          setSearchQuery(searchQuery);
+          // 列表由变更推送修补，无需重新检索
           toast?.success(t('vocabulary.toast.deleteSuccess'));
         } else {
           console.error('[LingoRecall] Delete failed:', response.error);
@@ -653,7 +665,7 @@ export function VocabularyList({
         toast?.error(t('vocabulary.toast.deleteFailed'));
       }
     },
-    [searchQuery, setSearchQuery, toast, t]
+    [toast, t]
   );
 
   /**
@@ -690,8 +702,6 @@ export function VocabularyList({
         });
 
         if (response.success) {
-          // 刷新搜索结果以反映更新
-          setSearchQuery(searchQuery);
           toast?.success(t('vocabulary.toast.tagUpdated'));
         } else {
           console.error('[LingoRecall] Update word tags failed:', response.error);
@@ -702,7 +712,7 @@ export function VocabularyList({
         toast?.error(t('vocabulary.toast.tagUpdateFailed'));
       }
     },
-    [searchResults, searchQuery, setSearchQuery, toast, t]
+    [searchResults, toast, t]
   );
 
   /**
@@ -743,54 +753,46 @@ export function VocabularyList({
 
   /**
    * Story 4.6 - AC4: 批量添加标签
+   * 一次 BATCH_UPDATE_WORDS 提交全部选中词汇，标签在 Service Worker 内与现有标签合并
    */
   const handleBatchAddTags = useCallback(
     async (tagIds: string[]) => {
       if (selectedWordIds.size === 0 || tagIds.length === 0) return;
 
-      setIsBatchProcessing(true);
-      try {
-        // 为每个选中的词汇添加标签
-        const updatePromises = Array.from(selectedWordIds).map(async (wordId) => {
-          const word = searchResults?.find((w) => w.id === wordId);
-          if (!word) return;
-
-          // 合并现有标签和新标签（去重）
-          const currentTagIds = word.tagIds || [];
-          const mergedTagIds = [...new Set([...currentTagIds, ...tagIds])];
-
-          // 如果没有变化则跳过
-          if (mergedTagIds.length === currentTagIds.length) return;
-
-          return chrome.runtime.sendMessage({
-            type: MessageTypes.UPDATE_WORD,
-            payload: {
-              id: wordId,
-              updates: { tagIds: mergedTagIds },
-            },
-          });
-        });
-
-        await Promise.all(updatePromises);
-
-        // 刷新数据
-        setSearchQuery(searchQuery);
-
-        // 清除选中状态
-        setSelectedWordIds(new Set());
-        setIsSelectionMode(false);
-
-        toast?.success(t('vocabulary.toast.batchTagSuccess', { count: selectedWordIds.size }));
-      } catch (err) {
-        console.error('[LingoRecall] Batch add tags error:', err);
+      const result = await addTagsToWords(Array.from(selectedWordIds), tagIds);
+      if (!result || result.succeeded === 0) {
         toast?.error(t('vocabulary.toast.batchTagFailed'));
-      } finally {
-        setIsBatchProcessing(false);
+        return;
       }
+
+      // 清除选中状态
+      setSelectedWordIds(new Set());
+      setIsSelectionMode(false);
+
+      toast?.success(t('vocabulary.toast.batchTagSuccess', { count: result.succeeded }));
     },
-    [selectedWordIds, searchResults, searchQuery, setSearchQuery, toast, t]
+    [selectedWordIds, addTagsToWords, toast, t]
   );
 
+  /**
+   * 批量删除选中词汇
+   */
+  const handleBatchDelete = useCallback(async () => {
+    setShowBatchDeleteConfirm(false);
+    if (selectedWordIds.size === 0) return;
+
+    const result = await deleteWordsInBatch(Array.from(selectedWordIds));
+    if (!result || result.succeeded === 0) {
+      toast?.error(t('vocabulary.toast.batchDeleteFailed'));
+      return;
+    }
+
+    setSelectedWordIds(new Set());
+    setIsSelectionMode(false);
+
+    toast?.success(t('vocabulary.toast.batchDeleteSuccess', { count: result.succeeded }));
+  }, [selectedWordIds, deleteWordsInBatch, toast, t]);
+
   /**
    * 对词汇列表进行排序和标签筛选
    * Story 2.5 - AC2: 排序逻辑
@@ -1056,9 +1058,23 @@ export function VocabularyList({
         selectedCount={selectedWordIds.size}
         onAddTags={() => setShowBatchTagSelector(true)}
         onClearSelection={handleClearSelection}
+        onDelete={() => setShowBatchDeleteConfirm(true)}
         isProcessing={isBatchProcessing}
+        progress={batchProgress}
       />
 
+      {showBatchDeleteConfirm && (
+        <ConfirmDialog
+          title={t('vocabulary.batch.deleteConfirmTitle')}
+          message={t('vocabulary.batch.deleteConfirmMessage', { count: selectedWordIds.size })}
+          confirmText={t('vocabulary.batch.delete')}
+          cancelText={t('common.cancel')}
+          confirmType="danger"
+          onConfirm={handleBatchDelete}
+          onCancel={() => setShowBatchDeleteConfirm(false)}
+        />
+      )}
+
       {/* Story 4.6 - AC4: 批量标签选择弹窗 */}
       <BatchTagSelector
         isOpen={showBatchTagSelector}
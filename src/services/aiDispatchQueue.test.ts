@@ -0,0 +1,127 @@
+/**
+ * LingoRecall AI - AI Dispatch Queue Tests
+ * 优先级类别、并发上限、防饥饿与延迟分位数
+ *
+ * @module services/aiDispatchQueue.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import {
+  dispatchAIRequest,
+  getDispatchStats,
+  resetDispatchQueue,
+  CLASS_CONCURRENCY,
+  MAX_TOTAL_CONCURRENCY,
+  STARVATION_THRESHOLD_MS,
+  type AIRequestClass,
+} from './aiDispatchQueue';
+
+/** 可手动结束的请求，记录开始顺序 */
+function createHarness() {
+  const started: string[] = [];
+  const finishers = new Map<string, () => void>();
+
+  const submit = (requestClass: AIRequestClass, name: string) =>
+    dispatchAIRequest(requestClass, () => {
+      started.push(name);
+      return new Promise<string>((resolve) => finishers.set(name, () => resolve(name)));
+    });
+
+  const finish = async (name: string) => {
+    finishers.get(name)!();
+    // 等待 finally 中的 pump 派发下一个请求
+    await new Promise((resolve) => setTimeout(resolve, 0));
+  };
+
+  return { started, submit, finish };
+}
+
+describe('aiDispatchQueue', () => {
+  beforeEach(() => {
+    resetDispatchQueue();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('各类别不超过自己的并发上限', async () => {
+    const { started, submit } = createHarness();
+
+    for (let i = 0; i < 5; i++) {
+      void submit('background', `bg${i}`);
+    }
+    await vi.waitFor(() => expect(started).toHaveLength(CLASS_CONCURRENCY.background));
+
+    expect(getDispatchStats().background).toMatchObject({ running: 2, queued: 3 });
+  });
+
+  it('全页翻译占满时单词分析仍可立即开始', async () => {
+    const { started, submit } = createHarness();
+
+    for (let i = 0; i < 10; i++) {
+      void submit('visible', `v${i}`);
+      void submit('background', `bg${i}`);
+    }
+    await vi.waitFor(() => expect(started).toHaveLength(
+      CLASS_CONCURRENCY.visible + CLASS_CONCURRENCY.background
+    ));
+
+    void submit('interactive', 'click');
+    await vi.waitFor(() => expect(started).toContain('click'));
+    expect(started.length).toBeLessThanOrEqual(MAX_TOTAL_CONCURRENCY);
+  });
+
+  it('空出名额时高优先级类别先派发', async () => {
+    const { started, submit, finish } = createHarness();
+
+    // 占满总并发：4 interactive + 2 background
+    for (let i = 0; i < 4; i++) {
+      void submit('interactive', `i${i}`);
+    }
+    void submit('background', 'bg0');
+    void submit('background', 'bg1');
+    void submit('background', 'bg2');
+    void submit('visible', 'v0');
+    await vi.waitFor(() => expect(started).toHaveLength(MAX_TOTAL_CONCURRENCY));
+    expect(started).not.toContain('v0');
+
+    await finish('i0');
+
+    expect(started[MAX_TOTAL_CONCURRENCY]).toBe('v0');
+  });
+
+  it('排队过久的低优先级请求不会被饿死', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    vi.setSystemTime(0);
+    const { started, submit, finish } = createHarness();
+
+    // 占满总并发：3 interactive + 2 visible + 1 background，另一个 background 排队
+    for (let i = 0; i < 3; i++) {
+      void submit('interactive', `i${i}`);
+    }
+    void submit('visible', 'v0');
+    void submit('visible', 'v1');
+    void submit('background', 'bg0');
+    void submit('background', 'old');
+    await vi.waitFor(() => expect(started).toHaveLength(MAX_TOTAL_CONCURRENCY));
+
+    // 新的单词分析排在后面，但 old 已等待超过阈值
+    vi.setSystemTime(STARVATION_THRESHOLD_MS);
+    void submit('interactive', 'fresh');
+    await finish('v0');
+
+    expect(started[MAX_TOTAL_CONCURRENCY]).toBe('old');
+  });
+
+  it('按类别统计排队时间与总延迟分位数', async () => {
+    await Promise.all([1, 2, 3].map(() => dispatchAIRequest('interactive', async () => 'ok')));
+    await expect(dispatchAIRequest('visible', async () => { throw new Error('boom'); })).rejects.toThrow('boom');
+
+    const stats = getDispatchStats();
+    expect(stats.interactive).toMatchObject({ completed: 3, failed: 0, queued: 0, running: 0 });
+    expect(stats.visible).toMatchObject({ completed: 1, failed: 1 });
+    expect(stats.interactive.latency.p99).toBeGreaterThanOrEqual(stats.interactive.latency.p50);
+    expect(stats.background.latency).toEqual({ p50: 0, p90: 0, p99: 0 });
+  });
+});
@@ -0,0 +1,256 @@
+/**
+ * LingoRecall AI - AI Dispatch Queue
+ * Service Worker 内所有 AI 请求的统一优先级队列
+ *
+ * 优先级（高 → 低）：
+ *   - interactive：用户点击触发的单词分析
+ *   - visible：视口内的全页翻译批次
+ *   - background：视口外 / 空闲时补翻的批次
+ *
+ * 每个类别有独立的并发上限，翻译类别的上限之和小于总并发数，
+ * 全页翻译占满时仍给单词分析留有空位，点击不必排在翻译批次之后。
+ * 防饥饿：排队超过 STARVATION_THRESHOLD_MS 的请求不论类别按等待时间最久者优先派发。
+ *
+ * 每个类别记录最近 LATENCY_SAMPLE_SIZE 次请求的排队时间与总延迟，按 p50 / p90 / p99 汇报。
+ *
+ * @module services/aiDispatchQueue
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 请求优先级类别 */
+export type AIRequestClass = 'interactive' | 'visible' | 'background';
+
+/** 单个类别的延迟分位数（毫秒） */
+export interface LatencyPercentiles {
+  p50: number;
+  p90: number;
+  p99: number;
+}
+
+/** 单个类别的队列统计 */
+export interface DispatchClassStats {
+  /** 排队中的请求数 */
+  queued: number;
+  /** 执行中的请求数 */
+  running: number;
+  /** 已完成（含失败）的请求数 */
+  completed: number;
+  /** 失败的请求数 */
+  failed: number;
+  /** 排队时间分位数 */
+  wait: LatencyPercentiles;
+  /** 排队 + 执行的总延迟分位数 */
+  latency: LatencyPercentiles;
+}
+
+interface QueuedRequest {
+  requestClass: AIRequestClass;
+  enqueuedAt: number;
+  start: () => void;
+}
+
+interface ClassState {
+  queue: QueuedRequest[];
+  running: number;
+  completed: number;
+  failed: number;
+  /** 环形缓冲：排队时间 */
+  waitSamples: number[];
+  /** 环形缓冲：总延迟 */
+  latencySamples: number[];
+  nextSample: number;
+}
+
+// ============================================================
+// Constants
+// ============================================================
+
+/** 派发顺序（优先级从高到低） */
+export const AI_REQUEST_CLASSES: readonly AIRequestClass[] = ['interactive', 'visible', 'background'];
+
+/** 各类别的并发上限 */
+export const CLASS_CONCURRENCY: Readonly<Record<AIRequestClass, number>> = Object.freeze({
+  interactive: 4,
+  visible: 3,
+  background: 2,
+});
+
+/** 总并发上限（visible + background 最多占 5 个，至少留 1 个给 interactive） */
+export const MAX_TOTAL_CONCURRENCY = 6;
+
+/** 排队超过该时间的请求按等待时间优先派发 */
+export const STARVATION_THRESHOLD_MS = 15_000;
+
+/** 每个类别保留的延迟样本数 */
+const LATENCY_SAMPLE_SIZE = 200;
+
+/** 每完成多少个请求输出一次分位数日志 */
+const STATS_LOG_INTERVAL = 20;
+
+// ============================================================
+// State
+// ============================================================
+
+function createClassState(): ClassState {
+  return { queue: [], running: 0, completed: 0, failed: 0, waitSamples: [], latencySamples: [], nextSample: 0 };
+}
+
+let classes: Record<AIRequestClass, ClassState> = {
+  interactive: createClassState(),
+  visible: createClassState(),
+  background: createClassState(),
+};
+
+let totalRunning = 0;
+
+// ============================================================
+// Scheduling
+// ============================================================
+
+/**
+ * 选出下一个可派发的请求
+ * 先看有没有饿太久的请求（取等待最久者），否则按优先级取第一个未达上限的类别
+ */
+function pickNext(now: number): QueuedRequest | null {
+  let starved: QueuedRequest | null = null;
+  let preferred: QueuedRequest | null = null;
+
+  for (const requestClass of AI_REQUEST_CLASSES) {
+    const state = classes[requestClass];
+    const head = state.queue[0];
+    if (!head || state.running >= CLASS_CONCURRENCY[requestClass]) {
+      continue;
+    }
+    preferred ??= head;
+    if (now - head.enqueuedAt >= STARVATION_THRESHOLD_MS && (!starved || head.enqueuedAt < starved.enqueuedAt)) {
+      starved = head;
+    }
+  }
+
+  return starved ?? preferred;
+}
+
+/**
+ * 在总并发与类别上限允许的范围内派发请求
+ */
+function pump(): void {
+  while (totalRunning < MAX_TOTAL_CONCURRENCY) {
+    const next = pickNext(Date.now());
+    if (!next) {
+      return;
+    }
+    const state = classes[next.requestClass];
+    state.queue.shift();
+    state.running++;
+    totalRunning++;
+    next.start();
+  }
+}
+
+function recordSample(state: ClassState, waitMs: number, latencyMs: number): void {
+  const slot = state.nextSample % LATENCY_SAMPLE_SIZE;
+  state.waitSamples[slot] = waitMs;
+  state.latencySamples[slot] = latencyMs;
+  state.nextSample++;
+}
+
+function percentiles(samples: number[]): LatencyPercentiles {
+  if (samples.length === 0) {
+    return { p50: 0, p90: 0, p99: 0 };
+  }
+  const sorted = [...samples].sort((a, b) => a - b);
+  const at = (p: number) => sorted[Math.min(sorted.length - 1, Math.ceil(p * sorted.length) - 1)];
+  return { p50: at(0.5), p90: at(0.9), p99: at(0.99) };
+}
+
+// ============================================================
+// Public API
+// ============================================================
+
+/**
+ * 通过优先级队列执行一次 AI 请求
+ *
+ * @param requestClass 优先级类别
+ * @param run 实际请求（派发时才调用，限流额度也在此时才预扣）
+ * @returns run 的结果
+ */
+export function dispatchAIRequest<T>(requestClass: AIRequestClass, run: () => Promise<T>): Promise<T> {
+  const state = classes[requestClass];
+  const enqueuedAt = Date.now();
+
+  return new Promise<T>((resolve, reject) => {
+    const start = () => {
+      const startedAt = Date.now();
+      let failed = false;
+
+      Promise.resolve()
+        .then(run)
+        .then(resolve, (error: unknown) => {
+          failed = true;
+          reject(error);
+        })
+        .finally(() => {
+          // 队列被重置后，之前发出的请求不再计入新的状态
+          if (classes[requestClass] === state) {
+            state.running--;
+            totalRunning--;
+            state.completed++;
+            if (failed) {
+              state.failed++;
+            }
+            recordSample(state, startedAt - enqueuedAt, Date.now() - enqueuedAt);
+            if (state.completed % STATS_LOG_INTERVAL === 0) {
+              logClassStats(requestClass);
+            }
+          }
+          pump();
+        });
+    };
+
+    state.queue.push({ requestClass, enqueuedAt, start });
+    pump();
+  });
+}
+
+/**
+ * 获取各类别的队列统计与延迟分位数
+ */
+export function getDispatchStats(): Record<AIRequestClass, DispatchClassStats> {
+  const stats = {} as Record<AIRequestClass, DispatchClassStats>;
+  for (const requestClass of AI_REQUEST_CLASSES) {
+    const state = classes[requestClass];
+    stats[requestClass] = {
+      queued: state.queue.length,
+      running: state.running,
+      completed: state.completed,
+      failed: state.failed,
+      wait: percentiles(state.waitSamples),
+      latency: percentiles(state.latencySamples),
+    };
+  }
+  return stats;
+}
+
+function logClassStats(requestClass: AIRequestClass): void {
+  const { completed, failed, wait, latency } = getDispatchStats()[requestClass];
+  console.log(
+    `[LingoRecall AI] Dispatch ${requestClass}: ${completed} done (${failed} failed), ` +
+    `wait p50/p90/p99 ${wait.p50}/${wait.p90}/${wait.p99}ms, ` +
+    `latency p50/p90/p99 ${latency.p50}/${latency.p90}/${latency.p99}ms`
+  );
+}
+
+/**
+ * 重置队列状态（测试用；执行中的请求不受影响）
+ */
+export function resetDispatchQueue(): void {
+  classes = {
+    interactive: createClassState(),
+    visible: createClassState(),
+    background: createClassState(),
+  };
+  totalRunning = 0;
+}
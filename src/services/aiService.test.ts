@@ -0,0 +1,393 @@
+/**
+ * LingoRecall AI - Unified AI Service Tests
+ * 并发去重（single-flight）、词库查询、流式分析、流式批量翻译与对冲请求测试
+ *
+ * @module services/aiService.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+vi.mock('./geminiService', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('./geminiService')>();
+  return { ...actual, analyzeWord: vi.fn(), translateBatchGemini: vi.fn() };
+});
+
+import { analyzeWord, translateBatchGemini } from './geminiService';
+import type { AIAnalysisResult } from './geminiService';
+import {
+  analyzeWordUnified,
+  translateBatchUnified,
+  getInFlightStats,
+  getHedgeStats,
+  type AIServiceConfig,
+} from './aiService';
+import { clearCache, warmupCache, __test__ as cacheTest } from './analysisCache';
+import { resetRateLimiter } from './rateLimiter';
+import { getProviderHealth, recordProviderFailure, recordProviderSuccess, resetProviderHealth } from './providerHealth';
+import { deleteDatabase, closeDatabase } from '../shared/storage/db';
+import { saveWord } from '../shared/storage/wordService';
+
+const CONFIG: AIServiceConfig = { provider: 'gemini', apiKey: 'test-key' };
+
+const RESULT: AIAnalysisResult = {
+  meaning: '雄辩的',
+  pronunciation: '/ˈeləkwənt/',
+  partOfSpeech: 'adjective',
+  usage: 'Used to describe persuasive speech.',
+  mode: 'word',
+};
+
+function request(text: string) {
+  return { text, context: '', url: '', xpath: '', targetLanguage: 'zh-CN' as const };
+}
+
+describe('analyzeWordUnified in-flight deduplication', () => {
+  beforeEach(async () => {
+    cacheTest.simulateWorkerRestart();
+    await deleteDatabase();
+    await clearCache();
+    resetRateLimiter();
+    vi.mocked(analyzeWord).mockReset();
+  });
+
+  afterEach(async () => {
+    await warmupCache();
+    closeDatabase();
+  });
+
+  it('shares one provider call among concurrent identical requests', async () => {
+    let resolveCall!: (value: AIAnalysisResult) => void;
+    vi.mocked(analyzeWord).mockImplementation(
+      () => new Promise((resolve) => { resolveCall = resolve; })
+    );
+    const before = getInFlightStats().coalesced;
+
+    const calls = [
+      analyzeWordUnified(request('eloquent'), CONFIG),
+      analyzeWordUnified(request('Eloquent'), CONFIG),
+      analyzeWordUnified(request(' eloquent '), CONFIG),
+    ];
+    await vi.waitFor(() => expect(analyzeWord).toHaveBeenCalledTimes(1));
+    resolveCall(RESULT);
+
+    await expect(Promise.all(calls)).resolves.toEqual([RESULT, RESULT, RESULT]);
+    expect(analyzeWord).toHaveBeenCalledTimes(1);
+    expect(getInFlightStats().coalesced - before).toBe(2);
+    expect(getInFlightStats().inFlight).toBe(0);
+  });
+
+  it('propagates failures to every waiter and allows a retry afterwards', async () => {
+    let rejectCall!: (error: Error) => void;
+    vi.mocked(analyzeWord).mockImplementationOnce(
+      () => new Promise((_, reject) => { rejectCall = reject; })
+    );
+
+    const first = analyzeWordUnified(request('fleeting'), CONFIG);
+    const second = analyzeWordUnified(request('fleeting'), CONFIG);
+    await vi.waitFor(() => expect(analyzeWord).toHaveBeenCalledTimes(1));
+    rejectCall(new Error('NETWORK_ERROR'));
+
+    await expect(first).rejects.toThrow('NETWORK_ERROR');
+    await expect(second).rejects.toThrow('NETWORK_ERROR');
+
+    vi.mocked(analyzeWord).mockResolvedValueOnce(RESULT);
+    await expect(analyzeWordUnified(request('fleeting'), CONFIG)).resolves.toEqual(RESULT);
+    expect(analyzeWord).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe('analyzeWordUnified vocabulary lookup', () => {
+  beforeEach(async () => {
+    cacheTest.simulateWorkerRestart();
+    await deleteDatabase();
+    await clearCache();
+    resetRateLimiter();
+    vi.mocked(analyzeWord).mockReset();
+    await saveWord({
+      text: 'eloquent',
+      meaning: '雄辩的；有说服力的',
+      pronunciation: '/ˈeləkwənt/',
+      partOfSpeech: 'adj.',
+      exampleSentence: '',
+      sourceUrl: 'https://example.com',
+      sourceTitle: '',
+      xpath: '/html/body/p[1]',
+      textOffset: 0,
+      contextBefore: '',
+      contextAfter: '',
+    });
+  });
+
+  afterEach(async () => {
+    await warmupCache();
+    closeDatabase();
+  });
+
+  it('answers a saved word without calling the provider', async () => {
+    const result = await analyzeWordUnified(request('Eloquent'), CONFIG);
+
+    expect(result).toMatchObject({ meaning: '雄辩的；有说服力的', pronunciation: '/ˈeləkwənt/', usage: '' });
+    expect(analyzeWord).not.toHaveBeenCalled();
+  });
+
+  it('refreshes the saved analysis in the background when enabled', async () => {
+    vi.mocked(analyzeWord).mockResolvedValue(RESULT);
+    const config: AIServiceConfig = { ...CONFIG, refreshSavedAnalyses: true };
+
+    const saved = await analyzeWordUnified(request('eloquent'), config);
+    expect(saved.meaning).toBe('雄辩的；有说服力的');
+
+    await vi.waitFor(() => expect(getInFlightStats().inFlight).toBe(0));
+    expect(analyzeWord).toHaveBeenCalledTimes(1);
+    await expect(analyzeWordUnified(request('eloquent'), config)).resolves.toEqual(RESULT);
+    expect(analyzeWord).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe('analyzeWordUnified streaming', () => {
+  beforeEach(async () => {
+    cacheTest.simulateWorkerRestart();
+    await deleteDatabase();
+    await clearCache();
+    resetRateLimiter();
+    vi.mocked(analyzeWord).mockReset();
+  });
+
+  afterEach(async () => {
+    await warmupCache();
+    closeDatabase();
+  });
+
+  it('pushes meaning before the rest of the fields arrive', async () => {
+    const chunks = ['```json\n{"meaning": "雄', '辩的", "pronunciation": "/ˈel', 'əkwənt/", "partOfSpeech": "adjective"}'];
+    vi.mocked(analyzeWord).mockImplementation(async (_request, _apiKey, _model, onChunk) => {
+      chunks.forEach((chunk) => onChunk?.(chunk));
+      return RESULT;
+    });
+    const partials: unknown[] = [];
+
+    await expect(
+      analyzeWordUnified(request('eloquent'), CONFIG, (partial) => partials.push(partial))
+    ).resolves.toEqual(RESULT);
+
+    expect(partials[0]).toEqual({ meaning: '雄' });
+    expect(partials[1]).toEqual({ meaning: '雄辩的', pronunciation: '/ˈel' });
+    expect(partials[partials.length - 1]).toEqual({
+      meaning: '雄辩的',
+      pronunciation: '/ˈeləkwənt/',
+      partOfSpeech: 'adjective',
+    });
+  });
+
+  it('replays the latest partial to a coalesced subscriber', async () => {
+    let finish!: () => void;
+    vi.mocked(analyzeWord).mockImplementation((_request, _apiKey, _model, onChunk) => {
+      onChunk?.('{"meaning": "短暂的"');
+      return new Promise((resolve) => { finish = () => resolve(RESULT); });
+    });
+
+    const first = analyzeWordUnified(request('fleeting'), CONFIG, () => {});
+    await vi.waitFor(() => expect(analyzeWord).toHaveBeenCalledTimes(1));
+
+    const late = vi.fn();
+    const second = analyzeWordUnified(request('fleeting'), CONFIG, late);
+    await vi.waitFor(() => expect(late).toHaveBeenCalledWith({ meaning: '短暂的' }));
+
+    finish();
+    await expect(Promise.all([first, second])).resolves.toEqual([RESULT, RESULT]);
+  });
+});
+
+describe('translateBatchUnified streaming', () => {
+  beforeEach(() => {
+    resetRateLimiter();
+    vi.mocked(translateBatchGemini).mockReset();
+  });
+
+  it('emits each translated segment as soon as it is complete', async () => {
+    vi.mocked(translateBatchGemini).mockImplementation(
+      async (_texts, _lang, _key, _model, _maxTokens, onChunk) => {
+        onChunk?.('{"1": "你');
+        onChunk?.('好", "2": "", "3": "世界", "4": "多余');
+        onChunk?.('"}');
+        return ['你好', 'Hi', '世界'];
+      }
+    );
+    const segments: Array<[number, string]> = [];
+
+    const result = await translateBatchUnified(
+      ['Hello', 'Hi', 'World'],
+      'zh-CN',
+      CONFIG,
+      (index, translation) => segments.push([index, translation])
+    );
+
+    // 空译文与未知编号不推送
+    expect(segments).toEqual([[0, '你好'], [2, '世界']]);
+    expect(result).toEqual(['你好', 'Hi', '世界']);
+  });
+
+  it('does not request streaming without a segment callback', async () => {
+    vi.mocked(translateBatchGemini).mockResolvedValue(['你好']);
+
+    await translateBatchUnified(['Hello'], 'zh-CN', CONFIG);
+
+    expect(vi.mocked(translateBatchGemini).mock.calls[0][5]).toBeUndefined();
+  });
+
+  it('re-requests only the missing items', async () => {
+    vi.mocked(translateBatchGemini)
+      .mockResolvedValueOnce(['你好', null, '世界', null])
+      .mockResolvedValueOnce(['嗨', null]);
+
+    const result = await translateBatchUnified(['Hello', 'Hi', 'World', 'Hey'], 'zh-CN', CONFIG);
+
+    expect(vi.mocked(translateBatchGemini).mock.calls[1][0]).toEqual(['Hi', 'Hey']);
+    // 补翻后仍缺失的条目回退原文
+    expect(result).toEqual(['你好', '嗨', '世界', 'Hey']);
+  });
+
+  it('streams repaired items under their original indices', async () => {
+    vi.mocked(translateBatchGemini)
+      .mockResolvedValueOnce(['你好', null])
+      .mockImplementationOnce(async (_texts, _lang, _key, _model, _maxTokens, onChunk) => {
+        onChunk?.('{"1": "世界"}');
+        return ['世界'];
+      });
+    const segments: Array<[number, string]> = [];
+
+    await translateBatchUnified(['Hello', 'World'], 'zh-CN', CONFIG, (index, translation) =>
+      segments.push([index, translation])
+    );
+
+    expect(segments).toEqual([[1, '世界']]);
+  });
+});
+
+describe('analyzeWordUnified hedging and failover', () => {
+  const PRIMARY_ENDPOINT = 'http://127.0.0.1:8080/v1/chat/completions';
+  const FALLBACK_ENDPOINT = 'http://127.0.0.1:11434';
+  const HEDGED: AIServiceConfig = {
+    provider: 'openai-compatible',
+    apiKey: 'test-key',
+    customEndpoint: PRIMARY_ENDPOINT,
+    fallback: {
+      provider: 'localhost',
+      apiKey: '',
+      localModelConfig: { tool: 'ollama', endpoint: FALLBACK_ENDPOINT, modelName: 'llama3.2' },
+    },
+  };
+  const PRIMARY = 'openai-compatible/gpt-4';
+
+  interface StubRoute {
+    delayMs?: number;
+    status?: number;
+    meaning?: string;
+  }
+
+  /** 本地桩服务：按端点前缀返回 OpenAI 兼容响应，支持延迟、错误状态与取消 */
+  function stubServers(routes: Record<string, StubRoute>) {
+    const fetchMock = vi.fn((url: string, init?: RequestInit) => new Promise((resolve, reject) => {
+      const route = Object.entries(routes).find(([prefix]) => url.startsWith(prefix))?.[1];
+      if (!route) {
+        reject(new TypeError('Failed to fetch'));
+        return;
+      }
+      const status = route.status ?? 200;
+      const timer = setTimeout(() => resolve({
+        ok: status < 400,
+        status,
+        headers: { get: () => 'application/json' },
+        text: async () => 'stub error',
+        json: async () => ({ choices: [{ message: { content: JSON.stringify({ meaning: route.meaning }) } }] }),
+      }), route.delayMs ?? 0);
+      init?.signal?.addEventListener('abort', () => {
+        clearTimeout(timer);
+        reject(new DOMException('The operation was aborted.', 'AbortError'));
+      });
+    }));
+    vi.stubGlobal('fetch', fetchMock);
+    return fetchMock;
+  }
+
+  beforeEach(async () => {
+    cacheTest.simulateWorkerRestart();
+    await deleteDatabase();
+    await clearCache();
+    resetRateLimiter();
+    resetProviderHealth();
+  });
+
+  afterEach(async () => {
+    vi.unstubAllGlobals();
+    await warmupCache();
+    closeDatabase();
+  });
+
+  it('hedges to the fallback after the primary p90 latency and cancels the loser', async () => {
+    for (let i = 0; i < 5; i++) {
+      recordProviderSuccess(PRIMARY, 10);
+    }
+    const fetchMock = stubServers({
+      [PRIMARY_ENDPOINT]: { delayMs: 10_000, meaning: '主' },
+      [FALLBACK_ENDPOINT]: { meaning: '备' },
+    });
+    const before = getHedgeStats();
+
+    const result = await analyzeWordUnified(request('hedged'), HEDGED);
+
+    expect(result.meaning).toBe('备');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect((fetchMock.mock.calls[0][1] as RequestInit).signal!.aborted).toBe(true);
+    expect(getHedgeStats().won - before.won).toBe(1);
+    // 被取消的一方不计入失败
+    expect(getProviderHealth(PRIMARY).failures).toBe(0);
+  });
+
+  it('fails over immediately when the primary errors', async () => {
+    stubServers({
+      [PRIMARY_ENDPOINT]: { status: 500 },
+      [FALLBACK_ENDPOINT]: { meaning: '备' },
+    });
+    const startedAt = performance.now();
+
+    const result = await analyzeWordUnified(request('failover'), HEDGED);
+
+    expect(result.meaning).toBe('备');
+    expect(performance.now() - startedAt).toBeLessThan(1000);
+    expect(getProviderHealth(PRIMARY).failures).toBe(1);
+  });
+
+  it('does not hedge when the primary answers in time', async () => {
+    const fetchMock = stubServers({
+      [PRIMARY_ENDPOINT]: { meaning: '主' },
+      [FALLBACK_ENDPOINT]: { meaning: '备' },
+    });
+
+    await expect(analyzeWordUnified(request('prompt'), HEDGED)).resolves.toMatchObject({ meaning: '主' });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('sends requests to the fallback first while the primary is bypassed', async () => {
+    recordProviderFailure(PRIMARY);
+    recordProviderFailure(PRIMARY);
+    recordProviderFailure(PRIMARY);
+    const fetchMock = stubServers({
+      [PRIMARY_ENDPOINT]: { meaning: '主' },
+      [FALLBACK_ENDPOINT]: { meaning: '备' },
+    });
+
+    await expect(analyzeWordUnified(request('bypassed'), HEDGED)).resolves.toMatchObject({ meaning: '备' });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock.mock.calls[0][0]).toContain(FALLBACK_ENDPOINT);
+  });
+
+  it('rejects with the primary error when both providers fail', async () => {
+    stubServers({
+      [PRIMARY_ENDPOINT]: { status: 404 },
+      [FALLBACK_ENDPOINT]: { status: 500 },
+    });
+
+    await expect(analyzeWordUnified(request('broken'), HEDGED)).rejects.toThrow('ENDPOINT_NOT_FOUND');
+  });
+});
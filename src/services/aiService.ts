@@ -3,18 +3,38 @@
  * 统一的 AI 服务接口，支持多种 Provider
  *
  * 性能优化：
- * 1. 内存缓存 - 减少重复 API 调用
+ * 1. 两级缓存（内存 + IndexedDB）- 减少重复 API 调用，Worker 重启后仍可命中
  * 2. 配置缓存 - 避免每次请求读取 storage
+ * 3. 并发去重（single-flight）- 多个 frame/标签页同时分析同一文本时只发起一次 API 调用
+ * 4. 流式分析 - meaning 一出现就推送给调用方，音标/用法随后补齐，缩短首字可见时间
+ * 5. 流式批量翻译 - 按编号键的 JSON 对象中每条译文一结束就推送，页面可逐段应用而不必等整批完成
+ * 6. 按 Provider + 端点 + 模型的 RPM / TPM 令牌桶限流 - 并发批次在额度内同时放行
+ * 7. 优先级派发队列 - 单词分析优先于全页翻译批次，视口内批次优先于视口外批次
+ * 8. 对冲请求与故障切换 - 主 Provider 超过其 p90 延迟未返回或失败时请求备用 Provider，先返回者胜出
+ * 9. 结构化输出 - 按 Schema 约束响应，批量翻译按编号键挽救部分有效的响应，只补翻缺失的条目
+ * 10. 词库即缓存 - 缓存未命中时先查用户保存的词汇，已保存的单词直接返回保存的释义（可选后台刷新）
  *
  * @module services/aiService
  */
 
-import type { Settings, AIProviderType, TargetLanguage, LocalModelConfig } from '../shared/types/settings';
+import type {
+  Settings,
+  AIProviderType,
+  TargetLanguage,
+  LocalModelConfig,
+  BatchTokenBudget,
+  ProviderRateLimit,
+} from '../shared/types/settings';
+import { DEFAULT_BATCH_TOKEN_BUDGETS } from '../shared/types/settings';
 import { analyzeWord as analyzeWordGemini, type AIAnalysisResult, type AnalyzeWordRequest, type AnalysisMode } from './geminiService';
 import { analyzeWordOpenAI, translateBatchOpenAI } from './openaiCompatibleService';
-import { getCachedAnalysis, setCachedAnalysis, getCacheStats } from './analysisCache';
+import { getCachedAnalysis, getSavedAnalysis, setCachedAnalysis, getCacheStats, generateCacheKey } from './analysisCache';
 import { translateBatchGemini } from './geminiService';
-import { checkRateLimit } from './rateLimiter';
+import { configureRateLimit, estimateRequestTokens, getLimiterKey, isCancelledError, withRateLimit } from './rateLimiter';
+import { dispatchAIRequest, type AIRequestClass } from './aiDispatchQueue';
+import { getHedgeDelay, isProviderBypassed, recordProviderFailure, recordProviderSuccess } from './providerHealth';
+import { createPartialJsonParser } from '../shared/utils/partialJson';
+import { getBatchItemKeys } from './promptTemplates';
 
 export type { AIAnalysisResult, AnalyzeWordRequest, AnalysisMode };
 
@@ -32,6 +52,14 @@ export interface AIServiceConfig {
   customModel?: string;
   /** 本地模型配置 */
   localModelConfig?: LocalModelConfig;
+  /** 全页翻译的 token 预算（决定批量翻译的 max_tokens） */
+  batchTokenBudget?: BatchTokenBudget;
+  /** 请求速率额度（RPM / TPM），缺省使用 Provider 默认值 */
+  rateLimit?: ProviderRateLimit;
+  /** 单词分析的备用 Provider（对冲请求与故障切换），不设置时只请求主 Provider */
+  fallback?: AIServiceConfig;
+  /** 命中词库后是否在后台重新请求 AI，刷新缓存中的分析结果 */
+  refreshSavedAnalyses?: boolean;
 }
 
 /**
@@ -45,87 +73,506 @@ export function buildAIConfig(settings: Settings, apiKey: string): AIServiceConf
     customEndpoint: settings.customApiEndpoint,
     customModel: settings.customModelName,
     localModelConfig: settings.localModelConfig,
+    batchTokenBudget: settings.batchTokenBudgets?.[settings.aiProvider],
+    rateLimit: settings.rateLimits?.[settings.aiProvider],
+    fallback: buildFallbackConfig(settings),
+    refreshSavedAnalyses: settings.refreshSavedAnalyses,
   };
 }
 
 /**
- * 统一的单词分析接口（带缓存）
+ * 用 providerConfigs 中保存的本地模型配置构建备用 Provider
+ * 备用 Provider 不携带 API Key（存储中的 Key 属于主 Provider）；
+ * 未启用、与主 Provider 相同或未配置端点时返回 undefined
+ */
+function buildFallbackConfig(settings: Settings): AIServiceConfig | undefined {
+  if (settings.fallbackProvider !== 'localhost' || settings.aiProvider === 'localhost') {
+    return undefined;
+  }
+
+  const local = settings.providerConfigs?.localhost;
+  if (!local?.endpoint) {
+    return undefined;
+  }
+
+  return {
+    provider: 'localhost',
+    apiKey: '',
+    localModelConfig: local,
+    batchTokenBudget: settings.batchTokenBudgets?.localhost,
+    rateLimit: settings.rateLimits?.localhost,
+  };
+}
+
+/** 系统提示词的字符数估算（用于 TPM 预扣） */
+const PROMPT_OVERHEAD_CHARS = 1200;
+
+/** 批量翻译响应缺失条目时的补翻轮数 */
+const BATCH_REPAIR_ROUNDS = 1;
+
+/**
+ * 获取当前配置实际使用的模型标识（provider + model）
+ * 用于区分不同模型产生的缓存译文
+ */
+export function getModelIdentity(config: AIServiceConfig): string {
+  switch (config.provider) {
+    case 'gemini':
+      return `gemini/${config.geminiModel || 'default'}`;
+    case 'localhost':
+      return `localhost/${config.localModelConfig?.modelName || 'llama3.2'}`;
+    case 'openai-compatible':
+      return `openai-compatible/${config.customModel || 'gpt-4'}`;
+    default:
+      return String(config.provider);
+  }
+}
+
+// ============================================================
+// In-flight Deduplication
+// ============================================================
+
+/** 流式分析的中间结果（只包含已到达的字段） */
+export type AnalysisPartial = Partial<Pick<AIAnalysisResult, 'meaning' | 'pronunciation' | 'partOfSpeech' | 'usage'>>;
+
+/** 流式中间结果回调 */
+export type AnalysisPartialCallback = (partial: AnalysisPartial) => void;
+
+/**
+ * 批量翻译流式回调
+ * 某条译文在响应中完整出现时调用；最终结果以 translateBatchUnified 的返回值为准
+ */
+export type BatchSegmentCallback = (index: number, translation: string) => void;
+
+/** 中间结果的订阅状态 */
+interface PartialStream {
+  /** 订阅中间结果的调用方（发起者 + 被合并的请求） */
+  listeners: Set<AnalysisPartialCallback>;
+  /** 最近一次中间结果，晚加入的订阅者先收到它 */
+  latest: AnalysisPartial | null;
+}
+
+/** 进行中的分析请求 */
+interface InFlightAnalysis {
+  promise: Promise<AIAnalysisResult>;
+  stream: PartialStream;
+}
+
+/**
+ * 进行中的分析请求（键与缓存键一致）
+ * 相同请求并发到达时共享同一个 Promise，只占用一次 API 调用和一个限流名额
+ */
+const inFlightAnalyses = new Map<string, InFlightAnalysis>();
+
+/** 被合并（未实际调用 API）的请求数 */
+let coalescedCount = 0;
+
+/**
+ * 获取并发去重统计
+ */
+export function getInFlightStats(): { inFlight: number; coalesced: number } {
+  return { inFlight: inFlightAnalyses.size, coalesced: coalescedCount };
+}
+
+/** 发起过对冲请求的分析数 */
+let hedgedCount = 0;
+
+/** 由备用 Provider 胜出的分析数 */
+let hedgeWinCount = 0;
+
+/**
+ * 获取对冲请求统计
+ */
+export function getHedgeStats(): { hedged: number; won: number } {
+  return { hedged: hedgedCount, won: hedgeWinCount };
+}
+
+/**
+ * 统一的单词分析接口（带缓存、词库查询与并发去重）
  *
  * @param request - 分析请求
  * @param config - AI 配置
+ * @param onPartial - 可选：以流式请求 Provider，meaning 出现后每次字段变化都回调
  * @returns AI 分析结果
  */
 export async function analyzeWordUnified(
   request: AnalyzeWordRequest,
-  config: AIServiceConfig
+  config: AIServiceConfig,
+  onPartial?: AnalysisPartialCallback
 ): Promise<AIAnalysisResult> {
   const startTime = performance.now();
   const mode = request.mode || 'word';
+  const targetLanguage = request.targetLanguage || 'zh-CN';
 
-  // 1. 检查缓存
-  const cached = getCachedAnalysis(request.text, mode);
+  // 1. 检查缓存（L1 内存 → L2 IndexedDB）
+  const cached = await getCachedAnalysis(request.text, mode, targetLanguage);
   if (cached) {
     const elapsed = performance.now() - startTime;
     console.log(`[LingoRecall AI] Cache hit in ${elapsed.toFixed(1)}ms`);
     return cached;
   }
 
-  // 2. 快速失败门控：对 Gemini provider 检查速率限制器
-  if (config.provider === 'gemini') {
-    const rateLimitCheck = checkRateLimit();
-    if (!rateLimitCheck.allowed) {
-      console.warn(`[LingoRecall AI] analyzeWordUnified blocked by rate limiter: ${rateLimitCheck.reason}`);
-      throw new Error(`${rateLimitCheck.reason}: Too many requests. Please try again later.`);
+  const key = generateCacheKey(request.text, mode, targetLanguage);
+
+  // 2. 用户保存过的单词直接返回保存的释义（仅单词模式）
+  const saved = await getSavedAnalysis(request.text, mode, targetLanguage);
+  if (saved) {
+    const elapsed = performance.now() - startTime;
+    const stats = getCacheStats();
+    console.log(
+      `[LingoRecall AI] Served from vocabulary in ${elapsed.toFixed(1)}ms ` +
+      `(${(stats.localRate * 100).toFixed(1)}% of analyses served locally)`
+    );
+    if (config.refreshSavedAnalyses) {
+      refreshSavedAnalysis(request, config, mode, targetLanguage, key);
     }
+    return saved;
   }
 
-  // 3. 调用 AI API
-  let result: AIAnalysisResult;
-
-  switch (config.provider) {
-    case 'gemini':
-      result = await analyzeWordGemini(request, config.apiKey, config.geminiModel);
-      break;
-
-    case 'localhost':
-      // 本地模型使用 OpenAI 兼容 API 格式
-      if (!config.localModelConfig?.endpoint) {
-        throw new Error('INVALID_CONFIG: Local model endpoint is required.');
+  // 3. 相同请求正在进行中，直接复用其结果
+  const inFlight = inFlightAnalyses.get(key);
+  if (inFlight) {
+    coalescedCount++;
+    console.log(`[LingoRecall AI] Coalesced with in-flight request (${coalescedCount} coalesced so far)`);
+    if (onPartial) {
+      inFlight.stream.listeners.add(onPartial);
+      if (inFlight.stream.latest) {
+        onPartial(inFlight.stream.latest);
       }
-      result = await analyzeWordOpenAI(
-        request,
-        '', // 本地模型不需要 API Key
-        config.localModelConfig.endpoint,
-        config.localModelConfig.modelName || 'llama3.2'
-      );
-      break;
+    }
+    return inFlight.promise;
+  }
 
-    case 'openai-compatible':
-      if (!config.customEndpoint) {
-        throw new Error('INVALID_CONFIG: Custom API endpoint is required for OpenAI-compatible provider.');
+  // 从 get 到 set 之间没有 await，保证同一键只会登记一次
+  const stream: PartialStream = {
+    listeners: new Set(onPartial ? [onPartial] : []),
+    latest: null,
+  };
+  const emit: AnalysisPartialCallback | undefined = onPartial
+    ? (partial) => {
+        stream.latest = partial;
+        stream.listeners.forEach((listener) => {
+          try {
+            listener(partial);
+          } catch (error) {
+            console.warn('[LingoRecall AI] Partial listener failed:', error);
+          }
+        });
       }
-      result = await analyzeWordOpenAI(
-        request,
-        config.apiKey,
-        config.customEndpoint,
-        config.customModel || 'gpt-4'
-      );
-      break;
+    : undefined;
+  // 被合并的请求不占用派发队列的名额
+  const pending = dispatchAIRequest('interactive', () =>
+    requestAnalysis(request, config, mode, targetLanguage, startTime, emit)
+  ).finally(() => {
+    inFlightAnalyses.delete(key);
+  });
+  inFlightAnalyses.set(key, { promise: pending, stream });
 
-    default:
-      throw new Error(`INVALID_PROVIDER: Unknown AI provider: ${config.provider}`);
+  return pending;
+}
+
+/**
+ * 命中词库后在后台重新请求 AI，结果写入缓存，之后的查询命中刷新后的结果
+ * 以后台优先级排队，不与交互请求争抢；同一键已有请求在进行时不重复发起
+ */
+function refreshSavedAnalysis(
+  request: AnalyzeWordRequest,
+  config: AIServiceConfig,
+  mode: AnalysisMode,
+  targetLanguage: string,
+  key: string
+): void {
+  if (inFlightAnalyses.has(key)) {
+    return;
   }
 
-  // 4. 缓存结果
-  setCachedAnalysis(request.text, result, mode);
+  const pending = dispatchAIRequest('background', () =>
+    requestAnalysis(request, config, mode, targetLanguage, performance.now())
+  ).finally(() => {
+    inFlightAnalyses.delete(key);
+  });
+  inFlightAnalyses.set(key, { promise: pending, stream: { listeners: new Set(), latest: null } });
+
+  pending.catch((error) => {
+    console.warn('[LingoRecall AI] Saved analysis refresh failed:', error);
+  });
+}
+
+/**
+ * 把 Provider 的流式文本转换为中间结果
+ * 增量解析 JSON，meaning 出现之前不推送；字段无变化的分片不推送
+ */
+function createStreamHandler(
+  mode: AnalysisMode,
+  startTime: number,
+  emit: AnalysisPartialCallback
+): (chunk: string) => void {
+  const parser = createPartialJsonParser();
+  const fieldNames = mode === 'translate'
+    ? (['meaning'] as const)
+    : (['meaning', 'pronunciation', 'partOfSpeech', 'usage'] as const);
+  let lastSnapshot = '';
+
+  return (chunk: string) => {
+    parser.push(chunk);
+    const fields = parser.getFields();
+    if (!fields.meaning) {
+      return;
+    }
+
+    const partial: AnalysisPartial = {};
+    fieldNames.forEach((field) => {
+      if (typeof fields[field] === 'string') {
+        partial[field] = fields[field];
+      }
+    });
+
+    const snapshot = JSON.stringify(partial);
+    if (snapshot === lastSnapshot) {
+      return;
+    }
+    if (!lastSnapshot) {
+      console.log(`[LingoRecall AI] First visible token in ${(performance.now() - startTime).toFixed(1)}ms`);
+    }
+    lastSnapshot = snapshot;
+    emit(partial);
+  };
+}
+
+/**
+ * 实际调用 AI Provider 并写入缓存
+ * 配置了备用 Provider 时走对冲请求，否则只请求主 Provider
+ */
+async function requestAnalysis(
+  request: AnalyzeWordRequest,
+  config: AIServiceConfig,
+  mode: AnalysisMode,
+  targetLanguage: string,
+  startTime: number,
+  emit?: AnalysisPartialCallback
+): Promise<AIAnalysisResult> {
+  const result = config.fallback
+    ? await hedgeAnalysis(request, orderByHealth(config, config.fallback), mode, startTime, emit)
+    : await callAnalysisProvider(request, config, mode, emit && createStreamHandler(mode, startTime, emit));
+
+  // 缓存结果（L2 异步写入，不阻塞返回）
+  void setCachedAnalysis(request.text, result, mode, targetLanguage);
 
   const elapsed = performance.now() - startTime;
   const stats = getCacheStats();
-  console.log(`[LingoRecall AI] API call in ${elapsed.toFixed(1)}ms (cache: ${stats.size} items, ${(stats.hitRate * 100).toFixed(1)}% hit rate)`);
+  console.log(
+    `[LingoRecall AI] API call in ${elapsed.toFixed(1)}ms (cache: ${stats.size} items, ` +
+    `${(stats.hitRate * 100).toFixed(1)}% hit rate, L1 ${stats.l1.hits} / L2 ${stats.l2.hits} / ` +
+    `vocabulary ${stats.vocabulary.hits} hits, ${(stats.localRate * 100).toFixed(1)}% served locally, ` +
+    `${coalescedCount} coalesced)`
+  );
 
   return result;
 }
 
+// ============================================================
+// Hedged Requests
+// ============================================================
+
+/**
+ * 按健康状态排列主备 Provider：主 Provider 正被绕过而备用 Provider 健康时交换顺序
+ */
+function orderByHealth(
+  primary: AIServiceConfig,
+  fallback: AIServiceConfig
+): [AIServiceConfig, AIServiceConfig] {
+  if (isProviderBypassed(getModelIdentity(primary)) && !isProviderBypassed(getModelIdentity(fallback))) {
+    return [fallback, primary];
+  }
+  return [primary, fallback];
+}
+
+/**
+ * 对冲请求
+ * 先请求 configs[0]；超过其 p90 延迟仍未开始输出时请求 configs[1]，configs[0] 失败时立即请求 configs[1]。
+ * 先成功者胜出并通过 AbortController 取消另一方；两者都失败时抛出 configs[0] 的错误。
+ * 正被绕过的 configs[1] 不参与定时对冲，只在 configs[0] 失败时兜底。
+ * 流式中间结果只转发给最先产出内容的一方，该方失败后由另一方接替。
+ */
+function hedgeAnalysis(
+  request: AnalyzeWordRequest,
+  configs: [AIServiceConfig, AIServiceConfig],
+  mode: AnalysisMode,
+  startTime: number,
+  emit?: AnalysisPartialCallback
+): Promise<AIAnalysisResult> {
+  return new Promise<AIAnalysisResult>((resolve, reject) => {
+    const controllers: AbortController[] = [];
+    const errors: unknown[] = [];
+    let running = 0;
+    let settled = false;
+    let streamOwner: number | null = null;
+    let hedgeTimer: ReturnType<typeof setTimeout> | null = null;
+
+    const cancelHedgeTimer = () => {
+      if (hedgeTimer) {
+        clearTimeout(hedgeTimer);
+        hedgeTimer = null;
+      }
+    };
+
+    const launch = (index: number) => {
+      if (settled || controllers[index]) {
+        return;
+      }
+      const controller = new AbortController();
+      controllers[index] = controller;
+      running++;
+      if (index > 0) {
+        hedgedCount++;
+        console.log(
+          `[LingoRecall AI] Hedging ${getModelIdentity(configs[0])} with ${getModelIdentity(configs[1])} ` +
+          `after ${(performance.now() - startTime).toFixed(0)}ms`
+        );
+      }
+
+      const handleChunk = emit && createStreamHandler(mode, startTime, (partial) => {
+        streamOwner ??= index;
+        if (streamOwner === index) {
+          emit(partial);
+        }
+      });
+      const onChunk = handleChunk && ((chunk: string) => {
+        // 主请求开始输出即视为已响应，不再对冲
+        if (index === 0) {
+          cancelHedgeTimer();
+        }
+        handleChunk(chunk);
+      });
+
+      callAnalysisProvider(request, configs[index], mode, onChunk, controller.signal).then(
+        (result) => {
+          running--;
+          if (settled) {
+            return;
+          }
+          settled = true;
+          cancelHedgeTimer();
+          controllers.forEach((other, otherIndex) => {
+            if (otherIndex !== index) {
+              other.abort();
+            }
+          });
+          if (index > 0) {
+            hedgeWinCount++;
+            console.log(`[LingoRecall AI] ${getModelIdentity(configs[index])} won (${hedgeWinCount}/${hedgedCount} hedges won)`);
+          }
+          resolve(result);
+        },
+        (error: unknown) => {
+          running--;
+          if (settled) {
+            return;
+          }
+          errors[index] = error;
+          if (streamOwner === index) {
+            streamOwner = null;
+          }
+          if (!controllers[1]) {
+            cancelHedgeTimer();
+            console.warn(`[LingoRecall AI] ${getModelIdentity(configs[0])} failed, failing over:`, error);
+            launch(1);
+            return;
+          }
+          if (running === 0) {
+            settled = true;
+            reject(errors[0] ?? error);
+          }
+        }
+      );
+    };
+
+    launch(0);
+    if (!isProviderBypassed(getModelIdentity(configs[1]))) {
+      hedgeTimer = setTimeout(() => {
+        hedgeTimer = null;
+        launch(1);
+      }, getHedgeDelay(getModelIdentity(configs[0])));
+    }
+  });
+}
+
+/**
+ * 调用单个 Provider 并记录其健康状态（被取消的请求不计入）
+ */
+async function callAnalysisProvider(
+  request: AnalyzeWordRequest,
+  config: AIServiceConfig,
+  mode: AnalysisMode,
+  onChunk?: (chunk: string) => void,
+  signal?: AbortSignal
+): Promise<AIAnalysisResult> {
+  const identity = getModelIdentity(config);
+  const attemptStart = performance.now();
+
+  // 应用当前额度；Gemini 在重试循环内逐次限流，其他 Provider 在这里限流
+  configureRateLimit(config.provider, config.rateLimit);
+  const estimatedTokens = estimateRequestTokens(
+    request.text.length + request.context.length + PROMPT_OVERHEAD_CHARS,
+    mode === 'translate' ? 1500 : 200
+  );
+
+  let result: AIAnalysisResult;
+
+  try {
+    switch (config.provider) {
+      case 'gemini':
+        result = await analyzeWordGemini(request, config.apiKey, config.geminiModel, onChunk, signal);
+        break;
+
+      case 'localhost':
+        // 本地模型使用 OpenAI 兼容 API 格式
+        if (!config.localModelConfig?.endpoint) {
+          throw new Error('INVALID_CONFIG: Local model endpoint is required.');
+        }
+        {
+          const { endpoint } = config.localModelConfig;
+          const modelName = config.localModelConfig.modelName || 'llama3.2';
+          result = await withRateLimit(getLimiterKey('localhost', endpoint, modelName), estimatedTokens, (settle) =>
+            analyzeWordOpenAI(
+              request,
+              '', // 本地模型不需要 API Key
+              endpoint,
+              modelName,
+              onChunk,
+              signal,
+              settle
+            )
+          );
+        }
+        break;
+
+      case 'openai-compatible':
+        if (!config.customEndpoint) {
+          throw new Error('INVALID_CONFIG: Custom API endpoint is required for OpenAI-compatible provider.');
+        }
+        {
+          const endpoint = config.customEndpoint;
+          const modelName = config.customModel || 'gpt-4';
+          result = await withRateLimit(getLimiterKey('openai-compatible', endpoint, modelName), estimatedTokens, (settle) =>
+            analyzeWordOpenAI(request, config.apiKey, endpoint, modelName, onChunk, signal, settle)
+          );
+        }
+        break;
+
+      default:
+        throw new Error(`INVALID_PROVIDER: Unknown AI provider: ${config.provider}`);
+    }
+  } catch (error) {
+    if (!isCancelledError(error)) {
+      recordProviderFailure(identity);
+    }
+    throw error;
+  }
+
+  recordProviderSuccess(identity, performance.now() - attemptStart);
+  return result;
+}
+
 /**
  * 统一的批量翻译接口
  * 用于全页翻译功能
@@ -133,70 +580,186 @@ export async function analyzeWordUnified(
  * @param texts - 待翻译的文本数组
  * @param targetLanguage - 目标翻译语言
  * @param config - AI 配置
+ * @param onSegment - 可选流式回调：每条译文生成完毕即回调，用于逐段应用到页面
+ * @param priority - 派发优先级：视口内批次为 'visible'，视口外 / 空闲补翻为 'background'
  * @returns 翻译后的文本数组
  */
 export async function translateBatchUnified(
   texts: string[],
   targetLanguage: TargetLanguage,
-  config: AIServiceConfig
+  config: AIServiceConfig,
+  onSegment?: BatchSegmentCallback,
+  priority: Exclude<AIRequestClass, 'interactive'> = 'visible'
 ): Promise<string[]> {
-  const startTime = performance.now();
-
   if (texts.length === 0) {
     return [];
   }
 
-  // 快速失败门控：对 Gemini provider 检查速率限制器
-  if (config.provider === 'gemini') {
-    const rateLimitCheck = checkRateLimit();
-    if (!rateLimitCheck.allowed) {
-      console.warn(`[LingoRecall AI] translateBatchUnified blocked by rate limiter: ${rateLimitCheck.reason}`);
-      throw new Error(`${rateLimitCheck.reason}: Too many requests. Please try again later.`);
+  return dispatchAIRequest(priority, () => requestBatchTranslation(texts, targetLanguage, config, onSegment));
+}
+
+/**
+ * 实际调用 AI Provider 批量翻译
+ * 响应按编号键解析，缺失的条目只补翻这些条目（最多 BATCH_REPAIR_ROUNDS 轮），仍缺失的回退原文
+ */
+async function requestBatchTranslation(
+  texts: string[],
+  targetLanguage: TargetLanguage,
+  config: AIServiceConfig,
+  onSegment?: BatchSegmentCallback
+): Promise<string[]> {
+  const startTime = performance.now();
+
+  const items = await callBatchProvider(
+    texts,
+    targetLanguage,
+    config,
+    onSegment && createBatchStreamHandler(texts.length, startTime, onSegment)
+  );
+
+  for (let round = 0; round < BATCH_REPAIR_ROUNDS; round++) {
+    const missing = items.flatMap((item, index) => (item === null ? [index] : []));
+    if (missing.length === 0) {
+      break;
     }
+
+    console.warn(`[LingoRecall AI] Batch translation missing ${missing.length}/${texts.length} items, re-requesting them`);
+    const repaired = await callBatchProvider(
+      missing.map((index) => texts[index]),
+      targetLanguage,
+      config,
+      onSegment && createBatchStreamHandler(missing.length, startTime, (index, translation) =>
+        onSegment(missing[index], translation)
+      )
+    );
+    repaired.forEach((item, index) => {
+      items[missing[index]] = item;
+    });
   }
 
-  let translations: string[];
+  const unresolved = items.filter((item) => item === null).length;
+  if (unresolved > 0) {
+    console.warn(`[LingoRecall AI] ${unresolved}/${texts.length} batch items still missing, keeping originals`);
+  }
+
+  const elapsed = performance.now() - startTime;
+  console.log(`[LingoRecall AI] Batch translation (${texts.length} texts) in ${elapsed.toFixed(1)}ms`);
+
+  return items.map((item, index) => item ?? texts[index]);
+}
+
+/**
+ * 调用 AI Provider 翻译一批文本
+ *
+ * @returns 逐条译文，缺失或为空的条目为 null
+ */
+async function callBatchProvider(
+  texts: string[],
+  targetLanguage: TargetLanguage,
+  config: AIServiceConfig,
+  onChunk?: (chunk: string) => void
+): Promise<Array<string | null>> {
+  // 应用当前额度；并发批次在 RPM / TPM 额度内同时放行
+  configureRateLimit(config.provider, config.rateLimit);
+
+  const maxOutputTokens = config.batchTokenBudget?.maxOutputTokens;
+  const estimatedTokens = estimateRequestTokens(
+    texts.reduce((sum, text) => sum + text.length, PROMPT_OVERHEAD_CHARS),
+    maxOutputTokens ?? DEFAULT_BATCH_TOKEN_BUDGETS[config.provider]?.maxOutputTokens ?? 0
+  );
 
   switch (config.provider) {
     case 'gemini':
-      translations = await translateBatchGemini(texts, targetLanguage, config.apiKey, config.geminiModel);
-      break;
+      return translateBatchGemini(
+        texts,
+        targetLanguage,
+        config.apiKey,
+        config.geminiModel,
+        maxOutputTokens,
+        onChunk
+      );
 
     case 'localhost':
       // 本地模型使用 OpenAI 兼容 API 格式
       if (!config.localModelConfig?.endpoint) {
         throw new Error('INVALID_CONFIG: Local model endpoint is required.');
       }
-      translations = await translateBatchOpenAI(
-        texts,
-        targetLanguage,
-        '', // 本地模型不需要 API Key
-        config.localModelConfig.endpoint,
-        config.localModelConfig.modelName || 'llama3.2'
-      );
-      break;
+      {
+        const { endpoint } = config.localModelConfig;
+        const modelName = config.localModelConfig.modelName || 'llama3.2';
+        return withRateLimit(getLimiterKey('localhost', endpoint, modelName), estimatedTokens, (settle) =>
+          translateBatchOpenAI(
+            texts,
+            targetLanguage,
+            '', // 本地模型不需要 API Key
+            endpoint,
+            modelName,
+            maxOutputTokens,
+            onChunk,
+            settle
+          )
+        );
+      }
 
     case 'openai-compatible':
       if (!config.customEndpoint) {
         throw new Error('INVALID_CONFIG: Custom API endpoint is required for OpenAI-compatible provider.');
       }
-      translations = await translateBatchOpenAI(
-        texts,
-        targetLanguage,
-        config.apiKey,
-        config.customEndpoint,
-        config.customModel || 'gpt-4'
-      );
-      break;
+      {
+        const endpoint = config.customEndpoint;
+        const modelName = config.customModel || 'gpt-4';
+        return withRateLimit(getLimiterKey('openai-compatible', endpoint, modelName), estimatedTokens, (settle) =>
+          translateBatchOpenAI(
+            texts,
+            targetLanguage,
+            config.apiKey,
+            endpoint,
+            modelName,
+            maxOutputTokens,
+            onChunk,
+            settle
+          )
+        );
+      }
 
     default:
       throw new Error(`INVALID_PROVIDER: Unknown AI provider: ${config.provider}`);
   }
+}
 
-  const elapsed = performance.now() - startTime;
-  console.log(`[LingoRecall AI] Batch translation (${texts.length} texts) in ${elapsed.toFixed(1)}ms`);
+/**
+ * 创建批量翻译流式处理器：把原始文本块解析为逐条译文
+ * 响应是按编号键的 JSON 对象，某个键的值完整结束即推送；未知键与空译文不推送（以最终结果为准）
+ */
+function createBatchStreamHandler(
+  expectedCount: number,
+  startTime: number,
+  emit: BatchSegmentCallback
+): (chunk: string) => void {
+  const parser = createPartialJsonParser();
+  const keys = getBatchItemKeys(expectedCount);
+  const pending = new Set(keys.map((_, index) => index));
+  let emittedCount = 0;
 
-  return translations;
+  return (chunk: string) => {
+    parser.push(chunk);
+    const fields = parser.getFields();
+    for (const index of pending) {
+      const key = keys[index];
+      if (!parser.isFieldComplete(key)) {
+        continue;
+      }
+      pending.delete(index);
+      if (!fields[key].trim()) {
+        continue;
+      }
+      if (emittedCount === 0) {
+        console.log(`[LingoRecall AI] First batch segment in ${(performance.now() - startTime).toFixed(1)}ms`);
+      }
+      emittedCount++;
+      emit(index, fields[key]);
+    }
+  };
 }
 
 /**
@@ -0,0 +1,195 @@
+/**
+ * LingoRecall AI - Analysis Cache Tests
+ * 两级缓存（L1 内存 + L2 IndexedDB）测试
+ *
+ * @module services/analysisCache.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { deleteDatabase, closeDatabase } from '../shared/storage/db';
+import { saveWord, updateWord, deleteWord } from '../shared/storage/wordService';
+import {
+  getCachedAnalysis,
+  getSavedAnalysis,
+  setCachedAnalysis,
+  clearCache,
+  getCacheStats,
+  warmupCache,
+  generateCacheKey,
+  __test__,
+} from './analysisCache';
+import type { AIAnalysisResult } from './geminiService';
+import type { SaveWordPayload } from '../shared/messaging/types';
+
+const RESULT: AIAnalysisResult = {
+  meaning: '雄辩的',
+  pronunciation: '/ˈeləkwənt/',
+  partOfSpeech: 'adjective',
+  usage: 'Used to describe persuasive speech.',
+  mode: 'word',
+};
+
+const SAVED_WORD: SaveWordPayload = {
+  text: 'Eloquent',
+  meaning: '雄辩的；有说服力的',
+  pronunciation: '/ˈeləkwənt/',
+  partOfSpeech: 'adj.',
+  exampleSentence: 'She gave an eloquent speech.',
+  sourceUrl: 'https://example.com/article',
+  sourceTitle: 'Example',
+  xpath: '/html/body/p[1]',
+  textOffset: 0,
+  contextBefore: 'She gave an ',
+  contextAfter: ' speech.',
+};
+
+async function saveTestWord(payload: Partial<SaveWordPayload> = {}): Promise<string> {
+  const result = await saveWord({ ...SAVED_WORD, ...payload });
+  return result.data!.id;
+}
+
+describe('analysisCache', () => {
+  beforeEach(async () => {
+    __test__.simulateWorkerRestart();
+    await deleteDatabase();
+    await clearCache();
+  });
+
+  afterEach(async () => {
+    // 等待后台预热结束，避免其持有的连接阻塞下一次 deleteDatabase
+    await warmupCache();
+    closeDatabase();
+    vi.restoreAllMocks();
+  });
+
+  it('keys entries by mode, target language and normalized text', () => {
+    expect(generateCacheKey('  Eloquent ', 'word', 'zh-CN')).toBe('word:zh-CN:eloquent');
+    expect(generateCacheKey('Eloquent', 'word', 'ja')).not.toBe(generateCacheKey('Eloquent', 'word', 'zh-CN'));
+    expect(generateCacheKey('Eloquent', 'translate', 'zh-CN')).not.toBe(generateCacheKey('Eloquent', 'word', 'zh-CN'));
+  });
+
+  it('serves repeated lookups from L1', async () => {
+    await setCachedAnalysis('eloquent', RESULT, 'word', 'zh-CN');
+
+    expect(await getCachedAnalysis('Eloquent', 'word', 'zh-CN')).toEqual(RESULT);
+
+    const stats = getCacheStats();
+    expect(stats.l1.hits).toBe(1);
+    expect(stats.l2.hits).toBe(0);
+  });
+
+  it('does not share entries across target languages', async () => {
+    await setCachedAnalysis('eloquent', RESULT, 'word', 'zh-CN');
+
+    expect(await getCachedAnalysis('eloquent', 'word', 'ja')).toBeNull();
+  });
+
+  it('survives a worker restart through L2 and promotes the entry to L1', async () => {
+    await setCachedAnalysis('eloquent', RESULT, 'word', 'zh-CN');
+    __test__.simulateWorkerRestart();
+
+    expect(await getCachedAnalysis('eloquent', 'word', 'zh-CN')).toEqual(RESULT);
+    expect(await getCachedAnalysis('eloquent', 'word', 'zh-CN')).toEqual(RESULT);
+
+    const stats = getCacheStats();
+    expect(stats.l2.hits).toBe(1);
+    expect(stats.l1.hits).toBe(1);
+    expect(stats.misses).toBe(0);
+  });
+
+  it('counts a miss in both tiers when nothing is cached', async () => {
+    expect(await getCachedAnalysis('unknown', 'word', 'zh-CN')).toBeNull();
+
+    const stats = getCacheStats();
+    expect(stats.l1.misses).toBe(1);
+    expect(stats.l2.misses).toBe(1);
+    expect(stats.hitRate).toBe(0);
+  });
+
+  it('treats expired L2 entries as misses', async () => {
+    const now = 1700000000000;
+    const spy = vi.spyOn(Date, 'now').mockReturnValue(now);
+    await setCachedAnalysis('eloquent', RESULT, 'word', 'zh-CN');
+    __test__.simulateWorkerRestart();
+
+    spy.mockReturnValue(now + 8 * 24 * 60 * 60 * 1000);
+    expect(await getCachedAnalysis('eloquent', 'word', 'zh-CN')).toBeNull();
+  });
+
+  it('hydrates L1 from L2 on warmup', async () => {
+    await setCachedAnalysis('eloquent', RESULT, 'word', 'zh-CN');
+    __test__.simulateWorkerRestart();
+
+    await warmupCache();
+
+    expect(getCacheStats().size).toBe(1);
+    expect(await getCachedAnalysis('eloquent', 'word', 'zh-CN')).toEqual(RESULT);
+    expect(getCacheStats().l1.hits).toBe(1);
+  });
+
+  describe('vocabulary', () => {
+    it('answers word analyses from a saved word and promotes it to L1', async () => {
+      await saveTestWord();
+
+      expect(await getCachedAnalysis('eloquent', 'word', 'zh-CN')).toBeNull();
+      expect(await getSavedAnalysis(' eloquent ', 'word', 'zh-CN')).toEqual({
+        meaning: SAVED_WORD.meaning,
+        pronunciation: SAVED_WORD.pronunciation,
+        partOfSpeech: SAVED_WORD.partOfSpeech,
+        usage: '',
+        mode: 'word',
+      });
+      expect((await getCachedAnalysis('Eloquent', 'word', 'zh-CN'))?.meaning).toBe(SAVED_WORD.meaning);
+
+      const stats = getCacheStats();
+      expect(stats.vocabulary.hits).toBe(1);
+      expect(stats.localRate).toBe(1);
+    });
+
+    it('prefers the most recently saved word with a meaning', async () => {
+      await saveTestWord({ meaning: '旧释义', xpath: '/html/body/p[2]' });
+      await saveTestWord({ meaning: '', xpath: '/html/body/p[3]' });
+      await new Promise((resolve) => setTimeout(resolve, 2));
+      await saveTestWord({ meaning: '新释义', xpath: '/html/body/p[4]' });
+      await saveTestWord({ meaning: ' ', xpath: '/html/body/p[5]' });
+
+      expect((await getSavedAnalysis('eloquent'))?.meaning).toBe('新释义');
+    });
+
+    it('ignores translate mode and unsaved words', async () => {
+      await saveTestWord();
+
+      expect(await getSavedAnalysis('eloquent', 'translate', 'zh-CN')).toBeNull();
+      expect(await getSavedAnalysis('verbose', 'word', 'zh-CN')).toBeNull();
+      expect(getCacheStats().vocabulary).toMatchObject({ hits: 0, misses: 1 });
+    });
+
+    it('updates or drops promoted entries when the word changes', async () => {
+      // 先完成预热，避免后台预热与删除交错
+      await warmupCache();
+      const id = await saveTestWord();
+      await getSavedAnalysis('eloquent', 'word', 'zh-CN');
+
+      await updateWord(id, { meaning: '口才好的' });
+      expect((await getCachedAnalysis('eloquent', 'word', 'zh-CN'))?.meaning).toBe('口才好的');
+
+      await deleteWord(id);
+      expect(await getCachedAnalysis('eloquent', 'word', 'zh-CN')).toBeNull();
+      expect(await getSavedAnalysis('eloquent', 'word', 'zh-CN')).toBeNull();
+    });
+
+    it('hydrates saved words on warmup without overriding cached analyses', async () => {
+      await saveTestWord();
+      await saveTestWord({ text: 'verbose', meaning: '冗长的', xpath: '/html/body/p[2]' });
+      await setCachedAnalysis('verbose', { ...RESULT, meaning: '啰嗦的' }, 'word', 'zh-CN');
+      __test__.simulateWorkerRestart();
+
+      await warmupCache();
+
+      expect((await getCachedAnalysis('eloquent', 'word', 'zh-CN'))?.meaning).toBe(SAVED_WORD.meaning);
+      expect((await getCachedAnalysis('verbose', 'word', 'zh-CN'))?.meaning).toBe('啰嗦的');
+      expect(getCacheStats().vocabulary.warmed).toBe(1);
+      expect(getCacheStats().l1.hits).toBe(2);
+    });
+  });
+});
@@ -1,28 +1,60 @@
 /**
  * LingoRecall AI - Analysis Cache Service
- * 高性能内存缓存，用于减少重复 AI API 调用
+ * 两级缓存，用于减少重复 AI API 调用
  *
  * 优化策略：
- * 1. 内存缓存 - 单词级别的 LRU 缓存
- * 2. 模糊匹配 - 相同单词不同上下文可复用
- * 3. TTL 过期 - 自动清理过期条目
+ * 1. L1 内存缓存 - 分段 LRU（SLRU），读写与淘汰均为 O(1)，
+ *    同时受条目数和字节数预算约束
+ * 2. L2 持久化缓存 - IndexedDB (LingoRecallDB.analysisCache)，
+ *    Service Worker 被回收后仍然有效
+ * 3. 懒加载预热 - Worker 唤醒后首次查询时，从 L2 回填最近访问的条目
+ * 4. TTL 过期 - 两级缓存共享 expiresAt，L2 额外有容量上限淘汰
+ * 5. 词库查询 - 两级缓存未命中时按规范化词形查找用户保存的词汇，直接返回保存的释义；
+ *    预热时同时回填最近保存的词汇，词汇被修改或删除后对应的 L1 条目失效
  *
  * @module services/analysisCache
  */
 
 import type { AIAnalysisResult, AnalysisMode } from './geminiService';
+import type { TargetLanguage } from '../shared/types/settings';
+import { createSegmentedLru } from '../shared/utils/segmentedLru';
+import {
+  getPersistedAnalysis,
+  getRecentPersistedAnalyses,
+  putPersistedAnalysis,
+  touchPersistedAnalysis,
+  clearPersistedAnalyses,
+  prunePersistedAnalyses,
+  type PersistedAnalysisEntry,
+} from '../shared/storage/analysisCacheStore';
+import { findWordsByText, getRecentWordSummaries } from '../shared/storage/wordService';
+import { subscribeChanges, type StorageChange } from '../shared/storage/changeFeed';
+import type { WordSummary } from '../shared/messaging/types';
 
 /** 缓存条目接口 */
 interface CacheEntry {
   result: AIAnalysisResult;
   timestamp: number;
+  expiresAt: number;
   hitCount: number;
+  /** 来自词库的条目记录词汇 ID，该词汇被修改或删除时失效 */
+  wordId?: string;
 }
 
 /** 缓存配置 */
 const CACHE_CONFIG = {
-  /** 最大缓存条目数 */
+  /** L1 最大缓存条目数 */
   MAX_ENTRIES: 500,
+  /** L1 最大字节数（估算）- 2MB，防止长段落翻译结果撑爆内存 */
+  MAX_BYTES: 2 * 1024 * 1024,
+  /** L2 最大持久化条目数 */
+  MAX_PERSISTED_ENTRIES: 5000,
+  /** 每写入多少条 L2 记录执行一次清理 */
+  PRUNE_EVERY_WRITES: 50,
+  /** 预热时从 L2 回填到 L1 的条目数 */
+  WARMUP_ENTRIES: 200,
+  /** 预热时回填到 L1 的最近保存的词汇数 */
+  WARMUP_VOCABULARY_ENTRIES: 300,
   /** 缓存过期时间（毫秒）- 24小时 */
   TTL_MS: 24 * 60 * 60 * 1000,
   /** 短文本阈值（字符数）- 短文本更适合缓存 */
@@ -31,166 +63,529 @@ const CACHE_CONFIG = {
   SHORT_TEXT_TTL_MS: 7 * 24 * 60 * 60 * 1000,
 } as const;
 
-/** 内存缓存 Map */
-const cache = new Map<string, CacheEntry>();
+/** 默认目标语言（与 geminiService 保持一致） */
+const DEFAULT_TARGET_LANGUAGE: TargetLanguage = 'zh-CN';
 
-/** 缓存统计 */
+/** 单个条目的固定开销估算（对象头、数字字段等） */
+const ENTRY_OVERHEAD_BYTES = 64;
+
+/**
+ * 估算 L1 条目占用的字节数（UTF-16，每字符 2 字节）
+ */
+function estimateEntryBytes(key: string, entry: CacheEntry): number {
+  const { meaning, pronunciation, partOfSpeech, usage } = entry.result;
+  const chars = key.length + meaning.length + pronunciation.length + partOfSpeech.length + usage.length;
+  return chars * 2 + ENTRY_OVERHEAD_BYTES;
+}
+
+/** 缓存统计（按层级） */
 const stats = {
-  hits: 0,
-  misses: 0,
+  l1Hits: 0,
+  l1Misses: 0,
+  l2Hits: 0,
+  l2Misses: 0,
+  l2Writes: 0,
+  l2Errors: 0,
   evictions: 0,
+  vocabularyHits: 0,
+  vocabularyMisses: 0,
+  vocabularyWarmed: 0,
 };
 
+/** L1 中来自词库的条目：词汇 ID → 缓存键与目标语言 */
+const vocabularyKeys = new Map<string, { key: string; targetLanguage: TargetLanguage }>();
+
+/** 是否已订阅词汇变更（首次写入词库条目时订阅） */
+let vocabularySubscribed = false;
+
+/** L1 内存缓存（SLRU） */
+const cache = createSegmentedLru<CacheEntry>({
+  maxEntries: CACHE_CONFIG.MAX_ENTRIES,
+  maxBytes: CACHE_CONFIG.MAX_BYTES,
+  sizeOf: estimateEntryBytes,
+  onEvict: (_key, entry) => {
+    stats.evictions++;
+    if (entry.wordId) {
+      vocabularyKeys.delete(entry.wordId);
+    }
+  },
+});
+
+/** 自上次 L2 清理以来的写入次数 */
+let writesSincePrune = 0;
+
+/** 预热 Promise（保证每个 Worker 生命周期只预热一次） */
+let warmupPromise: Promise<void> | null = null;
+
+/**
+ * 规范化文本
+ */
+function normalizeCacheText(text: string): string {
+  return text.trim().toLowerCase();
+}
+
 /**
  * 生成缓存键
- * 对于单词模式，只使用文本作为键（忽略上下文）
- * 对于翻译模式，使用文本+上下文hash
+ * 对于单词模式，只使用文本作为键（忽略上下文），可跨上下文复用
+ * 对于翻译模式，文本完全相同才能复用
+ * 两种模式都区分目标语言，避免切换语言后命中旧语言的结果
  *
  * @param text - 待分析文本
  * @param mode - 分析模式
+ * @param targetLanguage - 目标语言
  * @returns 缓存键
  */
-function generateCacheKey(text: string, mode: AnalysisMode = 'word'): string {
-  const normalizedText = text.trim().toLowerCase();
+export function generateCacheKey(
+  text: string,
+  mode: AnalysisMode = 'word',
+  targetLanguage: TargetLanguage = DEFAULT_TARGET_LANGUAGE
+): string {
+  return `${mode}:${targetLanguage}:${normalizeCacheText(text)}`;
+}
 
-  if (mode === 'translate') {
-    // 翻译模式：文本完全相同才能复用
-    return `translate:${normalizedText}`;
-  }
+/**
+ * 根据文本长度计算 TTL
+ */
+function getTtl(text: string): number {
+  return text.length <= CACHE_CONFIG.SHORT_TEXT_THRESHOLD
+    ? CACHE_CONFIG.SHORT_TEXT_TTL_MS
+    : CACHE_CONFIG.TTL_MS;
+}
 
-  // 单词模式：只用单词本身作为键，可跨上下文复用
-  return `word:${normalizedText}`;
+/**
+ * 写入 L1，超出预算时由 SLRU 以 O(1) 淘汰
+ */
+function setMemoryEntry(key: string, entry: CacheEntry): void {
+  cache.set(key, entry);
+}
+
+/**
+ * 查询 L1
+ * 过期条目会被顺带删除；未过期的条目标记为最近访问
+ */
+function getMemoryEntry(key: string, now: number): CacheEntry | null {
+  const entry = cache.peek(key);
+  if (!entry) {
+    return null;
+  }
+  if (now > entry.expiresAt) {
+    cache.delete(key);
+    return null;
+  }
+  cache.get(key);
+  return entry;
 }
 
 /**
  * 获取缓存的分析结果
+ * 先查 L1，未命中再查 L2；L2 命中后回填 L1
  *
  * @param text - 待分析文本
  * @param mode - 分析模式
+ * @param targetLanguage - 目标语言
  * @returns 缓存的结果或 null
  */
-export function getCachedAnalysis(
+export async function getCachedAnalysis(
   text: string,
-  mode: AnalysisMode = 'word'
-): AIAnalysisResult | null {
-  const key = generateCacheKey(text, mode);
-  const entry = cache.get(key);
+  mode: AnalysisMode = 'word',
+  targetLanguage: TargetLanguage = DEFAULT_TARGET_LANGUAGE
+): Promise<AIAnalysisResult | null> {
+  // Worker 唤醒后的首次查询触发预热（不阻塞本次查询）
+  void warmupCache();
 
-  if (!entry) {
-    stats.misses++;
+  const key = generateCacheKey(text, mode, targetLanguage);
+  const now = Date.now();
+
+  // 1. L1
+  const memoryEntry = getMemoryEntry(key, now);
+  if (memoryEntry) {
+    memoryEntry.hitCount++;
+    stats.l1Hits++;
+    console.log(`[LingoRecall Cache] L1 HIT: "${text}" (hits: ${memoryEntry.hitCount})`);
+    return memoryEntry.result;
+  }
+  stats.l1Misses++;
+
+  // 2. L2
+  let persisted: PersistedAnalysisEntry | null = null;
+  try {
+    persisted = await getPersistedAnalysis(key, now);
+  } catch (error) {
+    stats.l2Errors++;
+    console.warn('[LingoRecall Cache] L2 read failed:', error);
+  }
+
+  if (!persisted) {
+    stats.l2Misses++;
     return null;
   }
 
-  // 检查是否过期
-  const ttl = text.length <= CACHE_CONFIG.SHORT_TEXT_THRESHOLD
-    ? CACHE_CONFIG.SHORT_TEXT_TTL_MS
-    : CACHE_CONFIG.TTL_MS;
+  stats.l2Hits++;
+  const result = persisted.result as AIAnalysisResult;
+  setMemoryEntry(key, {
+    result,
+    timestamp: persisted.createdAt,
+    expiresAt: persisted.expiresAt,
+    hitCount: persisted.hitCount + 1,
+  });
+
+  // 更新 L2 访问时间，供容量淘汰使用（异步，不阻塞）
+  touchPersistedAnalysis(key, now).catch((error) => {
+    stats.l2Errors++;
+    console.warn('[LingoRecall Cache] L2 touch failed:', error);
+  });
+
+  console.log(`[LingoRecall Cache] L2 HIT: "${text}" (promoted to L1)`);
+  return result;
+}
+
+// ============================================================
+// Vocabulary
+// ============================================================
+
+/**
+ * 把保存的词汇转换为分析结果（词汇不保存用法说明）
+ */
+function toSavedAnalysis(word: WordSummary): AIAnalysisResult {
+  return {
+    meaning: word.meaning,
+    pronunciation: word.pronunciation,
+    partOfSpeech: word.partOfSpeech,
+    usage: '',
+    mode: 'word',
+  };
+}
+
+/**
+ * 把保存的词汇写入 L1（不写 L2：词库本身已持久化）
+ */
+function setVocabularyEntry(
+  key: string,
+  word: WordSummary,
+  targetLanguage: TargetLanguage,
+  now: number
+): void {
+  setMemoryEntry(key, {
+    result: toSavedAnalysis(word),
+    timestamp: word.createdAt,
+    expiresAt: now + CACHE_CONFIG.SHORT_TEXT_TTL_MS,
+    hitCount: 0,
+    wordId: word.id,
+  });
+  vocabularyKeys.set(word.id, { key, targetLanguage });
+
+  if (!vocabularySubscribed) {
+    vocabularySubscribed = true;
+    subscribeChanges(applyVocabularyChanges);
+  }
+}
 
-  if (Date.now() - entry.timestamp > ttl) {
+/**
+ * 同步 L1 中由词汇产生的条目：
+ * 词汇被修改时就地更新（词形改变或释义被清空则移除），被删除时移除
+ * 已被 AI 结果覆盖的键不受影响
+ */
+function applyVocabularyChanges(changes: StorageChange[]): void {
+  for (const change of changes) {
+    const wordId = change.type === 'word:update'
+      ? change.word.id
+      : change.type === 'word:delete' ? change.id : null;
+    const tracked = wordId ? vocabularyKeys.get(wordId) : undefined;
+    if (!wordId || !tracked) {
+      continue;
+    }
+
+    const { key, targetLanguage } = tracked;
+    const entry = cache.peek(key);
+    if (!entry || entry.wordId !== wordId) {
+      vocabularyKeys.delete(wordId);
+      continue;
+    }
+
+    if (
+      change.type === 'word:update' &&
+      change.word.meaning.trim() &&
+      generateCacheKey(change.word.text, 'word', targetLanguage) === key
+    ) {
+      setMemoryEntry(key, { ...entry, result: toSavedAnalysis(change.word) });
+      continue;
+    }
+
+    vocabularyKeys.delete(wordId);
     cache.delete(key);
-    stats.misses++;
+  }
+}
+
+/**
+ * 从用户保存的词汇中查找分析结果（两级缓存未命中之后调用）
+ * 只用于单词模式；同一词形保存过多次时取最近保存且有释义的一条，命中后写入 L1
+ *
+ * @param text - 待分析文本
+ * @param mode - 分析模式
+ * @param targetLanguage - 目标语言（决定写入 L1 的缓存键）
+ * @returns 保存的释义，未保存过时返回 null
+ */
+export async function getSavedAnalysis(
+  text: string,
+  mode: AnalysisMode = 'word',
+  targetLanguage: TargetLanguage = DEFAULT_TARGET_LANGUAGE
+): Promise<AIAnalysisResult | null> {
+  if (mode !== 'word') {
     return null;
   }
 
-  // 更新命中计数
-  entry.hitCount++;
-  stats.hits++;
+  let words: WordSummary[] = [];
+  try {
+    words = await findWordsByText(text);
+  } catch (error) {
+    console.warn('[LingoRecall Cache] Vocabulary lookup failed:', error);
+  }
+
+  let saved: WordSummary | null = null;
+  for (const word of words) {
+    if (word.meaning.trim() && (!saved || word.createdAt > saved.createdAt)) {
+      saved = word;
+    }
+  }
 
-  console.log(`[LingoRecall Cache] HIT: "${text}" (hits: ${entry.hitCount})`);
-  return entry.result;
+  if (!saved) {
+    stats.vocabularyMisses++;
+    return null;
+  }
+
+  stats.vocabularyHits++;
+  setVocabularyEntry(generateCacheKey(text, mode, targetLanguage), saved, targetLanguage, Date.now());
+  console.log(`[LingoRecall Cache] VOCABULARY HIT: "${text}" (promoted to L1)`);
+  return toSavedAnalysis(saved);
 }
 
 /**
  * 缓存分析结果
+ * L1 同步写入；L2 异步写入，返回的 Promise 在 L2 写入完成后 resolve
+ * （调用方通常无需等待）
  *
  * @param text - 分析的文本
  * @param result - AI 分析结果
  * @param mode - 分析模式
+ * @param targetLanguage - 目标语言
  */
 export function setCachedAnalysis(
   text: string,
   result: AIAnalysisResult,
-  mode: AnalysisMode = 'word'
-): void {
-  const key = generateCacheKey(text, mode);
+  mode: AnalysisMode = 'word',
+  targetLanguage: TargetLanguage = DEFAULT_TARGET_LANGUAGE
+): Promise<void> {
+  const key = generateCacheKey(text, mode, targetLanguage);
+  const now = Date.now();
+  const expiresAt = now + getTtl(text);
 
-  // 如果缓存已满，移除最旧的条目
-  if (cache.size >= CACHE_CONFIG.MAX_ENTRIES) {
-    evictOldestEntries(Math.floor(CACHE_CONFIG.MAX_ENTRIES * 0.1)); // 移除 10%
-  }
-
-  cache.set(key, {
+  setMemoryEntry(key, {
     result,
-    timestamp: Date.now(),
+    timestamp: now,
+    expiresAt,
     hitCount: 0,
   });
 
   console.log(`[LingoRecall Cache] SET: "${text}" (size: ${cache.size})`);
+
+  return persistEntry({
+    key,
+    mode,
+    text: normalizeCacheText(text),
+    targetLanguage,
+    result,
+    createdAt: now,
+    lastAccessAt: now,
+    expiresAt,
+    hitCount: 0,
+  });
 }
 
 /**
- * 移除最旧的缓存条目
- *
- * @param count - 移除数量
- */
-function evictOldestEntries(count: number): void {
-  // 按时间戳排序，优先移除命中次数低的旧条目
-  const entries = Array.from(cache.entries())
-    .sort((a, b) => {
-      // 先按命中次数排序（低的优先移除）
-      if (a[1].hitCount !== b[1].hitCount) {
-        return a[1].hitCount - b[1].hitCount;
-      }
-      // 再按时间戳排序（旧的优先移除）
-      return a[1].timestamp - b[1].timestamp;
-    });
+ * 写入 L2，并按写入次数周期性清理
+ * L2 失败时降级为仅 L1，不向上抛出
+ */
+async function persistEntry(entry: PersistedAnalysisEntry): Promise<void> {
+  try {
+    await putPersistedAnalysis(entry);
+    stats.l2Writes++;
+    writesSincePrune++;
 
-  for (let i = 0; i < count && i < entries.length; i++) {
-    cache.delete(entries[i][0]);
-    stats.evictions++;
+    if (writesSincePrune >= CACHE_CONFIG.PRUNE_EVERY_WRITES) {
+      writesSincePrune = 0;
+      const removed = await prunePersistedAnalyses(CACHE_CONFIG.MAX_PERSISTED_ENTRIES);
+      if (removed > 0) {
+        console.log(`[LingoRecall Cache] L2 pruned ${removed} entries`);
+      }
+    }
+  } catch (error) {
+    stats.l2Errors++;
+    console.warn('[LingoRecall Cache] L2 write failed:', error);
   }
-
-  console.log(`[LingoRecall Cache] Evicted ${count} entries`);
 }
 
 /**
  * 清空缓存
+ *
+ * @param options.persistent - 是否同时清空 L2（默认 true）
  */
-export function clearCache(): void {
+export async function clearCache(options: { persistent?: boolean } = {}): Promise<void> {
   cache.clear();
-  stats.hits = 0;
-  stats.misses = 0;
+  stats.l1Hits = 0;
+  stats.l1Misses = 0;
+  stats.l2Hits = 0;
+  stats.l2Misses = 0;
+  stats.l2Writes = 0;
+  stats.l2Errors = 0;
   stats.evictions = 0;
+  stats.vocabularyHits = 0;
+  stats.vocabularyMisses = 0;
+  stats.vocabularyWarmed = 0;
+  vocabularyKeys.clear();
+  writesSincePrune = 0;
+
+  if (options.persistent !== false) {
+    try {
+      await clearPersistedAnalyses();
+    } catch (error) {
+      console.warn('[LingoRecall Cache] L2 clear failed:', error);
+    }
+  }
+
   console.log('[LingoRecall Cache] Cleared');
 }
 
 /**
  * 获取缓存统计信息
+ * hits / misses / hitRate 为两级合计，l1 / l2 / vocabulary 为分层统计
+ * localRate 为无需调用 AI 的分析占比（两级缓存命中 + 词库命中）
  */
 export function getCacheStats(): {
   size: number;
+  bytes: number;
   hits: number;
   misses: number;
   hitRate: number;
   evictions: number;
+  localRate: number;
+  l1: { size: number; bytes: number; hits: number; misses: number; hitRate: number };
+  l2: { hits: number; misses: number; hitRate: number; writes: number; errors: number };
+  vocabulary: { hits: number; misses: number; hitRate: number; warmed: number };
 } {
-  const total = stats.hits + stats.misses;
+  const hits = stats.l1Hits + stats.l2Hits;
+  const misses = stats.l2Misses;
+  const total = hits + misses;
+  const l1Total = stats.l1Hits + stats.l1Misses;
+  const l2Total = stats.l2Hits + stats.l2Misses;
+  const vocabularyTotal = stats.vocabularyHits + stats.vocabularyMisses;
+
   return {
     size: cache.size,
-    hits: stats.hits,
-    misses: stats.misses,
-    hitRate: total > 0 ? stats.hits / total : 0,
+    bytes: cache.bytes,
+    hits,
+    misses,
+    hitRate: total > 0 ? hits / total : 0,
     evictions: stats.evictions,
+    localRate: total > 0 ? (hits + stats.vocabularyHits) / total : 0,
+    l1: {
+      size: cache.size,
+      bytes: cache.bytes,
+      hits: stats.l1Hits,
+      misses: stats.l1Misses,
+      hitRate: l1Total > 0 ? stats.l1Hits / l1Total : 0,
+    },
+    l2: {
+      hits: stats.l2Hits,
+      misses: stats.l2Misses,
+      hitRate: l2Total > 0 ? stats.l2Hits / l2Total : 0,
+      writes: stats.l2Writes,
+      errors: stats.l2Errors,
+    },
+    vocabulary: {
+      hits: stats.vocabularyHits,
+      misses: stats.vocabularyMisses,
+      hitRate: vocabularyTotal > 0 ? stats.vocabularyHits / vocabularyTotal : 0,
+      warmed: stats.vocabularyWarmed,
+    },
   };
 }
 
 /**
- * 预热缓存（从 IndexedDB 加载常用词汇）
- * 可选功能，在 Service Worker 启动时调用
+ * 预热缓存（从 IndexedDB 回填最近访问的条目到 L1）
+ * 每个 Service Worker 生命周期只执行一次，重复调用返回同一个 Promise
+ * 同时清理 L2 中的过期条目，并回填最近保存的词汇（按默认目标语言生成键，
+ * 不覆盖已回填的 AI 结果）
  */
-export async function warmupCache(): Promise<void> {
-  // 这里可以从 IndexedDB 加载用户保存过的词汇
-  // 预先缓存这些词汇的分析结果
-  console.log('[LingoRecall Cache] Warmup started');
-  // 实现略，需要额外的存储逻辑
+export function warmupCache(): Promise<void> {
+  if (warmupPromise) {
+    return warmupPromise;
+  }
+
+  warmupPromise = (async () => {
+    const startTime = performance.now();
+    console.log('[LingoRecall Cache] Warmup started');
+
+    try {
+      await prunePersistedAnalyses(CACHE_CONFIG.MAX_PERSISTED_ENTRIES);
+      const entries = await getRecentPersistedAnalyses(CACHE_CONFIG.WARMUP_ENTRIES);
+
+      let loaded = 0;
+      for (const entry of entries) {
+        // 不覆盖预热期间已写入的新结果
+        if (cache.has(entry.key)) {
+          continue;
+        }
+        setMemoryEntry(entry.key, {
+          result: entry.result as AIAnalysisResult,
+          timestamp: entry.createdAt,
+          expiresAt: entry.expiresAt,
+          hitCount: entry.hitCount,
+        });
+        loaded++;
+      }
+
+      const elapsed = performance.now() - startTime;
+      console.log(`[LingoRecall Cache] Warmup loaded ${loaded} entries in ${elapsed.toFixed(1)}ms`);
+    } catch (error) {
+      stats.l2Errors++;
+      console.warn('[LingoRecall Cache] Warmup failed:', error);
+    }
+
+    try {
+      const words = await getRecentWordSummaries(CACHE_CONFIG.WARMUP_VOCABULARY_ENTRIES);
+      const now = Date.now();
+
+      let warmed = 0;
+      for (const word of words) {
+        const key = generateCacheKey(word.text, 'word', DEFAULT_TARGET_LANGUAGE);
+        // 按创建时间倒序遍历，同一词形只保留最近保存的一条
+        if (!word.meaning.trim() || cache.has(key)) {
+          continue;
+        }
+        setVocabularyEntry(key, word, DEFAULT_TARGET_LANGUAGE, now);
+        warmed++;
+      }
+      stats.vocabularyWarmed += warmed;
+
+      console.log(`[LingoRecall Cache] Warmup loaded ${warmed} saved words`);
+    } catch (error) {
+      console.warn('[LingoRecall Cache] Vocabulary warmup failed:', error);
+    }
+  })();
+
+  return warmupPromise;
 }
+
+/**
+ * 测试辅助导出
+ */
+export const __test__ = {
+  /** 模拟 Service Worker 重启：清空 L1 和预热状态，保留 L2 */
+  simulateWorkerRestart(): void {
+    cache.clear();
+    vocabularyKeys.clear();
+    warmupPromise = null;
+    writesSincePrune = 0;
+  },
+  CACHE_CONFIG,
+};
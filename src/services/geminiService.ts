@@ -5,19 +5,34 @@
  * @module services/geminiService
  */
 
-import { GoogleGenerativeAI, GenerativeModel } from '@google/generative-ai';
+import {
+  GoogleGenerativeAI,
+  GenerativeModel,
+  SchemaType,
+  type EnhancedGenerateContentResponse,
+  type GenerateContentRequest,
+  type GenerationConfig,
+  type ObjectSchema,
+} from '@google/generative-ai';
 import type { TargetLanguage } from '../shared/types/settings';
 import {
   buildWordAnalysisPrompt as buildWordPrompt,
   buildTranslationPrompt as buildTranslatePrompt,
   getFallbackMeaningMessage,
   buildBatchTranslationPrompt,
-  parseBatchTranslationResponse,
+  buildStringObjectSchema,
+  getAnalysisFields,
+  getBatchItemKeys,
+  parseBatchTranslationItems,
+  parseJsonStringFields,
 } from './promptTemplates';
 import { trackUsage } from './usageService';
 import {
   checkRateLimit,
-  onRequestStart,
+  acquireRateLimit,
+  settleTokenUsage,
+  estimateRequestTokens,
+  getLimiterKey,
   onRequestSuccess,
   onRateLimitError,
   onRequestError,
@@ -69,6 +84,9 @@ export interface AnalyzeWordRequest {
 /** 默认模型 - 使用配额更高的稳定版 */
 const DEFAULT_MODEL = 'gemini-2.0-flash';
 
+/** 未指定 maxOutputTokens 时批量翻译的输出 token 估算（用于 TPM 预扣） */
+const BATCH_OUTPUT_TOKEN_ESTIMATE = 8192;
+
 /** 响应时间上限（毫秒）- Story 1.6 AC-3
  * 从 8s 提升至 15s：解决 Service Worker 冷启动后首次请求超时问题。
  * 冷启动耗时包括：SW 初始化 + DNS 解析 + TLS 握手 + Gemini 服务端冷启动 + AI 生成，
@@ -149,9 +167,27 @@ function buildAnalysisPrompt(
   return buildWordPrompt(text, context, targetLanguage);
 }
 
+/**
+ * 构建结构化输出配置：要求模型只返回符合 Schema 的 JSON 对象（字段均为必填字符串）
+ *
+ * @param keys - 字段名
+ * @returns generationConfig 中的 responseMimeType / responseSchema
+ */
+function buildJsonGenerationConfig(keys: string[]): Pick<GenerationConfig, 'responseMimeType' | 'responseSchema'> {
+  const { properties, required } = buildStringObjectSchema(keys);
+  const responseSchema: ObjectSchema = {
+    type: SchemaType.OBJECT,
+    properties: Object.fromEntries(
+      Object.keys(properties).map((key) => [key, { type: SchemaType.STRING }])
+    ),
+    required,
+  };
+  return { responseMimeType: 'application/json', responseSchema };
+}
+
 /**
  * 解析 AI 响应
- * 尝试解析 JSON，失败则使用原始文本
+ * 结构化输出时直接解析 JSON；无法解析出任何字段时使用原始文本
  *
  * @param response - AI 响应文本
  * @param mode - 分析模式
@@ -165,21 +201,15 @@ function parseAIResponse(
 ): AIAnalysisResult {
   const fallbackMessage = getFallbackMeaningMessage(targetLanguage);
 
-  // 尝试提取 JSON 部分（可能被 markdown 包裹）
-  const jsonMatch = response.match(/\{[\s\S]*\}/);
-  if (jsonMatch) {
-    try {
-      const parsed = JSON.parse(jsonMatch[0]);
-      return {
-        meaning: parsed.meaning || fallbackMessage,
-        pronunciation: mode === 'word' ? (parsed.pronunciation || '') : '',
-        partOfSpeech: mode === 'word' ? (parsed.partOfSpeech || '') : '',
-        usage: mode === 'word' ? (parsed.usage || '') : '',
-        mode,
-      };
-    } catch {
-      // JSON 解析失败
-    }
+  const fields = parseJsonStringFields(response);
+  if (fields) {
+    return {
+      meaning: fields.meaning || fallbackMessage,
+      pronunciation: mode === 'word' ? (fields.pronunciation || '') : '',
+      partOfSpeech: mode === 'word' ? (fields.partOfSpeech || '') : '',
+      usage: mode === 'word' ? (fields.usage || '') : '',
+      mode,
+    };
   }
 
   // 回退：使用原始响应作为含义
@@ -355,6 +385,31 @@ async function withTimeout<T>(
   }
 }
 
+/**
+ * 生成内容
+ * 提供 onChunk 时走流式接口，边生成边回调；最终返回聚合后的完整响应
+ */
+async function generateContentWithChunks(
+  model: GenerativeModel,
+  request: string | GenerateContentRequest,
+  onChunk?: (chunk: string) => void,
+  signal?: AbortSignal
+): Promise<EnhancedGenerateContentResponse> {
+  if (!onChunk) {
+    const result = await model.generateContent(request, { signal });
+    return result.response;
+  }
+
+  const result = await model.generateContentStream(request, { signal });
+  for await (const chunk of result.stream) {
+    const text = chunk.text();
+    if (text) {
+      onChunk(text);
+    }
+  }
+  return result.response;
+}
+
 /**
  * 分析单词/短语
  * 调用 Gemini API 获取语境分析结果
@@ -362,6 +417,8 @@ async function withTimeout<T>(
  * @param request - 分析请求
  * @param apiKey - Google AI API Key
  * @param modelName - 可选模型名称
+ * @param onChunk - 可选流式回调：传入时使用 generateContentStream，每收到一段文本回调一次
+ * @param signal - 可选取消信号：取消后中止进行中的请求且不再重试，抛出 CANCELLED 错误
  * @returns AI 分析结果
  * @throws Error 如果 API 调用失败
  *
@@ -376,7 +433,9 @@ async function withTimeout<T>(
 export async function analyzeWord(
   request: AnalyzeWordRequest,
   apiKey: string,
-  modelName?: string
+  modelName?: string,
+  onChunk?: (chunk: string) => void,
+  signal?: AbortSignal
 ): Promise<AIAnalysisResult> {
   const startTime = Date.now();
   const mode = request.mode || 'word';
@@ -384,51 +443,66 @@ export async function analyzeWord(
 
   const model = getModel(apiKey, modelName);
   const prompt = buildAnalysisPrompt(request.text, request.context, mode, targetLanguage);
+  const contentRequest: GenerateContentRequest = {
+    contents: [{ role: 'user', parts: [{ text: prompt }] }],
+    generationConfig: buildJsonGenerationConfig(getAnalysisFields(mode)),
+  };
 
   // 翻译模式可能需要更长时间处理长文本
   const timeout = mode === 'translate' ? RESPONSE_TIMEOUT_MS * 3 : RESPONSE_TIMEOUT_MS;
 
+  // 按模型限流：输出按与 OpenAI 兼容路径相同的 max_tokens 估算
+  const limiterKey = getLimiterKey('gemini', '', modelName || DEFAULT_MODEL);
+  const estimatedTokens = estimateRequestTokens(prompt.length, mode === 'translate' ? 1500 : 200);
+
   // 速率限制器预检查：熔断器打开时立即拒绝
-  const rateLimitCheck = checkRateLimit();
+  const rateLimitCheck = await checkRateLimit(limiterKey);
   if (!rateLimitCheck.allowed) {
     console.warn(`[LingoRecall] analyzeWord blocked by rate limiter: ${rateLimitCheck.reason}`);
     throw new Error(`${rateLimitCheck.reason}: Too many requests. Please try again later.`);
   }
 
   let lastError: Error | null = null;
+  /** 已向调用方推送过流式文本：此时重试会与已显示的内容混杂，不再重试 */
+  let streamedAnyChunk = false;
 
   // 使用指数退避重试（处理速率限制 429 错误）
   for (let retryCount = 0; retryCount <= ANALYZE_MAX_RETRIES; retryCount++) {
+    if (signal?.aborted) {
+      throw new Error('CANCELLED: Request was cancelled.');
+    }
+
     try {
-      // 每次 API 调用前检查速率限制间隔
-      const preCheck = checkRateLimit();
+      // 每次 API 调用前预扣 RPM / TPM 额度
+      const preCheck = await acquireRateLimit(limiterKey, estimatedTokens);
       if (!preCheck.allowed) {
         throw new Error(`${preCheck.reason}: Too many requests. Please try again later.`);
       }
       if (preCheck.waitMs > 0) {
-        console.log(`[LingoRecall] Waiting ${preCheck.waitMs}ms before API call (rate limit spacing)`);
+        console.log(`[LingoRecall] Waiting ${preCheck.waitMs}ms before API call (rate limit quota)`);
         await sleep(preCheck.waitMs);
       }
 
-      onRequestStart();
-
-      const result = await withTimeout(
-        model.generateContent(prompt),
+      const response = await withTimeout(
+        generateContentWithChunks(model, contentRequest, onChunk && ((chunk) => {
+          streamedAnyChunk = true;
+          onChunk(chunk);
+        }), signal),
         timeout,
         `TIMEOUT: AI response exceeded ${timeout / 1000}s limit.`
       );
 
-      const response = result.response;
       const text = response.text();
 
       // 标记请求成功
-      onRequestSuccess();
+      onRequestSuccess(limiterKey);
 
       // 追踪 token 使用量 (Gemini API 提供 usageMetadata)
       const usageMetadata = response.usageMetadata;
       if (usageMetadata) {
         const inputTokens = usageMetadata.promptTokenCount || 0;
         const outputTokens = usageMetadata.candidatesTokenCount || 0;
+        settleTokenUsage(limiterKey, estimatedTokens, inputTokens + outputTokens);
         const actualModelName = modelName || DEFAULT_MODEL;
         // 异步追踪，不阻塞主流程
         trackUsage(inputTokens, outputTokens, actualModelName).catch((err) => {
@@ -449,17 +523,22 @@ export async function analyzeWord(
     } catch (error) {
       lastError = error instanceof Error ? error : new Error(String(error));
 
+      // 调用方已取消（例如对冲请求中另一个 Provider 先返回）：不计入熔断器，也不重试
+      if (signal?.aborted) {
+        throw new Error('CANCELLED: Request was cancelled.');
+      }
+
       // 通知速率限制器
       if (is429Error(error)) {
-        onRateLimitError();
+        onRateLimitError(limiterKey);
       } else {
-        onRequestError();
+        onRequestError(limiterKey);
       }
 
       // 检测是否为可重试的错误（超时、速率限制、网络波动）
-      if (isRetryableError(error) && retryCount < ANALYZE_MAX_RETRIES) {
+      if (isRetryableError(error) && retryCount < ANALYZE_MAX_RETRIES && !streamedAnyChunk) {
         // 429 错误且熔断器已打开，不再重试
-        const circuitCheck = checkRateLimit();
+        const circuitCheck = await checkRateLimit(limiterKey);
         if (!circuitCheck.allowed) {
           throw new Error(`${circuitCheck.reason}: Too many requests. Please try again later.`);
         }
@@ -528,14 +607,18 @@ export async function analyzeWord(
  * @param targetLanguage - 目标翻译语言
  * @param apiKey - Google AI API Key
  * @param modelName - 可选模型名称
- * @returns 翻译后的文本数组
+ * @param maxOutputTokens - 可选的最大输出 token 数（来自 Provider 的批量翻译预算）
+ * @param onChunk - 可选流式回调：传入时使用 generateContentStream，每收到一段文本回调一次
+ * @returns 逐条译文（按编号键解析），缺失或为空的条目为 null
  */
 export async function translateBatchGemini(
   texts: string[],
   targetLanguage: TargetLanguage,
   apiKey: string,
-  modelName?: string
-): Promise<string[]> {
+  modelName?: string,
+  maxOutputTokens?: number,
+  onChunk?: (chunk: string) => void
+): Promise<Array<string | null>> {
   if (texts.length === 0) {
     return [];
   }
@@ -544,69 +627,92 @@ export async function translateBatchGemini(
   const prompt = buildBatchTranslationPrompt(texts, targetLanguage);
   const timeout = RESPONSE_TIMEOUT_MS * 6; // 批量翻译允许更长时间（90秒）
 
+  const limiterKey = getLimiterKey('gemini', '', modelName || DEFAULT_MODEL);
+  const estimatedTokens = estimateRequestTokens(prompt.length, maxOutputTokens ?? BATCH_OUTPUT_TOKEN_ESTIMATE);
+
   // 速率限制器预检查
-  const rateLimitCheck = checkRateLimit();
+  const rateLimitCheck = await checkRateLimit(limiterKey);
   if (!rateLimitCheck.allowed) {
     console.warn(`[LingoRecall] translateBatchGemini blocked by rate limiter: ${rateLimitCheck.reason}`);
     throw new Error(`${rateLimitCheck.reason}: Too many requests. Please try again later.`);
   }
 
   let lastError: Error | null = null;
+  // 已向调用方推送过内容后不再重试，避免重复输出
+  let streamedAnyChunk = false;
 
   // 使用指数退避重试
   for (let retryCount = 0; retryCount <= MAX_RETRIES; retryCount++) {
     try {
-      // 每次 API 调用前检查速率限制间隔
-      const preCheck = checkRateLimit();
+      // 每次 API 调用前预扣 RPM / TPM 额度
+      const preCheck = await acquireRateLimit(limiterKey, estimatedTokens);
       if (!preCheck.allowed) {
         throw new Error(`${preCheck.reason}: Too many requests. Please try again later.`);
       }
       if (preCheck.waitMs > 0) {
-        console.log(`[LingoRecall] Waiting ${preCheck.waitMs}ms before batch API call (rate limit spacing)`);
+        console.log(`[LingoRecall] Waiting ${preCheck.waitMs}ms before batch API call (rate limit quota)`);
         await sleep(preCheck.waitMs);
       }
 
-      onRequestStart();
-
-      const result = await withTimeout(
-        model.generateContent(prompt),
+      const response = await withTimeout(
+        generateContentWithChunks(
+          model,
+          {
+            contents: [{ role: 'user', parts: [{ text: prompt }] }],
+            generationConfig: {
+              ...buildJsonGenerationConfig(getBatchItemKeys(texts.length)),
+              ...(maxOutputTokens ? { maxOutputTokens } : {}),
+            },
+          },
+          onChunk && ((chunk) => {
+            streamedAnyChunk = true;
+            onChunk(chunk);
+          })
+        ),
         timeout,
         `TIMEOUT: Batch translation exceeded ${timeout / 1000}s limit.`
       );
 
-      const response = result.response;
       const text = response.text();
 
+      // 输出触顶会导致 JSON 不完整，已完成的条目仍可按键取出，其余条目由调用方补翻
+      if (response.candidates?.[0]?.finishReason === 'MAX_TOKENS') {
+        console.warn(
+          `[LingoRecall] Gemini batch translation truncated at maxOutputTokens=${maxOutputTokens ?? 'default'} (${texts.length} texts)`
+        );
+      }
+
       // 标记请求成功
-      onRequestSuccess();
+      onRequestSuccess(limiterKey);
 
       // 追踪 token 使用量
       const usageMetadata = response.usageMetadata;
       if (usageMetadata) {
         const inputTokens = usageMetadata.promptTokenCount || 0;
         const outputTokens = usageMetadata.candidatesTokenCount || 0;
+        settleTokenUsage(limiterKey, estimatedTokens, inputTokens + outputTokens);
         const actualModelName = modelName || DEFAULT_MODEL;
         trackUsage(inputTokens, outputTokens, actualModelName).catch((err) => {
           console.warn('[LingoRecall Usage] Failed to track Gemini batch usage:', err);
         });
       }
 
-      return parseBatchTranslationResponse(text, texts);
+      return parseBatchTranslationItems(text, texts.length);
     } catch (error) {
       lastError = error instanceof Error ? error : new Error(String(error));
       const errorMessage = lastError.message;
 
       // 通知速率限制器
       if (is429Error(error)) {
-        onRateLimitError();
+        onRateLimitError(limiterKey);
       } else {
-        onRequestError();
+        onRequestError(limiterKey);
       }
 
       // 检测是否为可重试的错误（超时、速率限制、网络波动）
-      if (isRetryableError(error) && retryCount < MAX_RETRIES) {
+      if (isRetryableError(error) && retryCount < MAX_RETRIES && !streamedAnyChunk) {
         // 429 错误且熔断器已打开，不再重试
-        const circuitCheck = checkRateLimit();
+        const circuitCheck = await checkRateLimit(limiterKey);
         if (!circuitCheck.allowed) {
           throw new Error(`${circuitCheck.reason}: Too many requests. Please try again later.`);
         }
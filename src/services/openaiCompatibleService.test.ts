@@ -0,0 +1,127 @@
+/**
+ * LingoRecall AI - OpenAI Compatible Service Tests
+ * 流式请求（单词分析与批量翻译）的 usage 统计与 TPM 结算回调
+ *
+ * @module services/openaiCompatibleService.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+vi.mock('./usageService', () => ({ trackUsage: vi.fn(() => Promise.resolve()) }));
+
+import { trackUsage } from './usageService';
+import { analyzeWordOpenAI, translateBatchOpenAI } from './openaiCompatibleService';
+
+const ENDPOINT = 'http://127.0.0.1:8080/v1/chat/completions';
+
+/** 构造 SSE 响应：每个对象一行 data，最后以 [DONE] 结束 */
+function eventStreamResponse(chunks: object[]) {
+  const encoder = new TextEncoder();
+  const lines = [...chunks.map((chunk) => `data: ${JSON.stringify(chunk)}\n\n`), 'data: [DONE]\n\n'];
+  let next = 0;
+  return {
+    ok: true,
+    status: 200,
+    headers: { get: () => 'text/event-stream' },
+    body: {
+      getReader: () => ({
+        read: async () =>
+          next < lines.length
+            ? { value: encoder.encode(lines[next++]), done: false }
+            : { value: undefined, done: true },
+      }),
+    },
+  };
+}
+
+describe('analyzeWordOpenAI streaming', () => {
+  let fetchMock: ReturnType<typeof vi.fn>;
+
+  beforeEach(() => {
+    vi.mocked(trackUsage).mockClear();
+    fetchMock = vi.fn(async () =>
+      eventStreamResponse([
+        { choices: [{ delta: { content: '{"meaning": "雄辩的"' } }] },
+        { choices: [{ delta: { content: '}' }, finish_reason: 'stop' }] },
+        { choices: [], usage: { prompt_tokens: 120, completion_tokens: 30, total_tokens: 150 } },
+      ])
+    );
+    vi.stubGlobal('fetch', fetchMock);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('requests usage in the stream and tracks it', async () => {
+    const chunks: string[] = [];
+    const result = await analyzeWordOpenAI(
+      { text: 'eloquent', context: '', url: '', xpath: '' },
+      'test-key',
+      ENDPOINT,
+      'gpt-4',
+      (chunk) => chunks.push(chunk)
+    );
+
+    expect(result.meaning).toBe('雄辩的');
+    expect(chunks.join('')).toBe('{"meaning": "雄辩的"}');
+
+    const body = JSON.parse(fetchMock.mock.calls[0][1].body);
+    expect(body).toMatchObject({ stream: true, stream_options: { include_usage: true } });
+    expect(trackUsage).toHaveBeenCalledWith(120, 30, 'gpt-4');
+  });
+
+  it('reports the actual token usage for rate limiter settlement', async () => {
+    const onUsage = vi.fn();
+
+    await analyzeWordOpenAI(
+      { text: 'eloquent', context: '', url: '', xpath: '' },
+      'test-key',
+      ENDPOINT,
+      'gpt-4',
+      () => {},
+      undefined,
+      onUsage
+    );
+
+    expect(onUsage).toHaveBeenCalledWith(150);
+  });
+});
+
+describe('translateBatchOpenAI streaming', () => {
+  let fetchMock: ReturnType<typeof vi.fn>;
+
+  beforeEach(() => {
+    vi.mocked(trackUsage).mockClear();
+    fetchMock = vi.fn(async () =>
+      eventStreamResponse([
+        { choices: [{ delta: { content: '{"1": "你好", ' } }] },
+        { choices: [{ delta: { content: '"2": "世界"}' }, finish_reason: 'stop' }] },
+        { choices: [], usage: { prompt_tokens: 200, completion_tokens: 12, total_tokens: 212 } },
+      ])
+    );
+    vi.stubGlobal('fetch', fetchMock);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('requests usage in the stream and tracks it', async () => {
+    const translations = await translateBatchOpenAI(
+      ['Hello', 'World'],
+      'zh-CN',
+      'test-key',
+      ENDPOINT,
+      'gpt-4',
+      4000,
+      () => {}
+    );
+
+    expect(translations).toEqual(['你好', '世界']);
+
+    const body = JSON.parse(fetchMock.mock.calls[0][1].body);
+    expect(body).toMatchObject({ stream: true, stream_options: { include_usage: true } });
+    expect(trackUsage).toHaveBeenCalledWith(200, 12, 'gpt-4');
+  });
+});
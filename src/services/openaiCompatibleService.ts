@@ -15,7 +15,11 @@ import {
   getFallbackMeaningMessage,
   buildBatchTranslateSystemPrompt,
   buildBatchTranslateUserMessage,
-  parseBatchTranslationResponse,
+  buildStringObjectSchema,
+  getAnalysisFields,
+  getBatchItemKeys,
+  parseBatchTranslationItems,
+  parseJsonStringFields,
 } from './promptTemplates';
 import { trackUsage } from './usageService';
 
@@ -35,6 +39,21 @@ interface ChatCompletionRequest {
   }>;
   temperature?: number;
   max_tokens?: number;
+  stream?: boolean;
+  stream_options?: { include_usage: boolean };
+  response_format?: ChatCompletionResponseFormat;
+}
+
+/**
+ * 结构化输出格式（response_format: json_schema）
+ */
+interface ChatCompletionResponseFormat {
+  type: 'json_schema';
+  json_schema: {
+    name: string;
+    strict: boolean;
+    schema: Record<string, unknown>;
+  };
 }
 
 /**
@@ -60,9 +79,108 @@ interface ChatCompletionResponse {
   };
 }
 
+/**
+ * OpenAI Chat Completion 流式响应块（SSE data 行）
+ */
+interface ChatCompletionChunk {
+  choices?: Array<{
+    delta?: {
+      content?: string;
+    };
+    finish_reason?: string | null;
+  }>;
+  usage?: ChatCompletionResponse['usage'];
+}
+
 /** 默认目标语言 */
 const DEFAULT_TARGET_LANGUAGE: TargetLanguage = 'zh-CN';
 
+/**
+ * 实际 token 用量回调（输入 + 输出），用于按实际用量结算限流器的 TPM 预扣
+ */
+export type TokenUsageCallback = (totalTokens: number) => void;
+
+/**
+ * 流式请求参数
+ * 服务端默认不在 SSE 中返回 usage，需显式请求（最后一个数据块携带 usage、choices 为空）
+ */
+const STREAM_REQUEST_OPTIONS: Pick<ChatCompletionRequest, 'stream' | 'stream_options'> = {
+  stream: true,
+  stream_options: { include_usage: true },
+};
+
+/** 批量翻译默认最大输出 token 数（未传入 Provider 预算时使用） */
+const DEFAULT_BATCH_MAX_TOKENS = 4000;
+
+/**
+ * 拒绝 response_format 的端点（Service Worker 生命周期内不再发送结构化输出参数）
+ */
+const structuredOutputUnsupported = new Set<string>();
+
+/**
+ * 构建结构化输出格式：字段均为必填字符串，不允许额外字段
+ *
+ * @param name - Schema 名称
+ * @param keys - 字段名
+ */
+function buildResponseFormat(name: string, keys: string[]): ChatCompletionResponseFormat {
+  return {
+    type: 'json_schema',
+    json_schema: {
+      name,
+      strict: true,
+      schema: { ...buildStringObjectSchema(keys), additionalProperties: false },
+    },
+  };
+}
+
+/**
+ * 发送 Chat Completions 请求
+ * 带 response_format 的请求被端点以 400 / 422 拒绝、去掉该参数后成功时，
+ * 记住该端点不支持结构化输出，之后直接发送普通请求
+ *
+ * @param endpoint - 规范化后的端点 URL
+ * @param apiKey - API Key
+ * @param body - 请求体
+ * @param signal - 取消信号（超时与调用方取消）
+ */
+async function postChatCompletion(
+  endpoint: string,
+  apiKey: string,
+  body: ChatCompletionRequest,
+  signal: AbortSignal
+): Promise<Response> {
+  const send = (payload: ChatCompletionRequest) =>
+    fetch(endpoint, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        Authorization: `Bearer ${apiKey}`,
+      },
+      body: JSON.stringify(payload),
+      signal,
+    });
+
+  const plain: ChatCompletionRequest = { ...body };
+  delete plain.response_format;
+
+  if (!body.response_format || structuredOutputUnsupported.has(endpoint)) {
+    return send(plain);
+  }
+
+  const response = await send(body);
+  if (response.status !== 400 && response.status !== 422) {
+    return response;
+  }
+
+  const retried = await send(plain);
+  if (retried.ok) {
+    structuredOutputUnsupported.add(endpoint);
+    console.warn(`[LingoRecall] ${endpoint} does not support response_format, falling back to prompt-only JSON`);
+  }
+  return retried;
+}
+
 /**
  * 根据模式和目标语言构建系统提示词
  */
@@ -89,21 +207,15 @@ function parseResponse(
 ): AIAnalysisResult {
   const fallbackMessage = getFallbackMeaningMessage(targetLanguage);
 
-  // 尝试提取 JSON 部分（可能被 markdown 包裹）
-  const jsonMatch = content.match(/\{[\s\S]*\}/);
-  if (jsonMatch) {
-    try {
-      const parsed = JSON.parse(jsonMatch[0]);
-      return {
-        meaning: parsed.meaning || fallbackMessage,
-        pronunciation: mode === 'word' ? (parsed.pronunciation || '') : '',
-        partOfSpeech: mode === 'word' ? (parsed.partOfSpeech || '') : '',
-        usage: mode === 'word' ? (parsed.usage || '') : '',
-        mode,
-      };
-    } catch {
-      // JSON 解析失败
-    }
+  const fields = parseJsonStringFields(content);
+  if (fields) {
+    return {
+      meaning: fields.meaning || fallbackMessage,
+      pronunciation: mode === 'word' ? (fields.pronunciation || '') : '',
+      partOfSpeech: mode === 'word' ? (fields.partOfSpeech || '') : '',
+      usage: mode === 'word' ? (fields.usage || '') : '',
+      mode,
+    };
   }
 
   // 回退：使用原始响应作为含义
@@ -116,6 +228,69 @@ function parseResponse(
   };
 }
 
+/**
+ * 读取 SSE 流式响应，逐段回调 delta 文本
+ * 兼容 `data: {...}` 多行分片、`data: [DONE]` 结束标记与注释行
+ *
+ * @returns 聚合后的完整文本、结束原因与 usage（服务端提供时）
+ */
+async function readChatCompletionStream(
+  body: ReadableStream<Uint8Array>,
+  onChunk: (chunk: string) => void
+): Promise<{ content: string; finishReason?: string; usage?: ChatCompletionResponse['usage'] }> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let pending = '';
+  let content = '';
+  let finishReason: string | undefined;
+  let usage: ChatCompletionResponse['usage'];
+
+  const handleLine = (line: string): boolean => {
+    const trimmed = line.trim();
+    if (!trimmed.startsWith('data:')) {
+      return false;
+    }
+    const data = trimmed.slice(5).trim();
+    if (data === '[DONE]') {
+      return true;
+    }
+    try {
+      const chunk: ChatCompletionChunk = JSON.parse(data);
+      const delta = chunk.choices?.[0]?.delta?.content;
+      if (delta) {
+        content += delta;
+        onChunk(delta);
+      }
+      if (chunk.choices?.[0]?.finish_reason) {
+        finishReason = chunk.choices[0].finish_reason;
+      }
+      if (chunk.usage) {
+        usage = chunk.usage;
+      }
+    } catch {
+      // 忽略无法解析的行（心跳、非标准扩展字段等）
+    }
+    return false;
+  };
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) {
+      break;
+    }
+    pending += decoder.decode(value, { stream: true });
+    const lines = pending.split('\n');
+    pending = lines.pop() ?? '';
+    if (lines.some(handleLine)) {
+      void reader.cancel();
+      return { content, finishReason, usage };
+    }
+  }
+
+  handleLine(pending + decoder.decode());
+  return { content, finishReason, usage };
+}
+
 /**
  * 使用 OpenAI 兼容 API 分析单词
  *
@@ -123,13 +298,19 @@ function parseResponse(
  * @param apiKey - API Key
  * @param endpoint - API 端点 URL (e.g., http://localhost:8080/v1/chat/completions)
  * @param modelName - 模型名称 (e.g., gpt-4, claude-3-opus, llama3)
+ * @param onChunk - 可选流式回调：传入时以 `stream: true` 请求 SSE，每收到一段文本回调一次
+ * @param signal - 可选取消信号：取消后中止进行中的请求，抛出 CANCELLED 错误
+ * @param onUsage - 可选：响应带有 usage 时回调实际 token 用量
  * @returns AI 分析结果
  */
 export async function analyzeWordOpenAI(
   request: AnalyzeWordRequest,
   apiKey: string,
   endpoint: string,
-  modelName: string = 'gpt-4'
+  modelName: string = 'gpt-4',
+  onChunk?: (chunk: string) => void,
+  signal?: AbortSignal,
+  onUsage?: TokenUsageCallback
 ): Promise<AIAnalysisResult> {
   const startTime = Date.now();
   const mode = request.mode || 'word';
@@ -158,25 +339,32 @@ export async function analyzeWordOpenAI(
     ],
     temperature: 0.3,
     max_tokens: maxTokens,
+    ...(onChunk ? STREAM_REQUEST_OPTIONS : {}),
+    response_format: buildResponseFormat('word_analysis', getAnalysisFields(mode)),
   };
 
   // 翻译模式使用更长的超时时间
   const timeout = mode === 'translate' ? TRANSLATE_TIMEOUT_MS : RESPONSE_TIMEOUT_MS;
   const controller = new AbortController();
   const timeoutId = setTimeout(() => controller.abort(), timeout);
+  // 调用方取消与超时共用同一个 controller，按 signal.aborted 区分
+  const cancel = () => controller.abort();
+  if (signal?.aborted) {
+    controller.abort();
+  }
+  signal?.addEventListener('abort', cancel, { once: true });
 
   try {
-    const response = await fetch(normalizedEndpoint, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${apiKey}`,
-      },
-      body: JSON.stringify(requestBody),
-      signal: controller.signal,
-    });
+    const response = await postChatCompletion(normalizedEndpoint, apiKey, requestBody, controller.signal);
 
-    clearTimeout(timeoutId);
+    // 流式响应需要在读完 body 后才清除超时，避免生成中途卡死无人察觉
+    const isEventStream = Boolean(
+      onChunk && response.ok && response.body &&
+      response.headers.get('content-type')?.includes('text/event-stream')
+    );
+    if (!isEventStream) {
+      clearTimeout(timeoutId);
+    }
 
     if (!response.ok) {
       const errorText = await response.text().catch(() => 'Unknown error');
@@ -198,13 +386,24 @@ export async function analyzeWordOpenAI(
       throw new Error(`API_ERROR: ${status} - ${errorText}`);
     }
 
-    const data: ChatCompletionResponse = await response.json();
-    const content = data.choices?.[0]?.message?.content || '';
+    let content: string;
+    let usage: ChatCompletionResponse['usage'];
+
+    if (isEventStream && onChunk && response.body) {
+      ({ content, usage } = await readChatCompletionStream(response.body, onChunk));
+      clearTimeout(timeoutId);
+    } else {
+      // 服务端不支持流式时会忽略 stream 参数，按普通响应处理
+      const data: ChatCompletionResponse = await response.json();
+      content = data.choices?.[0]?.message?.content || '';
+      usage = data.usage;
+    }
 
     // 追踪 token 使用量
-    if (data.usage) {
-      const inputTokens = data.usage.prompt_tokens || 0;
-      const outputTokens = data.usage.completion_tokens || 0;
+    if (usage) {
+      const inputTokens = usage.prompt_tokens || 0;
+      const outputTokens = usage.completion_tokens || 0;
+      onUsage?.(inputTokens + outputTokens);
       // 异步追踪，不阻塞主流程
       trackUsage(inputTokens, outputTokens, modelName).catch((err) => {
         console.warn('[LingoRecall Usage] Failed to track usage:', err);
@@ -218,6 +417,9 @@ export async function analyzeWordOpenAI(
   } catch (error) {
     clearTimeout(timeoutId);
 
+    if (signal?.aborted) {
+      throw new Error('CANCELLED: Request was cancelled.');
+    }
     if (error instanceof Error) {
       if (error.name === 'AbortError') {
         throw new Error('TIMEOUT: Request timed out. Please try again.');
@@ -229,6 +431,8 @@ export async function analyzeWordOpenAI(
     }
 
     throw new Error('Unknown error occurred');
+  } finally {
+    signal?.removeEventListener('abort', cancel);
   }
 }
 
@@ -241,15 +445,21 @@ export async function analyzeWordOpenAI(
  * @param apiKey - API Key
  * @param endpoint - API 端点 URL
  * @param modelName - 模型名称
- * @returns 翻译后的文本数组
+ * @param maxTokens - 单次请求的最大输出 token 数（来自 Provider 的批量翻译预算）
+ * @param onChunk - 可选流式回调：传入时以 `stream: true` 请求 SSE，每收到一段文本回调一次
+ * @param onUsage - 可选：响应带有 usage 时回调实际 token 用量
+ * @returns 逐条译文（按编号键解析），缺失或为空的条目为 null
  */
 export async function translateBatchOpenAI(
   texts: string[],
   targetLanguage: TargetLanguage,
   apiKey: string,
   endpoint: string,
-  modelName: string = 'gpt-4'
-): Promise<string[]> {
+  modelName: string = 'gpt-4',
+  maxTokens: number = DEFAULT_BATCH_MAX_TOKENS,
+  onChunk?: (chunk: string) => void,
+  onUsage?: TokenUsageCallback
+): Promise<Array<string | null>> {
   if (texts.length === 0) {
     return [];
   }
@@ -271,7 +481,9 @@ export async function translateBatchOpenAI(
       { role: 'user', content: buildBatchTranslateUserMessage(texts) },
     ],
     temperature: 0.3,
-    max_tokens: 4000, // 批量翻译需要更多 tokens
+    max_tokens: maxTokens,
+    ...(onChunk ? STREAM_REQUEST_OPTIONS : {}),
+    response_format: buildResponseFormat('batch_translation', getBatchItemKeys(texts.length)),
   };
 
   // 批量翻译使用更长的超时时间
@@ -280,22 +492,26 @@ export async function translateBatchOpenAI(
   const timeoutId = setTimeout(() => controller.abort(), timeout);
 
   try {
-    const response = await fetch(normalizedEndpoint, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${apiKey}`,
-      },
-      body: JSON.stringify(requestBody),
-      signal: controller.signal,
-    });
+    const response = await postChatCompletion(normalizedEndpoint, apiKey, requestBody, controller.signal);
 
-    clearTimeout(timeoutId);
+    // 流式响应需要在读完 body 后才清除超时
+    const isEventStream = Boolean(
+      onChunk && response.ok && response.body &&
+      response.headers.get('content-type')?.includes('text/event-stream')
+    );
+    if (!isEventStream) {
+      clearTimeout(timeoutId);
+    }
 
     if (!response.ok) {
       const errorText = await response.text().catch(() => 'Unknown error');
       console.error('[LingoRecall] OpenAI batch translation error:', response.status, errorText);
 
+      // 429 交给限流器退避，并与单词分析的错误码保持一致
+      if (response.status === 429) {
+        throw new Error('RATE_LIMIT: Too many requests. Please try again later.');
+      }
+
       // 解析错误信息
       let errorMessage = `HTTP ${response.status}`;
       try {
@@ -309,19 +525,39 @@ export async function translateBatchOpenAI(
       throw new Error(`API_ERROR: ${errorMessage}`);
     }
 
-    const data: ChatCompletionResponse = await response.json();
-    const content = data.choices?.[0]?.message?.content || '';
+    let content: string;
+    let finishReason: string | undefined;
+    let usage: ChatCompletionResponse['usage'];
+
+    if (isEventStream && onChunk && response.body) {
+      ({ content, finishReason, usage } = await readChatCompletionStream(response.body, onChunk));
+      clearTimeout(timeoutId);
+    } else {
+      // 服务端不支持流式时会忽略 stream 参数，按普通响应处理
+      const data: ChatCompletionResponse = await response.json();
+      content = data.choices?.[0]?.message?.content || '';
+      finishReason = data.choices?.[0]?.finish_reason;
+      usage = data.usage;
+    }
+
+    // 输出触顶会导致 JSON 不完整，已完成的条目仍可按键取出，其余条目由调用方补翻
+    if (finishReason === 'length') {
+      console.warn(
+        `[LingoRecall] OpenAI batch translation truncated at max_tokens=${maxTokens} (${texts.length} texts)`
+      );
+    }
 
     // 追踪 token 使用量
-    if (data.usage) {
-      const inputTokens = data.usage.prompt_tokens || 0;
-      const outputTokens = data.usage.completion_tokens || 0;
+    if (usage) {
+      const inputTokens = usage.prompt_tokens || 0;
+      const outputTokens = usage.completion_tokens || 0;
+      onUsage?.(inputTokens + outputTokens);
       trackUsage(inputTokens, outputTokens, modelName).catch((err) => {
         console.warn('[LingoRecall Usage] Failed to track batch usage:', err);
       });
     }
 
-    return parseBatchTranslationResponse(content, texts);
+    return parseBatchTranslationItems(content, texts.length);
   } catch (error) {
     clearTimeout(timeoutId);
 
@@ -0,0 +1,75 @@
+/**
+ * LingoRecall AI - Prompt Templates Tests
+ * 结构化输出的编号键、Schema 与响应解析
+ *
+ * @module services/promptTemplates.test
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  getBatchItemKeys,
+  buildStringObjectSchema,
+  buildBatchTranslateUserMessage,
+  parseJsonStringFields,
+  parseBatchTranslationItems,
+} from './promptTemplates';
+
+describe('getBatchItemKeys', () => {
+  it('按条目数补零，字母序与数字序一致', () => {
+    expect(getBatchItemKeys(3)).toEqual(['1', '2', '3']);
+
+    const keys = getBatchItemKeys(12);
+    expect(keys[0]).toBe('01');
+    expect([...keys].sort()).toEqual(keys);
+  });
+
+  it('提示词中的编号与键一致', () => {
+    expect(buildBatchTranslateUserMessage(['a', 'b'])).toBe('[1] a\n[2] b');
+  });
+});
+
+describe('buildStringObjectSchema', () => {
+  it('所有字段均为必填字符串', () => {
+    expect(buildStringObjectSchema(['meaning'])).toEqual({
+      type: 'object',
+      properties: { meaning: { type: 'string' } },
+      required: ['meaning'],
+    });
+  });
+});
+
+describe('parseJsonStringFields', () => {
+  it('直接解析结构化输出', () => {
+    expect(parseJsonStringFields('{"meaning":"雄辩的","count":1}')).toEqual({ meaning: '雄辩的' });
+  });
+
+  it('跳过代码块前缀，截断时只保留已完整结束的字段', () => {
+    expect(parseJsonStringFields('```json\n{"meaning": "短暂的", "usage": "Used')).toEqual({ meaning: '短暂的' });
+  });
+
+  it('没有 JSON 对象时返回 null', () => {
+    expect(parseJsonStringFields('plain response')).toBeNull();
+    expect(parseJsonStringFields('["a"]')).toBeNull();
+  });
+});
+
+describe('parseBatchTranslationItems', () => {
+  it('按编号键取出译文，缺失与空译文为 null', () => {
+    expect(parseBatchTranslationItems('{"1": "你好", "3": "", "4": "多余"}', 3)).toEqual(['你好', null, null]);
+  });
+
+  it('挽救被截断响应中已完成的条目', () => {
+    expect(parseBatchTranslationItems('{"01": "一", "02": "二", "03": "三', 10)).toEqual([
+      '一', '二', null, null, null, null, null, null, null, null,
+    ]);
+  });
+
+  it('接受省略补零的键', () => {
+    expect(parseBatchTranslationItems('{"1": "一", "10": "十"}', 10)[0]).toBe('一');
+  });
+
+  it('旧格式数组只在条数一致时按位置采用', () => {
+    expect(parseBatchTranslationItems('["你好", "世界"]', 2)).toEqual(['你好', '世界']);
+    expect(parseBatchTranslationItems('["你好"]', 2)).toEqual([null, null]);
+  });
+});
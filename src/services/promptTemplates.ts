@@ -8,6 +8,7 @@
  */
 
 import type { TargetLanguage } from '../shared/types/settings';
+import { createPartialJsonParser, createJsonArrayStreamParser } from '../shared/utils/partialJson';
 
 // ============================================================
 // Language Information
@@ -291,6 +292,26 @@ export function buildTranslateUserMessage(text: string): string {
 // Full Page Translation Prompts (Batch)
 // ============================================================
 
+/**
+ * 批量翻译中各条目的编号键（"1" 起，按条目数补零，使字母序与数字序一致）
+ * 提示词中的 `[编号]` 与响应对象的键一一对应，响应部分有效时按键挽救已完成的条目
+ *
+ * @param count - 条目数
+ * @returns 编号键数组
+ */
+export function getBatchItemKeys(count: number): string[] {
+  const width = String(count).length;
+  return Array.from({ length: count }, (_, index) => String(index + 1).padStart(width, '0'));
+}
+
+/**
+ * 把待翻译文本按编号键逐行列出
+ */
+function formatNumberedTexts(texts: string[]): string {
+  const keys = getBatchItemKeys(texts.length);
+  return texts.map((text, index) => `[${keys[index]}] ${text}`).join('\n');
+}
+
 /**
  * 构建批量翻译提示词（用于全页翻译功能）
  *
@@ -303,25 +324,22 @@ export function buildBatchTranslationPrompt(
   targetLanguage: TargetLanguage
 ): string {
   const langInfo = LANGUAGE_INFO[targetLanguage];
-
-  // 将文本数组转换为带编号的格式
-  const numberedTexts = texts.map((text, index) => `[${index + 1}] ${text}`).join('\n');
+  const keys = getBatchItemKeys(texts.length);
 
   return `You are a professional translator. Translate the following texts to ${langInfo.name}.
 
 **Important requirements**:
 - Translate each text accurately while maintaining natural flow in ${langInfo.name}
 - Keep the original meaning and tone
-- Return ONLY a valid JSON array of translated strings
-- The array MUST have exactly ${texts.length} items
-- Each item must correspond to the input text at the same position
+- Return ONLY a valid JSON object that maps each item number to its translation
+- Include every item number exactly once (${texts.length} items)
 - Do NOT add any explanatory text or markdown formatting
 
 **Texts to translate** (${texts.length} items):
-${numberedTexts}
+${formatNumberedTexts(texts)}
 
-**Response format** (JSON array only):
-["translation 1", "translation 2", ...]`;
+**Response format** (JSON object only):
+{"${keys[0]}": "translation of [${keys[0]}]", ...}`;
 }
 
 /**
@@ -333,7 +351,7 @@ ${numberedTexts}
 export function buildBatchTranslateSystemPrompt(targetLanguage: TargetLanguage): string {
   const langInfo = LANGUAGE_INFO[targetLanguage];
 
-  return `Professional batch translator to ${langInfo.name}. Return JSON array of translations. Each element corresponds to input text at same position. No extra text, JSON array only.`;
+  return `Professional batch translator to ${langInfo.name}. Return a JSON object mapping each item number to its translation, e.g. [01] → {"01": "..."}. Include every item number exactly once. No extra text, JSON object only.`;
 }
 
 /**
@@ -343,44 +361,112 @@ export function buildBatchTranslateSystemPrompt(targetLanguage: TargetLanguage):
  * @returns 用户消息
  */
 export function buildBatchTranslateUserMessage(texts: string[]): string {
-  return texts.map((text, index) => `[${index + 1}] ${text}`).join('\n');
+  return formatNumberedTexts(texts);
+}
+
+// ============================================================
+// Structured Output
+// ============================================================
+
+/**
+ * 字段全部为字符串的对象 JSON Schema（结构化输出使用）
+ */
+export interface StringObjectSchema {
+  type: 'object';
+  properties: Record<string, { type: 'string' }>;
+  required: string[];
+}
+
+/**
+ * 构建字段全部为必填字符串的对象 Schema
+ *
+ * @param keys - 字段名
+ * @returns JSON Schema
+ */
+export function buildStringObjectSchema(keys: string[]): StringObjectSchema {
+  return {
+    type: 'object',
+    properties: Object.fromEntries(keys.map((key) => [key, { type: 'string' as const }])),
+    required: keys,
+  };
 }
 
 /**
- * 解析批量翻译响应
+ * 单词分析 / 翻译模式响应中的字段
+ *
+ * @param mode - 分析模式
+ * @returns 字段名
+ */
+export function getAnalysisFields(mode: 'word' | 'translate'): string[] {
+  return mode === 'translate' ? ['meaning'] : ['meaning', 'pronunciation', 'partOfSpeech', 'usage'];
+}
+
+/**
+ * 解析响应中 JSON 对象的字符串字段
+ * 结构化输出时响应本身就是 JSON，直接 JSON.parse；
+ * 否则用增量解析器跳过前缀（如 ```json 代码块标记），只保留已完整结束的字段（被截断的响应也能挽救前面的字段）
  *
  * @param response - AI 响应文本
- * @param originalTexts - 原始文本数组（用于失败时回退）
- * @returns 翻译后的文本数组
+ * @returns 字符串字段；响应中没有任何完整字段时返回 null
  */
-export function parseBatchTranslationResponse(
-  response: string,
-  originalTexts: string[]
-): string[] {
+export function parseJsonStringFields(response: string): Record<string, string> | null {
+  let fields: Record<string, string> = {};
+
   try {
-    // 尝试提取 JSON 数组
-    const jsonMatch = response.match(/\[[\s\S]*\]/);
-    if (jsonMatch) {
-      const parsed = JSON.parse(jsonMatch[0]);
-      if (Array.isArray(parsed) && parsed.length === originalTexts.length) {
-        return parsed.map((item, index) =>
-          typeof item === 'string' ? item : originalTexts[index]
-        );
-      }
+    const parsed: unknown = JSON.parse(response);
+    if (parsed && typeof parsed === 'object' && !Array.isArray(parsed)) {
+      Object.entries(parsed).forEach(([key, value]) => {
+        if (typeof value === 'string') {
+          fields[key] = value;
+        }
+      });
     }
+  } catch {
+    const parser = createPartialJsonParser();
+    parser.push(response);
+    fields = Object.fromEntries(
+      Object.entries(parser.getFields()).filter(([key]) => parser.isFieldComplete(key))
+    );
+  }
 
-    // 如果解析失败，尝试按行分割
-    const lines = response.trim().split('\n');
-    if (lines.length === originalTexts.length) {
-      return lines.map((line) => line.replace(/^\[\d+\]\s*/, '').trim());
-    }
+  return Object.keys(fields).length > 0 ? fields : null;
+}
+
+/**
+ * 解析批量翻译响应为逐条译文
+ * 按编号键取出各条目，缺失或为空的条目为 null（由调用方只补翻这些条目）；
+ * 不支持结构化输出的模型可能仍返回 JSON 数组，此时只有条数一致才按位置采用
+ *
+ * @param response - AI 响应文本
+ * @param count - 原文条数
+ * @returns 逐条译文，缺失为 null
+ */
+export function parseBatchTranslationItems(response: string, count: number): Array<string | null> {
+  const items: Array<string | null> = new Array(count).fill(null);
+
+  const fields = parseJsonStringFields(response);
+  if (fields) {
+    getBatchItemKeys(count).forEach((key, index) => {
+      // 模型可能省略补零
+      const value = fields[key] ?? fields[String(index + 1)];
+      if (value?.trim()) {
+        items[index] = value;
+      }
+    });
+    return items;
+  }
 
-    console.warn('[LingoRecall] Failed to parse batch translation, returning original');
-    return originalTexts;
-  } catch (error) {
-    console.error('[LingoRecall] Batch translation parse error:', error);
-    return originalTexts;
+  const arrayParser = createJsonArrayStreamParser();
+  const elements = arrayParser.push(response);
+  if (arrayParser.isDone() && arrayParser.getCount() === count) {
+    elements.forEach(({ index, value }) => {
+      if (value.trim()) {
+        items[index] = value;
+      }
+    });
   }
+
+  return items;
 }
 
 // ============================================================
@@ -0,0 +1,88 @@
+/**
+ * LingoRecall AI - Provider Health Tests
+ * 对冲等待时间（p90 延迟）与健康分绕过
+ *
+ * @module services/providerHealth.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import {
+  recordProviderSuccess,
+  recordProviderFailure,
+  isProviderBypassed,
+  getHedgeDelay,
+  getProviderHealth,
+  resetProviderHealth,
+  DEFAULT_HEDGE_DELAY_MS,
+  MIN_HEDGE_DELAY_MS,
+  MAX_HEDGE_DELAY_MS,
+  BYPASS_COOLDOWN_MS,
+} from './providerHealth';
+
+const PROVIDER = 'openai-compatible/gpt-4';
+
+describe('providerHealth', () => {
+  beforeEach(() => {
+    resetProviderHealth();
+    vi.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  describe('getHedgeDelay', () => {
+    it('样本不足时使用默认等待时间', () => {
+      recordProviderSuccess(PROVIDER, 800);
+
+      expect(getHedgeDelay(PROVIDER)).toBe(DEFAULT_HEDGE_DELAY_MS);
+      expect(getHedgeDelay('unknown/model')).toBe(DEFAULT_HEDGE_DELAY_MS);
+    });
+
+    it('取最近成功请求的 p90 延迟', () => {
+      for (let i = 1; i <= 10; i++) {
+        recordProviderSuccess(PROVIDER, i * 100);
+      }
+
+      expect(getHedgeDelay(PROVIDER)).toBe(900);
+      expect(getProviderHealth(PROVIDER).p90LatencyMs).toBe(900);
+    });
+
+    it('限制在上下限之间', () => {
+      for (let i = 0; i < 5; i++) {
+        recordProviderSuccess(PROVIDER, 10);
+        recordProviderSuccess('slow/model', 60_000);
+      }
+
+      expect(getHedgeDelay(PROVIDER)).toBe(MIN_HEDGE_DELAY_MS);
+      expect(getHedgeDelay('slow/model')).toBe(MAX_HEDGE_DELAY_MS);
+    });
+  });
+
+  describe('bypass', () => {
+    it('连续失败后绕过，冷却结束后重新参与', () => {
+      const now = 1_700_000_000_000;
+      const clock = vi.spyOn(Date, 'now').mockReturnValue(now);
+
+      recordProviderFailure(PROVIDER);
+      recordProviderFailure(PROVIDER);
+      expect(isProviderBypassed(PROVIDER)).toBe(false);
+
+      recordProviderFailure(PROVIDER);
+      expect(isProviderBypassed(PROVIDER)).toBe(true);
+
+      clock.mockReturnValue(now + BYPASS_COOLDOWN_MS);
+      expect(isProviderBypassed(PROVIDER)).toBe(false);
+    });
+
+    it('一次成功即可恢复', () => {
+      recordProviderFailure(PROVIDER);
+      recordProviderFailure(PROVIDER);
+      recordProviderFailure(PROVIDER);
+      recordProviderSuccess(PROVIDER, 500);
+
+      expect(isProviderBypassed(PROVIDER)).toBe(false);
+      expect(getProviderHealth(PROVIDER)).toMatchObject({ successes: 1, failures: 3, bypassed: false });
+    });
+  });
+});
@@ -0,0 +1,168 @@
+/**
+ * LingoRecall AI - Provider Health
+ * 按 Provider + 模型（getModelIdentity）记录单词分析的延迟与成败，用于对冲请求与故障切换
+ *
+ * - 延迟：最近 LATENCY_SAMPLE_SIZE 次成功请求的耗时，p90 作为对冲等待时间
+ * - 健康分：成功记 1、失败记 0 的指数滑动平均（初始为 1）
+ *   低于 BYPASS_SCORE 时在 BYPASS_COOLDOWN_MS 内绕过该 Provider，冷却结束后重新参与，
+ *   一次成功即可把分数拉回阈值之上
+ *
+ * 状态只保存在 Service Worker 内存中，Worker 重启后重新积累。
+ *
+ * @module services/providerHealth
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 单个 Provider 的健康状态快照 */
+export interface ProviderHealthSnapshot {
+  /** 健康分（0 ~ 1） */
+  score: number;
+  /** 成功次数 */
+  successes: number;
+  /** 失败次数 */
+  failures: number;
+  /** 最近成功请求的延迟 p90（毫秒），样本不足时为 null */
+  p90LatencyMs: number | null;
+  /** 当前是否被绕过 */
+  bypassed: boolean;
+}
+
+interface HealthState {
+  score: number;
+  successes: number;
+  failures: number;
+  /** 环形缓冲：成功请求的延迟 */
+  latencySamples: number[];
+  nextSample: number;
+  lastFailureAt: number;
+}
+
+// ============================================================
+// Constants
+// ============================================================
+
+/** 每个 Provider 保留的延迟样本数 */
+const LATENCY_SAMPLE_SIZE = 50;
+
+/** 计算 p90 所需的最少样本数，不足时使用默认对冲等待时间 */
+const MIN_LATENCY_SAMPLES = 5;
+
+/** 样本不足时的对冲等待时间 */
+export const DEFAULT_HEDGE_DELAY_MS = 3000;
+
+/** 对冲等待时间下限（避免极快的 Provider 让每次请求都被对冲） */
+export const MIN_HEDGE_DELAY_MS = 300;
+
+/** 对冲等待时间上限 */
+export const MAX_HEDGE_DELAY_MS = 10_000;
+
+/** 健康分的平滑系数（新结果的权重） */
+const SCORE_ALPHA = 0.3;
+
+/** 健康分低于该值时绕过该 Provider */
+export const BYPASS_SCORE = 0.35;
+
+/** 绕过的冷却时间，之后重新参与请求 */
+export const BYPASS_COOLDOWN_MS = 60_000;
+
+// ============================================================
+// State
+// ============================================================
+
+const providers = new Map<string, HealthState>();
+
+function getState(identity: string): HealthState {
+  let state = providers.get(identity);
+  if (!state) {
+    state = { score: 1, successes: 0, failures: 0, latencySamples: [], nextSample: 0, lastFailureAt: 0 };
+    providers.set(identity, state);
+  }
+  return state;
+}
+
+function p90(samples: number[]): number | null {
+  if (samples.length < MIN_LATENCY_SAMPLES) {
+    return null;
+  }
+  const sorted = [...samples].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.ceil(0.9 * sorted.length) - 1)];
+}
+
+// ============================================================
+// Public API
+// ============================================================
+
+/**
+ * 记录一次成功请求
+ *
+ * @param identity Provider 标识（getModelIdentity）
+ * @param latencyMs 请求耗时
+ */
+export function recordProviderSuccess(identity: string, latencyMs: number): void {
+  const state = getState(identity);
+  state.successes++;
+  state.score = state.score * (1 - SCORE_ALPHA) + SCORE_ALPHA;
+  state.latencySamples[state.nextSample % LATENCY_SAMPLE_SIZE] = Math.round(latencyMs);
+  state.nextSample++;
+}
+
+/**
+ * 记录一次失败请求（被对冲取消的请求不应记录）
+ *
+ * @param identity Provider 标识（getModelIdentity）
+ */
+export function recordProviderFailure(identity: string): void {
+  const state = getState(identity);
+  state.failures++;
+  state.score = state.score * (1 - SCORE_ALPHA);
+  state.lastFailureAt = Date.now();
+  if (state.score < BYPASS_SCORE) {
+    console.warn(
+      `[LingoRecall AI] Provider ${identity} unhealthy (score ${state.score.toFixed(2)}), ` +
+      `bypassing for ${BYPASS_COOLDOWN_MS / 1000}s`
+    );
+  }
+}
+
+/**
+ * Provider 是否正被绕过（健康分过低且仍在冷却期内）
+ */
+export function isProviderBypassed(identity: string): boolean {
+  const state = providers.get(identity);
+  return Boolean(
+    state && state.score < BYPASS_SCORE && Date.now() - state.lastFailureAt < BYPASS_COOLDOWN_MS
+  );
+}
+
+/**
+ * 获取对冲等待时间：该 Provider 最近成功请求的 p90 延迟
+ * 样本不足时使用 DEFAULT_HEDGE_DELAY_MS，结果限制在 [MIN_HEDGE_DELAY_MS, MAX_HEDGE_DELAY_MS]
+ */
+export function getHedgeDelay(identity: string): number {
+  const latency = p90(providers.get(identity)?.latencySamples ?? []) ?? DEFAULT_HEDGE_DELAY_MS;
+  return Math.min(MAX_HEDGE_DELAY_MS, Math.max(MIN_HEDGE_DELAY_MS, latency));
+}
+
+/**
+ * 获取 Provider 健康状态（调试与测试）
+ */
+export function getProviderHealth(identity: string): ProviderHealthSnapshot {
+  const state = getState(identity);
+  return {
+    score: state.score,
+    successes: state.successes,
+    failures: state.failures,
+    p90LatencyMs: p90(state.latencySamples),
+    bypassed: isProviderBypassed(identity),
+  };
+}
+
+/**
+ * 清空所有 Provider 的健康状态（设置变更或测试用）
+ */
+export function resetProviderHealth(): void {
+  providers.clear();
+}
@@ -0,0 +1,151 @@
+/**
+ * LingoRecall AI - Rate Limiter Tests
+ * 按键隔离的 RPM / TPM 令牌桶、熔断器与 chrome.storage.session 持久化
+ *
+ * @module services/rateLimiter.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import {
+  acquireRateLimit,
+  checkRateLimit,
+  configureRateLimit,
+  getLimiterKey,
+  getRateLimiterSnapshot,
+  onRateLimitError,
+  onRequestSuccess,
+  resetRateLimiter,
+  settleTokenUsage,
+  withRateLimit,
+} from './rateLimiter';
+
+const KEY = getLimiterKey('openai-compatible', 'https://api.example.com/v1/', 'gpt-4o');
+
+/** 内存中的 chrome.storage.session */
+let sessionData: Record<string, unknown> = {};
+
+const sessionMock = {
+  get: vi.fn(async (key: string) => (key in sessionData ? { [key]: sessionData[key] } : {})),
+  set: vi.fn(async (items: Record<string, unknown>) => {
+    sessionData = { ...sessionData, ...structuredClone(items) };
+  }),
+  remove: vi.fn(async (key: string) => {
+    delete sessionData[key];
+  }),
+};
+
+describe('rateLimiter', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.setSystemTime(1_700_000_000_000);
+    Object.assign(chrome.storage, { session: sessionMock });
+    resetRateLimiter();
+    sessionData = {};
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  describe('token buckets', () => {
+    it('额度内的并发请求同时放行，超出部分按补充速率排开', async () => {
+      configureRateLimit('openai-compatible', { rpm: 3, tpm: 0 });
+
+      const checks = await Promise.all([1, 2, 3, 4, 5].map(() => acquireRateLimit(KEY)));
+
+      expect(checks.map((check) => check.waitMs)).toEqual([0, 0, 0, 20_000, 40_000]);
+    });
+
+    it('TPM 按估算预扣，按实际用量结算', async () => {
+      configureRateLimit('openai-compatible', { rpm: 0, tpm: 1000 });
+
+      expect((await acquireRateLimit(KEY, 800)).waitMs).toBe(0);
+      expect((await acquireRateLimit(KEY, 400)).waitMs).toBe(12_000);
+
+      // 两次实际各用 100：退回 1000，余额 800
+      settleTokenUsage(KEY, 800, 100);
+      settleTokenUsage(KEY, 400, 100);
+      expect(getRateLimiterSnapshot(KEY)?.tokens).toBe(800);
+    });
+
+    it('withRateLimit 把实际用量交给请求结算', async () => {
+      configureRateLimit('openai-compatible', { rpm: 0, tpm: 1000 });
+
+      await withRateLimit(KEY, 800, async (settle) => settle(100));
+
+      expect(getRateLimiterSnapshot(KEY)?.tokens).toBe(900);
+    });
+
+    it('不同端点与模型的额度互不影响', async () => {
+      configureRateLimit('openai-compatible', { rpm: 1, tpm: 0 });
+      const other = getLimiterKey('openai-compatible', 'https://api.example.com/v1', 'gpt-4o-mini');
+
+      await acquireRateLimit(KEY);
+
+      expect((await acquireRateLimit(KEY)).waitMs).toBe(60_000);
+      expect((await acquireRateLimit(other)).waitMs).toBe(0);
+    });
+
+    it('额度为 0 时不限流', async () => {
+      configureRateLimit('localhost', { rpm: 0, tpm: 0 });
+      const key = getLimiterKey('localhost', 'http://localhost:11434', 'llama3.2');
+
+      const checks = await Promise.all(Array.from({ length: 100 }, () => acquireRateLimit(key, 10_000)));
+
+      expect(checks.every((check) => check.allowed && check.waitMs === 0)).toBe(true);
+    });
+  });
+
+  describe('circuit breaker', () => {
+    it('429 后退避，连续 3 次打开熔断器，冷却后只放行一个试探请求', async () => {
+      configureRateLimit('openai-compatible', { rpm: 60, tpm: 0 });
+
+      onRateLimitError(KEY);
+      expect((await checkRateLimit(KEY)).waitMs).toBe(5000);
+
+      onRateLimitError(KEY);
+      onRateLimitError(KEY);
+      expect(await acquireRateLimit(KEY)).toMatchObject({ allowed: false, reason: 'CIRCUIT_OPEN' });
+
+      vi.advanceTimersByTime(60_000);
+      expect((await acquireRateLimit(KEY)).allowed).toBe(true);
+      expect((await acquireRateLimit(KEY)).allowed).toBe(false);
+
+      onRequestSuccess(KEY);
+      expect((await acquireRateLimit(KEY)).allowed).toBe(true);
+    });
+
+    it('withRateLimit 把 429 计入熔断器', async () => {
+      const run = vi.fn().mockRejectedValue(new Error('RATE_LIMIT: Too many requests.'));
+
+      for (let i = 0; i < 3; i++) {
+        const pending = withRateLimit(KEY, 0, run);
+        const settled = expect(pending).rejects.toThrow('RATE_LIMIT');
+        await vi.runAllTimersAsync();
+        await settled;
+      }
+
+      await expect(withRateLimit(KEY, 0, run)).rejects.toThrow('CIRCUIT_OPEN');
+      expect(run).toHaveBeenCalledTimes(3);
+    });
+  });
+
+  describe('persistence', () => {
+    it('状态写入 chrome.storage.session，Worker 重启后恢复', async () => {
+      configureRateLimit('openai-compatible', { rpm: 2, tpm: 0 });
+      await acquireRateLimit(KEY);
+      await acquireRateLimit(KEY);
+      await vi.runAllTimersAsync();
+
+      expect(sessionMock.set).toHaveBeenCalled();
+
+      // 模拟 Worker 重启：重新加载模块
+      vi.resetModules();
+      const restarted = await import('./rateLimiter');
+      restarted.configureRateLimit('openai-compatible', { rpm: 2, tpm: 0 });
+
+      // 额度已用完（写入后只过了合并写入的 200ms），需等待约半分钟
+      expect((await restarted.acquireRateLimit(KEY)).waitMs).toBeGreaterThan(29_000);
+    });
+  });
+});
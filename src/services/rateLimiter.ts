@@ -1,17 +1,26 @@
 /**
  * LingoRecall AI - Rate Limiter & Circuit Breaker
- * 全局速率限制器 + 熔断器，防止 Gemini API 429 级联失败
+ * 按 Provider + 端点 + 模型分别限流的令牌桶 + 熔断器，防止 429 级联失败
  *
- * Circuit Breaker 状态机：
+ * 每个限流器持有两个令牌桶：
+ *   - RPM：每分钟请求数，容量 = rpm，按 rpm / 60s 匀速补充
+ *   - TPM：每分钟 token 数，容量 = tpm，按估算 token 预扣，响应后按实际用量结算
+ * 取令牌时立即预扣（余额可为负），返回需要等待的时间；并发请求在额度内同时放行，
+ * 超出额度的请求按补充速率依次排开，而不是统一按固定间隔串行。
+ *
+ * Circuit Breaker 状态机（每个限流器独立）：
  *   closed → (连续 3 次 429) → open → (冷却 60s) → half-open → (试探成功) → closed
  *                                                                (试探失败) → open
+ * 429 后清空请求桶并退避（首次 5s，连续 10s）。
  *
- * Request Spacing：
- *   默认 1000ms → 首次 429 后 5000ms → 连续 429 后 10000ms → 成功后逐步缩短 (× 0.7)
+ * 限流状态写入 chrome.storage.session，Service Worker 被回收后额度与熔断状态不会被重置。
  *
  * @module services/rateLimiter
  */
 
+import type { AIProviderType, ProviderRateLimit } from '../shared/types/settings';
+import { DEFAULT_RATE_LIMITS } from '../shared/types/settings';
+
 // ============================================================
 // Types
 // ============================================================
@@ -29,6 +38,28 @@ export interface RateLimitCheck {
   reason?: 'CIRCUIT_OPEN';
 }
 
+/**
+ * 单个限流器的状态（可序列化，写入 chrome.storage.session）
+ */
+interface LimiterState {
+  provider: AIProviderType;
+  /** 请求桶余额（可为负，表示已预约的请求） */
+  requests: number;
+  /** token 桶余额（可为负） */
+  tokens: number;
+  /** 上次补充令牌的时间戳 */
+  refilledAt: number;
+  circuitState: CircuitState;
+  /** half-open 状态下是否已有试探请求在飞行中 */
+  halfOpenProbeInFlight: boolean;
+  /** 连续 429 错误计数 */
+  consecutive429Count: number;
+  /** 熔断器打开的时间戳 */
+  circuitOpenedAt: number;
+  /** 429 退避结束时间 */
+  backoffUntil: number;
+}
+
 // ============================================================
 // Constants
 // ============================================================
@@ -39,39 +70,38 @@ const CIRCUIT_OPEN_THRESHOLD = 3;
 /** 熔断冷却时间（毫秒）— 60s */
 const CIRCUIT_COOLDOWN_MS = 60_000;
 
-/** 默认请求最小间隔（毫秒）— ~12 RPM，留余量 */
-const DEFAULT_SPACING_MS = 1000;
+/** 首次 429 后的退避时间 */
+const FIRST_429_BACKOFF_MS = 5000;
+
+/** 连续 429 后的退避时间 */
+const CONSECUTIVE_429_BACKOFF_MS = 10_000;
 
-/** 首次 429 后的间隔 */
-const FIRST_429_SPACING_MS = 5000;
+/** 令牌桶补充窗口（每分钟） */
+const WINDOW_MS = 60_000;
 
-/** 连续 429 后的间隔 */
-const CONSECUTIVE_429_SPACING_MS = 10_000;
+/** chrome.storage.session 中的状态键 */
+const SESSION_STORAGE_KEY = 'rateLimiterState';
 
-/** 成功请求后间隔缩短系数 */
-const SPACING_DECAY_FACTOR = 0.7;
+/** 状态变化后写入 session 的延迟（合并短时间内的多次变化） */
+const PERSIST_DELAY_MS = 200;
+
+/** 粗略估算：平均每 token 约 4 个字符 */
+const CHARS_PER_TOKEN = 4;
 
 // ============================================================
 // State
 // ============================================================
 
-/** 熔断器当前状态 */
-let circuitState: CircuitState = 'closed';
-
-/** half-open 状态下是否已有试探请求在飞行中 */
-let halfOpenProbeInFlight = false;
+/** 限流器注册表（键为 getLimiterKey 的返回值） */
+const limiters = new Map<string, LimiterState>();
 
-/** 连续 429 错误计数 */
-let consecutive429Count = 0;
+/** 各 Provider 的额度配置（未配置时使用默认值） */
+const configuredLimits: Partial<Record<AIProviderType, ProviderRateLimit>> = {};
 
-/** 熔断器打开的时间戳 */
-let circuitOpenedAt = 0;
+/** 从 session 恢复状态（每个 Worker 生命周期一次） */
+let restorePromise: Promise<void> | null = null;
 
-/** 上一次请求发出的时间戳 */
-let lastRequestAt = 0;
-
-/** 当前请求间隔（毫秒） */
-let currentSpacingMs = DEFAULT_SPACING_MS;
+let persistTimer: ReturnType<typeof setTimeout> | null = null;
 
 // ============================================================
 // 429 Error Detection
@@ -108,6 +138,146 @@ export function is429Error(error: unknown): boolean {
   return false;
 }
 
+/**
+ * 判断错误是否由调用方取消引起（例如对冲请求中的落败方）
+ * 取消不代表 Provider 出错，不应影响熔断器
+ */
+export function isCancelledError(error: unknown): boolean {
+  return error instanceof Error && error.message.startsWith('CANCELLED');
+}
+
+// ============================================================
+// Registry
+// ============================================================
+
+/**
+ * 生成限流器键：同一 Provider 下不同端点、不同模型的额度互不影响
+ *
+ * @param provider AI Provider
+ * @param endpoint API 端点（Gemini 为空）
+ * @param model 模型名称
+ */
+export function getLimiterKey(provider: AIProviderType, endpoint: string, model: string): string {
+  return `${provider}|${endpoint.trim().replace(/\/+$/, '')}|${model}`;
+}
+
+/**
+ * 设置 Provider 的 RPM / TPM 额度（来自 Settings.rateLimits）
+ * 已有限流器的余额不超过新的容量
+ */
+export function configureRateLimit(provider: AIProviderType, limit: ProviderRateLimit | undefined): void {
+  const current = configuredLimits[provider];
+  if (limit && current && current.rpm === limit.rpm && current.tpm === limit.tpm) {
+    return;
+  }
+  if (limit) {
+    configuredLimits[provider] = { rpm: limit.rpm, tpm: limit.tpm };
+  } else {
+    delete configuredLimits[provider];
+  }
+
+  const effective = getLimit(provider);
+  for (const state of limiters.values()) {
+    if (state.provider === provider) {
+      state.requests = Math.min(state.requests, effective.rpm);
+      state.tokens = Math.min(state.tokens, effective.tpm);
+    }
+  }
+}
+
+function getLimit(provider: AIProviderType): ProviderRateLimit {
+  return configuredLimits[provider] ?? DEFAULT_RATE_LIMITS[provider];
+}
+
+function getLimiter(key: string): LimiterState {
+  let state = limiters.get(key);
+  if (!state) {
+    const provider = key.slice(0, key.indexOf('|')) as AIProviderType;
+    const limit = getLimit(provider);
+    state = {
+      provider,
+      requests: limit.rpm,
+      tokens: limit.tpm,
+      refilledAt: Date.now(),
+      circuitState: 'closed',
+      halfOpenProbeInFlight: false,
+      consecutive429Count: 0,
+      circuitOpenedAt: 0,
+      backoffUntil: 0,
+    };
+    limiters.set(key, state);
+  }
+  return state;
+}
+
+/**
+ * 按经过的时间补充令牌（额度为 0 表示该维度不限）
+ */
+function refill(state: LimiterState, now: number): void {
+  const limit = getLimit(state.provider);
+  const elapsed = Math.max(0, now - state.refilledAt);
+  state.requests = limit.rpm > 0 ? Math.min(limit.rpm, state.requests + (elapsed * limit.rpm) / WINDOW_MS) : 0;
+  state.tokens = limit.tpm > 0 ? Math.min(limit.tpm, state.tokens + (elapsed * limit.tpm) / WINDOW_MS) : 0;
+  state.refilledAt = now;
+}
+
+/**
+ * 余额回到 0 所需的时间
+ */
+function timeUntilNonNegative(balance: number, perMinute: number): number {
+  return balance >= 0 || perMinute <= 0 ? 0 : Math.ceil((-balance * WINDOW_MS) / perMinute);
+}
+
+// ============================================================
+// Persistence
+// ============================================================
+
+function getSessionStorage(): chrome.storage.StorageArea | null {
+  return typeof chrome !== 'undefined' && chrome.storage?.session ? chrome.storage.session : null;
+}
+
+/**
+ * 从 chrome.storage.session 恢复限流状态（内存中已有的限流器优先）
+ */
+function restoreState(): Promise<void> {
+  if (!restorePromise) {
+    const storage = getSessionStorage();
+    restorePromise = storage
+      ? storage
+          .get(SESSION_STORAGE_KEY)
+          .then((result) => {
+            const saved = result?.[SESSION_STORAGE_KEY] as Record<string, LimiterState> | undefined;
+            for (const [key, state] of Object.entries(saved ?? {})) {
+              if (!limiters.has(key)) {
+                // 飞行中的试探请求随上一个 Worker 一起结束
+                limiters.set(key, { ...state, halfOpenProbeInFlight: false });
+              }
+            }
+          })
+          .catch((error) => {
+            console.warn('[LingoRecall RateLimiter] Failed to restore state:', error);
+          })
+      : Promise.resolve();
+  }
+  return restorePromise;
+}
+
+/**
+ * 合并写入 chrome.storage.session
+ */
+function schedulePersist(): void {
+  const storage = getSessionStorage();
+  if (!storage || persistTimer) {
+    return;
+  }
+  persistTimer = setTimeout(() => {
+    persistTimer = null;
+    storage.set({ [SESSION_STORAGE_KEY]: Object.fromEntries(limiters) }).catch((error) => {
+      console.warn('[LingoRecall RateLimiter] Failed to persist state:', error);
+    });
+  }, PERSIST_DELAY_MS);
+}
+
 // ============================================================
 // Circuit Breaker Logic
 // ============================================================
@@ -116,39 +286,35 @@ export function is429Error(error: unknown): boolean {
  * 检查熔断器是否允许请求通过
  * half-open 状态下只允许 1 个试探请求
  */
-function checkCircuitBreaker(): { allowed: boolean; reason?: 'CIRCUIT_OPEN' } {
-  if (circuitState === 'closed') {
-    return { allowed: true };
+function checkCircuitBreaker(key: string, state: LimiterState): boolean {
+  if (state.circuitState === 'closed') {
+    return true;
   }
 
-  if (circuitState === 'open') {
-    const elapsed = Date.now() - circuitOpenedAt;
-    if (elapsed >= CIRCUIT_COOLDOWN_MS) {
+  if (state.circuitState === 'open') {
+    if (Date.now() - state.circuitOpenedAt >= CIRCUIT_COOLDOWN_MS) {
       // 冷却时间已过，进入 half-open 状态
-      circuitState = 'half-open';
-      console.log('[LingoRecall RateLimiter] Circuit breaker → half-open (cooldown elapsed)');
-      return { allowed: true };
+      state.circuitState = 'half-open';
+      console.log(`[LingoRecall RateLimiter] ${key}: circuit breaker → half-open (cooldown elapsed)`);
+      return true;
     }
     // 仍在冷却中
-    return { allowed: false, reason: 'CIRCUIT_OPEN' };
+    return false;
   }
 
-  // half-open：只允许 1 个试探请求
-  if (halfOpenProbeInFlight) {
-    // 已有试探请求在飞行中，拒绝并发请求
-    return { allowed: false, reason: 'CIRCUIT_OPEN' };
-  }
-  return { allowed: true };
+  // half-open：已有试探请求在飞行中时拒绝并发请求
+  return !state.halfOpenProbeInFlight;
 }
 
 /**
  * 打开熔断器
  */
-function openCircuit(): void {
-  circuitState = 'open';
-  circuitOpenedAt = Date.now();
+function openCircuit(key: string, state: LimiterState): void {
+  state.circuitState = 'open';
+  state.circuitOpenedAt = Date.now();
+  state.halfOpenProbeInFlight = false;
   console.warn(
-    `[LingoRecall RateLimiter] Circuit breaker → OPEN (${consecutive429Count} consecutive 429 errors). ` +
+    `[LingoRecall RateLimiter] ${key}: circuit breaker → OPEN (${state.consecutive429Count} consecutive 429 errors). ` +
     `Will retry after ${CIRCUIT_COOLDOWN_MS / 1000}s cooldown.`
   );
 }
@@ -158,125 +324,217 @@ function openCircuit(): void {
 // ============================================================
 
 /**
- * 检查是否允许发送请求
- * 综合熔断器状态和请求间隔控制
+ * 估算一次请求消耗的 token 数（输入按字符数估算 + 输出上限）
+ *
+ * @param inputChars 提示词与原文的总字符数
+ * @param maxOutputTokens 请求的最大输出 token 数
+ */
+export function estimateRequestTokens(inputChars: number, maxOutputTokens: number): number {
+  return Math.ceil(inputChars / CHARS_PER_TOKEN) + maxOutputTokens;
+}
+
+/**
+ * 检查熔断器是否允许请求（不占用额度）
+ */
+export async function checkRateLimit(key: string): Promise<RateLimitCheck> {
+  await restoreState();
+  const state = getLimiter(key);
+  if (!checkCircuitBreaker(key, state)) {
+    return { allowed: false, waitMs: 0, reason: 'CIRCUIT_OPEN' };
+  }
+  return { allowed: true, waitMs: Math.max(0, state.backoffUntil - Date.now()) };
+}
+
+/**
+ * 为一次请求预扣 1 个请求令牌和估算的 token
+ * allowed 为 true 时额度已预扣，调用方等待 waitMs 后发出请求
  *
+ * @param key 限流器键
+ * @param estimatedTokens 估算的 token 数（超过 TPM 容量时按容量计，避免永远无法放行）
  * @returns RateLimitCheck — allowed / waitMs / reason
  */
-export function checkRateLimit(): RateLimitCheck {
+export async function acquireRateLimit(key: string, estimatedTokens = 0): Promise<RateLimitCheck> {
+  await restoreState();
+  const state = getLimiter(key);
+
   // 1. 熔断器检查
-  const circuitCheck = checkCircuitBreaker();
-  if (!circuitCheck.allowed) {
-    return {
-      allowed: false,
-      waitMs: 0,
-      reason: 'CIRCUIT_OPEN',
-    };
+  if (!checkCircuitBreaker(key, state)) {
+    return { allowed: false, waitMs: 0, reason: 'CIRCUIT_OPEN' };
   }
 
-  // 2. 请求间隔检查
+  // 2. 令牌桶预扣
   const now = Date.now();
-  const elapsed = now - lastRequestAt;
-  const waitMs = Math.max(0, currentSpacingMs - elapsed);
+  const limit = getLimit(state.provider);
+  refill(state, now);
+  if (limit.rpm > 0) {
+    state.requests -= 1;
+  }
+  if (limit.tpm > 0) {
+    state.tokens -= Math.min(estimatedTokens, limit.tpm);
+  }
+
+  // half-open 状态下标记试探请求已发出
+  if (state.circuitState === 'half-open') {
+    state.halfOpenProbeInFlight = true;
+  }
+  schedulePersist();
 
-  return {
-    allowed: true,
-    waitMs,
-  };
+  const waitMs = Math.max(
+    state.backoffUntil - now,
+    timeUntilNonNegative(state.requests, limit.rpm),
+    timeUntilNonNegative(state.tokens, limit.tpm)
+  );
+  return { allowed: true, waitMs: Math.max(0, waitMs) };
 }
 
 /**
- * 标记请求开始
- * 更新最后请求时间戳
+ * 按实际 token 用量结算预扣的 token（多退少补）
+ *
+ * @param key 限流器键
+ * @param estimatedTokens 预扣时的估算值
+ * @param actualTokens 响应中的实际用量
  */
-export function onRequestStart(): void {
-  lastRequestAt = Date.now();
-  // half-open 状态下标记试探请求已发出
-  if (circuitState === 'half-open') {
-    halfOpenProbeInFlight = true;
+export function settleTokenUsage(key: string, estimatedTokens: number, actualTokens: number): void {
+  const state = limiters.get(key);
+  const limit = state && getLimit(state.provider);
+  if (!state || !limit || limit.tpm <= 0) {
+    return;
   }
+  refill(state, Date.now());
+  state.tokens = Math.min(limit.tpm, state.tokens + Math.min(estimatedTokens, limit.tpm) - actualTokens);
+  schedulePersist();
 }
 
 /**
  * 标记请求成功
- * 重置熔断器（如果处于 half-open 状态），逐步缩短间隔
+ * 重置熔断器（如果处于 half-open 状态）与连续 429 计数
  */
-export function onRequestSuccess(): void {
+export function onRequestSuccess(key: string): void {
+  const state = getLimiter(key);
+
   // half-open 试探成功 → 回到 closed
-  if (circuitState === 'half-open') {
-    circuitState = 'closed';
-    halfOpenProbeInFlight = false;
-    console.log('[LingoRecall RateLimiter] Circuit breaker → closed (probe request succeeded)');
+  if (state.circuitState === 'half-open') {
+    state.circuitState = 'closed';
+    state.halfOpenProbeInFlight = false;
+    console.log(`[LingoRecall RateLimiter] ${key}: circuit breaker → closed (probe request succeeded)`);
   }
 
-  // 重置连续 429 计数
-  consecutive429Count = 0;
-
-  // 逐步缩短间隔，但不低于默认值
-  if (currentSpacingMs > DEFAULT_SPACING_MS) {
-    currentSpacingMs = Math.max(
-      DEFAULT_SPACING_MS,
-      Math.round(currentSpacingMs * SPACING_DECAY_FACTOR)
-    );
-    console.log(`[LingoRecall RateLimiter] Spacing decreased to ${currentSpacingMs}ms`);
-  }
+  state.consecutive429Count = 0;
+  schedulePersist();
 }
 
 /**
  * 标记 429 速率限制错误
- * 增加连续 429 计数，调整间隔，必要时触发熔断
+ * 清空请求桶并退避，连续 429 达到阈值时触发熔断
  */
-export function onRateLimitError(): void {
-  consecutive429Count++;
+export function onRateLimitError(key: string): void {
+  const state = getLimiter(key);
+  state.consecutive429Count++;
 
   // half-open 试探失败 → 回到 open
-  if (circuitState === 'half-open') {
-    halfOpenProbeInFlight = false;
-    openCircuit();
+  if (state.circuitState === 'half-open') {
+    openCircuit(key, state);
+    schedulePersist();
     return;
   }
 
-  // 调整请求间隔
-  if (consecutive429Count === 1) {
-    currentSpacingMs = FIRST_429_SPACING_MS;
-    console.warn(`[LingoRecall RateLimiter] First 429 error, spacing increased to ${currentSpacingMs}ms`);
-  } else {
-    currentSpacingMs = CONSECUTIVE_429_SPACING_MS;
-    console.warn(`[LingoRecall RateLimiter] Consecutive 429 error (#${consecutive429Count}), spacing increased to ${currentSpacingMs}ms`);
-  }
+  // 服务端认为额度已用完：本地余额归零，之后的请求按补充速率排开
+  const now = Date.now();
+  refill(state, now);
+  state.requests = Math.min(state.requests, 0);
+  const backoffMs = state.consecutive429Count === 1 ? FIRST_429_BACKOFF_MS : CONSECUTIVE_429_BACKOFF_MS;
+  state.backoffUntil = Math.max(state.backoffUntil, now + backoffMs);
+  console.warn(
+    `[LingoRecall RateLimiter] ${key}: 429 error (#${state.consecutive429Count}), backing off ${backoffMs}ms`
+  );
 
   // 连续 429 次数达到阈值 → 打开熔断器
-  if (consecutive429Count >= CIRCUIT_OPEN_THRESHOLD) {
-    openCircuit();
+  if (state.consecutive429Count >= CIRCUIT_OPEN_THRESHOLD) {
+    openCircuit(key, state);
   }
+  schedulePersist();
 }
 
 /**
  * 标记非 429 的其他错误
  * 不影响熔断器状态，但不重置连续 429 计数
  */
-export function onRequestError(): void {
+export function onRequestError(key: string): void {
+  const state = getLimiter(key);
   // half-open 状态下，非 429 错误也视为试探失败 → 回到 open
-  if (circuitState === 'half-open') {
-    halfOpenProbeInFlight = false;
-    openCircuit();
-    console.warn('[LingoRecall RateLimiter] Half-open probe failed (non-429 error), circuit → OPEN');
-    return;
+  if (state.circuitState === 'half-open') {
+    openCircuit(key, state);
+    console.warn(`[LingoRecall RateLimiter] ${key}: half-open probe failed (non-429 error), circuit → OPEN`);
+    schedulePersist();
   }
   // closed 状态下的其他错误不改变熔断器状态
   // 也不重置 consecutive429Count，因为可能只是中间穿插了一个其他错误
 }
 
+/**
+ * 在限流器下执行一次请求：预扣额度、等待、执行并按结果更新熔断器
+ * run 收到 settle 回调，响应带有实际 token 用量时调用它按实际用量结算 TPM 预扣
+ *
+ * @param key 限流器键
+ * @param estimatedTokens 估算的 token 数
+ * @param run 实际请求
+ */
+export async function withRateLimit<T>(
+  key: string,
+  estimatedTokens: number,
+  run: (settle: (actualTokens: number) => void) => Promise<T>
+): Promise<T> {
+  const check = await acquireRateLimit(key, estimatedTokens);
+  if (!check.allowed) {
+    console.warn(`[LingoRecall RateLimiter] ${key}: request blocked (${check.reason})`);
+    throw new Error(`${check.reason}: Too many requests. Please try again later.`);
+  }
+  if (check.waitMs > 0) {
+    console.log(`[LingoRecall RateLimiter] ${key}: waiting ${check.waitMs}ms for quota`);
+    await new Promise((resolve) => setTimeout(resolve, check.waitMs));
+  }
+
+  const settle = (actualTokens: number) => settleTokenUsage(key, estimatedTokens, actualTokens);
+
+  try {
+    const result = await run(settle);
+    onRequestSuccess(key);
+    return result;
+  } catch (error) {
+    if (is429Error(error)) {
+      onRateLimitError(key);
+    } else if (!isCancelledError(error)) {
+      onRequestError(key);
+    }
+    throw error;
+  }
+}
+
+/**
+ * 获取限流器快照（调试与测试）
+ */
+export function getRateLimiterSnapshot(key: string): Readonly<LimiterState> | undefined {
+  const state = limiters.get(key);
+  if (state) {
+    refill(state, Date.now());
+  }
+  return state;
+}
+
 /**
  * 重置速率限制器到初始状态
  * 用于设置变更或手动恢复
  */
 export function resetRateLimiter(): void {
-  circuitState = 'closed';
-  halfOpenProbeInFlight = false;
-  consecutive429Count = 0;
-  circuitOpenedAt = 0;
-  lastRequestAt = 0;
-  currentSpacingMs = DEFAULT_SPACING_MS;
+  limiters.clear();
+  for (const provider of Object.keys(configuredLimits) as AIProviderType[]) {
+    delete configuredLimits[provider];
+  }
+  restorePromise = Promise.resolve();
+  if (persistTimer) {
+    clearTimeout(persistTimer);
+    persistTimer = null;
+  }
+  Promise.resolve(getSessionStorage()?.remove(SESSION_STORAGE_KEY)).catch(() => undefined);
   console.log('[LingoRecall RateLimiter] Reset to initial state');
 }
@@ -0,0 +1,68 @@
+/**
+ * LingoRecall AI - Translation Memory Tests
+ *
+ * @module services/translationMemory.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { deleteDatabase, closeDatabase } from '../shared/storage/db';
+import {
+  countTranslationMemoryEntries,
+  pruneTranslationMemoryEntries,
+} from '../shared/storage/translationMemoryStore';
+import {
+  generateMemoryKey,
+  lookupTranslationMemory,
+  rememberTranslations,
+  clearTranslationMemory,
+} from './translationMemory';
+
+const MODEL = 'gemini/gemini-2.0-flash';
+
+describe('translationMemory', () => {
+  beforeEach(async () => {
+    await deleteDatabase();
+    await clearTranslationMemory();
+  });
+
+  afterEach(() => {
+    closeDatabase();
+  });
+
+  it('normalizes whitespace but keeps case in keys', () => {
+    expect(generateMemoryKey('  Sign   in ', 'zh-CN', MODEL)).toBe(`${MODEL}:zh-CN:Sign in`);
+    expect(generateMemoryKey('Sign in', 'zh-CN', MODEL)).not.toBe(generateMemoryKey('sign in', 'zh-CN', MODEL));
+  });
+
+  it('returns remembered translations in input order with null for misses', async () => {
+    await rememberTranslations(['Home', 'Sign in'], ['首页', '登录'], 'zh-CN', MODEL);
+
+    const results = await lookupTranslationMemory(['Sign in', 'Unknown', 'Home'], 'zh-CN', MODEL);
+
+    expect(results).toEqual(['登录', null, '首页']);
+  });
+
+  it('separates entries by target language and model', async () => {
+    await rememberTranslations(['Home'], ['首页'], 'zh-CN', MODEL);
+
+    expect(await lookupTranslationMemory(['Home'], 'ja', MODEL)).toEqual([null]);
+    expect(await lookupTranslationMemory(['Home'], 'zh-CN', 'openai-compatible/gpt-4')).toEqual([null]);
+  });
+
+  it('does not remember fallbacks that echo the source text', async () => {
+    await rememberTranslations(['Home', 'Privacy'], ['Home', ''], 'zh-CN', MODEL);
+
+    expect(await countTranslationMemoryEntries()).toBe(0);
+  });
+
+  it('evicts least recently accessed entries beyond the limit', async () => {
+    await rememberTranslations(['A1', 'B1', 'C1'], ['甲', '乙', '丙'], 'zh-CN', MODEL);
+    await new Promise((resolve) => setTimeout(resolve, 5));
+    await lookupTranslationMemory(['A1'], 'zh-CN', MODEL);
+
+    const removed = await pruneTranslationMemoryEntries(1);
+
+    expect(removed).toBe(2);
+    expect(await lookupTranslationMemory(['A1', 'B1', 'C1'], 'zh-CN', MODEL)).toEqual(['甲', null, null]);
+  });
+});
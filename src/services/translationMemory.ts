@@ -0,0 +1,184 @@
+/**
+ * LingoRecall AI - Translation Memory
+ * 全页翻译的持久化翻译记忆服务
+ *
+ * - lookupTranslationMemory: translatePage 在分批前批量查询，命中的片段不再发给 AI
+ * - rememberTranslations: TRANSLATE_PAGE_SEGMENT 成功后写入（不阻塞响应）
+ *
+ * 条目按模型区分，切换模型后不会复用其他模型的译文。
+ *
+ * @module services/translationMemory
+ */
+
+import {
+  getTranslationMemoryEntries,
+  putTranslationMemoryEntries,
+  pruneTranslationMemoryEntries,
+  clearTranslationMemoryEntries,
+  type TranslationMemoryEntry,
+} from '../shared/storage/translationMemoryStore';
+
+// ============================================================
+// Configuration
+// ============================================================
+
+const MEMORY_CONFIG = {
+  /** 最大条目数 */
+  MAX_ENTRIES: 20000,
+  /** 每写入多少条触发一次容量清理 */
+  PRUNE_EVERY_WRITES: 200,
+  /** 超过该长度的片段不写入（通常是正文段落，几乎不会重复） */
+  MAX_TEXT_LENGTH: 500,
+};
+
+/** 距离上次清理以来写入的条目数 */
+let writesSincePrune = 0;
+
+const stats = {
+  hits: 0,
+  misses: 0,
+  writes: 0,
+  errors: 0,
+};
+
+// ============================================================
+// Keys
+// ============================================================
+
+/**
+ * 规范化片段文本：合并空白，保留大小写（大小写会影响译文）
+ */
+function normalizeSegment(text: string): string {
+  return text.trim().replace(/\s+/g, ' ');
+}
+
+/**
+ * 生成翻译记忆主键
+ *
+ * @param text - 原文
+ * @param targetLanguage - 目标语言
+ * @param model - 模型标识
+ */
+export function generateMemoryKey(text: string, targetLanguage: string, model: string): string {
+  return `${model}:${targetLanguage}:${normalizeSegment(text)}`;
+}
+
+// ============================================================
+// Public API
+// ============================================================
+
+/**
+ * 批量查询翻译记忆
+ * 存储异常时按全部未命中处理，不影响翻译流程
+ *
+ * @param texts - 原文列表
+ * @param targetLanguage - 目标语言
+ * @param model - 模型标识
+ * @returns 与 texts 顺序对应的译文，未命中为 null
+ */
+export async function lookupTranslationMemory(
+  texts: string[],
+  targetLanguage: string,
+  model: string
+): Promise<(string | null)[]> {
+  try {
+    const keys = texts.map((text) => generateMemoryKey(text, targetLanguage, model));
+    const results = await getTranslationMemoryEntries(keys);
+    const hitCount = results.filter((result) => result !== null).length;
+    stats.hits += hitCount;
+    stats.misses += texts.length - hitCount;
+    return results;
+  } catch (error) {
+    stats.errors++;
+    console.warn('[LingoRecall TranslationMemory] Lookup failed:', error);
+    return texts.map(() => null);
+  }
+}
+
+/**
+ * 写入翻译结果
+ * 译文为空或与原文相同（通常是解析失败后的原文回退）时不写入
+ *
+ * @param texts - 原文列表
+ * @param translations - 与 texts 顺序对应的译文
+ * @param targetLanguage - 目标语言
+ * @param model - 模型标识
+ */
+export async function rememberTranslations(
+  texts: string[],
+  translations: string[],
+  targetLanguage: string,
+  model: string
+): Promise<void> {
+  const now = Date.now();
+  const entries: TranslationMemoryEntry[] = [];
+
+  texts.forEach((text, index) => {
+    const translation = translations[index];
+    const normalized = normalizeSegment(text);
+    if (
+      !translation ||
+      normalized.length > MEMORY_CONFIG.MAX_TEXT_LENGTH ||
+      normalizeSegment(translation) === normalized
+    ) {
+      return;
+    }
+
+    entries.push({
+      key: generateMemoryKey(text, targetLanguage, model),
+      text: normalized,
+      targetLanguage,
+      model,
+      translation,
+      createdAt: now,
+      lastAccessAt: now,
+      hitCount: 0,
+    });
+  });
+
+  if (entries.length === 0) {
+    return;
+  }
+
+  try {
+    await putTranslationMemoryEntries(entries);
+    stats.writes += entries.length;
+
+    writesSincePrune += entries.length;
+    if (writesSincePrune >= MEMORY_CONFIG.PRUNE_EVERY_WRITES) {
+      writesSincePrune = 0;
+      const removed = await pruneTranslationMemoryEntries(MEMORY_CONFIG.MAX_ENTRIES);
+      if (removed > 0) {
+        console.log(`[LingoRecall TranslationMemory] Pruned ${removed} entries`);
+      }
+    }
+  } catch (error) {
+    stats.errors++;
+    console.warn('[LingoRecall TranslationMemory] Write failed:', error);
+  }
+}
+
+/**
+ * 清空翻译记忆
+ */
+export async function clearTranslationMemory(): Promise<void> {
+  writesSincePrune = 0;
+  await clearTranslationMemoryEntries();
+}
+
+/**
+ * 获取翻译记忆统计
+ */
+export function getTranslationMemoryStats(): {
+  hits: number;
+  misses: number;
+  hitRate: number;
+  writes: number;
+  errors: number;
+} {
+  const total = stats.hits + stats.misses;
+  return {
+    ...stats,
+    hitRate: total > 0 ? stats.hits / total : 0,
+  };
+}
@@ -4,7 +4,15 @@
  */
 
 import { ErrorCode, createError } from '../types/errors';
-import type { Message, MessageType, Response, ResponseDataMap, PayloadMap } from './types';
+import type {
+  Message,
+  MessageType,
+  PortName,
+  Response,
+  ResponseDataMap,
+  PayloadMap,
+  StreamPortMessage,
+} from './types';
 
 /**
  * 消息处理函数类型
@@ -32,6 +40,77 @@ export function registerHandler<T extends MessageType>(
   console.log(`[LingoRecall] Registered handler for: ${type}`);
 }
 
+/**
+ * 流式处理函数类型
+ * 通过 emit 推送中间结果，返回值作为最终响应
+ */
+export type StreamHandler<T extends MessageType, TPartial> = (
+  payload: PayloadMap[T],
+  emit: (partial: TPartial) => void
+) => Promise<Response<ResponseDataMap[T]>>;
+
+/**
+ * 注册流式端口处理程序（Service Worker 侧）
+ * 每个端口只处理一次请求：收到负载后边处理边推送 PARTIAL，最后发送 DONE；
+ * 对端提前断开时停止推送，处理本身继续完成（结果仍会写入缓存）
+ *
+ * @param portName 端口名称
+ * @param handler 处理函数
+ */
+export function registerStreamHandler<T extends MessageType, TPartial>(
+  portName: PortName,
+  handler: StreamHandler<T, TPartial>
+): void {
+  chrome.runtime.onConnect.addListener((port) => {
+    if (port.name !== portName) {
+      return;
+    }
+
+    let connected = true;
+    let started = false;
+    port.onDisconnect.addListener(() => {
+      connected = false;
+    });
+
+    const post = (message: StreamPortMessage<TPartial, ResponseDataMap[T]>) => {
+      if (!connected) {
+        return;
+      }
+      try {
+        port.postMessage(message);
+      } catch {
+        // 对端已关闭（弹窗被关闭或页面跳转）
+        connected = false;
+      }
+    };
+
+    port.onMessage.addListener((payload: PayloadMap[T]) => {
+      if (started) {
+        return;
+      }
+      started = true;
+
+      handler(payload, (partial) => post({ type: 'PARTIAL', data: partial }))
+        .then((response) => post({ type: 'DONE', response }))
+        .catch((error) => {
+          console.error(`[LingoRecall] Stream handler error for ${portName}:`, error);
+          post({
+            type: 'DONE',
+            response: {
+              success: false,
+              error: createError(
+                ErrorCode.UNKNOWN,
+                error instanceof Error ? error.message : 'Unknown error'
+              ),
+            },
+          });
+        });
+    });
+  });
+
+  console.log(`[LingoRecall] Registered stream handler for: ${portName}`);
+}
+
 /**
  * 获取消息处理程序
  * @param type 消息类型
@@ -6,20 +6,39 @@
 // Types
 export {
   MessageTypes,
+  PortNames,
   type MessageType,
+  type PortName,
   type Message,
   type Response,
   type TypedResponse,
+  type StreamPortMessage,
   type PayloadMap,
   type ResponseDataMap,
   type AnalyzeWordPayload,
   type AnalyzeWordResult,
+  type AnalyzeWordPartial,
   type AnalysisMode,
   type SaveWordPayload,
   type WordRecord,
   type GetWordsPayload,
+  type GetWordsResult,
+  type WordSortField,
+  type WordField,
+  type WordRecordView,
+  type WordDetailField,
+  type WordDetail,
+  type WordSummary,
+  type GetWordDetailPayload,
+  type SearchWordsPayload,
+  type SearchWordsResult,
   type UpdateWordPayload,
   type DeleteWordPayload,
+  type BatchUpdateWordsPayload,
+  type BatchDeleteWordsPayload,
+  type BatchWordResult,
+  type BatchWordsResult,
+  type BatchProgress,
   type HighlightTextPayload,
   type UpdateBadgePayload,
   // Story 2.3: Jump to Source
@@ -32,9 +51,16 @@ export {
   // Story 3.4: Review Word
   type ReviewWordPayload,
   type ReviewWordResult,
+  type GetReviewForecastPayload,
+  type ReviewForecastDay,
+  type ReviewForecast,
   // Full Page Translation
   type TranslatePageSegmentPayload,
   type TranslatePageSegmentResult,
+  type TranslatedSegment,
+  type TranslationPriority,
+  type LookupTranslationMemoryPayload,
+  type LookupTranslationMemoryResult,
   // Local Model Connection
   type TestLocalConnectionPayload,
   type TestLocalConnectionResult,
@@ -48,6 +74,7 @@ export {
 // Sender utilities
 export {
   sendMessage,
+  sendMessageWithStream,
   sendToTab,
   sendToActiveTab,
 } from './sender';
@@ -56,6 +83,8 @@ export {
 export {
   type MessageHandler,
   registerHandler,
+  registerStreamHandler,
+  type StreamHandler,
   getHandler,
   hasHandler,
   getRegisteredTypes,
@@ -1,6 +1,6 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
-import { sendMessage, sendToTab } from './sender';
-import { MessageTypes } from './types';
+import { sendMessage, sendToTab, sendMessageWithStream } from './sender';
+import { MessageTypes, PortNames } from './types';
 import { ErrorCode } from '../types/errors';
 
 const analyzePayload = {
@@ -61,6 +61,77 @@ describe('messaging sender', () => {
     });
   });
 
+  describe('sendMessageWithStream', () => {
+    function mockPort() {
+      const listeners: {
+        message?: (message: unknown) => void;
+        disconnect?: () => void;
+      } = {};
+      const port = {
+        onMessage: { addListener: vi.fn((fn) => { listeners.message = fn; }) },
+        onDisconnect: { addListener: vi.fn((fn) => { listeners.disconnect = fn; }) },
+        postMessage: vi.fn(),
+        disconnect: vi.fn(),
+      };
+      vi.spyOn(
+        chrome.runtime as unknown as { connect: (...args: unknown[]) => unknown },
+        'connect'
+      ).mockReturnValue(port);
+      return { port, listeners };
+    }
+
+    it('forwards partial results before resolving with the final response', async () => {
+      const { port, listeners } = mockPort();
+      const partials: unknown[] = [];
+      const final = {
+        success: true,
+        data: { meaning: '词', pronunciation: '/w/', partOfSpeech: 'noun', usage: 'usage' },
+      };
+
+      const promise = sendMessageWithStream(
+        PortNames.ANALYZE_WORD_STREAM,
+        MessageTypes.ANALYZE_WORD,
+        analyzePayload,
+        (partial) => partials.push(partial),
+        1000
+      );
+      expect(chrome.runtime.connect).toHaveBeenCalledWith({ name: PortNames.ANALYZE_WORD_STREAM });
+      expect(port.postMessage).toHaveBeenCalledWith(analyzePayload);
+
+      listeners.message?.({ type: 'PARTIAL', data: { meaning: '词' } });
+      listeners.message?.({ type: 'DONE', response: final });
+
+      await expect(promise).resolves.toEqual(final);
+      expect(partials).toEqual([{ meaning: '词' }]);
+      expect(port.disconnect).toHaveBeenCalled();
+    });
+
+    it('falls back to sendMessage when the port disconnects early', async () => {
+      const { listeners } = mockPort();
+      const response = { success: true, data: { meaning: 'm', pronunciation: '', partOfSpeech: '', usage: '' } };
+      vi.spyOn(
+        chrome.runtime as unknown as { sendMessage: (...args: unknown[]) => unknown },
+        'sendMessage'
+      ).mockImplementation((_message, callback) => {
+        if (typeof callback === 'function') {
+          callback(response);
+        }
+        return undefined;
+      });
+
+      const promise = sendMessageWithStream(
+        PortNames.ANALYZE_WORD_STREAM,
+        MessageTypes.ANALYZE_WORD,
+        analyzePayload,
+        () => {},
+        1000
+      );
+      listeners.disconnect?.();
+
+      await expect(promise).resolves.toEqual(response);
+    });
+  });
+
   describe('sendToTab', () => {
     it('returns response from tab', async () => {
       const response = { success: true, data: { success: true } };
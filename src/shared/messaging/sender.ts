@@ -4,7 +4,15 @@
  */
 
 import { ErrorCode } from '../types/errors';
-import type { Message, MessageType, PayloadMap, Response, ResponseDataMap } from './types';
+import type {
+  Message,
+  MessageType,
+  PayloadMap,
+  PortName,
+  Response,
+  ResponseDataMap,
+  StreamPortMessage,
+} from './types';
 
 // 默认超时时间（毫秒）
 const DEFAULT_TIMEOUT = 30000;
@@ -164,6 +172,103 @@ export async function sendMessage<T extends MessageType>(
   });
 }
 
+/**
+ * 通过长连接端口发起流式请求
+ * 中间结果经 onPartial 推送，最终响应与同类型的普通消息结构一致；
+ * 端口不可用或在结果到达前断开（如 Service Worker 被回收）时回退到 sendMessage
+ *
+ * @param portName 端口名称（Service Worker 侧由 registerStreamHandler 注册）
+ * @param type 回退使用的消息类型
+ * @param payload 消息负载
+ * @param onPartial 中间结果回调
+ * @param timeout 超时时间（默认 30 秒）
+ * @returns Promise<Response<T>>
+ */
+export async function sendMessageWithStream<T extends MessageType, TPartial>(
+  portName: PortName,
+  type: T,
+  payload: PayloadMap[T],
+  onPartial: (partial: TPartial) => void,
+  timeout = DEFAULT_TIMEOUT
+): Promise<Response<ResponseDataMap[T]>> {
+  if (typeof chrome === 'undefined' || !chrome.runtime || !chrome.runtime.connect) {
+    return sendMessage(type, payload, timeout);
+  }
+
+  return new Promise((resolve) => {
+    let settled = false;
+    let port: chrome.runtime.Port | null = null;
+
+    const settle = (): boolean => {
+      if (settled) {
+        return false;
+      }
+      settled = true;
+      clearTimeout(timer);
+      return true;
+    };
+
+    const finish = (response: Response<ResponseDataMap[T]>) => {
+      if (!settle()) {
+        return;
+      }
+      try {
+        port?.disconnect();
+      } catch {
+        // 端口可能已被对端关闭
+      }
+      resolve(response);
+    };
+
+    const fallback = () => {
+      if (settle()) {
+        sendMessage(type, payload, timeout).then(resolve);
+      }
+    };
+
+    const timer = setTimeout(() => {
+      finish({
+        success: false,
+        error: {
+          code: ErrorCode.TIMEOUT,
+          message: `Request timed out after ${timeout}ms`,
+        },
+      });
+    }, timeout);
+
+    try {
+      port = chrome.runtime.connect({ name: portName });
+      port.onMessage.addListener((message: StreamPortMessage<TPartial, ResponseDataMap[T]>) => {
+        if (message.type === 'PARTIAL') {
+          if (!settled) {
+            onPartial(message.data);
+          }
+        } else if (message.type === 'DONE') {
+          finish(message.response);
+        }
+      });
+      port.onDisconnect.addListener(() => {
+        // 读取 lastError，避免控制台出现 Unchecked runtime.lastError
+        void chrome.runtime.lastError;
+        fallback();
+      });
+      port.postMessage(payload);
+    } catch (error) {
+      if (isContextInvalidatedError(error)) {
+        finish({
+          success: false,
+          error: {
+            code: ErrorCode.EXTENSION_CONTEXT_INVALIDATED,
+            message: '扩展已更新，请刷新页面后重试',
+          },
+        });
+      } else {
+        fallback();
+      }
+    }
+  });
+}
+
 /**
  * 从 Service Worker 发送消息到指定标签页的 Content Script
  * @param tabId 目标标签页 ID
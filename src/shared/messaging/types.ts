@@ -17,10 +17,14 @@ export const MessageTypes = {
   // 词汇存储相关
   SAVE_WORD: 'SAVE_WORD',
   GET_WORDS: 'GET_WORDS',
+  GET_WORD_DETAIL: 'GET_WORD_DETAIL',
+  SEARCH_WORDS: 'SEARCH_WORDS',
   GET_DUE_WORDS: 'GET_DUE_WORDS',
   GET_DUE_COUNT: 'GET_DUE_COUNT',
   UPDATE_WORD: 'UPDATE_WORD',
   DELETE_WORD: 'DELETE_WORD',
+  BATCH_UPDATE_WORDS: 'BATCH_UPDATE_WORDS',
+  BATCH_DELETE_WORDS: 'BATCH_DELETE_WORDS',
 
   // 页面交互相关
   HIGHLIGHT_TEXT: 'HIGHLIGHT_TEXT',
@@ -34,12 +38,14 @@ export const MessageTypes = {
 
   // 复习相关 - Story 3.4
   REVIEW_WORD: 'REVIEW_WORD',
+  GET_REVIEW_FORECAST: 'GET_REVIEW_FORECAST',
 
   // 设置相关 - Story 4.2
   SETTINGS_CHANGED: 'SETTINGS_CHANGED',
 
   // 全页翻译相关
   TRANSLATE_PAGE_SEGMENT: 'TRANSLATE_PAGE_SEGMENT',
+  LOOKUP_TRANSLATION_MEMORY: 'LOOKUP_TRANSLATION_MEMORY',
 
   // 本地模型相关
   TEST_LOCAL_CONNECTION: 'TEST_LOCAL_CONNECTION',
@@ -51,6 +57,22 @@ export const MessageTypes = {
 
 export type MessageType = typeof MessageTypes[keyof typeof MessageTypes];
 
+// ============================================================
+// Long-lived Port Names
+// ============================================================
+
+export const PortNames = {
+  // 流式词汇分析：Content Script 发起，Service Worker 推送中间结果
+  ANALYZE_WORD_STREAM: 'ANALYZE_WORD_STREAM',
+  // 流式批量翻译：每个段落译完即推送
+  TRANSLATE_PAGE_SEGMENT_STREAM: 'TRANSLATE_PAGE_SEGMENT_STREAM',
+  // 批量修改词汇：每提交一个分块推送一次进度
+  BATCH_UPDATE_WORDS_STREAM: 'BATCH_UPDATE_WORDS_STREAM',
+  BATCH_DELETE_WORDS_STREAM: 'BATCH_DELETE_WORDS_STREAM',
+} as const;
+
+export type PortName = typeof PortNames[keyof typeof PortNames];
+
 // ============================================================
 // Payload Definitions
 // ============================================================
@@ -80,6 +102,9 @@ export interface AnalyzeWordResult {
   mode?: AnalysisMode;    // 返回使用的分析模式
 }
 
+// 流式分析的中间结果（只包含已到达的字段）
+export type AnalyzeWordPartial = Partial<Pick<AnalyzeWordResult, 'meaning' | 'pronunciation' | 'partOfSpeech' | 'usage'>>;
+
 // 保存词汇请求
 export interface SaveWordPayload {
   text: string;
@@ -115,14 +140,68 @@ export interface WordRecord {
   easeFactor: number;
   interval: number;
   tagIds: string[];
+  /** 派生字段：规范化词形（byNormalizedText 索引），由存储层写入 */
+  normalizedText?: string;
+  /** 派生字段：每个标签一条 [tagId, createdAt]（byTagCreatedAt 索引），由存储层写入 */
+  tagTimeKeys?: [string, number][];
 }
 
+// 词汇冷字段：单独存放于 wordDetails，按需读取
+export type WordDetailField = 'exampleSentence' | 'contextBefore' | 'contextAfter';
+
+// 词汇冷字段记录（wordDetails 存储格式）
+export type WordDetail = Pick<WordRecord, 'id' | WordDetailField>;
+
+// 词汇摘要：列表 / 检索返回的精简记录，冷字段可能缺省
+export type WordSummary = Omit<WordRecord, WordDetailField> & Partial<Pick<WordRecord, WordDetailField>>;
+
+// 获取词汇冷字段请求
+export interface GetWordDetailPayload {
+  id: string;
+}
+
+// 词汇列表排序字段
+export type WordSortField = 'createdAt' | 'text' | 'nextReviewAt';
+
+// 词汇字段名（用于字段投影）
+export type WordField = keyof WordRecord;
+
+// 字段投影后的词汇记录：id 始终返回，其余字段仅包含请求的部分
+export type WordRecordView = Pick<WordRecord, 'id'> & Partial<WordRecord>;
+
 // 获取词汇请求
 export interface GetWordsPayload {
   limit?: number;
+  /** 偏移量（兼容旧调用；深分页请使用 cursor） */
   offset?: number;
   tagIds?: string[];
   searchQuery?: string;
+  sortBy?: WordSortField;
+  sortOrder?: 'asc' | 'desc';
+  /** 上一页返回的 nextCursor（不透明字符串），一次 seek 定位到下一页 */
+  cursor?: string;
+  /** 字段投影：只返回列出的字段（id 始终返回），缺省返回完整记录 */
+  fields?: WordField[];
+}
+
+// 获取词汇结果：nextCursor 为 null 表示没有下一页
+export interface GetWordsResult {
+  words: WordRecordView[];
+  nextCursor: string | null;
+}
+
+// 搜索词汇请求（倒排索引检索，有关键词时默认按相关性排序）
+export interface SearchWordsPayload {
+  query: string;
+  sortBy?: 'relevance' | 'createdAt' | 'text';
+  sortOrder?: 'asc' | 'desc';
+}
+
+// 搜索词汇结果：匹配列表与词库总数一次返回
+export interface SearchWordsResult {
+  words: WordSummary[];
+  matchCount: number;
+  totalCount: number;
 }
 
 // 更新词汇请求
@@ -136,6 +215,39 @@ export interface DeleteWordPayload {
   id: string;
 }
 
+// 批量更新词汇请求：updates 对每个词汇生效，标签增删在服务端与现有 tagIds 合并
+export interface BatchUpdateWordsPayload {
+  ids: string[];
+  updates?: Partial<Omit<WordRecord, 'id' | 'createdAt' | 'tagIds'>>;
+  addTagIds?: string[];
+  removeTagIds?: string[];
+}
+
+// 批量删除词汇请求
+export interface BatchDeleteWordsPayload {
+  ids: string[];
+}
+
+// 批量操作中单个词汇的结果
+export interface BatchWordResult {
+  id: string;
+  success: boolean;
+  error?: ErrorInfo;
+}
+
+// 批量操作结果：results 与请求 ids 顺序一致
+export interface BatchWordsResult {
+  results: BatchWordResult[];
+  succeeded: number;
+  failed: number;
+}
+
+// 批量操作进度（每个分块事务提交后推送）
+export interface BatchProgress {
+  processed: number;
+  total: number;
+}
+
 // 高亮文本请求（Service Worker -> Content Script）
 export interface HighlightTextPayload {
   xpath: string;
@@ -175,6 +287,34 @@ export interface ReviewWordResult {
   word: WordRecord;
 }
 
+/**
+ * 复习预测请求
+ */
+export interface GetReviewForecastPayload {
+  /** 预测天数（含今天），默认 30 */
+  days?: number;
+}
+
+/**
+ * 单日预测
+ */
+export interface ReviewForecastDay {
+  /** 本地日期 YYYY-MM-DD */
+  date: string;
+  /** 当天将到期的词汇数（今天只统计此刻之后到期的） */
+  count: number;
+}
+
+/**
+ * 复习预测
+ */
+export interface ReviewForecast {
+  /** 此刻已到期的词汇数 */
+  dueCount: number;
+  /** 从今天开始逐日的到期数量 */
+  days: ReviewForecastDay[];
+}
+
 // ============================================================
 // Story 2.3: Jump to Source Page Payloads
 // ============================================================
@@ -239,8 +379,15 @@ export interface TranslatePageSegmentPayload {
   texts: string[];
   /** 目标翻译语言（可选，默认使用设置中的语言） */
   targetLanguage?: string;
+  /** 派发优先级：视口内为 'visible'（默认），视口外 / 空闲补翻为 'background' */
+  priority?: TranslationPriority;
 }
 
+/**
+ * 全页翻译批次的派发优先级
+ */
+export type TranslationPriority = 'visible' | 'background';
+
 /**
  * 翻译页面文本段落响应
  */
@@ -249,6 +396,35 @@ export interface TranslatePageSegmentResult {
   translations: string[];
 }
 
+/**
+ * 流式批量翻译中已完成的单个段落
+ */
+export interface TranslatedSegment {
+  /** 段落在请求 texts 中的下标 */
+  index: number;
+  /** 译文 */
+  translation: string;
+}
+
+/**
+ * 批量查询翻译记忆请求
+ * 全页翻译分批前调用，命中的片段不再发送 TRANSLATE_PAGE_SEGMENT
+ */
+export interface LookupTranslationMemoryPayload {
+  /** 待查询的原文列表 */
+  texts: string[];
+  /** 目标翻译语言（可选，默认使用设置中的语言） */
+  targetLanguage?: string;
+}
+
+/**
+ * 批量查询翻译记忆响应
+ */
+export interface LookupTranslationMemoryResult {
+  /** 与输入顺序对应的译文，未命中为 null */
+  translations: (string | null)[];
+}
+
 // ============================================================
 // Local Model Connection Payloads
 // ============================================================
@@ -343,17 +519,23 @@ export type PayloadMap = {
   [MessageTypes.ANALYZE_WORD]: AnalyzeWordPayload;
   [MessageTypes.SAVE_WORD]: SaveWordPayload;
   [MessageTypes.GET_WORDS]: GetWordsPayload;
+  [MessageTypes.GET_WORD_DETAIL]: GetWordDetailPayload;
+  [MessageTypes.SEARCH_WORDS]: SearchWordsPayload;
   [MessageTypes.GET_DUE_WORDS]: void;
   [MessageTypes.GET_DUE_COUNT]: void;
   [MessageTypes.UPDATE_WORD]: UpdateWordPayload;
   [MessageTypes.DELETE_WORD]: DeleteWordPayload;
+  [MessageTypes.BATCH_UPDATE_WORDS]: BatchUpdateWordsPayload;
+  [MessageTypes.BATCH_DELETE_WORDS]: BatchDeleteWordsPayload;
   [MessageTypes.HIGHLIGHT_TEXT]: HighlightTextPayload;
   [MessageTypes.JUMP_TO_SOURCE]: JumpToSourcePayload;
   [MessageTypes.HIGHLIGHT_WORD]: HighlightWordPayload;
   [MessageTypes.UPDATE_BADGE]: UpdateBadgePayload;
   [MessageTypes.REVIEW_WORD]: ReviewWordPayload;
+  [MessageTypes.GET_REVIEW_FORECAST]: GetReviewForecastPayload;
   [MessageTypes.SETTINGS_CHANGED]: SettingsChangedPayload;
   [MessageTypes.TRANSLATE_PAGE_SEGMENT]: TranslatePageSegmentPayload;
+  [MessageTypes.LOOKUP_TRANSLATION_MEMORY]: LookupTranslationMemoryPayload;
   [MessageTypes.TEST_LOCAL_CONNECTION]: TestLocalConnectionPayload;
   [MessageTypes.GET_LOCAL_MODELS]: GetLocalModelsPayload;
   [MessageTypes.TEST_API_CONNECTION]: TestApiConnectionPayload;
@@ -366,18 +548,24 @@ export type PayloadMap = {
 export type ResponseDataMap = {
   [MessageTypes.ANALYZE_WORD]: AnalyzeWordResult;
   [MessageTypes.SAVE_WORD]: { id: string };
-  [MessageTypes.GET_WORDS]: WordRecord[];
+  [MessageTypes.GET_WORDS]: GetWordsResult;
+  [MessageTypes.GET_WORD_DETAIL]: WordDetail;
+  [MessageTypes.SEARCH_WORDS]: SearchWordsResult;
   [MessageTypes.GET_DUE_WORDS]: WordRecord[];
   [MessageTypes.GET_DUE_COUNT]: number;
   [MessageTypes.UPDATE_WORD]: void;
   [MessageTypes.DELETE_WORD]: void;
+  [MessageTypes.BATCH_UPDATE_WORDS]: BatchWordsResult;
+  [MessageTypes.BATCH_DELETE_WORDS]: BatchWordsResult;
   [MessageTypes.HIGHLIGHT_TEXT]: { success: boolean };
   [MessageTypes.JUMP_TO_SOURCE]: JumpToSourceResult;
   [MessageTypes.HIGHLIGHT_WORD]: HighlightWordResult;
   [MessageTypes.UPDATE_BADGE]: void;
   [MessageTypes.REVIEW_WORD]: ReviewWordResult;
+  [MessageTypes.GET_REVIEW_FORECAST]: ReviewForecast;
   [MessageTypes.SETTINGS_CHANGED]: void;
   [MessageTypes.TRANSLATE_PAGE_SEGMENT]: TranslatePageSegmentResult;
+  [MessageTypes.LOOKUP_TRANSLATION_MEMORY]: LookupTranslationMemoryResult;
   [MessageTypes.TEST_LOCAL_CONNECTION]: TestLocalConnectionResult;
   [MessageTypes.GET_LOCAL_MODELS]: GetLocalModelsResult;
   [MessageTypes.TEST_API_CONNECTION]: TestApiConnectionResult;
@@ -405,3 +593,8 @@ export interface Response<T = unknown> {
 
 // 类型安全的响应
 export type TypedResponse<T extends MessageType> = Response<ResponseDataMap[T]>;
+
+// 流式端口消息（Service Worker → Content Script）：若干 PARTIAL，最后一个 DONE
+export type StreamPortMessage<TPartial, TResult> =
+  | { type: 'PARTIAL'; data: TPartial }
+  | { type: 'DONE'; response: Response<TResult> };
@@ -0,0 +1,234 @@
+/**
+ * LingoRecall AI - Analysis Cache Storage Layer
+ * AI 分析结果的持久化缓存（analysisCache 的 L2 层）
+ *
+ * MV3 Service Worker 空闲约 30s 后会被回收，内存缓存随之丢失。
+ * 本模块把分析结果写入 IndexedDB，使 Worker 唤醒后仍能命中缓存。
+ *
+ * - 主键: `${mode}:${targetLanguage}:${normalizedText}`
+ * - TTL: 每条记录自带 expiresAt，读取时校验，清理时按 byExpiresAt 批量删除
+ * - 容量: 超过上限时按 byLastAccessAt 淘汰最久未访问的条目
+ *
+ * @module shared/storage/analysisCacheStore
+ */
+
+import { getDatabase, STORES, INDEXES, evictLeastRecentlyAccessed } from './db';
+import type { AnalyzeWordResult, AnalysisMode } from '../messaging/types';
+
+// ============================================================
+// Types
+// ============================================================
+
+/**
+ * 持久化的分析缓存条目
+ */
+export interface PersistedAnalysisEntry {
+  /** 缓存键（mode + targetLanguage + 规范化文本） */
+  key: string;
+  /** 分析模式 */
+  mode: AnalysisMode;
+  /** 规范化后的文本 */
+  text: string;
+  /** 目标语言 */
+  targetLanguage: string;
+  /** AI 分析结果 */
+  result: AnalyzeWordResult;
+  /** 写入时间 */
+  createdAt: number;
+  /** 最近一次访问时间（淘汰依据） */
+  lastAccessAt: number;
+  /** 过期时间 */
+  expiresAt: number;
+  /** 命中次数 */
+  hitCount: number;
+}
+
+// ============================================================
+// Read
+// ============================================================
+
+/**
+ * 按键读取持久化条目
+ * 已过期的条目视为不存在（由 prunePersistedAnalyses 统一删除）
+ *
+ * @param key - 缓存键
+ * @param now - 当前时间（测试注入）
+ * @returns 条目或 null
+ */
+export async function getPersistedAnalysis(
+  key: string,
+  now: number = Date.now()
+): Promise<PersistedAnalysisEntry | null> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.analysisCache, 'readonly');
+    const store = tx.objectStore(STORES.analysisCache);
+    const request = store.get(key);
+
+    request.onsuccess = () => {
+      const entry = request.result as PersistedAnalysisEntry | undefined;
+      if (!entry || entry.expiresAt <= now) {
+        resolve(null);
+        return;
+      }
+      resolve(entry);
+    };
+
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/**
+ * 读取最近访问的若干条未过期条目
+ * 用于 Worker 唤醒后预热内存缓存
+ *
+ * @param limit - 最大条数
+ * @param now - 当前时间（测试注入）
+ * @returns 按 lastAccessAt 降序排列的条目
+ */
+export async function getRecentPersistedAnalyses(
+  limit: number,
+  now: number = Date.now()
+): Promise<PersistedAnalysisEntry[]> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.analysisCache, 'readonly');
+    const index = tx.objectStore(STORES.analysisCache).index(INDEXES.byLastAccessAt);
+    const entries: PersistedAnalysisEntry[] = [];
+
+    const request = index.openCursor(null, 'prev');
+
+    request.onsuccess = (event) => {
+      const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
+      if (!cursor || entries.length >= limit) {
+        resolve(entries);
+        return;
+      }
+
+      const entry = cursor.value as PersistedAnalysisEntry;
+      if (entry.expiresAt > now) {
+        entries.push(entry);
+      }
+      cursor.continue();
+    };
+
+    request.onerror = () => reject(request.error);
+  });
+}
+
+// ============================================================
+// Write
+// ============================================================
+
+/**
+ * 写入（或覆盖）持久化条目
+ *
+ * @param entry - 缓存条目
+ */
+export async function putPersistedAnalysis(entry: PersistedAnalysisEntry): Promise<void> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.analysisCache, 'readwrite');
+    tx.objectStore(STORES.analysisCache).put(entry);
+
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+/**
+ * 更新条目的访问时间和命中次数
+ * 条目不存在时静默忽略
+ *
+ * @param key - 缓存键
+ * @param accessedAt - 访问时间
+ */
+export async function touchPersistedAnalysis(
+  key: string,
+  accessedAt: number = Date.now()
+): Promise<void> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.analysisCache, 'readwrite');
+    const store = tx.objectStore(STORES.analysisCache);
+    const request = store.get(key);
+
+    request.onsuccess = () => {
+      const entry = request.result as PersistedAnalysisEntry | undefined;
+      if (entry) {
+        store.put({ ...entry, lastAccessAt: accessedAt, hitCount: entry.hitCount + 1 });
+      }
+    };
+
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+/**
+ * 清空所有持久化条目
+ */
+export async function clearPersistedAnalyses(): Promise<void> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.analysisCache, 'readwrite');
+    tx.objectStore(STORES.analysisCache).clear();
+
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+// ============================================================
+// Eviction
+// ============================================================
+
+/**
+ * 清理持久化缓存
+ * 1. 删除所有已过期条目（byExpiresAt 范围删除）
+ * 2. 数量仍超过 maxEntries 时，按 byLastAccessAt 从最旧开始淘汰
+ *
+ * 两步在同一个 readwrite 事务内完成
+ *
+ * @param maxEntries - 最大保留条数
+ * @param now - 当前时间（测试注入）
+ * @returns 删除的条目数
+ */
+export async function prunePersistedAnalyses(
+  maxEntries: number,
+  now: number = Date.now()
+): Promise<number> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.analysisCache, 'readwrite');
+    const store = tx.objectStore(STORES.analysisCache);
+    let removed = 0;
+
+    // 1. 过期条目
+    const expiredRequest = store.index(INDEXES.byExpiresAt).openCursor(IDBKeyRange.upperBound(now));
+
+    expiredRequest.onsuccess = (event) => {
+      const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
+      if (cursor) {
+        cursor.delete();
+        removed++;
+        cursor.continue();
+        return;
+      }
+
+      // 2. 容量淘汰
+      evictLeastRecentlyAccessed(store, maxEntries, () => {
+        removed++;
+      });
+    };
+
+    tx.oncomplete = () => resolve(removed);
+    tx.onerror = () => reject(tx.error);
+  });
+}
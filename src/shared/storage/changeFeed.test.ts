@@ -0,0 +1,189 @@
+/**
+ * LingoRecall AI - Change Feed Tests
+ * 写操作提交后发布的增量、列表修补与待复习数量增减
+ *
+ * @module shared/storage/changeFeed.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import 'fake-indexeddb/auto';
+import {
+  subscribeChanges,
+  patchWordList,
+  dueCountDelta,
+  type StorageChange,
+} from './changeFeed';
+import { deleteDatabase, closeDatabase } from './db';
+import { saveWord, updateWord, deleteWord, batchDeleteWords } from './wordService';
+import { createTag, deleteTag } from './tagStore';
+import type { SaveWordPayload, WordSummary } from '../messaging/types';
+
+const PAYLOAD: SaveWordPayload = {
+  text: 'context',
+  meaning: '语境',
+  pronunciation: '',
+  partOfSpeech: 'noun',
+  exampleSentence: 'The context matters.',
+  sourceUrl: 'https://example.com',
+  sourceTitle: 'Example',
+  xpath: '/html/body/p[1]',
+  textOffset: 0,
+  contextBefore: 'The ',
+  contextAfter: ' matters.',
+};
+
+function summary(id: string, overrides: Partial<WordSummary> = {}): WordSummary {
+  return {
+    id,
+    text: id,
+    meaning: '',
+    pronunciation: '',
+    partOfSpeech: '',
+    sourceUrl: '',
+    sourceTitle: '',
+    xpath: '',
+    textOffset: 0,
+    createdAt: 0,
+    nextReviewAt: 0,
+    reviewCount: 0,
+    easeFactor: 2.5,
+    interval: 1,
+    tagIds: [],
+    ...overrides,
+  };
+}
+
+describe('changeFeed', () => {
+  let received: StorageChange[][];
+  let unsubscribe: () => void;
+
+  beforeEach(async () => {
+    await deleteDatabase();
+    received = [];
+    unsubscribe = subscribeChanges((changes) => received.push(changes));
+  });
+
+  afterEach(() => {
+    unsubscribe();
+    closeDatabase();
+  });
+
+  // ============================================================
+  // Publishing
+  // ============================================================
+
+  describe('publishing', () => {
+    it('保存、修改、删除词汇后各发布一次增量（只含摘要）', async () => {
+      const saved = await saveWord(PAYLOAD);
+      const id = saved.data!.id;
+      await updateWord(id, { meaning: '上下文', nextReviewAt: 1 });
+      await deleteWord(id);
+
+      const changes = received.flat();
+      expect(changes.map((change) => change.type)).toEqual(['word:add', 'word:update', 'word:delete']);
+
+      const added = changes[0] as Extract<StorageChange, { type: 'word:add' }>;
+      expect(added.word.id).toBe(id);
+      expect(added.word).not.toHaveProperty('exampleSentence');
+
+      const updated = changes[1] as Extract<StorageChange, { type: 'word:update' }>;
+      expect(updated.word.meaning).toBe('上下文');
+      expect(updated.previousNextReviewAt).toBe(added.word.nextReviewAt);
+
+      expect(changes[2]).toEqual({ type: 'word:delete', id, nextReviewAt: 1 });
+    });
+
+    it('失败的写操作不发布', async () => {
+      await updateWord('missing', { meaning: 'x' });
+      await deleteWord('missing');
+
+      expect(received).toEqual([]);
+    });
+
+    it('批量操作每个分块发布一批', async () => {
+      const first = await saveWord(PAYLOAD);
+      const second = await saveWord({ ...PAYLOAD, xpath: '/html/body/p[2]' });
+      received = [];
+
+      await batchDeleteWords([first.data!.id, second.data!.id, 'missing']);
+
+      expect(received).toHaveLength(1);
+      expect(received[0].map((change) => change.type)).toEqual(['word:delete', 'word:delete']);
+    });
+
+    it('标签创建与删除发布标签增量', async () => {
+      const created = await createTag({ name: '学术', color: '#3B82F6' });
+      await deleteTag(created.data!.id);
+
+      await expect.poll(() => received.flat().map((change) => change.type)).toEqual([
+        'tag:put',
+        'tag:delete',
+      ]);
+    });
+  });
+
+  // ============================================================
+  // Helpers
+  // ============================================================
+
+  describe('patchWordList', () => {
+    const project = (word: WordSummary) => word;
+
+    it('替换、删除词汇并移除已删除的标签', () => {
+      const words = [summary('a', { tagIds: ['t1'] }), summary('b'), summary('c')];
+
+      const next = patchWordList(
+        words,
+        [
+          {
+            type: 'word:update',
+            word: summary('a', { meaning: 'new', tagIds: ['t1', 't2'] }),
+            previousNextReviewAt: 0,
+          },
+          { type: 'word:delete', id: 'b', nextReviewAt: 0 },
+          { type: 'tag:delete', id: 't1' },
+        ],
+        { project }
+      );
+
+      expect(next.map((word) => word.id)).toEqual(['a', 'c']);
+      expect(next[0]).toMatchObject({ meaning: 'new', tagIds: ['t2'] });
+      expect(words).toHaveLength(3);
+    });
+
+    it('新增词汇按 includeAdded 决定是否插入开头', () => {
+      const words = [summary('a')];
+      const change: StorageChange = { type: 'word:add', word: summary('new') };
+
+      expect(patchWordList(words, [change], { project }).map((word) => word.id)).toEqual(['a']);
+      expect(
+        patchWordList(words, [change], { project, includeAdded: () => true }).map((word) => word.id)
+      ).toEqual(['new', 'a']);
+    });
+
+    it('无关变更返回原数组', () => {
+      const words = [summary('a')];
+
+      expect(patchWordList(words, [{ type: 'word:delete', id: 'x', nextReviewAt: 0 }], { project })).toBe(words);
+    });
+  });
+
+  describe('dueCountDelta', () => {
+    it('按变更前后的复习时间增减', () => {
+      const now = 1000;
+
+      expect(
+        dueCountDelta(
+          [
+            { type: 'word:add', word: summary('a', { nextReviewAt: 500 }) },
+            { type: 'word:update', word: summary('b', { nextReviewAt: 5000 }), previousNextReviewAt: 900 },
+            { type: 'word:update', word: summary('c', { nextReviewAt: 800 }), previousNextReviewAt: 700 },
+            { type: 'word:delete', id: 'd', nextReviewAt: 100 },
+            { type: 'word:delete', id: 'e', nextReviewAt: 2000 },
+          ],
+          now
+        )
+      ).toBe(-1);
+    });
+  });
+});
@@ -0,0 +1,212 @@
+/**
+ * LingoRecall AI - Storage Change Feed
+ * 词汇与标签变更推送
+ *
+ * 写操作在事务提交后发布 ID 级增量：同一上下文内直接回调订阅者，
+ * 其他扩展上下文（Service Worker、Popup、Options）经 BroadcastChannel 收到同一批增量。
+ * 订阅方据此修补本地状态，不再在每次修改后重新拉取整个列表。
+ *
+ * BroadcastChannel 按源隔离，只在扩展源（chrome-extension:）内启用；
+ * Content Script 与网页同源，不能在其中广播词库数据。
+ *
+ * @module shared/storage/changeFeed
+ */
+
+import type { WordSummary } from '../messaging/types';
+import type { Tag } from '../types/tag';
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 变更频道名称 */
+export const CHANGE_FEED_CHANNEL = 'lingorecall-changes';
+
+/**
+ * 单条存储变更
+ * 词汇变更携带复习时间，订阅方无需回读即可修补待复习数量；
+ * tag:cascade 为删除标签后后台清理词汇的进度，词汇列表已在 tag:delete 时修补
+ */
+export type StorageChange =
+  | { type: 'word:add'; word: WordSummary }
+  | { type: 'word:update'; word: WordSummary; previousNextReviewAt: number }
+  | { type: 'word:delete'; id: string; nextReviewAt: number }
+  | { type: 'tag:put'; tag: Tag }
+  | { type: 'tag:delete'; id: string }
+  | { type: 'tag:cascade'; tagId: string; processed: number; total: number; done: boolean };
+
+/**
+ * 变更订阅函数（同一事务内的变更一次送达）
+ */
+export type ChangeListener = (changes: StorageChange[]) => void;
+
+// ============================================================
+// Channel
+// ============================================================
+
+const listeners = new Set<ChangeListener>();
+
+let channel: BroadcastChannel | null | undefined;
+
+/**
+ * 获取跨上下文频道（非扩展源或环境不支持时为 null）
+ */
+function getChannel(): BroadcastChannel | null {
+  if (channel !== undefined) {
+    return channel;
+  }
+
+  const isExtensionOrigin = globalThis.location?.protocol === 'chrome-extension:';
+  if (!isExtensionOrigin || typeof BroadcastChannel === 'undefined') {
+    channel = null;
+    return channel;
+  }
+
+  channel = new BroadcastChannel(CHANGE_FEED_CHANNEL);
+  channel.onmessage = (event: MessageEvent<StorageChange[]>) => {
+    if (Array.isArray(event.data)) {
+      dispatch(event.data);
+    }
+  };
+  return channel;
+}
+
+function dispatch(changes: StorageChange[]): void {
+  for (const listener of listeners) {
+    try {
+      listener(changes);
+    } catch (error) {
+      console.error('[LingoRecall] Change listener error:', error);
+    }
+  }
+}
+
+// ============================================================
+// Public API
+// ============================================================
+
+/**
+ * 发布变更（在事务提交后调用）
+ *
+ * @param changes 同一事务内的变更
+ */
+export function publishChanges(changes: StorageChange[]): void {
+  if (changes.length === 0) {
+    return;
+  }
+
+  dispatch(changes);
+
+  try {
+    getChannel()?.postMessage(changes);
+  } catch (error) {
+    console.warn('[LingoRecall] Failed to broadcast changes:', error);
+  }
+}
+
+/**
+ * 订阅变更
+ *
+ * @param listener 变更回调
+ * @returns 取消订阅函数
+ */
+export function subscribeChanges(listener: ChangeListener): () => void {
+  getChannel();
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+// ============================================================
+// Helpers
+// ============================================================
+
+/**
+ * 按增量修补词汇列表
+ * 已在列表中的词汇原地替换，删除的词汇移除，删除的标签从 tagIds 中去掉；
+ * 新增词汇只在 includeAdded 返回 true 时插到列表开头（默认按创建时间倒序）。
+ * 没有任何变化时返回原数组，便于 React 跳过渲染。
+ *
+ * @param words 当前列表
+ * @param changes 变更
+ * @param options.project 把摘要转换为列表元素（如字段投影）
+ * @param options.includeAdded 新增词汇是否进入列表
+ */
+export function patchWordList<T extends { id: string; tagIds?: string[] }>(
+  words: T[],
+  changes: StorageChange[],
+  options: {
+    project: (word: WordSummary) => T;
+    includeAdded?: (word: WordSummary) => boolean;
+  }
+): T[] {
+  let next = words;
+  const edit = () => {
+    if (next === words) {
+      next = words.slice();
+    }
+    return next;
+  };
+
+  for (const change of changes) {
+    switch (change.type) {
+      case 'word:add': {
+        if (options.includeAdded?.(change.word) && !next.some((word) => word.id === change.word.id)) {
+          edit().unshift(options.project(change.word));
+        }
+        break;
+      }
+      case 'word:update': {
+        const index = next.findIndex((word) => word.id === change.word.id);
+        if (index !== -1) {
+          edit()[index] = options.project(change.word);
+        }
+        break;
+      }
+      case 'word:delete': {
+        const index = next.findIndex((word) => word.id === change.id);
+        if (index !== -1) {
+          edit().splice(index, 1);
+        }
+        break;
+      }
+      case 'tag:delete': {
+        for (let i = 0; i < next.length; i++) {
+          const tagIds = next[i].tagIds;
+          if (tagIds?.includes(change.id)) {
+            edit()[i] = { ...next[i], tagIds: tagIds.filter((tagId) => tagId !== change.id) };
+          }
+        }
+        break;
+      }
+      default:
+        break;
+    }
+  }
+
+  return next;
+}
+
+/**
+ * 变更对待复习数量的影响
+ *
+ * @param changes 变更
+ * @param now 当前时间
+ * @returns 待复习数量的增减
+ */
+export function dueCountDelta(changes: StorageChange[], now = Date.now()): number {
+  const isDue = (nextReviewAt: number | undefined) => (nextReviewAt !== undefined && nextReviewAt <= now ? 1 : 0);
+
+  let delta = 0;
+  for (const change of changes) {
+    if (change.type === 'word:add') {
+      delta += isDue(change.word.nextReviewAt);
+    } else if (change.type === 'word:update') {
+      delta += isDue(change.word.nextReviewAt) - isDue(change.previousNextReviewAt);
+    } else if (change.type === 'word:delete') {
+      delta -= isDue(change.nextReviewAt);
+    }
+  }
+  return delta;
+}
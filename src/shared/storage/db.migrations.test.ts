@@ -0,0 +1,207 @@
+/**
+ * LingoRecall AI - Database Migration Tests
+ * v3 -> v4：倒排索引分批回填，回填完成前搜索退回全表扫描
+ * v4 -> v5：组合索引与分批可续跑的派生字段回填
+ * v5 -> v6：冷字段拆分到 wordDetails
+ *
+ * @module shared/storage/db.migrations.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import {
+  DB_NAME,
+  STORES,
+  INDEXES,
+  getDatabase,
+  closeDatabase,
+  deleteDatabase,
+  isBackfillComplete,
+  runPendingBackfills,
+} from './db';
+import { getWordById, getWordDetail, searchWords } from './wordService';
+import type { WordRecord, WordDetail } from '../messaging/types';
+
+function createLegacyWord(index: number): WordRecord {
+  return {
+    id: `w${index}`,
+    text: index % 2 === 0 ? `Word${index}` : `word${index}`,
+    meaning: `释义 ${index}`,
+    pronunciation: '',
+    partOfSpeech: 'noun',
+    exampleSentence: `Example ${index}.`,
+    sourceUrl: 'https://example.com',
+    sourceTitle: 'Example',
+    xpath: `/html/body/p[${index}]`,
+    textOffset: 0,
+    contextBefore: `before ${index} `,
+    contextAfter: ` after ${index}`,
+    createdAt: 1000 + index,
+    nextReviewAt: 2000 + index,
+    reviewCount: 0,
+    easeFactor: 2.5,
+    interval: 1,
+    tagIds: index % 3 === 0 ? ['tag-a'] : [],
+  };
+}
+
+/**
+ * 以 v4 结构创建数据库并写入旧版词汇（无派生字段）
+ */
+function createV4Database(count: number): Promise<void> {
+  return createLegacyDatabase(4, count);
+}
+
+/**
+ * 以旧版本号创建只有 words 的数据库并写入旧版词汇
+ */
+function createLegacyDatabase(version: number, count: number): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const request = indexedDB.open(DB_NAME, version);
+    request.onupgradeneeded = () => {
+      const wordsStore = request.result.createObjectStore(STORES.words, { keyPath: 'id' });
+      wordsStore.createIndex(INDEXES.byCreatedAt, 'createdAt', { unique: false });
+      for (let i = 1; i <= count; i++) {
+        wordsStore.put(createLegacyWord(i));
+      }
+    };
+    request.onsuccess = () => {
+      request.result.close();
+      resolve();
+    };
+    request.onerror = () => reject(request.error);
+  });
+}
+
+async function readWords(): Promise<WordRecord[]> {
+  const db = await getDatabase();
+  return new Promise((resolve, reject) => {
+    const request = db.transaction(STORES.words, 'readonly').objectStore(STORES.words).getAll();
+    request.onsuccess = () => resolve(request.result as WordRecord[]);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+async function readDetails(): Promise<WordDetail[]> {
+  const db = await getDatabase();
+  return new Promise((resolve, reject) => {
+    const request = db.transaction(STORES.wordDetails, 'readonly').objectStore(STORES.wordDetails).getAll();
+    request.onsuccess = () => resolve(request.result as WordDetail[]);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+describe('db migrations', () => {
+  beforeEach(async () => {
+    await deleteDatabase();
+  });
+
+  afterEach(() => {
+    closeDatabase();
+  });
+
+  it('builds the search index for existing words as a resumable backfill', async () => {
+    await createLegacyDatabase(3, 5);
+    await getDatabase();
+
+    expect(await isBackfillComplete('searchIndex')).toBe(false);
+    // 回填前搜索退回全表扫描
+    expect((await searchWords('word3', { details: false })).data?.words.map((word) => word.id)).toEqual(['w3']);
+
+    // searchIndex、wordIndexKeys、splitWordDetails 各遍历一遍
+    expect(await runPendingBackfills(2)).toBe(15);
+    expect(await isBackfillComplete('searchIndex')).toBe(true);
+
+    const db = await getDatabase();
+    const indexed = await new Promise<number>((resolve, reject) => {
+      const request = db.transaction(STORES.searchIndex, 'readonly').objectStore(STORES.searchIndex).count();
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => reject(request.error);
+    });
+    expect(indexed).toBeGreaterThan(0);
+    expect((await searchWords('word3', { details: false })).data?.words.map((word) => word.id)).toEqual(['w3']);
+  });
+
+  it('adds the v5 indexes and meta store on upgrade', async () => {
+    await createV4Database(3);
+    const db = await getDatabase();
+
+    expect(db.objectStoreNames.contains(STORES.meta)).toBe(true);
+    const store = db.transaction(STORES.words, 'readonly').objectStore(STORES.words);
+    expect(Array.from(store.indexNames)).toEqual(
+      expect.arrayContaining([INDEXES.byDuplicateKey, INDEXES.byNormalizedText, INDEXES.byTagCreatedAt])
+    );
+  });
+
+  it('backfills derived fields in chunks after the upgrade', async () => {
+    await createV4Database(7);
+
+    expect(await isBackfillComplete('wordIndexKeys')).toBe(false);
+    // wordIndexKeys 与 splitWordDetails 各遍历一遍
+    expect(await runPendingBackfills(3)).toBe(14);
+    expect(await isBackfillComplete('wordIndexKeys')).toBe(true);
+
+    const words = await readWords();
+    expect(words.every((word) => word.normalizedText === word.text.toLowerCase())).toBe(true);
+    expect(words.find((word) => word.id === 'w3')?.tagTimeKeys).toEqual([['tag-a', 1003]]);
+
+    // 回填完成后不再重复执行
+    expect(await runPendingBackfills(3)).toBe(0);
+  });
+
+  it('resumes from the saved checkpoint', async () => {
+    await createV4Database(5);
+    const db = await getDatabase();
+    await new Promise<void>((resolve, reject) => {
+      const tx = db.transaction(STORES.meta, 'readwrite');
+      tx.objectStore(STORES.meta).put({ key: 'backfill:wordIndexKeys', lastKey: 'w2' });
+      tx.oncomplete = () => resolve();
+      tx.onerror = () => reject(tx.error);
+    });
+
+    // splitWordDetails 5 条 + wordIndexKeys 从 w2 之后的 3 条
+    expect(await runPendingBackfills(2)).toBe(8);
+
+    const words = await readWords();
+    expect(words.filter((word) => word.normalizedText !== undefined).map((word) => word.id)).toEqual([
+      'w3',
+      'w4',
+      'w5',
+    ]);
+  });
+
+  it('has nothing to backfill on a fresh install', async () => {
+    await getDatabase();
+    expect(await isBackfillComplete('wordIndexKeys')).toBe(true);
+    expect(await isBackfillComplete('splitWordDetails')).toBe(true);
+  });
+
+  it('moves inline cold fields into wordDetails after the v6 upgrade', async () => {
+    await createV4Database(4);
+    const db = await getDatabase();
+    expect(db.objectStoreNames.contains(STORES.wordDetails)).toBe(true);
+
+    // 回填前读取方按内联值兜底
+    expect((await getWordById('w2')).data?.exampleSentence).toBe('Example 2.');
+
+    await runPendingBackfills(3);
+    expect(await isBackfillComplete('splitWordDetails')).toBe(true);
+
+    const words = await readWords();
+    expect(words.every((word) => word.exampleSentence === undefined && word.contextBefore === undefined)).toBe(true);
+    expect(words.every((word) => word.xpath.startsWith('/html/body/p['))).toBe(true);
+    expect(await readDetails()).toHaveLength(4);
+
+    expect((await getWordById('w2')).data).toMatchObject({
+      text: 'Word2',
+      exampleSentence: 'Example 2.',
+      contextBefore: 'before 2 ',
+      contextAfter: ' after 2',
+    });
+    expect((await getWordDetail('w3')).data).toEqual({
+      id: 'w3',
+      exampleSentence: 'Example 3.',
+      contextBefore: 'before 3 ',
+      contextAfter: ' after 3',
+    });
+  });
+});
@@ -0,0 +1,163 @@
+/**
+ * LingoRecall AI - Review Stats Tests
+ * 到期数量与复习预测聚合：增量维护、IDBIndex.count 核对与重建
+ *
+ * @module shared/storage/db.reviewStats.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import {
+  STORES,
+  REVIEW_STATS_KEY,
+  getDatabase,
+  deleteDatabase,
+  countDueWords,
+  getReviewForecast,
+  reconcileReviewStats,
+  toReviewDayKey,
+  type ReviewStatsRecord,
+} from './db';
+import { saveWord, updateWord, deleteWord, batchDeleteWords, batchUpdateWords } from './wordService';
+import type { SaveWordPayload, WordRecord } from '../messaging/types';
+
+function createPayload(index: number): SaveWordPayload {
+  return {
+    text: `word${index}`,
+    meaning: `释义 ${index}`,
+    pronunciation: '',
+    partOfSpeech: 'noun',
+    exampleSentence: '',
+    sourceUrl: 'https://example.com',
+    sourceTitle: 'Example',
+    xpath: `/html/body/p[${index}]`,
+    textOffset: 0,
+    contextBefore: '',
+    contextAfter: '',
+  };
+}
+
+/** 距今天 offset 天的本地正午 */
+function noonOf(offset: number): number {
+  const today = new Date();
+  return new Date(today.getFullYear(), today.getMonth(), today.getDate() + offset, 12).getTime();
+}
+
+async function saveWords(count: number): Promise<string[]> {
+  const ids: string[] = [];
+  for (let i = 0; i < count; i++) {
+    const result = await saveWord(createPayload(i));
+    ids.push(result.data!.id);
+  }
+  return ids;
+}
+
+async function readStats(): Promise<ReviewStatsRecord | undefined> {
+  const db = await getDatabase();
+  return new Promise((resolve, reject) => {
+    const request = db.transaction(STORES.meta, 'readonly').objectStore(STORES.meta).get(REVIEW_STATS_KEY);
+    request.onsuccess = () => resolve(request.result as ReviewStatsRecord | undefined);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/** 绕过 wordService 直接改写 nextReviewAt（模拟聚合漂移） */
+async function putNextReviewAtDirectly(id: string, nextReviewAt: number): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readwrite');
+    const store = tx.objectStore(STORES.words);
+    const request = store.get(id);
+    request.onsuccess = () => store.put({ ...(request.result as WordRecord), nextReviewAt });
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+describe('review stats', () => {
+  beforeEach(async () => {
+    await deleteDatabase();
+  });
+
+  afterEach(async () => {
+    await deleteDatabase();
+  });
+
+  it('builds the aggregate from the index on first read', async () => {
+    const ids = await saveWords(3);
+    expect(await readStats()).toBeUndefined();
+
+    await putNextReviewAtDirectly(ids[0], noonOf(-3));
+
+    expect(await countDueWords()).toBe(1);
+    const stats = await readStats();
+    expect(stats?.total).toBe(3);
+    expect(stats?.buckets[toReviewDayKey(noonOf(-3))]).toBe(1);
+  });
+
+  it('is maintained incrementally on save, review and delete', async () => {
+    await countDueWords();
+    const ids = await saveWords(4);
+
+    await updateWord(ids[0], { nextReviewAt: noonOf(-2) });
+    await updateWord(ids[1], { nextReviewAt: Date.now() - 1000 });
+    await updateWord(ids[2], { nextReviewAt: noonOf(5) });
+    expect(await countDueWords()).toBe(2);
+
+    await deleteWord(ids[0]);
+    expect(await countDueWords()).toBe(1);
+
+    const stats = await readStats();
+    expect(stats?.total).toBe(3);
+    // 增量结果与索引计数一致，核对不需要重建
+    expect(await reconcileReviewStats()).toBe(false);
+  });
+
+  it('applies several changes in one batch transaction', async () => {
+    await countDueWords();
+    const ids = await saveWords(5);
+
+    await batchUpdateWords(ids.slice(0, 3), { updates: { nextReviewAt: noonOf(-1) } });
+    expect(await countDueWords()).toBe(3);
+
+    await batchDeleteWords(ids.slice(1, 4));
+    expect(await countDueWords()).toBe(1);
+    expect((await readStats())?.total).toBe(2);
+    expect(await reconcileReviewStats()).toBe(false);
+  });
+
+  it('forecasts the coming days from the aggregate', async () => {
+    await countDueWords();
+    const ids = await saveWords(4);
+    await updateWord(ids[0], { nextReviewAt: noonOf(-1) });
+    await updateWord(ids[1], { nextReviewAt: noonOf(2) });
+    await updateWord(ids[2], { nextReviewAt: noonOf(2) });
+    await updateWord(ids[3], { nextReviewAt: noonOf(40) });
+
+    const forecast = await getReviewForecast(7);
+
+    expect(forecast.dueCount).toBe(1);
+    expect(forecast.days).toHaveLength(7);
+    expect(forecast.days[0].date).toBe(toReviewDayKey(Date.now()));
+    expect(forecast.days.map((day) => day.count)).toEqual([0, 0, 2, 0, 0, 0, 0]);
+  });
+
+  it('rebuilds when direct writes make the aggregate drift', async () => {
+    const ids = await saveWords(2);
+    await countDueWords();
+
+    await putNextReviewAtDirectly(ids[0], noonOf(3));
+    expect((await getReviewForecast(5)).days[3].count).toBe(0);
+
+    expect(await reconcileReviewStats()).toBe(true);
+    expect((await getReviewForecast(5)).days[3].count).toBe(1);
+  });
+
+  it('skips the check within maxAge', async () => {
+    const ids = await saveWords(1);
+    await countDueWords();
+    await putNextReviewAtDirectly(ids[0], noonOf(3));
+
+    expect(await reconcileReviewStats(60_000)).toBe(false);
+    expect(await reconcileReviewStats()).toBe(true);
+  });
+});
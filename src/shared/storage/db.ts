@@ -3,22 +3,50 @@
  * Story 2.1 实现 - AC3: 自动创建数据库
  *
  * 数据库名称: LingoRecallDB
- * 版本: 1
- * Object Stores: words, tags
+ * 版本: 7（结构变更见 MIGRATIONS）
+ * Object Stores: words, wordDetails, tags, analysisCache, translationMemory, searchIndex, meta,
+ *                usageLog, usageDaily, usageByModel
  *
  * @module shared/storage/db
  */
 
+import { buildIndexTerms, normalizeSearchText } from '../utils/textSearch';
+import type {
+  WordRecord,
+  WordSummary,
+  WordDetail,
+  WordDetailField,
+  ReviewForecast,
+  ReviewForecastDay,
+} from '../messaging/types';
+
 // ============================================================
 // Database Configuration
 // ============================================================
 
 export const DB_NAME = 'LingoRecallDB';
-export const DB_VERSION = 1;
+export const DB_VERSION = 7;
 
 export const STORES = {
+  /** 词汇摘要（列表、排序、复习调度用到的字段） */
   words: 'words',
+  /** 词汇冷字段（例句、上下文），详情 / 跳转原文 / 复习卡片按需读取，主键 id */
+  wordDetails: 'wordDetails',
   tags: 'tags',
+  /** AI 分析结果持久化缓存（analysisCache 的 L2 层） */
+  analysisCache: 'analysisCache',
+  /** 全页翻译的持久化翻译记忆（跨页面复用导航栏、页脚等重复片段） */
+  translationMemory: 'translationMemory',
+  /** 词库全文检索的倒排索引（主键 [term, wordId]） */
+  searchIndex: 'searchIndex',
+  /** 内部元数据（迁移回填进度、复习聚合等，主键 key） */
+  meta: 'meta',
+  /** AI 用量日志（只追加，自增主键） */
+  usageLog: 'usageLog',
+  /** AI 用量按日汇总（主键 date） */
+  usageDaily: 'usageDaily',
+  /** AI 用量按模型汇总（主键 model） */
+  usageByModel: 'usageByModel',
 } as const;
 
 export const INDEXES = {
@@ -26,8 +54,154 @@ export const INDEXES = {
   byNextReviewAt: 'byNextReviewAt',
   byTagId: 'byTagId',
   bySourceUrl: 'bySourceUrl',
+  byExpiresAt: 'byExpiresAt',
+  byLastAccessAt: 'byLastAccessAt',
+  byDuplicateKey: 'byDuplicateKey',
+  byNormalizedText: 'byNormalizedText',
+  byTagCreatedAt: 'byTagCreatedAt',
+  byTimestamp: 'byTimestamp',
+  byModelTimestamp: 'byModelTimestamp',
 } as const;
 
+// ============================================================
+// Migrations
+// ============================================================
+
+/**
+ * 版本迁移
+ * 在 versionchange 事务内执行，只做建表、建索引等结构变更；
+ * 需要逐条改写记录的数据回填交给 runPendingBackfills 在升级完成后分批执行
+ */
+interface Migration {
+  /** 迁移后的数据库版本 */
+  version: number;
+  /** 迁移说明（日志用） */
+  description: string;
+  /** 结构变更 */
+  upgrade: (db: IDBDatabase, tx: IDBTransaction, oldVersion: number) => void;
+}
+
+/**
+ * 按版本升序排列的迁移列表，新增迁移时追加到末尾并同步提升 DB_VERSION
+ */
+const MIGRATIONS: Migration[] = [
+  {
+    version: 1,
+    description: 'words / tags',
+    upgrade: (db) => {
+      const wordsStore = db.createObjectStore(STORES.words, { keyPath: 'id' });
+
+      // byCreatedAt: 按创建时间查询，用于列表排序
+      wordsStore.createIndex(INDEXES.byCreatedAt, 'createdAt', { unique: false });
+
+      // byNextReviewAt: 按下次复习时间查询，用于复习调度
+      wordsStore.createIndex(INDEXES.byNextReviewAt, 'nextReviewAt', { unique: false });
+
+      // byTagId: 按标签查询，multiEntry 支持数组中每个元素都作为索引键
+      wordsStore.createIndex(INDEXES.byTagId, 'tagIds', { unique: false, multiEntry: true });
+
+      // bySourceUrl: 按来源 URL 查询，用于跳回原文
+      wordsStore.createIndex(INDEXES.bySourceUrl, 'sourceUrl', { unique: false });
+
+      db.createObjectStore(STORES.tags, { keyPath: 'id' });
+    },
+  },
+  {
+    version: 2,
+    description: 'analysisCache（AI 分析结果 L2 缓存）',
+    upgrade: (db) => {
+      const cacheStore = db.createObjectStore(STORES.analysisCache, { keyPath: 'key' });
+
+      // byExpiresAt: 批量清理过期条目
+      cacheStore.createIndex(INDEXES.byExpiresAt, 'expiresAt', { unique: false });
+
+      // byLastAccessAt: 容量超限时按最近访问时间淘汰，以及启动预热
+      cacheStore.createIndex(INDEXES.byLastAccessAt, 'lastAccessAt', { unique: false });
+    },
+  },
+  {
+    version: 3,
+    description: 'translationMemory（全页翻译记忆）',
+    upgrade: (db) => {
+      const memoryStore = db.createObjectStore(STORES.translationMemory, { keyPath: 'key' });
+
+      // byLastAccessAt: 容量超限时按最近访问时间淘汰
+      memoryStore.createIndex(INDEXES.byLastAccessAt, 'lastAccessAt', { unique: false });
+    },
+  },
+  {
+    version: 4,
+    description: 'searchIndex（词库全文检索倒排索引）',
+    upgrade: (db, tx, oldVersion) => {
+      db.createObjectStore(STORES.searchIndex, { keyPath: ['term', 'wordId'] });
+
+      if (oldVersion > 0) {
+        // 已有词汇的索引词项在升级完成后分批写入；进度存于 meta（随本迁移提前创建）
+        db.createObjectStore(STORES.meta, { keyPath: 'key' });
+        const state: BackfillState = { key: backfillKey('searchIndex'), lastKey: null };
+        tx.objectStore(STORES.meta).put(state);
+      }
+    },
+  },
+  {
+    version: 5,
+    description: 'words 组合索引（重复检测 / 字母排序 / 标签时间视图）与 meta',
+    upgrade: (db, tx, oldVersion) => {
+      // 从 v4 之前升级时 meta 已由 v4 迁移创建
+      if (!db.objectStoreNames.contains(STORES.meta)) {
+        db.createObjectStore(STORES.meta, { keyPath: 'key' });
+      }
+      const wordsStore = tx.objectStore(STORES.words);
+
+      // byDuplicateKey: [sourceUrl, text, xpath]，保存前的重复检测一次探测即可
+      wordsStore.createIndex(INDEXES.byDuplicateKey, ['sourceUrl', 'text', 'xpath'], { unique: false });
+
+      // byNormalizedText: 规范化词形，用于按字母排序
+      wordsStore.createIndex(INDEXES.byNormalizedText, 'normalizedText', { unique: false });
+
+      // byTagCreatedAt: 每个标签一条 [tagId, createdAt]，标签筛选下按时间排序的范围扫描
+      wordsStore.createIndex(INDEXES.byTagCreatedAt, 'tagTimeKeys', { unique: false, multiEntry: true });
+
+      if (oldVersion > 0) {
+        // 已有词汇缺少派生字段，升级完成后分批回填
+        const state: BackfillState = { key: backfillKey('wordIndexKeys'), lastKey: null };
+        tx.objectStore(STORES.meta).put(state);
+      }
+    },
+  },
+  {
+    version: 6,
+    description: 'wordDetails（词汇冷字段拆分）',
+    upgrade: (db, tx, oldVersion) => {
+      db.createObjectStore(STORES.wordDetails, { keyPath: 'id' });
+
+      if (oldVersion > 0) {
+        // 已有词汇的冷字段仍内联在 words 中，升级完成后分批移出；读取方在此之前按内联值兜底
+        const state: BackfillState = { key: backfillKey('splitWordDetails'), lastKey: null };
+        tx.objectStore(STORES.meta).put(state);
+      }
+    },
+  },
+  {
+    version: 7,
+    description: 'usageLog / usageDaily / usageByModel（AI 用量日志与汇总）',
+    upgrade: (db) => {
+      const logStore = db.createObjectStore(STORES.usageLog, { keyPath: 'id', autoIncrement: true });
+
+      // byTimestamp: 按时间范围查询历史，以及清理过期日志
+      logStore.createIndex(INDEXES.byTimestamp, 'timestamp', { unique: false });
+
+      // byModelTimestamp: 单个模型在时间范围内的记录
+      logStore.createIndex(INDEXES.byModelTimestamp, ['model', 'timestamp'], { unique: false });
+
+      db.createObjectStore(STORES.usageDaily, { keyPath: 'date' });
+      db.createObjectStore(STORES.usageByModel, { keyPath: 'model' });
+
+      // 旧版 chrome.storage 中的统计在首次访问时由 usageStore 导入（升级事务内无法访问 chrome.storage）
+    },
+  },
+];
+
 // ============================================================
 // Database Singleton
 // ============================================================
@@ -105,37 +279,17 @@ function initDatabase(): Promise<IDBDatabase> {
       resolve(db);
     };
 
-    // 数据库升级（首次创建或版本升级）
+    // 数据库升级（首次创建或版本升级）：依次执行尚未应用的迁移
     request.onupgradeneeded = (event) => {
-      console.log('[LingoRecall] Database upgrade needed');
-      const db = (event.target as IDBOpenDBRequest).result;
-
-      // 创建 words Object Store
-      if (!db.objectStoreNames.contains(STORES.words)) {
-        console.log('[LingoRecall] Creating words Object Store');
-        const wordsStore = db.createObjectStore(STORES.words, { keyPath: 'id' });
-
-        // 创建索引
-        // byCreatedAt: 按创建时间查询，用于列表排序
-        wordsStore.createIndex(INDEXES.byCreatedAt, 'createdAt', { unique: false });
-
-        // byNextReviewAt: 按下次复习时间查询，用于复习调度
-        wordsStore.createIndex(INDEXES.byNextReviewAt, 'nextReviewAt', { unique: false });
-
-        // byTagId: 按标签查询，multiEntry 支持数组中每个元素都作为索引键
-        wordsStore.createIndex(INDEXES.byTagId, 'tagIds', { unique: false, multiEntry: true });
-
-        // bySourceUrl: 按来源 URL 查询，用于重复检测和跳回原文
-        wordsStore.createIndex(INDEXES.bySourceUrl, 'sourceUrl', { unique: false });
-
-        console.log('[LingoRecall] Words Object Store created with indexes');
-      }
+      const db = request.result;
+      const upgradeTx = request.transaction!;
+      console.log(`[LingoRecall] Database upgrade needed: v${event.oldVersion} -> v${DB_VERSION}`);
 
-      // 创建 tags Object Store
-      if (!db.objectStoreNames.contains(STORES.tags)) {
-        console.log('[LingoRecall] Creating tags Object Store');
-        db.createObjectStore(STORES.tags, { keyPath: 'id' });
-        console.log('[LingoRecall] Tags Object Store created');
+      for (const migration of MIGRATIONS) {
+        if (migration.version > event.oldVersion && migration.version <= DB_VERSION) {
+          console.log(`[LingoRecall] Applying migration v${migration.version}: ${migration.description}`);
+          migration.upgrade(db, upgradeTx, event.oldVersion);
+        }
       }
     };
 
@@ -168,6 +322,7 @@ export function closeDatabase(): void {
  */
 export function deleteDatabase(): Promise<void> {
   closeDatabase();
+  completedBackfills.clear();
 
   return new Promise((resolve, reject) => {
     console.log('[LingoRecall] Deleting database:', DB_NAME);
@@ -269,54 +424,674 @@ export async function withCursor<T>(
 }
 
 // ============================================================
-// Story 3.1: 待复习词汇查询
+// LRU Eviction
 // ============================================================
 
 /**
- * 统计待复习词汇数量
- * Story 3.1 - AC2: 查询所有 `nextReviewAt <= 当前时间` 的词汇
+ * 在调用方的 readwrite 事务内按 byLastAccessAt 从最旧开始删除条目，直到数量不超过 maxEntries
+ * 供带 lastAccessAt 的缓存类 Object Store（analysisCache、translationMemory）做容量淘汰
  *
- * 使用 byNextReviewAt 索引进行范围查询
+ * @param store 带 byLastAccessAt 索引的 Object Store
+ * @param maxEntries 最大保留条数
+ * @param onEvicted 每删除一条回调一次（用于统计）
+ */
+export function evictLeastRecentlyAccessed(
+  store: IDBObjectStore,
+  maxEntries: number,
+  onEvicted: () => void
+): void {
+  const countRequest = store.count();
+  countRequest.onsuccess = () => {
+    let overflow = countRequest.result - maxEntries;
+    if (overflow <= 0) {
+      return;
+    }
+
+    const lruRequest = store.index(INDEXES.byLastAccessAt).openCursor(null, 'next');
+    lruRequest.onsuccess = () => {
+      const cursor = lruRequest.result;
+      if (cursor && overflow > 0) {
+        cursor.delete();
+        onEvicted();
+        overflow--;
+        cursor.continue();
+      }
+    };
+  };
+}
+
+// ============================================================
+// Derived Index Keys (v5)
+// ============================================================
+
+/**
+ * 填充 v5 索引依赖的派生字段
+ * - normalizedText: byNormalizedText（字母排序）
+ * - tagTimeKeys: byTagCreatedAt（标签筛选 + 时间排序）
  *
- * @returns Promise<number> 待复习词汇数量
+ * 所有写入 words 的路径都应在 add/put 前调用，保证派生字段与 text/tagIds 一致
  */
-export async function countDueWords(): Promise<number> {
+export function withWordIndexKeys<T extends WordSummary>(word: T): T {
+  return {
+    ...word,
+    normalizedText: normalizeSearchText(word.text),
+    tagTimeKeys: (word.tagIds || []).map((tagId): [string, number] => [tagId, word.createdAt]),
+  };
+}
+
+// ============================================================
+// Word Summary / Detail Split
+// ============================================================
+
+/**
+ * 冷字段：体积大、列表 / 排序 / 检索 / 到期查询都不需要，存放于 wordDetails
+ * xpath 参与 byDuplicateKey 重复检测索引，留在 words
+ */
+export const WORD_DETAIL_FIELDS: readonly WordDetailField[] = ['exampleSentence', 'contextBefore', 'contextAfter'];
+
+/**
+ * 去掉冷字段，得到写入 words 的摘要记录
+ */
+export function toWordSummary<T extends WordSummary>(word: T): Omit<T, WordDetailField> {
+  const { exampleSentence: _example, contextBefore: _before, contextAfter: _after, ...summary } = word;
+  return summary;
+}
+
+/**
+ * 取出冷字段，得到写入 wordDetails 的记录
+ */
+export function toWordDetail(word: WordRecord): WordDetail {
+  return {
+    id: word.id,
+    exampleSentence: word.exampleSentence,
+    contextBefore: word.contextBefore,
+    contextAfter: word.contextAfter,
+  };
+}
+
+/**
+ * words 中的记录是否仍内联冷字段（splitWordDetails 回填完成前的旧记录）
+ */
+export function hasInlineDetail(word: WordSummary): boolean {
+  return WORD_DETAIL_FIELDS.some((field) => word[field] !== undefined);
+}
+
+/**
+ * 合并摘要与冷字段为完整记录；wordDetails 中没有时沿用内联值
+ */
+export function mergeWordDetail(summary: WordSummary, detail?: WordDetail | null): WordRecord {
+  return {
+    ...summary,
+    exampleSentence: detail?.exampleSentence ?? summary.exampleSentence ?? '',
+    contextBefore: detail?.contextBefore ?? summary.contextBefore ?? '',
+    contextAfter: detail?.contextAfter ?? summary.contextAfter ?? '',
+  };
+}
+
+/**
+ * 在调用方事务内为一组摘要补齐冷字段（每条一次主键 get，结果保持原顺序）
+ *
+ * @param detailStore wordDetails 的 objectStore
+ * @param words 摘要记录
+ * @param onDone 全部读取完成后回调
+ */
+export function joinWordDetails(
+  detailStore: IDBObjectStore,
+  words: WordSummary[],
+  onDone: (words: WordRecord[]) => void
+): void {
+  if (words.length === 0) {
+    onDone([]);
+    return;
+  }
+
+  const merged: WordRecord[] = new Array(words.length);
+  let remaining = words.length;
+  words.forEach((word, i) => {
+    const request = detailStore.get(word.id);
+    request.onsuccess = () => {
+      merged[i] = mergeWordDetail(word, request.result as WordDetail | undefined);
+      if (--remaining === 0) {
+        onDone(merged);
+      }
+    };
+  });
+}
+
+// ============================================================
+// Resumable Backfills
+// ============================================================
+
+/** 每个回填事务处理的记录数，单个事务保持短小，不阻塞其他读写 */
+export const BACKFILL_BATCH_SIZE = 200;
+
+/**
+ * 回填任务：逐条改写某个 Object Store 的记录
+ */
+interface BackfillTask {
+  store: string;
+  /** 回填时同一事务内还需写入的 Object Store */
+  extraStores?: string[];
+  /** 返回改写后的记录；原样返回同一对象时不写回 */
+  apply: (value: unknown, tx: IDBTransaction) => unknown;
+}
+
+/** 回填任务名称 */
+export type BackfillName = 'searchIndex' | 'wordIndexKeys' | 'splitWordDetails';
+
+const BACKFILL_TASKS: Record<BackfillName, BackfillTask> = {
+  /** v4: 为已有词汇写入倒排索引词项（词汇本身不变） */
+  searchIndex: {
+    store: STORES.words,
+    extraStores: [STORES.searchIndex],
+    apply: (value, tx) => {
+      const word = value as Pick<WordRecord, 'id' | 'text' | 'meaning'>;
+      const indexStore = tx.objectStore(STORES.searchIndex);
+      for (const term of buildIndexTerms(word)) {
+        indexStore.put({ term, wordId: word.id });
+      }
+      return value;
+    },
+  },
+  /** v5: 为已有词汇补齐 normalizedText / tagTimeKeys */
+  wordIndexKeys: {
+    store: STORES.words,
+    apply: (value) => withWordIndexKeys(value as WordRecord),
+  },
+  /** v6: 把已有词汇内联的冷字段移到 wordDetails（升级后新写入的记录已是摘要，原样跳过） */
+  splitWordDetails: {
+    store: STORES.words,
+    extraStores: [STORES.wordDetails],
+    apply: (value, tx) => {
+      const word = value as WordRecord;
+      if (!hasInlineDetail(word)) {
+        return word;
+      }
+      tx.objectStore(STORES.wordDetails).put(toWordDetail(mergeWordDetail(word)));
+      return toWordSummary(word);
+    },
+  },
+};
+
+/**
+ * 回填进度（存于 meta，记录存在即表示尚未完成）
+ */
+interface BackfillState {
+  key: string;
+  /** 最后一条已处理记录的主键，null 表示尚未开始 */
+  lastKey: IDBValidKey | null;
+}
+
+const BACKFILL_KEY_PREFIX = 'backfill:';
+
+/** 已确认完成的回填（完成后不会再变回未完成，可在内存中缓存） */
+const completedBackfills = new Set<BackfillName>();
+
+let backfillPromise: Promise<number> | null = null;
+
+function backfillKey(name: BackfillName): string {
+  return `${BACKFILL_KEY_PREFIX}${name}`;
+}
+
+/**
+ * 判断回填是否已完成
+ * 依赖派生字段的索引在回填完成前不完整，查询方应据此回退到旧的查询路径
+ */
+export async function isBackfillComplete(name: BackfillName): Promise<boolean> {
+  if (completedBackfills.has(name)) {
+    return true;
+  }
+
   const db = await getDatabase();
-  const now = Date.now();
+  const state = await new Promise<BackfillState | undefined>((resolve, reject) => {
+    const request = db.transaction(STORES.meta, 'readonly').objectStore(STORES.meta).get(backfillKey(name));
+    request.onsuccess = () => resolve(request.result as BackfillState | undefined);
+    request.onerror = () => reject(request.error);
+  });
 
-  return new Promise((resolve, reject) => {
-    const tx = db.transaction(STORES.words, 'readonly');
-    const store = tx.objectStore(STORES.words);
-    const index = store.index(INDEXES.byNextReviewAt);
+  if (!state) {
+    completedBackfills.add(name);
+  }
+  return !state;
+}
 
-    // 使用 upperBound 查询所有 nextReviewAt <= now 的记录
-    const range = IDBKeyRange.upperBound(now);
+/**
+ * 执行所有未完成的回填
+ * 每批记录一个独立事务，并在同一事务内写入进度；Service Worker 中途被回收时下次唤醒从断点继续。
+ * 并发调用共享同一次执行。
+ *
+ * @param batchSize 每批记录数
+ * @returns 本次处理的记录数
+ */
+export function runPendingBackfills(batchSize = BACKFILL_BATCH_SIZE): Promise<number> {
+  if (!backfillPromise) {
+    backfillPromise = runBackfills(batchSize).finally(() => {
+      backfillPromise = null;
+    });
+  }
+  return backfillPromise;
+}
+
+async function runBackfills(batchSize: number): Promise<number> {
+  const db = await getDatabase();
+  const pending = await new Promise<BackfillState[]>((resolve, reject) => {
+    const request = db
+      .transaction(STORES.meta, 'readonly')
+      .objectStore(STORES.meta)
+      .getAll(IDBKeyRange.bound(BACKFILL_KEY_PREFIX, `${BACKFILL_KEY_PREFIX}\uffff`));
+    request.onsuccess = () => resolve(request.result as BackfillState[]);
+    request.onerror = () => reject(request.error);
+  });
+
+  let processed = 0;
+  for (const state of pending) {
+    const name = state.key.slice(BACKFILL_KEY_PREFIX.length) as BackfillName;
+    const task: BackfillTask | undefined = BACKFILL_TASKS[name];
+    if (!task) {
+      console.warn('[LingoRecall] Unknown backfill:', state.key);
+      continue;
+    }
+
+    let lastKey = state.lastKey;
+    for (;;) {
+      const chunk = await runBackfillChunk(db, state.key, task, lastKey, batchSize);
+      processed += chunk.count;
+      if (chunk.done) {
+        break;
+      }
+      lastKey = chunk.lastKey;
+      // 让出事件循环，批次之间的其他事务可以插队执行
+      await new Promise((resolve) => setTimeout(resolve, 0));
+    }
+
+    completedBackfills.add(name);
+    console.log(`[LingoRecall] Backfill ${name} completed`);
+  }
+
+  return processed;
+}
+
+/**
+ * 在单个事务内回填一批记录，并保存进度
+ */
+function runBackfillChunk(
+  db: IDBDatabase,
+  key: string,
+  task: BackfillTask,
+  lastKey: IDBValidKey | null,
+  batchSize: number
+): Promise<{ count: number; lastKey: IDBValidKey | null; done: boolean }> {
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction([task.store, STORES.meta, ...(task.extraStores ?? [])], 'readwrite');
+    const metaStore = tx.objectStore(STORES.meta);
+    const range = lastKey === null ? null : IDBKeyRange.lowerBound(lastKey, true);
+    const request = tx.objectStore(task.store).openCursor(range);
 
     let count = 0;
-    const request = index.openCursor(range);
+    let chunkLastKey = lastKey;
+    let done = false;
 
-    request.onsuccess = (event) => {
-      const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
-      if (cursor) {
-        count++;
+    request.onsuccess = () => {
+      const cursor = request.result;
+      if (!cursor) {
+        done = true;
+        metaStore.delete(key);
+        return;
+      }
+
+      const value = cursor.value;
+      const next = task.apply(value, tx);
+      if (next !== value) {
+        cursor.update(next);
+      }
+      chunkLastKey = cursor.primaryKey;
+      count++;
+
+      if (count < batchSize) {
         cursor.continue();
-      } else {
-        resolve(count);
+        return;
       }
+
+      const state: BackfillState = { key, lastKey: chunkLastKey };
+      metaStore.put(state);
     };
 
-    request.onerror = () => {
-      console.error('[LingoRecall] countDueWords error:', request.error);
-      reject(request.error);
+    tx.oncomplete = () => resolve({ count, lastKey: chunkLastKey, done });
+    tx.onerror = () => {
+      console.error('[LingoRecall] Backfill chunk error:', tx.error);
+      reject(tx.error);
+    };
+  });
+}
+
+// ============================================================
+// Review Stats: 到期数量与复习预测聚合
+// ============================================================
+
+/**
+ * 复习聚合记录（存于 meta，主键 REVIEW_STATS_KEY）
+ * buckets 按本地日期统计 nextReviewAt 的分布，随保存 / 复习 / 删除在同一事务内增量维护
+ */
+export interface ReviewStatsRecord {
+  key: typeof REVIEW_STATS_KEY;
+  /** 本地日期 YYYY-MM-DD -> 当天到期的词汇数（不含 0） */
+  buckets: Record<string, number>;
+  /** 计入聚合的词汇总数 */
+  total: number;
+  /** 上次通过索引计数核对的时间 */
+  reconciledAt: number;
+}
+
+export const REVIEW_STATS_KEY = 'reviewStats';
+
+/** 默认预测天数（含今天） */
+export const REVIEW_FORECAST_DAYS = 30;
+
+/** 聚合核对间隔：绕过写入 API 的改动最迟在这之后被修正 */
+export const REVIEW_STATS_RECONCILE_INTERVAL = 6 * 60 * 60 * 1000;
+
+/**
+ * 同一事务内尚未落盘的聚合
+ * 事务内请求按发出顺序执行，多次 get/put 交错会读到旧值，因此每个事务只读取一次，后续变更在内存记录上累加
+ */
+interface PendingReviewStats {
+  loaded: boolean;
+  stats: ReviewStatsRecord | null;
+  queued: Array<[number | undefined, number | undefined]>;
+}
+
+const pendingReviewStats = new WeakMap<IDBTransaction, PendingReviewStats>();
+
+function padDatePart(value: number): string {
+  return String(value).padStart(2, '0');
+}
+
+/**
+ * 时间戳所在的本地日期
+ */
+export function toReviewDayKey(timestamp: number): string {
+  const date = new Date(timestamp);
+  return `${date.getFullYear()}-${padDatePart(date.getMonth() + 1)}-${padDatePart(date.getDate())}`;
+}
+
+/**
+ * 本地日期的 [当天 0 点, 次日 0 点) 时间戳
+ */
+function dayBounds(dayKey: string): [number, number] {
+  const [year, month, day] = dayKey.split('-').map(Number);
+  return [new Date(year, month - 1, day).getTime(), new Date(year, month - 1, day + 1).getTime()];
+}
+
+function applyReviewDelta(stats: ReviewStatsRecord, before?: number, after?: number): void {
+  if (before !== undefined) {
+    const key = toReviewDayKey(before);
+    const count = (stats.buckets[key] ?? 0) - 1;
+    if (count > 0) {
+      stats.buckets[key] = count;
+    } else {
+      delete stats.buckets[key];
+    }
+    stats.total = Math.max(0, stats.total - 1);
+  }
+  if (after !== undefined) {
+    const key = toReviewDayKey(after);
+    stats.buckets[key] = (stats.buckets[key] ?? 0) + 1;
+    stats.total++;
+  }
+}
+
+/**
+ * 在词汇写入事务内登记一次 nextReviewAt 变化
+ * 新增传 after，删除传 before，复习 / 改期两者都传。事务须包含 meta。
+ * 聚合尚未建立时忽略（首次读取时会从索引完整重建）。
+ *
+ * @param tx 包含 words 与 meta 的 readwrite 事务
+ * @param before 变更前的 nextReviewAt
+ * @param after 变更后的 nextReviewAt
+ */
+export function trackReviewChange(tx: IDBTransaction, before?: number, after?: number): void {
+  if (before === after) {
+    return;
+  }
+
+  const metaStore = tx.objectStore(STORES.meta);
+  let pending = pendingReviewStats.get(tx);
+
+  if (!pending) {
+    const state: PendingReviewStats = { loaded: false, stats: null, queued: [] };
+    pendingReviewStats.set(tx, state);
+    pending = state;
+
+    const request = metaStore.get(REVIEW_STATS_KEY);
+    request.onsuccess = () => {
+      state.loaded = true;
+      state.stats = (request.result as ReviewStatsRecord | undefined) ?? null;
+      if (state.stats) {
+        for (const [queuedBefore, queuedAfter] of state.queued) {
+          applyReviewDelta(state.stats, queuedBefore, queuedAfter);
+        }
+        metaStore.put(state.stats);
+      }
+      state.queued = [];
+    };
+  }
+
+  if (!pending.loaded) {
+    pending.queued.push([before, after]);
+    return;
+  }
+  if (pending.stats) {
+    applyReviewDelta(pending.stats, before, after);
+    metaStore.put(pending.stats);
+  }
+}
+
+/**
+ * 在事务内用 byNextReviewAt 的键游标重建聚合（只读索引键，不反序列化记录）
+ */
+function rebuildReviewStatsInTx(tx: IDBTransaction, now: number): void {
+  const stats: ReviewStatsRecord = { key: REVIEW_STATS_KEY, buckets: {}, total: 0, reconciledAt: now };
+  const request = tx.objectStore(STORES.words).index(INDEXES.byNextReviewAt).openKeyCursor();
+
+  request.onsuccess = () => {
+    const cursor = request.result;
+    if (cursor) {
+      applyReviewDelta(stats, undefined, cursor.key as number);
+      cursor.continue();
+      return;
+    }
+    tx.objectStore(STORES.meta).put(stats);
+  };
+}
+
+/**
+ * 核对复习聚合
+ * 对每个日期桶及总数各做一次 IDBIndex.count 比对，任一不一致（或聚合不存在）时在同一事务内重建。
+ *
+ * @param maxAge 距上次核对不足该时长时跳过；0 表示总是核对
+ * @returns 是否重建了聚合
+ */
+export async function reconcileReviewStats(maxAge = 0): Promise<boolean> {
+  const db = await getDatabase();
+  const now = Date.now();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction([STORES.words, STORES.meta], 'readwrite');
+    const metaStore = tx.objectStore(STORES.meta);
+    const index = tx.objectStore(STORES.words).index(INDEXES.byNextReviewAt);
+    let rebuilt = false;
+
+    const request = metaStore.get(REVIEW_STATS_KEY);
+    request.onsuccess = () => {
+      const stats = request.result as ReviewStatsRecord | undefined;
+      if (!stats) {
+        rebuilt = true;
+        rebuildReviewStatsInTx(tx, now);
+        return;
+      }
+      if (maxAge > 0 && now - stats.reconciledAt < maxAge) {
+        return;
+      }
+
+      const checks: Array<[IDBKeyRange | undefined, number]> = Object.entries(stats.buckets).map(
+        ([dayKey, count]): [IDBKeyRange | undefined, number] => {
+          const [start, end] = dayBounds(dayKey);
+          return [IDBKeyRange.bound(start, end, false, true), count];
+        }
+      );
+      checks.push([undefined, stats.total]);
+
+      let remaining = checks.length;
+      let consistent = true;
+      for (const [range, expected] of checks) {
+        const countRequest = index.count(range);
+        countRequest.onsuccess = () => {
+          consistent = consistent && countRequest.result === expected;
+          if (--remaining > 0) {
+            return;
+          }
+          if (consistent) {
+            metaStore.put({ ...stats, reconciledAt: now });
+          } else {
+            console.warn('[LingoRecall] Review stats drifted, rebuilding');
+            rebuilt = true;
+            rebuildReviewStatsInTx(tx, now);
+          }
+        };
+      }
     };
 
+    tx.oncomplete = () => resolve(rebuilt);
     tx.onerror = () => {
-      console.error('[LingoRecall] countDueWords transaction error:', tx.error);
+      console.error('[LingoRecall] reconcileReviewStats error:', tx.error);
       reject(tx.error);
     };
   });
 }
 
+/**
+ * 在一个只读事务内读取聚合与今天已到期的数量（两者对同一快照一致）
+ * 聚合不存在时先重建
+ */
+async function readReviewSnapshot(now: number): Promise<{ stats: ReviewStatsRecord; dueToday: number }> {
+  const db = await getDatabase();
+  const [todayStart] = dayBounds(toReviewDayKey(now));
+
+  const snapshot = await new Promise<{ stats: ReviewStatsRecord | undefined; dueToday: number }>(
+    (resolve, reject) => {
+      const tx = db.transaction([STORES.words, STORES.meta], 'readonly');
+      const statsRequest = tx.objectStore(STORES.meta).get(REVIEW_STATS_KEY);
+      const countRequest = tx
+        .objectStore(STORES.words)
+        .index(INDEXES.byNextReviewAt)
+        .count(IDBKeyRange.bound(todayStart, now));
+
+      tx.oncomplete = () =>
+        resolve({
+          stats: statsRequest.result as ReviewStatsRecord | undefined,
+          dueToday: countRequest.result,
+        });
+      tx.onerror = () => reject(tx.error);
+    }
+  );
+
+  if (snapshot.stats) {
+    return { stats: snapshot.stats, dueToday: snapshot.dueToday };
+  }
+
+  await reconcileReviewStats();
+  return readReviewSnapshot(now);
+}
+
+function sumBucketsBefore(stats: ReviewStatsRecord, dayKey: string): number {
+  let sum = 0;
+  for (const [key, count] of Object.entries(stats.buckets)) {
+    if (key < dayKey) {
+      sum += count;
+    }
+  }
+  return sum;
+}
+
+// ============================================================
+// Story 3.1: 待复习词汇查询
+// ============================================================
+
+/**
+ * 统计待复习词汇数量
+ * Story 3.1 - AC2: 查询所有 `nextReviewAt <= 当前时间` 的词汇
+ *
+ * 今天之前的到期数直接取自复习聚合，只有今天 0 点到此刻的区间走一次 IDBIndex.count，
+ * 与词库大小及积压量无关
+ *
+ * @returns Promise<number> 待复习词汇数量
+ */
+export async function countDueWords(): Promise<number> {
+  const now = Date.now();
+
+  try {
+    const { stats, dueToday } = await readReviewSnapshot(now);
+    return sumBucketsBefore(stats, toReviewDayKey(now)) + dueToday;
+  } catch (error) {
+    console.error('[LingoRecall] countDueWords error:', error);
+    throw error;
+  }
+}
+
+/**
+ * 获取下一个到期时间
+ * byNextReviewAt 中第一个大于 after 的键（键游标单次 seek，不读取记录）
+ *
+ * @param after 起点时间，默认当前时间
+ * @returns Promise<number | null> 下一个到期时间，没有未到期词汇时为 null
+ */
+export async function getNextDueAt(after = Date.now()): Promise<number | null> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readonly');
+    const request = tx
+      .objectStore(STORES.words)
+      .index(INDEXES.byNextReviewAt)
+      .openKeyCursor(IDBKeyRange.lowerBound(after, true));
+
+    request.onsuccess = () => {
+      const cursor = request.result;
+      resolve(cursor ? (cursor.key as number) : null);
+    };
+    request.onerror = () => {
+      console.error('[LingoRecall] getNextDueAt error:', request.error);
+      reject(request.error);
+    };
+  });
+}
+
+/**
+ * 获取复习预测
+ * 直接由复习聚合得出，不扫描词汇
+ *
+ * @param days 预测天数（含今天）
+ * @returns Promise<ReviewForecast> 已到期数量与逐日到期数量
+ */
+export async function getReviewForecast(days = REVIEW_FORECAST_DAYS): Promise<ReviewForecast> {
+  const now = Date.now();
+  const todayKey = toReviewDayKey(now);
+  const { stats, dueToday } = await readReviewSnapshot(now);
+
+  const today = new Date(now);
+  const forecast: ReviewForecastDay[] = [];
+  for (let offset = 0; offset < days; offset++) {
+    const date = toReviewDayKey(new Date(today.getFullYear(), today.getMonth(), today.getDate() + offset).getTime());
+    const count = stats.buckets[date] ?? 0;
+    forecast.push({ date, count: offset === 0 ? Math.max(0, count - dueToday) : count });
+  }
+
+  return {
+    dueCount: sumBucketsBefore(stats, todayKey) + dueToday,
+    days: forecast,
+  };
+}
+
 // ============================================================
 // Story 3.3: 获取待复习词汇列表
 // ============================================================
@@ -330,18 +1105,21 @@ export async function countDueWords(): Promise<number> {
  * @param limit 可选的数量限制
  * @returns Promise<WordRecord[]> 待复习词汇列表
  */
-export async function getDueWords(limit?: number): Promise<import('../messaging/types').WordRecord[]> {
+export async function getDueWords(limit?: number): Promise<WordRecord[]> {
   const db = await getDatabase();
   const now = Date.now();
 
   return new Promise((resolve, reject) => {
-    const tx = db.transaction(STORES.words, 'readonly');
+    const tx = db.transaction([STORES.words, STORES.wordDetails], 'readonly');
     const store = tx.objectStore(STORES.words);
     const index = store.index(INDEXES.byNextReviewAt);
 
     // 使用 upperBound 查询所有 nextReviewAt <= now 的记录
     const range = IDBKeyRange.upperBound(now);
-    const words: import('../messaging/types').WordRecord[] = [];
+    const words: WordSummary[] = [];
+
+    // 复习卡片需要例句 / 上下文，收集摘要后在同一事务内补齐冷字段
+    const finish = () => joinWordDetails(tx.objectStore(STORES.wordDetails), words, resolve);
 
     // 按 nextReviewAt 升序（最先到期的排在前面）
     const request = index.openCursor(range, 'next');
@@ -349,17 +1127,17 @@ export async function getDueWords(limit?: number): Promise<import('../messaging/
     request.onsuccess = (event) => {
       const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
       if (cursor) {
-        words.push(cursor.value as import('../messaging/types').WordRecord);
+        words.push(cursor.value as WordSummary);
 
         // 检查是否达到限制
         if (limit && words.length >= limit) {
-          resolve(words);
+          finish();
           return;
         }
 
         cursor.continue();
       } else {
-        resolve(words);
+        finish();
       }
     };
 
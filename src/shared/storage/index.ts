@@ -17,22 +17,61 @@ export {
   isDatabaseInitialized,
   withTransaction,
   withCursor,
+  evictLeastRecentlyAccessed,
   countDueWords,
   getDueWords,
+  getReviewForecast,
+  getNextDueAt,
+  reconcileReviewStats,
+  trackReviewChange,
+  REVIEW_FORECAST_DAYS,
+  REVIEW_STATS_RECONCILE_INTERVAL,
+  type ReviewStatsRecord,
+  withWordIndexKeys,
+  WORD_DETAIL_FIELDS,
+  toWordSummary,
+  toWordDetail,
+  mergeWordDetail,
+  runPendingBackfills,
+  isBackfillComplete,
+  BACKFILL_BATCH_SIZE,
+  type BackfillName,
 } from './db';
 
 // Word Service
 export {
   saveWord,
   findDuplicateWord,
+  findWordsByText,
+  getRecentWordSummaries,
   getAllWords,
+  getWordsPage,
+  projectWord,
   getWordById,
+  getWordDetail,
+  needsWordDetails,
   updateWord,
   deleteWord,
   getWordCount,
   searchWords,
+  batchUpdateWords,
+  batchDeleteWords,
+  BATCH_CHUNK_SIZE,
+  type WordPageOptions,
+  type BatchWordChanges,
 } from './wordService';
 
+// Change Feed
+export {
+  CHANGE_FEED_CHANNEL,
+  publishChanges,
+  subscribeChanges,
+  patchWordList,
+  dueCountDelta,
+  type StorageChange,
+  type ChangeListener,
+} from './changeFeed';
+
 // Tag Store - Story 4.4
 export {
   createTag,
@@ -41,4 +80,9 @@ export {
   updateTag,
   deleteTag,
   getTagsByIds,
+  runPendingTagCascades,
+  getPendingTagCascades,
+  getHiddenTagIds,
+  TAG_CASCADE_CHUNK_SIZE,
+  type TagCascadeProgress,
 } from './tagStore';
@@ -0,0 +1,116 @@
+/**
+ * LingoRecall AI - Search Index Storage Layer
+ * 词库全文检索的持久化倒排索引
+ *
+ * 每个 (词项, 词汇 ID) 是一条记录，主键为 [term, wordId]：
+ * - 写入/删除都是无需先读后写的 put/delete，可与 words 的修改放在同一事务内
+ * - 查询某个词项的倒排列表是一次主键范围扫描（getAllKeys）
+ *
+ * 词项生成规则见 shared/utils/textSearch。
+ *
+ * @module shared/storage/searchIndexStore
+ */
+
+import { getDatabase, STORES } from './db';
+import { buildIndexTerms, type SearchableFields } from '../utils/textSearch';
+
+// ============================================================
+// Types
+// ============================================================
+
+/**
+ * 倒排索引条目
+ */
+export interface SearchIndexEntry {
+  /** 索引词项（n-gram 或前缀项） */
+  term: string;
+  /** 词汇 ID */
+  wordId: string;
+}
+
+/** 可被索引的词汇 */
+export type IndexableWord = SearchableFields & { id: string };
+
+// ============================================================
+// Write (within caller's transaction)
+// ============================================================
+
+/**
+ * 写入词汇的全部索引词项
+ * 由调用方提供 searchIndex 的 objectStore，使索引与 words 在同一事务内原子更新
+ */
+export function indexWordTerms(store: IDBObjectStore, word: IndexableWord): void {
+  for (const term of buildIndexTerms(word)) {
+    const entry: SearchIndexEntry = { term, wordId: word.id };
+    store.put(entry);
+  }
+}
+
+/**
+ * 删除词汇的全部索引词项（词项由旧的 text/meaning 重新推导）
+ */
+export function removeWordTerms(store: IDBObjectStore, word: IndexableWord): void {
+  for (const term of buildIndexTerms(word)) {
+    store.delete([term, word.id]);
+  }
+}
+
+/**
+ * 判断更新是否会改变索引词项
+ */
+export function affectsSearchIndex(updates: Partial<SearchableFields>): boolean {
+  return updates.text !== undefined || updates.meaning !== undefined;
+}
+
+// ============================================================
+// Read
+// ============================================================
+
+/**
+ * 查询同时包含全部词项的词汇 ID（倒排列表求交集）
+ *
+ * @param terms - 查询词项（buildQueryTerms 的结果）
+ * @returns 候选词汇 ID，仍需调用方做子串校验
+ */
+export async function findCandidateWordIds(terms: string[]): Promise<string[]> {
+  if (terms.length === 0) {
+    return [];
+  }
+
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.searchIndex, 'readonly');
+    const store = tx.objectStore(STORES.searchIndex);
+    const postings: string[][] = [];
+
+    terms.forEach((term, index) => {
+      // [term] < [term, 任意字符串] < [term, []]：数组键排在字符串之后
+      const request = store.getAllKeys(IDBKeyRange.bound([term], [term, []]));
+      request.onsuccess = () => {
+        postings[index] = (request.result as IDBValidKey[]).map((key) => (key as [string, string])[1]);
+      };
+    });
+
+    tx.oncomplete = () => {
+      // 从最短的倒排列表开始求交集
+      postings.sort((a, b) => a.length - b.length);
+      let candidates = new Set(postings[0]);
+      for (let i = 1; i < postings.length && candidates.size > 0; i++) {
+        const next = new Set<string>();
+        for (const id of postings[i]) {
+          if (candidates.has(id)) {
+            next.add(id);
+          }
+        }
+        candidates = next;
+      }
+      resolve(Array.from(candidates));
+    };
+
+    tx.onerror = () => {
+      console.error('[LingoRecall] findCandidateWordIds error:', tx.error);
+      reject(tx.error);
+    };
+  });
+}
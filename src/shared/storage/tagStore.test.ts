@@ -17,8 +17,13 @@ import {
   updateTag,
   deleteTag,
   getTagsByIds,
+  runPendingTagCascades,
+  getPendingTagCascades,
+  withoutHiddenTags,
 } from './tagStore';
 import { getDatabase, deleteDatabase, STORES } from './db';
+import { getWordsPage } from './wordService';
+import { subscribeChanges, type StorageChange } from './changeFeed';
 import { ErrorCode } from '../types/errors';
 import type { Tag } from '../types/tag';
 
@@ -26,6 +31,39 @@ import type { Tag } from '../types/tag';
 // Test Setup
 // ============================================================
 
+/** 直接写入词汇（只含测试需要的字段） */
+async function putWords(words: { id: string; tagIds: string[] }[]): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readwrite');
+    for (const [index, word] of words.entries()) {
+      tx.objectStore(STORES.words).put({ ...word, text: word.id, createdAt: index, nextReviewAt: 0 });
+    }
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+async function readWords(): Promise<{ id: string; tagIds: string[] }[]> {
+  const db = await getDatabase();
+  return new Promise((resolve, reject) => {
+    const request = db.transaction(STORES.words, 'readonly').objectStore(STORES.words).getAll();
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/** 写入未完成的级联清理记录 */
+async function putCascade(tagId: string, processed: number, total: number): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction(STORES.meta, 'readwrite');
+    tx.objectStore(STORES.meta).put({ key: `tagCascade:${tagId}`, tagId, processed, total });
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
 describe('tagStore', () => {
   beforeEach(async () => {
     // 确保每个测试都有干净的数据库
@@ -276,6 +314,7 @@ describe('tagStore', () => {
       const db = await getDatabase();
       const word = {
         id: 'word-1',
+        text: 'hello',
         word: 'hello',
         context: 'Hello world',
         tagIds: [tagId, 'other-tag'],
@@ -292,9 +331,10 @@ describe('tagStore', () => {
         request.onerror = () => reject(request.error);
       });
 
-      // 删除标签
+      // 删除标签（词汇清理在后台执行）
       const result = await deleteTag(tagId);
       expect(result.success).toBe(true);
+      await runPendingTagCascades();
 
       // 验证词汇的 tagIds 已更新
       const updatedWord = await new Promise<typeof word>((resolve, reject) => {
@@ -308,6 +348,76 @@ describe('tagStore', () => {
       expect(updatedWord.tagIds).not.toContain(tagId);
       expect(updatedWord.tagIds).toContain('other-tag');
     });
+
+    it('删除后立即从读取结果中隐藏该标签', async () => {
+      const tag = await createTag({ name: 'Test', color: '#3B82F6' });
+      const tagId = tag.data!.id;
+      await putWords([{ id: 'word-1', tagIds: [tagId, 'other-tag'] }]);
+
+      await deleteTag(tagId);
+
+      const page = await getWordsPage({ details: false });
+      expect(page.data!.words[0].tagIds).toEqual(['other-tag']);
+
+      const filtered = await getWordsPage({ details: false, tagIds: [tagId] });
+      expect(filtered.data!.words).toEqual([]);
+
+      await runPendingTagCascades();
+      expect(await getPendingTagCascades()).toEqual([]);
+    });
+  });
+
+  // ============================================================
+  // Tag Cascade Tests
+  // ============================================================
+
+  describe('runPendingTagCascades', () => {
+    it('按块清理并在每块后发布进度', async () => {
+      await putWords([
+        { id: 'word-1', tagIds: ['gone'] },
+        { id: 'word-2', tagIds: ['gone', 'kept'] },
+        { id: 'word-3', tagIds: ['gone'] },
+        { id: 'word-4', tagIds: ['kept'] },
+      ]);
+      await putCascade('gone', 0, 3);
+
+      const progress: StorageChange[] = [];
+      const unsubscribe = subscribeChanges((changes) => progress.push(...changes));
+      try {
+        expect(await runPendingTagCascades(2)).toBe(3);
+      } finally {
+        unsubscribe();
+      }
+
+      expect(progress).toEqual([
+        { type: 'tag:cascade', tagId: 'gone', processed: 2, total: 3, done: false },
+        { type: 'tag:cascade', tagId: 'gone', processed: 3, total: 3, done: true },
+      ]);
+      expect((await readWords()).map((word) => word.tagIds)).toEqual([[], ['kept'], [], ['kept']]);
+      expect(await getPendingTagCascades()).toEqual([]);
+    });
+
+    it('从保存的进度继续（Worker 重启后）', async () => {
+      // 上次已处理 1 条，剩余 1 条仍带有该标签
+      await putWords([
+        { id: 'word-1', tagIds: [] },
+        { id: 'word-2', tagIds: ['gone'] },
+      ]);
+      await putCascade('gone', 1, 2);
+
+      expect(await getPendingTagCascades()).toEqual([{ tagId: 'gone', processed: 1, total: 2 }]);
+      expect(await runPendingTagCascades()).toBe(1);
+
+      expect((await readWords()).map((word) => word.tagIds)).toEqual([[], []]);
+      expect(await getPendingTagCascades()).toEqual([]);
+    });
+
+    it('withoutHiddenTags 只在需要时复制', () => {
+      const word = { id: 'word-1', tagIds: ['gone', 'kept'] };
+
+      expect(withoutHiddenTags(word, new Set(['gone']))).toEqual({ id: 'word-1', tagIds: ['kept'] });
+      expect(withoutHiddenTags(word, new Set(['other']))).toBe(word);
+    });
   });
 
   // ============================================================
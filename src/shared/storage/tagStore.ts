@@ -3,13 +3,13 @@
  * Story 4.4 - Task 2: Tag CRUD 操作
  *
  * 提供标签的创建、读取、更新、删除功能
- * 删除标签时会级联更新关联的词汇
+ * 删除标签时会级联更新关联的词汇（分块、可恢复）
  *
  * @module shared/storage/tagStore
  */
 
-import { getDatabase, STORES } from './db';
-import type { Response } from '../messaging/types';
+import { getDatabase, STORES, INDEXES, withWordIndexKeys } from './db';
+import type { Response, WordSummary } from '../messaging/types';
 import type { Tag, CreateTagInput, UpdateTagInput } from '../types/tag';
 import {
   isValidTagName,
@@ -18,6 +18,7 @@ import {
   DEFAULT_TAG_COLOR,
 } from '../types/tag';
 import { ErrorCode } from '../types/errors';
+import { publishChanges, subscribeChanges } from './changeFeed';
 
 // ============================================================
 // Create Tag
@@ -98,6 +99,8 @@ export async function createTag(input: CreateTagInput): Promise<Response<Tag>> {
         resolve({ success: true, data: newTag });
       };
 
+      tx.oncomplete = () => publishChanges([{ type: 'tag:put', tag: newTag }]);
+
       request.onerror = () => {
         console.error('[LingoRecall] Failed to create tag:', request.error);
         resolve({
@@ -305,6 +308,7 @@ export async function updateTag(
 
             putRequest.onsuccess = () => {
               console.log('[LingoRecall] Tag updated:', updated.name);
+              tx.oncomplete = () => publishChanges([{ type: 'tag:put', tag: updated }]);
               resolve({ success: true, data: updated });
             };
 
@@ -329,6 +333,7 @@ export async function updateTag(
 
           putRequest.onsuccess = () => {
             console.log('[LingoRecall] Tag updated:', updated.name);
+            tx.oncomplete = () => publishChanges([{ type: 'tag:put', tag: updated }]);
             resolve({ success: true, data: updated });
           };
 
@@ -370,26 +375,51 @@ export async function updateTag(
 // Delete Tag
 // ============================================================
 
+/** 级联清理每个事务处理的词汇数 */
+export const TAG_CASCADE_CHUNK_SIZE = 200;
+
+/** meta 中级联清理进度记录的键前缀（记录存在即表示清理未完成） */
+const TAG_CASCADE_KEY_PREFIX = 'tagCascade:';
+
+/**
+ * 标签删除后的级联清理进度
+ */
+export interface TagCascadeProgress {
+  /** 已删除的标签 ID */
+  tagId: string;
+  /** 已移除该标签的词汇数 */
+  processed: number;
+  /** 删除时带有该标签的词汇数 */
+  total: number;
+}
+
+interface TagCascadeRecord extends TagCascadeProgress {
+  key: string;
+}
+
+function cascadeKey(tagId: string): string {
+  return `${TAG_CASCADE_KEY_PREFIX}${tagId}`;
+}
+
 /**
  * 删除标签（带级联更新）
  * Story 4.4 - AC3: 删除标签时自动更新关联词汇的 tagIds
  *
- * 使用事务确保原子性：
- * 1. 删除 tags 表中的记录
- * 2. 更新所有关联词汇的 tagIds 数组
+ * 标签记录与清理进度（墓碑）在一个小事务内写入，标签立即从列表与读取结果中消失；
+ * 从词汇中移除该标签由 runPendingTagCascades 分块执行，不再用一个事务锁住整个 words 表。
+ * 清理中途页面关闭或 Worker 被回收时，下次启动从进度记录继续。
  *
  * @param id - 标签 ID
- * @returns Promise<Response<void>> 操作结果
+ * @returns Promise<Response<void>> 操作结果（级联清理在后台继续）
  */
 export async function deleteTag(id: string): Promise<Response<void>> {
   try {
     const db = await getDatabase();
 
-    return new Promise((resolve) => {
-      // 使用多表事务确保原子性
-      const tx = db.transaction([STORES.tags, STORES.words], 'readwrite');
+    const result = await new Promise<Response<void>>((resolve) => {
+      const tx = db.transaction([STORES.tags, STORES.words, STORES.meta], 'readwrite');
       const tagsStore = tx.objectStore(STORES.tags);
-      const wordsStore = tx.objectStore(STORES.words);
+      let found = false;
 
       // 检查标签是否存在
       const getRequest = tagsStore.get(id);
@@ -406,37 +436,14 @@ export async function deleteTag(id: string): Promise<Response<void>> {
           return;
         }
 
-        // 删除标签
-        const deleteRequest = tagsStore.delete(id);
-
-        deleteRequest.onsuccess = () => {
-          // 级联更新：从所有词汇中移除此标签
-          const tagIndex = wordsStore.index('byTagId');
-          const cursorRequest = tagIndex.openCursor(IDBKeyRange.only(id));
-
-          cursorRequest.onsuccess = (event) => {
-            const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
-            if (cursor) {
-              const word = cursor.value;
-              // 从 tagIds 数组中移除已删除的标签 ID
-              word.tagIds = (word.tagIds || []).filter(
-                (tagId: string) => tagId !== id
-              );
-              // 更新词汇记录
-              wordsStore.put(word);
-              cursor.continue();
-            }
-          };
-        };
+        found = true;
+        tagsStore.delete(id);
 
-        deleteRequest.onerror = () => {
-          resolve({
-            success: false,
-            error: {
-              code: ErrorCode.STORAGE_ERROR,
-              message: deleteRequest.error?.message || '删除标签失败',
-            },
-          });
+        // 记录需要清理的词汇数，用于进度展示
+        const countRequest = tx.objectStore(STORES.words).index(INDEXES.byTagId).count(IDBKeyRange.only(id));
+        countRequest.onsuccess = () => {
+          const record: TagCascadeRecord = { key: cascadeKey(id), tagId: id, processed: 0, total: countRequest.result };
+          tx.objectStore(STORES.meta).put(record);
         };
       };
 
@@ -452,7 +459,11 @@ export async function deleteTag(id: string): Promise<Response<void>> {
 
       // 事务完成回调
       tx.oncomplete = () => {
-        console.log('[LingoRecall] Tag deleted with cascade update:', id);
+        if (!found) {
+          return;
+        }
+        console.log('[LingoRecall] Tag deleted, cascade scheduled:', id);
+        publishChanges([{ type: 'tag:delete', id }]);
         resolve({ success: true });
       };
 
@@ -467,6 +478,13 @@ export async function deleteTag(id: string): Promise<Response<void>> {
         });
       };
     });
+
+    if (result.success) {
+      runPendingTagCascades().catch((error) => {
+        console.warn('[LingoRecall] Tag cascade interrupted, will resume later:', error);
+      });
+    }
+    return result;
   } catch (error) {
     console.error('[LingoRecall] deleteTag error:', error);
     return {
@@ -479,6 +497,177 @@ export async function deleteTag(id: string): Promise<Response<void>> {
   }
 }
 
+// ============================================================
+// Tag Cascade
+// ============================================================
+
+let cascadePromise: Promise<number> | null = null;
+
+/**
+ * 读取所有未完成的级联清理
+ */
+export async function getPendingTagCascades(): Promise<TagCascadeProgress[]> {
+  const db = await getDatabase();
+  const records = await new Promise<TagCascadeRecord[]>((resolve, reject) => {
+    const request = db
+      .transaction(STORES.meta, 'readonly')
+      .objectStore(STORES.meta)
+      .getAll(IDBKeyRange.bound(TAG_CASCADE_KEY_PREFIX, `${TAG_CASCADE_KEY_PREFIX}\uffff`));
+    request.onsuccess = () => resolve(request.result as TagCascadeRecord[]);
+    request.onerror = () => reject(request.error);
+  });
+  return records.map(({ tagId, processed, total }) => ({ tagId, processed, total }));
+}
+
+/**
+ * 执行所有未完成的级联清理
+ * 每块词汇一个独立事务，并在同一事务内更新进度；每块提交后发布一次进度。
+ * 已清理的词汇不再出现在 byTagId 的该标签范围内，每块都从范围开头继续即可。
+ * 并发调用共享同一次执行。
+ *
+ * @param chunkSize 每个事务处理的词汇数
+ * @returns 本次清理的词汇数
+ */
+export function runPendingTagCascades(chunkSize = TAG_CASCADE_CHUNK_SIZE): Promise<number> {
+  if (!cascadePromise) {
+    cascadePromise = runTagCascades(chunkSize).finally(() => {
+      cascadePromise = null;
+    });
+  }
+  return cascadePromise;
+}
+
+async function runTagCascades(chunkSize: number): Promise<number> {
+  const db = await getDatabase();
+  let processed = 0;
+
+  for (const pending of await getPendingTagCascades()) {
+    let progress = pending;
+    for (;;) {
+      const chunk = await runTagCascadeChunk(db, progress, chunkSize);
+      processed += chunk.count;
+      progress = chunk.progress;
+      publishChanges([{ type: 'tag:cascade', ...progress, done: chunk.done }]);
+      if (chunk.done) {
+        break;
+      }
+      // 让出事件循环，保存词汇等其他写事务可以在块之间执行
+      await new Promise((resolve) => setTimeout(resolve, 0));
+    }
+    console.log(`[LingoRecall] Tag cascade completed: ${pending.tagId} (${progress.processed} words)`);
+  }
+
+  return processed;
+}
+
+/**
+ * 在单个事务内从一块词汇中移除标签，并保存进度
+ */
+function runTagCascadeChunk(
+  db: IDBDatabase,
+  progress: TagCascadeProgress,
+  chunkSize: number
+): Promise<{ count: number; progress: TagCascadeProgress; done: boolean }> {
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction([STORES.words, STORES.meta], 'readwrite');
+    const wordsStore = tx.objectStore(STORES.words);
+    const metaStore = tx.objectStore(STORES.meta);
+    const request = wordsStore.index(INDEXES.byTagId).openCursor(IDBKeyRange.only(progress.tagId));
+
+    let count = 0;
+    let done = false;
+
+    request.onsuccess = () => {
+      const cursor = request.result;
+      if (!cursor) {
+        done = true;
+        metaStore.delete(cascadeKey(progress.tagId));
+        return;
+      }
+
+      if (count >= chunkSize) {
+        const record: TagCascadeRecord = {
+          key: cascadeKey(progress.tagId),
+          ...progress,
+          processed: progress.processed + count,
+        };
+        metaStore.put(record);
+        return;
+      }
+
+      const word = cursor.value as WordSummary;
+      // 只改 tagIds（tagTimeKeys 随之重新计算），检索索引、复习聚合与冷字段不受影响
+      cursor.update(
+        withWordIndexKeys({ ...word, tagIds: (word.tagIds || []).filter((tagId) => tagId !== progress.tagId) })
+      );
+      count++;
+      cursor.continue();
+    };
+
+    tx.oncomplete = () =>
+      resolve({
+        count,
+        progress: { ...progress, processed: progress.processed + count },
+        done,
+      });
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+// ============================================================
+// Hidden Tags
+// ============================================================
+
+/** 已删除但可能仍残留在词汇 tagIds 中的标签（本上下文内缓存，只增不减） */
+let hiddenTagIds: Set<string> | null = null;
+
+let hiddenTagIdsPromise: Promise<Set<string>> | null = null;
+
+/**
+ * 获取需要在读取结果中隐藏的标签 ID
+ * 首次调用读取未完成的级联清理，之后由变更推送补充（包括其他上下文删除的标签）
+ */
+export function getHiddenTagIds(): Promise<Set<string>> {
+  if (hiddenTagIds) {
+    return Promise.resolve(hiddenTagIds);
+  }
+  if (!hiddenTagIdsPromise) {
+    const added = new Set<string>();
+    const unsubscribe = subscribeChanges((changes) => {
+      for (const change of changes) {
+        if (change.type === 'tag:delete') {
+          (hiddenTagIds ?? added).add(change.id);
+        }
+      }
+    });
+
+    hiddenTagIdsPromise = getPendingTagCascades()
+      .then((pending) => {
+        hiddenTagIds = new Set([...pending.map((item) => item.tagId), ...added]);
+        return hiddenTagIds;
+      })
+      .catch((error) => {
+        unsubscribe();
+        throw error;
+      })
+      .finally(() => {
+        hiddenTagIdsPromise = null;
+      });
+  }
+  return hiddenTagIdsPromise;
+}
+
+/**
+ * 去掉词汇中已删除的标签（没有需要去掉的标签时返回原对象）
+ */
+export function withoutHiddenTags<T extends { tagIds?: string[] }>(word: T, hidden: Set<string>): T {
+  if (hidden.size === 0 || !word.tagIds?.some((tagId) => hidden.has(tagId))) {
+    return word;
+  }
+  return { ...word, tagIds: word.tagIds.filter((tagId) => !hidden.has(tagId)) };
+}
+
 // ============================================================
 // Batch Operations
 // ============================================================
@@ -0,0 +1,166 @@
+/**
+ * LingoRecall AI - Translation Memory Storage Layer
+ * 全页翻译的持久化翻译记忆
+ *
+ * 同一站点的导航栏、页脚、Cookie 提示、按钮文案在每个页面都会重复出现。
+ * 本模块把已翻译的片段写入 IndexedDB，后续页面先批量查询，只把未命中的片段发给 AI。
+ *
+ * - 主键: `${model}:${targetLanguage}:${normalizedText}`
+ * - 容量: 超过上限时按 byLastAccessAt 淘汰最久未访问的条目
+ *
+ * @module shared/storage/translationMemoryStore
+ */
+
+import { getDatabase, STORES, evictLeastRecentlyAccessed } from './db';
+
+// ============================================================
+// Types
+// ============================================================
+
+/**
+ * 翻译记忆条目
+ */
+export interface TranslationMemoryEntry {
+  /** 主键（model + targetLanguage + 规范化原文） */
+  key: string;
+  /** 规范化后的原文 */
+  text: string;
+  /** 目标语言 */
+  targetLanguage: string;
+  /** 产生译文的模型标识（provider + model） */
+  model: string;
+  /** 译文 */
+  translation: string;
+  /** 写入时间 */
+  createdAt: number;
+  /** 最近一次命中时间（淘汰依据） */
+  lastAccessAt: number;
+  /** 命中次数 */
+  hitCount: number;
+}
+
+// ============================================================
+// Read
+// ============================================================
+
+/**
+ * 批量查询翻译记忆
+ * 在同一个 readwrite 事务内读取所有键，并刷新命中条目的访问时间
+ *
+ * @param keys - 主键列表
+ * @param accessedAt - 访问时间（测试注入）
+ * @returns 与 keys 顺序对应的译文，未命中为 null
+ */
+export async function getTranslationMemoryEntries(
+  keys: string[],
+  accessedAt: number = Date.now()
+): Promise<(string | null)[]> {
+  if (keys.length === 0) {
+    return [];
+  }
+
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.translationMemory, 'readwrite');
+    const store = tx.objectStore(STORES.translationMemory);
+    const results: (string | null)[] = new Array(keys.length).fill(null);
+
+    keys.forEach((key, index) => {
+      const request = store.get(key);
+      request.onsuccess = () => {
+        const entry = request.result as TranslationMemoryEntry | undefined;
+        if (!entry) {
+          return;
+        }
+        results[index] = entry.translation;
+        store.put({ ...entry, lastAccessAt: accessedAt, hitCount: entry.hitCount + 1 });
+      };
+    });
+
+    tx.oncomplete = () => resolve(results);
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+/**
+ * 统计翻译记忆条目数量
+ */
+export async function countTranslationMemoryEntries(): Promise<number> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.translationMemory, 'readonly');
+    const request = tx.objectStore(STORES.translationMemory).count();
+
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+// ============================================================
+// Write
+// ============================================================
+
+/**
+ * 批量写入（或覆盖）翻译记忆条目
+ *
+ * @param entries - 条目列表
+ */
+export async function putTranslationMemoryEntries(entries: TranslationMemoryEntry[]): Promise<void> {
+  if (entries.length === 0) {
+    return;
+  }
+
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.translationMemory, 'readwrite');
+    const store = tx.objectStore(STORES.translationMemory);
+    entries.forEach((entry) => store.put(entry));
+
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+/**
+ * 清空翻译记忆
+ */
+export async function clearTranslationMemoryEntries(): Promise<void> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.translationMemory, 'readwrite');
+    tx.objectStore(STORES.translationMemory).clear();
+
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+// ============================================================
+// Eviction
+// ============================================================
+
+/**
+ * 数量超过 maxEntries 时，按 byLastAccessAt 从最旧开始淘汰
+ *
+ * @param maxEntries - 最大保留条数
+ * @returns 删除的条目数
+ */
+export async function pruneTranslationMemoryEntries(maxEntries: number): Promise<number> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.translationMemory, 'readwrite');
+    let removed = 0;
+
+    evictLeastRecentlyAccessed(tx.objectStore(STORES.translationMemory), maxEntries, () => {
+      removed++;
+    });
+
+    tx.oncomplete = () => resolve(removed);
+    tx.onerror = () => reject(tx.error);
+  });
+}
@@ -0,0 +1,228 @@
+/**
+ * LingoRecall AI - Usage Store Tests
+ * 用量日志追加、合并写入、汇总与范围查询测试
+ *
+ * @module shared/storage/usageStore.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import 'fake-indexeddb/auto';
+import {
+  getUsageStats,
+  updateUsageStats,
+  resetUsageStats,
+  clearUsageStats,
+  getUsageHistory,
+  getUsageByModel,
+  getUsageByDay,
+  flushUsageStats,
+  USAGE_LOG_RETENTION_DAYS,
+} from './usageStore';
+import { getDatabase, deleteDatabase, STORES } from './db';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+/** 直接写入一条日志（模拟历史数据） */
+async function putLogRecord(timestamp: number, model: string, tokens = 10): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction(STORES.usageLog, 'readwrite');
+    tx.objectStore(STORES.usageLog).add({ timestamp, tokens, cost: 0, model });
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+async function countLogRecords(): Promise<number> {
+  const db = await getDatabase();
+  return new Promise((resolve, reject) => {
+    const request = db.transaction(STORES.usageLog, 'readonly').objectStore(STORES.usageLog).count();
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+describe('usageStore', () => {
+  beforeEach(async () => {
+    await deleteDatabase();
+    Object.assign(chrome.storage.local, { remove: vi.fn().mockResolvedValue(undefined) });
+  });
+
+  afterEach(async () => {
+    await flushUsageStats();
+    await deleteDatabase();
+  });
+
+  // ============================================================
+  // Write Path
+  // ============================================================
+
+  describe('updateUsageStats', () => {
+    it('并发更新不会丢失记录', async () => {
+      await Promise.all(
+        Array.from({ length: 20 }, (_, i) => updateUsageStats(100, 0.01, i % 2 === 0 ? 'gpt-4o' : 'gemini-1.5-flash'))
+      );
+
+      const stats = await getUsageStats();
+      expect(stats.totalTokens).toBe(2000);
+      expect(stats.totalCost).toBeCloseTo(0.2);
+      expect(stats.dailyTokens).toBe(2000);
+      expect(stats.history).toHaveLength(20);
+    });
+
+    it('合并窗口内的记录在一个事务内提交', async () => {
+      const db = await getDatabase();
+      const spy = vi.spyOn(db, 'transaction');
+
+      await Promise.all([updateUsageStats(1, 0, 'a'), updateUsageStats(2, 0, 'b'), updateUsageStats(3, 0, 'c')]);
+
+      const writes = spy.mock.calls.filter(([, mode]) => mode === 'readwrite');
+      expect(writes).toHaveLength(1);
+      spy.mockRestore();
+    });
+
+    it('读取会等待尚未提交的记录', async () => {
+      updateUsageStats(50, 0.005, 'gpt-4o');
+      await flushUsageStats();
+
+      const stats = await getUsageStats();
+      expect(stats.totalTokens).toBe(50);
+    });
+
+    it('清理超过保留期的日志，汇总不受影响', async () => {
+      await putLogRecord(Date.now() - (USAGE_LOG_RETENTION_DAYS + 1) * DAY_MS, 'old-model');
+
+      await updateUsageStats(10, 0, 'gpt-4o');
+
+      expect(await countLogRecords()).toBe(1);
+      expect((await getUsageStats()).totalTokens).toBe(10);
+    });
+  });
+
+  // ============================================================
+  // Read Path
+  // ============================================================
+
+  describe('queries', () => {
+    it('getUsageByModel 返回按模型汇总', async () => {
+      await Promise.all([
+        updateUsageStats(100, 0.1, 'gpt-4o'),
+        updateUsageStats(50, 0.05, 'gpt-4o'),
+        updateUsageStats(30, 0, 'llama3'),
+      ]);
+
+      const byModel = await getUsageByModel();
+      expect(byModel['gpt-4o']).toEqual({ tokens: 150, cost: expect.closeTo(0.15), count: 2 });
+      expect(byModel.llama3).toEqual({ tokens: 30, cost: 0, count: 1 });
+    });
+
+    it('getUsageHistory 按时间范围查询，新的在前', async () => {
+      const now = Date.now();
+      await putLogRecord(now - 3 * DAY_MS, 'a');
+      await putLogRecord(now - 2 * DAY_MS, 'b');
+      await putLogRecord(now - DAY_MS, 'a');
+
+      const range = await getUsageHistory(now - 2.5 * DAY_MS, now);
+      expect(range.map((record) => record.model)).toEqual(['a', 'b']);
+
+      const byModel = await getUsageHistory(undefined, undefined, 'a');
+      expect(byModel.map((record) => record.timestamp)).toEqual([now - DAY_MS, now - 3 * DAY_MS]);
+      expect(byModel[0]).not.toHaveProperty('id');
+    });
+
+    it('getUsageByDay 返回按日汇总', async () => {
+      await updateUsageStats(10, 0, 'a');
+      await updateUsageStats(20, 0, 'b');
+
+      const today = new Date().toISOString().split('T')[0];
+      expect(await getUsageByDay(today, today)).toEqual([{ date: today, tokens: 30, cost: 0, count: 2 }]);
+      expect(await getUsageByDay('2000-01-01', '2000-12-31')).toEqual([]);
+    });
+
+    it('空库返回默认统计', async () => {
+      const stats = await getUsageStats();
+      expect(stats.totalTokens).toBe(0);
+      expect(stats.history).toEqual([]);
+    });
+  });
+
+  // ============================================================
+  // Reset
+  // ============================================================
+
+  describe('reset', () => {
+    it('resetUsageStats() 只清零今日数据', async () => {
+      await updateUsageStats(100, 0.1, 'gpt-4o');
+
+      await resetUsageStats();
+
+      const stats = await getUsageStats();
+      expect(stats.dailyTokens).toBe(0);
+      expect(stats.totalTokens).toBe(100);
+    });
+
+    it('resetUsageStats(true) 清空日志与汇总', async () => {
+      await updateUsageStats(100, 0.1, 'gpt-4o');
+
+      await resetUsageStats(true);
+
+      const stats = await getUsageStats();
+      expect(stats.totalTokens).toBe(0);
+      expect(stats.history).toEqual([]);
+      expect(await getUsageByModel()).toEqual({});
+    });
+
+    it('clearUsageStats 同时移除旧版存储键', async () => {
+      await updateUsageStats(100, 0.1, 'gpt-4o');
+
+      await clearUsageStats();
+
+      expect((await getUsageStats()).totalTokens).toBe(0);
+      expect(chrome.storage.local.remove).toHaveBeenCalledWith('lingorecall_usage_stats');
+    });
+  });
+
+  // ============================================================
+  // Legacy Import
+  // ============================================================
+
+  describe('legacy import', () => {
+    it('首次访问时导入 chrome.storage 中的旧版统计', async () => {
+      const now = Date.now();
+      const today = new Date(now).toISOString().split('T')[0];
+      vi.mocked(chrome.storage.local.get).mockResolvedValueOnce({
+        lingorecall_usage_stats: {
+          totalTokens: 5000,
+          totalCost: 1.5,
+          dailyTokens: 300,
+          dailyCost: 0.03,
+          lastResetDate: today,
+          history: [
+            { timestamp: now - 2 * DAY_MS, tokens: 200, cost: 0.02, model: 'gpt-4o' },
+            { timestamp: now - 1000, tokens: 300, cost: 0.03, model: 'gemini-1.5-flash' },
+          ],
+        },
+      });
+
+      // 导入状态按模块缓存，使用新的模块实例
+      vi.resetModules();
+      const store = await import('./usageStore');
+
+      const stats = await store.getUsageStats();
+      expect(stats.totalTokens).toBe(5000);
+      expect(stats.dailyTokens).toBe(300);
+      expect(stats.history.map((record) => record.model)).toEqual(['gemini-1.5-flash', 'gpt-4o']);
+      expect(await store.getUsageByModel()).toEqual({
+        'gpt-4o': { tokens: 200, cost: 0.02, count: 1 },
+        'gemini-1.5-flash': { tokens: 300, cost: 0.03, count: 1 },
+      });
+      expect(chrome.storage.local.remove).toHaveBeenCalledWith('lingorecall_usage_stats');
+
+      await store.updateUsageStats(100, 0, 'gpt-4o');
+      expect((await store.getUsageStats()).totalTokens).toBe(5100);
+
+      const db = await (await import('./db')).getDatabase();
+      db.close();
+    });
+  });
+});
@@ -2,15 +2,43 @@
  * LingoRecall AI - Usage Statistics Storage
  * 用量统计数据存储
  *
+ * 每次 AI 调用追加一条日志（IndexedDB usageLog），同一事务内累加按日 / 按模型汇总与总计；
+ * 短时间内的多次调用（如全页翻译的并发批次）合并为一次写事务，由单一写入队列串行提交，
+ * 不再整体读写 chrome.storage 中的统计对象，也就不会互相覆盖。
+ *
  * @module shared/storage/usageStore
  */
 
-/** 存储键 */
-const STORAGE_KEY = 'lingorecall_usage_stats';
+import { getDatabase, STORES, INDEXES } from './db';
+
+// ============================================================
+// Constants
+// ============================================================
+
+/** 旧版存储键（chrome.storage.local 中的整体统计对象，首次访问时导入） */
+const LEGACY_STORAGE_KEY = 'lingorecall_usage_stats';
 
-/** 历史记录最大条数 */
+/** UsageStats.history 返回的最近记录条数 */
 const MAX_HISTORY_RECORDS = 100;
 
+/** 合并写入窗口：窗口内的记录在一个事务内提交 */
+export const USAGE_FLUSH_DELAY_MS = 200;
+
+/** 日志保留天数（汇总不受影响） */
+export const USAGE_LOG_RETENTION_DAYS = 90;
+
+/** meta 中的总计记录 */
+const USAGE_TOTALS_KEY = 'usageTotals';
+
+/** meta 中的旧版数据导入标记 */
+const USAGE_LEGACY_IMPORTED_KEY = 'usageLegacyImported';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// ============================================================
+// Types
+// ============================================================
+
 /**
  * 单次使用记录
  */
@@ -39,15 +67,71 @@ export interface UsageStats {
   dailyCost: number;
   /** 上次重置日期 (ISO 格式) */
   lastResetDate: string;
-  /** 使用历史记录 */
+  /** 最近的使用记录（新的在前） */
   history: UsageRecord[];
 }
 
+/**
+ * 汇总值
+ */
+export interface UsageTotals {
+  tokens: number;
+  cost: number;
+  count: number;
+}
+
+/**
+ * 按日汇总（usageDaily 存储格式）
+ */
+export interface DailyUsage extends UsageTotals {
+  /** 日期 (ISO 格式，只取日期部分) */
+  date: string;
+}
+
+/**
+ * 按模型汇总（usageByModel 存储格式）
+ */
+interface ModelUsage extends UsageTotals {
+  model: string;
+}
+
+/**
+ * 总计（meta 存储格式）
+ */
+interface UsageTotalsRecord extends UsageTotals {
+  key: typeof USAGE_TOTALS_KEY;
+}
+
+/**
+ * 待提交的一批记录
+ */
+interface PendingBatch {
+  records: UsageRecord[];
+  promise: Promise<void>;
+  resolve: () => void;
+  reject: (error: unknown) => void;
+}
+
+// ============================================================
+// Helpers
+// ============================================================
+
+/**
+ * 获取日期 (ISO 格式，只取日期部分)
+ */
+function toDateKey(timestamp: number): string {
+  return new Date(timestamp).toISOString().split('T')[0];
+}
+
 /**
  * 获取今日日期 (ISO 格式，只取日期部分)
  */
 function getTodayDate(): string {
-  return new Date().toISOString().split('T')[0];
+  return toDateKey(Date.now());
+}
+
+function emptyTotals(): UsageTotals {
+  return { tokens: 0, cost: 0, count: 0 };
 }
 
 /**
@@ -64,41 +148,285 @@ function createDefaultStats(): UsageStats {
   };
 }
 
+/**
+ * 在事务内把一组增量累加到汇总记录（读后写）
+ */
+function addToRollup<T extends UsageTotals>(
+  store: IDBObjectStore,
+  key: IDBValidKey,
+  delta: UsageTotals,
+  create: () => T
+): void {
+  const request = store.get(key);
+  request.onsuccess = () => {
+    const current = (request.result as T | undefined) ?? create();
+    store.put({
+      ...current,
+      tokens: current.tokens + delta.tokens,
+      cost: current.cost + delta.cost,
+      count: current.count + delta.count,
+    });
+  };
+}
+
+/**
+ * 把记录按键分组求和
+ */
+function groupTotals(records: UsageRecord[], keyOf: (record: UsageRecord) => string): Map<string, UsageTotals> {
+  const groups = new Map<string, UsageTotals>();
+  for (const record of records) {
+    const key = keyOf(record);
+    const totals = groups.get(key) ?? emptyTotals();
+    totals.tokens += record.tokens;
+    totals.cost += record.cost;
+    totals.count += 1;
+    groups.set(key, totals);
+  }
+  return groups;
+}
+
+function requestToPromise<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function transactionDone(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+// ============================================================
+// Write Queue
+// ============================================================
+
+/** 正在收集的批次（窗口到期后提交） */
+let openBatch: PendingBatch | null = null;
+
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+/** 写入队列尾部：同一时刻最多一个写事务 */
+let writerTail: Promise<void> = Promise.resolve();
+
+/**
+ * 把当前批次交给写入队列
+ */
+function scheduleOpenBatch(): Promise<void> {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+
+  const batch = openBatch;
+  openBatch = null;
+  if (batch) {
+    writerTail = writerTail
+      .then(() => writeUsageBatch(batch.records))
+      .then(batch.resolve, (error) => {
+        console.error('[LingoRecall Usage] Failed to write usage batch:', error);
+        batch.reject(error);
+      });
+  }
+  return writerTail;
+}
+
+/**
+ * 在一个事务内追加日志并累加汇总，顺带清理过期日志
+ */
+async function writeUsageBatch(records: UsageRecord[]): Promise<void> {
+  await importLegacyStats();
+  const db = await getDatabase();
+  const tx = db.transaction(
+    [STORES.usageLog, STORES.usageDaily, STORES.usageByModel, STORES.meta],
+    'readwrite'
+  );
+  const logStore = tx.objectStore(STORES.usageLog);
+
+  for (const record of records) {
+    logStore.add(record);
+  }
+
+  const dailyStore = tx.objectStore(STORES.usageDaily);
+  for (const [date, delta] of groupTotals(records, (record) => toDateKey(record.timestamp))) {
+    addToRollup<DailyUsage>(dailyStore, date, delta, () => ({ date, ...emptyTotals() }));
+  }
+
+  const modelStore = tx.objectStore(STORES.usageByModel);
+  for (const [model, delta] of groupTotals(records, (record) => record.model)) {
+    addToRollup<ModelUsage>(modelStore, model, delta, () => ({ model, ...emptyTotals() }));
+  }
+
+  const [total] = groupTotals(records, () => USAGE_TOTALS_KEY).values();
+  addToRollup<UsageTotalsRecord>(tx.objectStore(STORES.meta), USAGE_TOTALS_KEY, total, () => ({
+    key: USAGE_TOTALS_KEY,
+    ...emptyTotals(),
+  }));
+
+  // 过期日志：没有可清理的记录时只是一次索引定位
+  const cutoff = Date.now() - USAGE_LOG_RETENTION_DAYS * DAY_MS;
+  const expired = logStore.index(INDEXES.byTimestamp).openKeyCursor(IDBKeyRange.upperBound(cutoff, true));
+  expired.onsuccess = () => {
+    const cursor = expired.result;
+    if (cursor) {
+      logStore.delete(cursor.primaryKey);
+      cursor.continue();
+    }
+  };
+
+  await transactionDone(tx);
+}
+
+/**
+ * 立即提交尚在合并窗口中的记录，并等待写入队列清空
+ */
+export function flushUsageStats(): Promise<void> {
+  return scheduleOpenBatch();
+}
+
+// ============================================================
+// Legacy Import
+// ============================================================
+
+let legacyImportPromise: Promise<void> | null = null;
+
+/**
+ * 导入旧版 chrome.storage 中的统计对象（每个上下文最多检查一次）
+ * 导入标记在同一事务内检查与写入，多个上下文同时导入时只有一个生效
+ */
+function importLegacyStats(): Promise<void> {
+  if (!legacyImportPromise) {
+    legacyImportPromise = runLegacyImport().catch((error) => {
+      console.warn('[LingoRecall Usage] Legacy usage import failed:', error);
+      legacyImportPromise = null;
+    });
+  }
+  return legacyImportPromise;
+}
+
+async function runLegacyImport(): Promise<void> {
+  const result = await chrome.storage.local.get(LEGACY_STORAGE_KEY);
+  const legacy = result[LEGACY_STORAGE_KEY] as UsageStats | undefined;
+  if (!legacy) {
+    return;
+  }
+
+  const db = await getDatabase();
+  const tx = db.transaction(
+    [STORES.usageLog, STORES.usageDaily, STORES.usageByModel, STORES.meta],
+    'readwrite'
+  );
+  const metaStore = tx.objectStore(STORES.meta);
+  const flagRequest = metaStore.get(USAGE_LEGACY_IMPORTED_KEY);
+
+  flagRequest.onsuccess = () => {
+    if (flagRequest.result) {
+      return;
+    }
+    metaStore.put({ key: USAGE_LEGACY_IMPORTED_KEY, importedAt: Date.now() });
+
+    // 旧版只保留最近 100 条历史，总计与今日数据直接沿用旧值
+    const history = legacy.history ?? [];
+    const logStore = tx.objectStore(STORES.usageLog);
+    for (const record of history) {
+      logStore.add(record);
+    }
+
+    const modelStore = tx.objectStore(STORES.usageByModel);
+    for (const [model, delta] of groupTotals(history, (record) => record.model)) {
+      addToRollup<ModelUsage>(modelStore, model, delta, () => ({ model, ...emptyTotals() }));
+    }
+
+    const dailyStore = tx.objectStore(STORES.usageDaily);
+    for (const [date, delta] of groupTotals(history, (record) => toDateKey(record.timestamp))) {
+      if (date !== legacy.lastResetDate) {
+        addToRollup<DailyUsage>(dailyStore, date, delta, () => ({ date, ...emptyTotals() }));
+      }
+    }
+    if (legacy.lastResetDate) {
+      const count = history.filter((record) => toDateKey(record.timestamp) === legacy.lastResetDate).length;
+      addToRollup<DailyUsage>(
+        dailyStore,
+        legacy.lastResetDate,
+        { tokens: legacy.dailyTokens ?? 0, cost: legacy.dailyCost ?? 0, count },
+        () => ({ date: legacy.lastResetDate, ...emptyTotals() })
+      );
+    }
+
+    addToRollup<UsageTotalsRecord>(
+      metaStore,
+      USAGE_TOTALS_KEY,
+      { tokens: legacy.totalTokens ?? 0, cost: legacy.totalCost ?? 0, count: history.length },
+      () => ({ key: USAGE_TOTALS_KEY, ...emptyTotals() })
+    );
+  };
+
+  await transactionDone(tx);
+  await chrome.storage.local.remove(LEGACY_STORAGE_KEY);
+  console.log(`[LingoRecall Usage] Imported legacy usage stats (${legacy.history?.length ?? 0} records)`);
+}
+
+// ============================================================
+// Public API
+// ============================================================
+
 /**
  * 获取用量统计数据
+ * 总计与今日数据来自汇总记录，history 为日志中最近的 MAX_HISTORY_RECORDS 条
  *
  * @returns 用量统计数据
  */
 export async function getUsageStats(): Promise<UsageStats> {
   try {
-    const result = await chrome.storage.local.get(STORAGE_KEY);
-    const stats = result[STORAGE_KEY] as UsageStats | undefined;
+    await importLegacyStats();
+    await writerTail;
+    const db = await getDatabase();
+    const today = getTodayDate();
+    const tx = db.transaction([STORES.usageLog, STORES.usageDaily, STORES.meta], 'readonly');
 
-    if (!stats) {
-      return createDefaultStats();
-    }
+    const totalsRequest = tx.objectStore(STORES.meta).get(USAGE_TOTALS_KEY);
+    const dailyRequest = tx.objectStore(STORES.usageDaily).get(today);
+    const history: UsageRecord[] = [];
+    const cursorRequest = tx.objectStore(STORES.usageLog).index(INDEXES.byTimestamp).openCursor(null, 'prev');
+    cursorRequest.onsuccess = () => {
+      const cursor = cursorRequest.result;
+      if (cursor && history.length < MAX_HISTORY_RECORDS) {
+        history.push(toUsageRecord(cursor.value));
+        cursor.continue();
+      }
+    };
 
-    // 检查是否需要重置每日统计
-    const today = getTodayDate();
-    if (stats.lastResetDate !== today) {
-      // 新的一天，重置每日统计
-      stats.dailyTokens = 0;
-      stats.dailyCost = 0;
-      stats.lastResetDate = today;
-
-      // 保存重置后的数据
-      await chrome.storage.local.set({ [STORAGE_KEY]: stats });
-    }
+    await transactionDone(tx);
+    const totals = (totalsRequest.result as UsageTotalsRecord | undefined) ?? emptyTotals();
+    const daily = (dailyRequest.result as DailyUsage | undefined) ?? emptyTotals();
 
-    return stats;
+    return {
+      totalTokens: totals.tokens,
+      totalCost: totals.cost,
+      dailyTokens: daily.tokens,
+      dailyCost: daily.cost,
+      lastResetDate: today,
+      history,
+    };
   } catch (error) {
     console.error('[LingoRecall Usage] Failed to get usage stats:', error);
     return createDefaultStats();
   }
 }
 
+/**
+ * 去掉日志主键
+ */
+function toUsageRecord(value: UsageRecord & { id?: number }): UsageRecord {
+  return { timestamp: value.timestamp, tokens: value.tokens, cost: value.cost, model: value.model };
+}
+
 /**
  * 更新用量统计数据
+ * 记录进入合并窗口，窗口到期后与其他记录一起提交；返回的 Promise 在提交完成后 resolve
  *
  * @param tokens - 使用的 tokens
  * @param cost - 估算成本 (USD)
@@ -109,32 +437,21 @@ export async function updateUsageStats(
   cost: number,
   model: string
 ): Promise<void> {
-  try {
-    const stats = await getUsageStats();
-
-    // 更新统计
-    stats.totalTokens += tokens;
-    stats.totalCost += cost;
-    stats.dailyTokens += tokens;
-    stats.dailyCost += cost;
-
-    // 添加历史记录
-    const record: UsageRecord = {
-      timestamp: Date.now(),
-      tokens,
-      cost,
-      model,
-    };
-
-    stats.history.unshift(record);
+  if (!openBatch) {
+    let resolve!: () => void;
+    let reject!: (error: unknown) => void;
+    const promise = new Promise<void>((res, rej) => {
+      resolve = res;
+      reject = rej;
+    });
+    openBatch = { records: [], promise, resolve, reject };
+    flushTimer = setTimeout(scheduleOpenBatch, USAGE_FLUSH_DELAY_MS);
+  }
 
-    // 限制历史记录数量
-    if (stats.history.length > MAX_HISTORY_RECORDS) {
-      stats.history = stats.history.slice(0, MAX_HISTORY_RECORDS);
-    }
+  openBatch.records.push({ timestamp: Date.now(), tokens, cost, model });
 
-    // 保存
-    await chrome.storage.local.set({ [STORAGE_KEY]: stats });
+  try {
+    await openBatch.promise;
   } catch (error) {
     console.error('[LingoRecall Usage] Failed to update usage stats:', error);
   }
@@ -149,14 +466,14 @@ export async function resetUsageStats(resetTotal: boolean = false): Promise<void
   try {
     if (resetTotal) {
       // 完全重置
-      await chrome.storage.local.set({ [STORAGE_KEY]: createDefaultStats() });
+      await clearUsageStores();
     } else {
       // 只重置每日数据
-      const stats = await getUsageStats();
-      stats.dailyTokens = 0;
-      stats.dailyCost = 0;
-      stats.lastResetDate = getTodayDate();
-      await chrome.storage.local.set({ [STORAGE_KEY]: stats });
+      await flushUsageStats();
+      const db = await getDatabase();
+      const tx = db.transaction(STORES.usageDaily, 'readwrite');
+      tx.objectStore(STORES.usageDaily).delete(getTodayDate());
+      await transactionDone(tx);
     }
   } catch (error) {
     console.error('[LingoRecall Usage] Failed to reset usage stats:', error);
@@ -168,56 +485,115 @@ export async function resetUsageStats(resetTotal: boolean = false): Promise<void
  */
 export async function clearUsageStats(): Promise<void> {
   try {
-    await chrome.storage.local.remove(STORAGE_KEY);
+    await clearUsageStores();
+    await chrome.storage.local.remove(LEGACY_STORAGE_KEY);
   } catch (error) {
     console.error('[LingoRecall Usage] Failed to clear usage stats:', error);
   }
 }
 
 /**
- * 获取指定日期范围内的使用记录
+ * 清空日志、汇总与总计
+ */
+async function clearUsageStores(): Promise<void> {
+  await importLegacyStats();
+  await flushUsageStats();
+  const db = await getDatabase();
+  const tx = db.transaction(
+    [STORES.usageLog, STORES.usageDaily, STORES.usageByModel, STORES.meta],
+    'readwrite'
+  );
+  tx.objectStore(STORES.usageLog).clear();
+  tx.objectStore(STORES.usageDaily).clear();
+  tx.objectStore(STORES.usageByModel).clear();
+  tx.objectStore(STORES.meta).delete(USAGE_TOTALS_KEY);
+  await transactionDone(tx);
+}
+
+/**
+ * 获取指定日期范围内的使用记录（byTimestamp 索引范围查询）
  *
  * @param startDate - 开始日期 (时间戳)
  * @param endDate - 结束日期 (时间戳)
- * @returns 筛选后的记录
+ * @param model - 只返回该模型的记录（走 byModelTimestamp）
+ * @returns 范围内的记录（新的在前）
  */
 export async function getUsageHistory(
   startDate?: number,
-  endDate?: number
+  endDate?: number,
+  model?: string
 ): Promise<UsageRecord[]> {
-  const stats = await getUsageStats();
-  let records = stats.history;
+  try {
+    await importLegacyStats();
+    await writerTail;
+    const db = await getDatabase();
+    const store = db.transaction(STORES.usageLog, 'readonly').objectStore(STORES.usageLog);
 
-  if (startDate !== undefined) {
-    records = records.filter((r) => r.timestamp >= startDate);
-  }
+    const lower = startDate ?? -Infinity;
+    const upper = endDate ?? Infinity;
+    const request =
+      model === undefined
+        ? store.index(INDEXES.byTimestamp).getAll(IDBKeyRange.bound(lower, upper))
+        : store.index(INDEXES.byModelTimestamp).getAll(IDBKeyRange.bound([model, lower], [model, upper]));
 
-  if (endDate !== undefined) {
-    records = records.filter((r) => r.timestamp <= endDate);
+    const records = (await requestToPromise(request)) as (UsageRecord & { id?: number })[];
+    return records.map(toUsageRecord).reverse();
+  } catch (error) {
+    console.error('[LingoRecall Usage] Failed to get usage history:', error);
+    return [];
   }
-
-  return records;
 }
 
 /**
- * 获取按模型分组的使用统计
+ * 获取按模型分组的使用统计（读取 usageByModel 汇总）
  *
  * @returns 按模型分组的统计 { model: { tokens, cost, count } }
  */
 export async function getUsageByModel(): Promise<
   Record<string, { tokens: number; cost: number; count: number }>
 > {
-  const stats = await getUsageStats();
-  const byModel: Record<string, { tokens: number; cost: number; count: number }> = {};
+  try {
+    await importLegacyStats();
+    await writerTail;
+    const db = await getDatabase();
+    const request = db.transaction(STORES.usageByModel, 'readonly').objectStore(STORES.usageByModel).getAll();
+    const rollups = (await requestToPromise(request)) as ModelUsage[];
 
-  for (const record of stats.history) {
-    if (!byModel[record.model]) {
-      byModel[record.model] = { tokens: 0, cost: 0, count: 0 };
+    const byModel: Record<string, { tokens: number; cost: number; count: number }> = {};
+    for (const { model, tokens, cost, count } of rollups) {
+      byModel[model] = { tokens, cost, count };
     }
-    byModel[record.model].tokens += record.tokens;
-    byModel[record.model].cost += record.cost;
-    byModel[record.model].count += 1;
+    return byModel;
+  } catch (error) {
+    console.error('[LingoRecall Usage] Failed to get usage by model:', error);
+    return {};
   }
+}
 
-  return byModel;
+/**
+ * 获取按日汇总（usageDaily 主键范围查询）
+ *
+ * @param startDate - 开始日期 (YYYY-MM-DD，含)
+ * @param endDate - 结束日期 (YYYY-MM-DD，含)
+ * @returns 按日期升序的汇总
+ */
+export async function getUsageByDay(startDate?: string, endDate?: string): Promise<DailyUsage[]> {
+  try {
+    await importLegacyStats();
+    await writerTail;
+    const db = await getDatabase();
+    const range =
+      startDate !== undefined && endDate !== undefined
+        ? IDBKeyRange.bound(startDate, endDate)
+        : startDate !== undefined
+          ? IDBKeyRange.lowerBound(startDate)
+          : endDate !== undefined
+            ? IDBKeyRange.upperBound(endDate)
+            : null;
+    const request = db.transaction(STORES.usageDaily, 'readonly').objectStore(STORES.usageDaily).getAll(range);
+    return (await requestToPromise(request)) as DailyUsage[];
+  } catch (error) {
+    console.error('[LingoRecall Usage] Failed to get daily usage:', error);
+    return [];
+  }
 }
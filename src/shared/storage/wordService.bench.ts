@@ -0,0 +1,166 @@
+/**
+ * LingoRecall AI - Word Pagination Benchmark
+ * 对比旧版 offset 分页（游标逐条 continue 跳过）与 keyset 游标分页在 20k 词库深页上的耗时，
+ * 以及完整记录与列表字段投影跨消息边界的 structured clone 体积与耗时；
+ * 另测整库列表（SEARCH_WORDS 空关键词）读取完整记录（摘要 + wordDetails 补齐）与只读摘要的耗时和体积
+ *
+ * 数据库由 fake-indexeddb 提供，绝对耗时与 Chrome 不同，但逐条跳过与单次 seek 的差距同样成立。
+ * 体积用 v8.serialize 计量，即 structured clone 的序列化格式。
+ *
+ * 运行: npm run bench
+ *
+ * @module shared/storage/wordService.bench
+ */
+
+import 'fake-indexeddb/auto';
+import { serialize } from 'node:v8';
+import { bench, describe } from 'vitest';
+import { getDatabase, STORES, INDEXES, toWordSummary, toWordDetail } from './db';
+import { getWordsPage, searchWords } from './wordService';
+import type { WordRecord, WordSummary, WordField } from '../messaging/types';
+
+const WORD_COUNT = 20_000;
+const PAGE_SIZE = 50;
+const DEEP_OFFSET = 19_000;
+
+/** 列表行实际渲染的字段 */
+const LIST_FIELDS: WordField[] = ['text', 'meaning', 'pronunciation', 'partOfSpeech', 'createdAt', 'tagIds'];
+
+const FILLER = 'The quick brown fox jumps over the lazy dog while the committee deliberates. ';
+
+async function seedWords(): Promise<void> {
+  const db = await getDatabase();
+  await new Promise<void>((resolve, reject) => {
+    const tx = db.transaction([STORES.words, STORES.wordDetails], 'readwrite');
+    const store = tx.objectStore(STORES.words);
+    const detailStore = tx.objectStore(STORES.wordDetails);
+    for (let i = 0; i < WORD_COUNT; i++) {
+      const word: WordRecord = {
+        id: `word-${String(i).padStart(6, '0')}`,
+        text: `word${i}`,
+        meaning: `第 ${i} 个词的释义，包含若干中文说明`,
+        pronunciation: '/wɜːd/',
+        partOfSpeech: 'noun',
+        exampleSentence: `This sentence uses word${i} in context.`,
+        sourceUrl: `https://example.com/articles/${i % 500}`,
+        sourceTitle: 'An Example Article Title',
+        xpath: `/html/body/main/article/p[${i % 40}]`,
+        textOffset: i % 300,
+        contextBefore: FILLER.repeat(3),
+        contextAfter: FILLER.repeat(3),
+        createdAt: 1_700_000_000_000 + i * 1000,
+        nextReviewAt: 1_700_000_000_000 + i * 500,
+        reviewCount: i % 7,
+        easeFactor: 2.5,
+        interval: 1,
+        tagIds: i % 3 === 0 ? ['tag-a'] : [],
+      };
+      store.put(toWordSummary(word));
+      detailStore.put(toWordDetail(word));
+    }
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+/**
+ * 旧版 getAllWords：按 byCreatedAt 倒序打开游标，逐条 continue 跳过 offset，再取 limit 条记录
+ */
+async function legacyOffsetPage(offset: number, limit: number): Promise<WordSummary[]> {
+  const db = await getDatabase();
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readonly');
+    const request = tx.objectStore(STORES.words).index(INDEXES.byCreatedAt).openCursor(null, 'prev');
+    const words: WordSummary[] = [];
+    let skipped = 0;
+
+    request.onsuccess = () => {
+      const cursor = request.result;
+      if (!cursor) {
+        resolve(words);
+        return;
+      }
+      if (skipped < offset) {
+        skipped++;
+        cursor.continue();
+        return;
+      }
+      words.push(cursor.value as WordSummary);
+      if (words.length >= limit) {
+        resolve(words);
+        return;
+      }
+      cursor.continue();
+    };
+    request.onerror = () => reject(request.error);
+  });
+}
+
+await seedWords();
+
+// 指向第 DEEP_OFFSET 条记录之后的游标（列表逐页翻到这里时持有的就是它）
+const deepCursor = (await getWordsPage({ limit: DEEP_OFFSET, fields: ['id'] })).data!.nextCursor!;
+
+const fullPage = (await getWordsPage({ limit: PAGE_SIZE, cursor: deepCursor })).data!;
+const projectedPage = (await getWordsPage({ limit: PAGE_SIZE, cursor: deepCursor, fields: LIST_FIELDS })).data!;
+
+console.log(
+  `[LingoRecall bench] ${PAGE_SIZE}-word page structured clone size: ` +
+    `full ${serialize(fullPage).length} B, projected ${serialize(projectedPage).length} B`
+);
+
+const fullVocabulary = (await searchWords('')).data!;
+const summaryVocabulary = (await searchWords('', { details: false })).data!;
+
+console.log(
+  `[LingoRecall bench] ${WORD_COUNT}-word list structured clone size: ` +
+    `full ${serialize(fullVocabulary).length} B, summaries ${serialize(summaryVocabulary).length} B`
+);
+
+describe(`deep page (offset ${DEEP_OFFSET} of ${WORD_COUNT}, ${PAGE_SIZE} per page)`, () => {
+  bench('legacy: offset via cursor.continue() per record', async () => {
+    await legacyOffsetPage(DEEP_OFFSET, PAGE_SIZE);
+  });
+
+  bench('offset via cursor.advance()', async () => {
+    await getWordsPage({ offset: DEEP_OFFSET, limit: PAGE_SIZE });
+  });
+
+  bench('keyset cursor (single seek)', async () => {
+    await getWordsPage({ cursor: deepCursor, limit: PAGE_SIZE });
+  });
+
+  bench('keyset cursor + list field projection', async () => {
+    await getWordsPage({ cursor: deepCursor, limit: PAGE_SIZE, fields: LIST_FIELDS });
+  });
+});
+
+describe(`structured clone of a ${PAGE_SIZE}-word page`, () => {
+  bench('full records', () => {
+    structuredClone(fullPage);
+  });
+
+  bench('list field projection', () => {
+    structuredClone(projectedPage);
+  });
+});
+
+describe(`whole vocabulary list read (${WORD_COUNT} words)`, () => {
+  bench('full records (summary + wordDetails join)', async () => {
+    await searchWords('');
+  });
+
+  bench('summaries only', async () => {
+    await searchWords('', { details: false });
+  });
+});
+
+describe(`structured clone of the ${WORD_COUNT}-word list`, () => {
+  bench('full records', () => {
+    structuredClone(fullVocabulary);
+  });
+
+  bench('summaries', () => {
+    structuredClone(summaryVocabulary);
+  });
+});
@@ -1,9 +1,30 @@
 import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 
-import { getDatabase, deleteDatabase, closeDatabase, STORES, INDEXES } from './db';
-import { saveWord, getWordById, getWordCount, searchWords, getAllWords } from './wordService';
+import {
+  getDatabase,
+  deleteDatabase,
+  closeDatabase,
+  withWordIndexKeys,
+  STORES,
+  INDEXES,
+} from './db';
+import {
+  saveWord,
+  findDuplicateWord,
+  getWordById,
+  getWordCount,
+  searchWords,
+  getAllWords,
+  getWordsPage,
+  getWordDetail,
+  updateWord,
+  deleteWord,
+  batchUpdateWords,
+  batchDeleteWords,
+  BATCH_CHUNK_SIZE,
+} from './wordService';
 import { ErrorCode } from '../types/errors';
-import type { SaveWordPayload } from '../messaging/types';
+import type { SaveWordPayload, WordRecord } from '../messaging/types';
 
 const BASE_PAYLOAD: SaveWordPayload = {
   text: 'context',
@@ -83,6 +104,24 @@ describe('wordService', () => {
     expect(count.data).toBe(1);
   });
 
+  it('finds duplicates with a single compound index probe', async () => {
+    const saved = await saveWord(BASE_PAYLOAD);
+
+    expect((await findDuplicateWord(BASE_PAYLOAD.text, BASE_PAYLOAD.sourceUrl, BASE_PAYLOAD.xpath))?.id).toBe(
+      saved.data?.id
+    );
+    expect(await findDuplicateWord(BASE_PAYLOAD.text, BASE_PAYLOAD.sourceUrl, '/html/body/p[9]')).toBeNull();
+  });
+
+  it('sorts by text case-insensitively through the normalized text index', async () => {
+    for (const [index, text] of ['banana', 'Apple', 'cherry'].entries()) {
+      await saveWord({ ...BASE_PAYLOAD, text, xpath: `/html/body/p[${index}]` });
+    }
+
+    const result = await getAllWords({ sortBy: 'text', sortOrder: 'asc' });
+    expect(result.data?.map((word) => word.text)).toEqual(['Apple', 'banana', 'cherry']);
+  });
+
   describe('searchWords - Story 2.5', () => {
     const WORD_APPLE: SaveWordPayload = {
       ...BASE_PAYLOAD,
@@ -168,5 +207,284 @@ describe('wordService', () => {
       // "banana" contains "an"
       expect(result.data?.words.some(w => w.text === 'banana')).toBe(true);
     });
+
+    it('ranks text matches above meaning-only matches', async () => {
+      await saveWord({ ...BASE_PAYLOAD, text: 'fruit', meaning: '水果', xpath: '/html/body/div[1]/p[4]' });
+      await saveWord({ ...BASE_PAYLOAD, text: 'grape', meaning: 'a small fruit', xpath: '/html/body/div[1]/p[5]' });
+
+      const result = await searchWords('fruit');
+      expect(result.data?.words.map(w => w.text)).toEqual(['fruit', 'grape']);
+      expect(result.data?.totalCount).toBe(5);
+    });
+
+    it('keeps the index in sync with updates and deletes', async () => {
+      const cherry = (await searchWords('cherry')).data!.words[0];
+
+      await updateWord(cherry.id, { text: 'plum', meaning: '李子' });
+      expect((await searchWords('cherry')).data?.matchCount).toBe(0);
+      expect((await searchWords('樱桃')).data?.matchCount).toBe(0);
+      expect((await searchWords('plum')).data?.words[0].id).toBe(cherry.id);
+
+      await deleteWord(cherry.id);
+      expect((await searchWords('plum')).data?.matchCount).toBe(0);
+      expect((await searchWords('李子')).data?.totalCount).toBe(2);
+    });
+
+    it('does not touch the index for non-text updates', async () => {
+      const apple = (await searchWords('apple')).data!.words[0];
+
+      await updateWord(apple.id, { reviewCount: 3 });
+
+      expect((await searchWords('apple')).data?.words[0].reviewCount).toBe(3);
+    });
+  });
+
+  describe('getWordsPage - keyset pagination', () => {
+    /**
+     * 直接写入记录：每 3 条共用一个 createdAt / nextReviewAt，覆盖索引键相同时的游标定位
+     */
+    async function seedWords(count: number): Promise<void> {
+      const db = await getDatabase();
+      await new Promise<void>((resolve, reject) => {
+        const tx = db.transaction(STORES.words, 'readwrite');
+        const store = tx.objectStore(STORES.words);
+        for (let i = 0; i < count; i++) {
+          const word: WordRecord = {
+            ...BASE_PAYLOAD,
+            id: `word-${String(i).padStart(3, '0')}`,
+            text: `word${i}`,
+            createdAt: 1000 + Math.floor(i / 3),
+            nextReviewAt: 5000 - Math.floor(i / 3),
+            reviewCount: 0,
+            easeFactor: 2.5,
+            interval: 1,
+            tagIds: i % 2 === 0 ? (i % 4 === 0 ? ['even', 'four'] : ['even']) : [],
+          };
+          store.put(withWordIndexKeys(word));
+        }
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+      });
+    }
+
+    async function collectPages(options: Parameters<typeof getWordsPage>[0]): Promise<string[][]> {
+      const pages: string[][] = [];
+      let cursor: string | undefined;
+      do {
+        const result = await getWordsPage({ ...options, cursor });
+        expect(result.success).toBe(true);
+        pages.push(result.data!.words.map((word) => word.id));
+        cursor = result.data!.nextCursor ?? undefined;
+      } while (cursor);
+      return pages;
+    }
+
+    beforeEach(async () => {
+      await seedWords(20);
+    });
+
+    it.each([
+      ['createdAt', 'desc'],
+      ['createdAt', 'asc'],
+      ['nextReviewAt', 'asc'],
+      ['text', 'desc'],
+    ] as const)('walks every record exactly once (%s %s)', async (sortBy, sortOrder) => {
+      const all = (await getAllWords({ sortBy, sortOrder })).data!.map((word) => word.id);
+      const pages = await collectPages({ sortBy, sortOrder, limit: 7 });
+
+      expect(pages.map((page) => page.length)).toEqual([7, 7, 6]);
+      expect(pages.flat()).toEqual(all);
+    });
+
+    it('returns no cursor when the last page is exactly full', async () => {
+      const pages = await collectPages({ limit: 10 });
+      expect(pages.map((page) => page.length)).toEqual([10, 10]);
+    });
+
+    it('keeps offset pagination for existing callers', async () => {
+      const all = (await getAllWords()).data!.map((word) => word.id);
+      const page = await getAllWords({ offset: 5, limit: 4 });
+      expect(page.data!.map((word) => word.id)).toEqual(all.slice(5, 9));
+    });
+
+    it('resumes after the cursor record even if it was deleted', async () => {
+      const first = await getWordsPage({ limit: 4 });
+      const lastId = first.data!.words[3].id;
+      await deleteWord(lastId);
+
+      const all = (await getAllWords()).data!.map((word) => word.id);
+      const second = await getWordsPage({ limit: 4, cursor: first.data!.nextCursor! });
+      expect(second.data!.words.map((word) => word.id)).toEqual(all.slice(3, 7));
+    });
+
+    it.each([[['even']], [['even', 'four']]])('pages through tag-filtered views (%j)', async (tagIds) => {
+      const all = (await getAllWords()).data!
+        .filter((word) => tagIds.every((tagId) => word.tagIds.includes(tagId)))
+        .map((word) => word.id);
+      const pages = await collectPages({ tagIds, limit: 3 });
+
+      expect(all.length).toBeGreaterThan(3);
+      expect(pages.flat()).toEqual(all);
+    });
+
+    it('rejects a cursor from another tag filter', async () => {
+      const first = await getWordsPage({ tagIds: ['even'], limit: 2 });
+      const result = await getWordsPage({ tagIds: ['four'], limit: 2, cursor: first.data!.nextCursor! });
+      expect(result.error?.code).toBe(ErrorCode.INVALID_INPUT);
+    });
+
+    it('projects only the requested fields', async () => {
+      const result = await getWordsPage({ limit: 2, fields: ['text', 'createdAt'] });
+
+      expect(result.data!.words).toHaveLength(2);
+      for (const word of result.data!.words) {
+        expect(Object.keys(word).sort()).toEqual(['createdAt', 'id', 'text']);
+      }
+    });
+
+    it('rejects malformed cursors and cursors from another sort order', async () => {
+      const first = await getWordsPage({ limit: 5, sortBy: 'createdAt' });
+
+      const mismatched = await getWordsPage({ sortBy: 'nextReviewAt', cursor: first.data!.nextCursor! });
+      expect(mismatched.success).toBe(false);
+      expect(mismatched.error?.code).toBe(ErrorCode.INVALID_INPUT);
+
+      const malformed = await getWordsPage({ cursor: 'not-a-cursor' });
+      expect(malformed.error?.code).toBe(ErrorCode.INVALID_INPUT);
+    });
+  });
+
+  describe('batch operations', () => {
+    async function saveWords(count: number): Promise<string[]> {
+      const ids: string[] = [];
+      for (let i = 0; i < count; i++) {
+        const result = await saveWord({ ...BASE_PAYLOAD, text: `batch${i}`, xpath: `/html/body/p[${i}]` });
+        ids.push(result.data!.id);
+      }
+      return ids;
+    }
+
+    it('merges tags per word and reports each id in request order', async () => {
+      const [first, second] = await saveWords(2);
+      await updateWord(first, { tagIds: ['old', 'keep'] });
+
+      const progress = vi.fn();
+      const result = await batchUpdateWords(
+        [second, 'missing', first],
+        { addTagIds: ['new'], removeTagIds: ['old'] },
+        progress
+      );
+
+      expect(result.data?.results.map((item) => [item.id, item.success])).toEqual([
+        [second, true],
+        ['missing', false],
+        [first, true],
+      ]);
+      expect(result.data?.results[1].error?.code).toBe(ErrorCode.NOT_FOUND);
+      expect(result.data).toMatchObject({ succeeded: 2, failed: 1 });
+      expect(progress).toHaveBeenLastCalledWith({ processed: 3, total: 3 });
+
+      expect((await getWordById(first)).data?.tagIds).toEqual(['keep', 'new']);
+      expect((await getWordById(second)).data?.tagIds).toEqual(['new']);
+    });
+
+    it('commits one transaction per chunk and reports progress after each', async () => {
+      const ids = await saveWords(BATCH_CHUNK_SIZE + 5);
+      const progress = vi.fn();
+
+      const result = await batchUpdateWords(ids, { addTagIds: ['bulk'] }, progress);
+
+      expect(result.data?.succeeded).toBe(ids.length);
+      expect(progress.mock.calls.map(([value]) => value)).toEqual([
+        { processed: BATCH_CHUNK_SIZE, total: ids.length },
+        { processed: ids.length, total: ids.length },
+      ]);
+      const tagged = await getWordsPage({ tagIds: ['bulk'] });
+      expect(tagged.data?.words).toHaveLength(ids.length);
+    });
+
+    it('keeps the search index in sync for text updates and deletes', async () => {
+      const [first, second] = await saveWords(2);
+
+      await batchUpdateWords([first], { updates: { text: 'renamed' } });
+      expect((await searchWords('renamed')).data?.words.map((word) => word.id)).toEqual([first]);
+      expect((await searchWords('batch0')).data?.words).toEqual([]);
+
+      const result = await batchDeleteWords([first, second, 'missing']);
+      expect(result.data).toMatchObject({ succeeded: 3, failed: 0 });
+      expect(await getWordCount()).toMatchObject({ data: 0 });
+      expect((await searchWords('renamed')).data?.words).toEqual([]);
+    });
+  });
+
+  describe('summary / detail split', () => {
+    async function readRaw(storeName: string, id: string): Promise<Record<string, unknown> | undefined> {
+      const db = await getDatabase();
+      return new Promise((resolve, reject) => {
+        const request = db.transaction(storeName, 'readonly').objectStore(storeName).get(id);
+        request.onsuccess = () => resolve(request.result as Record<string, unknown> | undefined);
+        request.onerror = () => reject(request.error);
+      });
+    }
+
+    it('stores cold fields in wordDetails and joins them transparently', async () => {
+      const id = (await saveWord(BASE_PAYLOAD)).data!.id;
+
+      const summary = await readRaw(STORES.words, id);
+      expect(summary).not.toHaveProperty('exampleSentence');
+      expect(summary).not.toHaveProperty('contextBefore');
+      expect(summary?.xpath).toBe(BASE_PAYLOAD.xpath);
+      expect(await readRaw(STORES.wordDetails, id)).toEqual({
+        id,
+        exampleSentence: BASE_PAYLOAD.exampleSentence,
+        contextBefore: BASE_PAYLOAD.contextBefore,
+        contextAfter: BASE_PAYLOAD.contextAfter,
+      });
+
+      expect((await getWordById(id)).data?.exampleSentence).toBe(BASE_PAYLOAD.exampleSentence);
+      expect((await getAllWords()).data?.[0].contextAfter).toBe(BASE_PAYLOAD.contextAfter);
+      expect(
+        (await findDuplicateWord(BASE_PAYLOAD.text, BASE_PAYLOAD.sourceUrl, BASE_PAYLOAD.xpath))?.contextBefore
+      ).toBe(BASE_PAYLOAD.contextBefore);
+      expect((await searchWords('context')).data?.words[0].exampleSentence).toBe(BASE_PAYLOAD.exampleSentence);
+    });
+
+    it('returns lean summaries when details are not requested', async () => {
+      await saveWord(BASE_PAYLOAD);
+
+      const searched = await searchWords('', { details: false });
+      expect(searched.data?.words[0]).not.toHaveProperty('exampleSentence');
+      expect((await searchWords('context', { details: false })).data?.words[0]).not.toHaveProperty('contextBefore');
+
+      const projected = await getWordsPage({ fields: ['text', 'exampleSentence'] });
+      expect(projected.data?.words[0].exampleSentence).toBe(BASE_PAYLOAD.exampleSentence);
+    });
+
+    it('keeps details in sync with updates and deletes', async () => {
+      const id = (await saveWord(BASE_PAYLOAD)).data!.id;
+
+      await updateWord(id, { meaning: '上下文' });
+      expect((await getWordDetail(id)).data?.exampleSentence).toBe(BASE_PAYLOAD.exampleSentence);
+
+      await updateWord(id, { exampleSentence: 'Updated example.' });
+      expect((await getWordById(id)).data).toMatchObject({
+        meaning: '上下文',
+        exampleSentence: 'Updated example.',
+        contextBefore: BASE_PAYLOAD.contextBefore,
+      });
+      expect(await readRaw(STORES.words, id)).not.toHaveProperty('exampleSentence');
+
+      await batchUpdateWords([id], { updates: { contextAfter: ' batch.' } });
+      expect((await getWordDetail(id)).data?.contextAfter).toBe(' batch.');
+
+      await deleteWord(id);
+      expect(await readRaw(STORES.wordDetails, id)).toBeUndefined();
+      expect((await getWordDetail(id)).error?.code).toBe(ErrorCode.NOT_FOUND);
+    });
+
+    it('reports NOT_FOUND when updating a missing word', async () => {
+      const result = await updateWord('missing', { meaning: 'x' });
+      expect(result.error?.code).toBe(ErrorCode.NOT_FOUND);
+    });
   });
 });
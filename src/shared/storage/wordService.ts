@@ -7,11 +7,45 @@
  * @module shared/storage/wordService
  */
 
-import { getDatabase, STORES, INDEXES } from './db';
+import {
+  getDatabase,
+  STORES,
+  INDEXES,
+  withWordIndexKeys,
+  isBackfillComplete,
+  trackReviewChange,
+  WORD_DETAIL_FIELDS,
+  toWordSummary,
+  toWordDetail,
+  hasInlineDetail,
+  mergeWordDetail,
+  joinWordDetails,
+} from './db';
 import type { Response } from '../messaging/types';
-import type { WordRecord, SaveWordPayload } from '../messaging/types';
+import type {
+  WordRecord,
+  WordSummary,
+  WordDetail,
+  SaveWordPayload,
+  WordSortField,
+  WordField,
+  WordRecordView,
+  GetWordsResult,
+  BatchWordResult,
+  BatchWordsResult,
+  BatchProgress,
+} from '../messaging/types';
 import { ErrorCode } from '../types/errors';
 import { initializeReviewParams } from '../utils/ebbinghaus';
+import { buildQueryTerms, normalizeSearchText, scoreMatch } from '../utils/textSearch';
+import {
+  indexWordTerms,
+  removeWordTerms,
+  affectsSearchIndex,
+  findCandidateWordIds,
+} from './searchIndexStore';
+import { publishChanges, type StorageChange } from './changeFeed';
+import { getHiddenTagIds, withoutHiddenTags } from './tagStore';
 
 // ============================================================
 // Constants
@@ -20,6 +54,16 @@ import { initializeReviewParams } from '../utils/ebbinghaus';
 /** 默认 SM-2 难度因子 */
 const DEFAULT_EASE_FACTOR = 2.5;
 
+/** 排序字段对应的索引（null 表示直接遍历主键；text 在回填完成后改走 byNormalizedText） */
+const SORT_INDEXES: Record<WordSortField, string | null> = {
+  createdAt: INDEXES.byCreatedAt,
+  nextReviewAt: INDEXES.byNextReviewAt,
+  text: null,
+};
+
+/** 游标中表示“直接遍历主键”的来源标记 */
+const PRIMARY_KEY_SOURCE = 'primary';
+
 // ============================================================
 // Word Record Operations
 // ============================================================
@@ -61,33 +105,32 @@ export async function saveWord(
         resolve(response);
       };
 
-      const tx = db.transaction(STORES.words, 'readwrite');
+      const tx = db.transaction([STORES.words, STORES.wordDetails, STORES.searchIndex, STORES.meta], 'readwrite');
       const store = tx.objectStore(STORES.words);
-      const index = store.index(INDEXES.bySourceUrl);
-
-      const cursorRequest = index.openCursor(IDBKeyRange.only(wordData.sourceUrl));
-
-      cursorRequest.onsuccess = (event) => {
-        const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
-
-        if (cursor) {
-          const existing = cursor.value as WordRecord;
-          if (existing.text === wordData.text && existing.xpath === wordData.xpath) {
-            finalize({
-              success: false,
-              error: {
-                code: ErrorCode.DUPLICATE_WORD,
-                message: '该词汇已保存',
-              },
-            });
-            return;
-          }
+      const index = store.index(INDEXES.byDuplicateKey);
 
-          cursor.continue();
+      // [sourceUrl, text, xpath] 组合索引，一次探测完成重复检测
+      const duplicateRequest = index.getKey([wordData.sourceUrl, wordData.text, wordData.xpath]);
+
+      duplicateRequest.onsuccess = () => {
+        if (duplicateRequest.result !== undefined) {
+          finalize({
+            success: false,
+            error: {
+              code: ErrorCode.DUPLICATE_WORD,
+              message: '该词汇已保存',
+            },
+          });
           return;
         }
 
-        const request = store.add(word);
+        const summary = withWordIndexKeys(toWordSummary(word));
+        const request = store.add(summary);
+        // 同一事务内写入冷字段、检索索引与复习聚合，add 失败时一并回滚
+        tx.objectStore(STORES.wordDetails).put(toWordDetail(word));
+        indexWordTerms(tx.objectStore(STORES.searchIndex), word);
+        trackReviewChange(tx, undefined, word.nextReviewAt);
+        tx.oncomplete = () => publishChanges([{ type: 'word:add', word: summary }]);
 
         request.onsuccess = () => {
           console.log('[LingoRecall] Word saved successfully:', word.id);
@@ -109,13 +152,13 @@ export async function saveWord(
         };
       };
 
-      cursorRequest.onerror = () => {
-        console.error('[LingoRecall] findDuplicateWord error:', cursorRequest.error);
+      duplicateRequest.onerror = () => {
+        console.error('[LingoRecall] findDuplicateWord error:', duplicateRequest.error);
         finalize({
           success: false,
           error: {
             code: ErrorCode.STORAGE_ERROR,
-            message: cursorRequest.error?.message || '保存失败',
+            message: duplicateRequest.error?.message || '保存失败',
           },
         });
       };
@@ -166,30 +209,20 @@ export async function findDuplicateWord(
     const db = await getDatabase();
 
     return new Promise((resolve, reject) => {
-      const tx = db.transaction(STORES.words, 'readonly');
+      const tx = db.transaction([STORES.words, STORES.wordDetails], 'readonly');
       const store = tx.objectStore(STORES.words);
-      const index = store.index(INDEXES.bySourceUrl);
-
-      // 先通过 sourceUrl 索引缩小范围
-      const request = index.openCursor(IDBKeyRange.only(sourceUrl));
-
-      request.onsuccess = (event) => {
-        const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
+      const index = store.index(INDEXES.byDuplicateKey);
 
-        if (cursor) {
-          const word = cursor.value as WordRecord;
-
-          // 检查是否完全匹配
-          if (word.text === text && word.xpath === xpath) {
-            resolve(word);
-            return;
-          }
+      // [sourceUrl, text, xpath] 组合索引，一次探测
+      const request = index.get([sourceUrl, text, xpath]);
 
-          cursor.continue();
-        } else {
-          // 遍历完成，没有找到重复
+      request.onsuccess = () => {
+        const summary = request.result as WordSummary | undefined;
+        if (!summary) {
           resolve(null);
+          return;
         }
+        joinWordDetails(tx.objectStore(STORES.wordDetails), [summary], ([word]) => resolve(word));
       };
 
       request.onerror = () => {
@@ -203,73 +236,282 @@ export async function findDuplicateWord(
   }
 }
 
+/**
+ * 按规范化词形查找已保存的词汇（byNormalizedText 索引，一次探测）
+ * 用于单词分析在调用 AI 之前复用用户保存的释义；只读摘要，不读冷字段
+ *
+ * 回填 normalizedText 完成之前的旧记录不在索引中，查不到时由调用方回退到 AI。
+ *
+ * @param text 选中的文本
+ * @returns 同一词形的全部词汇（不同来源页面可能各保存一条）
+ */
+export async function findWordsByText(text: string): Promise<WordSummary[]> {
+  const normalized = normalizeSearchText(text.trim());
+  if (!normalized) {
+    return [];
+  }
+
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readonly');
+    const request = tx.objectStore(STORES.words).index(INDEXES.byNormalizedText).getAll(normalized);
+
+    request.onsuccess = () => resolve(request.result as WordSummary[]);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/**
+ * 读取最近保存的若干条词汇摘要（byCreatedAt 倒序）
+ * 用于 Worker 唤醒后把用户的词库预热进分析缓存
+ *
+ * @param limit 最大条数
+ * @returns 按 createdAt 降序排列的词汇摘要
+ */
+export async function getRecentWordSummaries(limit: number): Promise<WordSummary[]> {
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORES.words, 'readonly');
+    const request = tx.objectStore(STORES.words).index(INDEXES.byCreatedAt).openCursor(null, 'prev');
+    const words: WordSummary[] = [];
+
+    request.onsuccess = (event) => {
+      const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
+      if (!cursor || words.length >= limit) {
+        resolve(words);
+        return;
+      }
+      words.push(cursor.value as WordSummary);
+      cursor.continue();
+    };
+
+    request.onerror = () => reject(request.error);
+  });
+}
+
 /**
  * 获取所有词汇
  * Story 2.2 会用到
  *
  * @param options 查询选项
- * @returns Promise<Response<WordRecord[]>> 词汇列表
+ * @returns Promise<Response<WordRecord[]>> 词汇列表（含冷字段）
  */
 export async function getAllWords(options?: {
-  sortBy?: 'createdAt' | 'text' | 'nextReviewAt';
+  sortBy?: WordSortField;
   sortOrder?: 'asc' | 'desc';
   limit?: number;
   offset?: number;
 }): Promise<Response<WordRecord[]>> {
+  const result = await getWordsPage(options);
+  if (!result.success || !result.data) {
+    return { success: false, error: result.error };
+  }
+  // 未指定 fields 时返回的是补齐冷字段的完整记录
+  return { success: true, data: result.data.words as WordRecord[] };
+}
+
+/**
+ * 请求的字段是否包含冷字段（缺省 fields 即完整记录）
+ *
+ * @param fields 字段投影
+ */
+export function needsWordDetails(fields?: WordField[]): boolean {
+  if (!fields || fields.length === 0) {
+    return true;
+  }
+  return fields.some((field) => (WORD_DETAIL_FIELDS as readonly WordField[]).includes(field));
+}
+
+/**
+ * 词汇分页查询选项
+ */
+export interface WordPageOptions {
+  sortBy?: WordSortField;
+  sortOrder?: 'asc' | 'desc';
+  /** 每页数量，缺省不限 */
+  limit?: number;
+  /** 偏移量（兼容旧调用；与 cursor 同时给出时以 cursor 为准） */
+  offset?: number;
+  /** 上一页返回的 nextCursor */
+  cursor?: string;
+  /** 字段投影 */
+  fields?: WordField[];
+  /** 标签筛选：同时包含全部标签的词汇 */
+  tagIds?: string[];
+  /** 是否补齐冷字段（默认 true；fields 不含冷字段时不读取 wordDetails） */
+  details?: boolean;
+}
+
+/**
+ * 分页获取词汇（keyset 分页 + 字段投影）
+ *
+ * 游标由遍历来源、排序索引键与词汇 ID 组成：
+ * - 走索引时先对索引做范围查询，再用 continuePrimaryKey 定位到 (key, id) 之后
+ * - 直接遍历主键时游标即 ID，直接用开区间范围
+ * 任意深度的页面都只需一次 seek，而不是逐条跳过 offset 条记录。
+ *
+ * 遍历来源：
+ * - sortBy 'text' 走 byNormalizedText（v5 回填完成前沿用主键顺序）
+ * - 按 createdAt 排序且有标签筛选时，走第一个标签在 byTagCreatedAt 上的范围，其余标签逐条校验
+ *
+ * 冷字段只为当前页按主键补齐，且仅在需要时读取。
+ * 已删除但仍在后台清理的标签不出现在结果的 tagIds 中，按这类标签筛选返回空页。
+ *
+ * @param options 查询选项
+ * @returns Promise<Response<GetWordsResult>> 当前页与下一页游标
+ */
+export async function getWordsPage(options: WordPageOptions = {}): Promise<Response<GetWordsResult>> {
+  const sortBy = options.sortBy || 'createdAt';
+  const sortOrder = options.sortOrder || 'desc';
+  const tagIds = options.tagIds?.filter(Boolean) ?? [];
+
   try {
+    // 依赖派生字段的索引在回填完成前不完整
+    const needsIndexKeys = sortBy === 'text' || tagIds.length > 0;
+    const indexKeysReady = needsIndexKeys && (await isBackfillComplete('wordIndexKeys'));
+    const tagId = indexKeysReady && sortBy === 'createdAt' ? tagIds[0] ?? null : null;
+    const indexName = tagId
+      ? INDEXES.byTagCreatedAt
+      : sortBy === 'text' && indexKeysReady
+        ? INDEXES.byNormalizedText
+        : SORT_INDEXES[sortBy];
+    const source = indexName ?? PRIMARY_KEY_SOURCE;
+
+    let after: WordCursor | null = null;
+    if (options.cursor) {
+      after = decodeWordCursor(options.cursor);
+      const matches =
+        after !== null &&
+        after.sortBy === sortBy &&
+        after.sortOrder === sortOrder &&
+        after.source === source &&
+        (!tagId || (Array.isArray(after.key) && after.key[0] === tagId));
+      if (!matches) {
+        return {
+          success: false,
+          error: {
+            code: ErrorCode.INVALID_INPUT,
+            message: '分页游标无效或与排序方式不匹配',
+          },
+        };
+      }
+    }
+
+    const hiddenTagIds = await getHiddenTagIds();
+    if (tagIds.some((id) => hiddenTagIds.has(id))) {
+      return { success: true, data: { words: [], nextCursor: null } };
+    }
+
+    const withDetails = (options.details ?? true) && needsWordDetails(options.fields);
     const db = await getDatabase();
 
     return new Promise((resolve) => {
-      const tx = db.transaction(STORES.words, 'readonly');
+      const tx = db.transaction(withDetails ? [STORES.words, STORES.wordDetails] : STORES.words, 'readonly');
       const store = tx.objectStore(STORES.words);
-
-      // 根据排序字段选择索引
-      const sortBy = options?.sortBy || 'createdAt';
-      const sortOrder = options?.sortOrder || 'desc';
       const direction: IDBCursorDirection = sortOrder === 'asc' ? 'next' : 'prev';
+      const cursorSource: IDBObjectStore | IDBIndex = indexName ? store.index(indexName) : store;
 
-      let source: IDBObjectStore | IDBIndex = store;
-      if (sortBy === 'createdAt') {
-        source = store.index(INDEXES.byCreatedAt);
-      } else if (sortBy === 'nextReviewAt') {
-        source = store.index(INDEXES.byNextReviewAt);
+      // 标签范围 [tagId, -∞] ~ [tagId, +∞]；有游标时把起点收窄到游标位置
+      let lower: IDBValidKey | undefined = tagId ? [tagId, -Infinity] : undefined;
+      let upper: IDBValidKey | undefined = tagId ? [tagId, Infinity] : undefined;
+      let lowerOpen = false;
+      let upperOpen = false;
+      if (after) {
+        // 走索引时包含游标键本身：同一索引键下可能还有排在游标之后的记录
+        if (direction === 'next') {
+          lower = after.key;
+          lowerOpen = !indexName;
+        } else {
+          upper = after.key;
+          upperOpen = !indexName;
+        }
       }
+      const range = buildKeyRange(lower, upper, lowerOpen, upperOpen);
 
-      const words: WordRecord[] = [];
-      const offset = options?.offset || 0;
-      const limit = options?.limit;
-      let skipped = 0;
+      const words: WordSummary[] = [];
+      const limit = options.limit;
+      let pendingOffset = after ? 0 : options.offset || 0;
+      let seeking = after !== null && indexName !== null;
+      let lastKey: IDBValidKey | null = null;
+      let lastId = '';
 
-      const request = source.openCursor(null, direction);
+      // 补齐冷字段（仍在同一事务内）后投影并返回
+      const finish = (nextCursor: string | null) => {
+        const respond = (page: WordSummary[]) =>
+          resolve({
+            success: true,
+            data: { words: page.map((word) => projectWord(word, options.fields)), nextCursor },
+          });
+        if (withDetails) {
+          joinWordDetails(tx.objectStore(STORES.wordDetails), words, respond);
+        } else {
+          respond(words);
+        }
+      };
 
-      request.onsuccess = (event) => {
-        const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
+      const request = cursorSource.openCursor(range, direction);
 
-        if (cursor) {
-          // 跳过 offset 条记录
-          if (skipped < offset) {
-            skipped++;
-            cursor.continue();
-            return;
+      request.onsuccess = () => {
+        const cursor = request.result;
+
+        if (!cursor) {
+          // 遍历完成
+          finish(null);
+          return;
+        }
+
+        if (seeking && after) {
+          // 索引键相同的记录按主键排列，定位到 (key, id) 之后的第一条
+          if (indexedDB.cmp(cursor.key, after.key) === 0) {
+            const order = indexedDB.cmp(cursor.primaryKey, after.id) * (direction === 'next' ? 1 : -1);
+            if (order < 0) {
+              cursor.continuePrimaryKey(after.key, after.id);
+              return;
+            }
+            if (order === 0) {
+              seeking = false;
+              cursor.continue();
+              return;
+            }
           }
+          seeking = false;
+        }
 
-          words.push(cursor.value as WordRecord);
+        const word = cursor.value as WordSummary;
+        if (tagIds.length > 0 && !tagIds.every((id) => word.tagIds?.includes(id))) {
+          cursor.continue();
+          return;
+        }
 
-          // 检查是否达到 limit
-          if (limit && words.length >= limit) {
-            resolve({ success: true, data: words });
+        // 跳过 offset 条记录（无标签筛选时一次 advance，而不是逐条 continue）
+        if (pendingOffset > 0) {
+          if (tagIds.length > 0) {
+            pendingOffset--;
+            cursor.continue();
             return;
           }
+          const count = pendingOffset;
+          pendingOffset = 0;
+          cursor.advance(count);
+          return;
+        }
 
-          cursor.continue();
-        } else {
-          // 遍历完成
-          resolve({ success: true, data: words });
+        // 已取满一页且后面仍有记录
+        if (limit && words.length >= limit && lastKey !== null) {
+          finish(encodeWordCursor({ sortBy, sortOrder, source, key: lastKey, id: lastId }));
+          return;
         }
+
+        words.push(withoutHiddenTags(word, hiddenTagIds));
+        lastKey = cursor.key;
+        lastId = cursor.primaryKey as string;
+        cursor.continue();
       };
 
       request.onerror = () => {
-        console.error('[LingoRecall] getAllWords error:', request.error);
+        console.error('[LingoRecall] getWordsPage error:', request.error);
         resolve({
           success: false,
           error: {
@@ -280,7 +522,7 @@ export async function getAllWords(options?: {
       };
     });
   } catch (error) {
-    console.error('[LingoRecall] getAllWords error:', error);
+    console.error('[LingoRecall] getWordsPage error:', error);
     return {
       success: false,
       error: {
@@ -291,26 +533,51 @@ export async function getAllWords(options?: {
   }
 }
 
+/**
+ * 字段投影：只保留列出的字段（id 始终保留）
+ *
+ * @param word 词汇记录（摘要或完整记录）
+ * @param fields 需要的字段，缺省或为空时原样返回
+ */
+export function projectWord(word: WordSummary, fields?: WordField[]): WordRecordView {
+  if (!fields || fields.length === 0) {
+    return word;
+  }
+
+  const view: Record<string, unknown> = { id: word.id };
+  for (const field of fields) {
+    if (field in word) {
+      view[field] = word[field];
+    }
+  }
+  return view as WordRecordView;
+}
+
 /**
  * 根据 ID 获取词汇
  *
  * @param id 词汇 ID
- * @returns Promise<Response<WordRecord | null>> 词汇记录
+ * @returns Promise<Response<WordRecord | null>> 词汇记录（含冷字段）
  */
 export async function getWordById(id: string): Promise<Response<WordRecord | null>> {
   try {
+    const hiddenTagIds = await getHiddenTagIds();
     const db = await getDatabase();
 
     return new Promise((resolve) => {
-      const tx = db.transaction(STORES.words, 'readonly');
+      const tx = db.transaction([STORES.words, STORES.wordDetails], 'readonly');
       const store = tx.objectStore(STORES.words);
       const request = store.get(id);
 
       request.onsuccess = () => {
-        resolve({
-          success: true,
-          data: request.result as WordRecord | null,
-        });
+        const summary = request.result as WordSummary | undefined;
+        if (!summary) {
+          resolve({ success: true, data: null });
+          return;
+        }
+        joinWordDetails(tx.objectStore(STORES.wordDetails), [summary], ([word]) =>
+          resolve({ success: true, data: withoutHiddenTags(word, hiddenTagIds) })
+        );
       };
 
       request.onerror = () => {
@@ -336,6 +603,71 @@ export async function getWordById(id: string): Promise<Response<WordRecord | nul
   }
 }
 
+/**
+ * 获取词汇冷字段（例句、上下文）
+ * 列表只拿到摘要，展开详情或跳转原文时按需读取
+ *
+ * @param id 词汇 ID
+ * @returns Promise<Response<WordDetail>> 冷字段，词汇不存在时返回 NOT_FOUND
+ */
+export async function getWordDetail(id: string): Promise<Response<WordDetail>> {
+  try {
+    const db = await getDatabase();
+
+    return new Promise((resolve) => {
+      const tx = db.transaction([STORES.words, STORES.wordDetails], 'readonly');
+      const summaryRequest = tx.objectStore(STORES.words).get(id);
+      const detailRequest = tx.objectStore(STORES.wordDetails).get(id);
+
+      tx.oncomplete = () => {
+        const summary = summaryRequest.result as WordSummary | undefined;
+        if (!summary) {
+          resolve({
+            success: false,
+            error: {
+              code: ErrorCode.NOT_FOUND,
+              message: '词汇不存在',
+            },
+          });
+          return;
+        }
+        // 回填完成前冷字段可能仍内联在摘要中
+        resolve({
+          success: true,
+          data: toWordDetail(mergeWordDetail(summary, detailRequest.result as WordDetail | undefined)),
+        });
+      };
+
+      tx.onerror = () => {
+        console.error('[LingoRecall] getWordDetail error:', tx.error);
+        resolve({
+          success: false,
+          error: {
+            code: ErrorCode.STORAGE_ERROR,
+            message: tx.error?.message || '查询失败',
+          },
+        });
+      };
+    });
+  } catch (error) {
+    console.error('[LingoRecall] getWordDetail error:', error);
+    return {
+      success: false,
+      error: {
+        code: ErrorCode.STORAGE_ERROR,
+        message: error instanceof Error ? error.message : '未知错误',
+      },
+    };
+  }
+}
+
+/**
+ * 是否需要改写 wordDetails：更新了冷字段，或记录仍内联冷字段（顺带完成拆分）
+ */
+function shouldWriteDetail(existing: WordSummary, updates: Partial<WordRecord>): boolean {
+  return WORD_DETAIL_FIELDS.some((field) => updates[field] !== undefined) || hasInlineDetail(existing);
+}
+
 /**
  * 更新词汇
  *
@@ -350,43 +682,103 @@ export async function updateWord(
   try {
     const db = await getDatabase();
 
-    // 先获取现有记录
-    const existing = await getWordById(id);
-    if (!existing.success || !existing.data) {
-      return {
-        success: false,
-        error: {
-          code: ErrorCode.NOT_FOUND,
-          message: '词汇不存在',
-        },
-      };
+    // text/meaning 变化时在同一事务内替换检索索引，nextReviewAt 变化时更新复习聚合
+    const reindex = affectsSearchIndex(updates);
+    const storeNames: string[] = [STORES.words, STORES.wordDetails];
+    if (reindex) {
+      storeNames.push(STORES.searchIndex);
+    }
+    if (updates.nextReviewAt !== undefined) {
+      storeNames.push(STORES.meta);
     }
-
-    // 合并更新
-    const updated: WordRecord = {
-      ...existing.data,
-      ...updates,
-      id: existing.data.id, // 确保 id 不被覆盖
-      createdAt: existing.data.createdAt, // 确保 createdAt 不被覆盖
-    };
 
     return new Promise((resolve) => {
-      const tx = db.transaction(STORES.words, 'readwrite');
+      let resolved = false;
+      const finalize = (response: Response<void>) => {
+        if (resolved) {
+          return;
+        }
+        resolved = true;
+        resolve(response);
+      };
+
+      // 读取与写入在同一 readwrite 事务内完成
+      const tx = db.transaction(storeNames, 'readwrite');
       const store = tx.objectStore(STORES.words);
-      const request = store.put(updated);
+      const getRequest = store.get(id);
+      let change: StorageChange | null = null;
 
-      request.onsuccess = () => {
+      getRequest.onsuccess = () => {
+        const previous = getRequest.result as WordSummary | undefined;
+        if (!previous) {
+          finalize({
+            success: false,
+            error: {
+              code: ErrorCode.NOT_FOUND,
+              message: '词汇不存在',
+            },
+          });
+          return;
+        }
+
+        // 合并更新，并重新计算派生索引字段
+        const updated = withWordIndexKeys({
+          ...previous,
+          ...updates,
+          id: previous.id, // 确保 id 不被覆盖
+          createdAt: previous.createdAt, // 确保 createdAt 不被覆盖
+        });
+        const summary = toWordSummary(updated);
+        const request = store.put(summary);
+        change = { type: 'word:update', word: summary, previousNextReviewAt: previous.nextReviewAt };
+
+        if (shouldWriteDetail(previous, updates)) {
+          const detailStore = tx.objectStore(STORES.wordDetails);
+          const detailRequest = detailStore.get(id);
+          detailRequest.onsuccess = () => {
+            const current = mergeWordDetail(previous, detailRequest.result as WordDetail | undefined);
+            detailStore.put(toWordDetail({ ...current, ...updates, id }));
+          };
+        }
+        if (reindex) {
+          const indexStore = tx.objectStore(STORES.searchIndex);
+          removeWordTerms(indexStore, previous);
+          indexWordTerms(indexStore, updated);
+        }
+        if (previous.nextReviewAt !== updated.nextReviewAt) {
+          trackReviewChange(tx, previous.nextReviewAt, updated.nextReviewAt);
+        }
+
+        request.onerror = () => {
+          console.error('[LingoRecall] updateWord error:', request.error);
+          finalize({
+            success: false,
+            error: {
+              code: ErrorCode.STORAGE_ERROR,
+              message: request.error?.message || '更新失败',
+            },
+          });
+        };
+      };
+
+      tx.oncomplete = () => {
+        if (resolved) {
+          return;
+        }
         console.log('[LingoRecall] Word updated:', id);
-        resolve({ success: true });
+        if (change) {
+          publishChanges([change]);
+        }
+        finalize({ success: true });
       };
 
-      request.onerror = () => {
-        console.error('[LingoRecall] updateWord error:', request.error);
-        resolve({
+      tx.onerror = () => {
+        console.error('[LingoRecall] updateWord transaction error:', tx.error);
+        finalize({
           success: false,
           error: {
             code: ErrorCode.STORAGE_ERROR,
-            message: request.error?.message || '更新失败',
+            message: tx.error?.message || '更新失败',
           },
         });
       };
@@ -415,9 +807,23 @@ export async function deleteWord(id: string): Promise<Response<void>> {
     const db = await getDatabase();
 
     return new Promise((resolve) => {
-      const tx = db.transaction(STORES.words, 'readwrite');
+      const tx = db.transaction([STORES.words, STORES.wordDetails, STORES.searchIndex, STORES.meta], 'readwrite');
       const store = tx.objectStore(STORES.words);
+
+      // 先读出旧记录以推导需要删除的索引词项与复习聚合
+      const getRequest = store.get(id);
+      getRequest.onsuccess = () => {
+        const existing = getRequest.result as WordSummary | undefined;
+        if (existing) {
+          removeWordTerms(tx.objectStore(STORES.searchIndex), existing);
+          trackReviewChange(tx, existing.nextReviewAt, undefined);
+          tx.oncomplete = () =>
+            publishChanges([{ type: 'word:delete', id, nextReviewAt: existing.nextReviewAt }]);
+        }
+      };
+
       const request = store.delete(id);
+      tx.objectStore(STORES.wordDetails).delete(id);
 
       request.onsuccess = () => {
         console.log('[LingoRecall] Word deleted:', id);
@@ -447,6 +853,204 @@ export async function deleteWord(id: string): Promise<Response<void>> {
   }
 }
 
+// ============================================================
+// Batch Operations
+// ============================================================
+
+/** 批量操作每个事务处理的词汇数 */
+export const BATCH_CHUNK_SIZE = 100;
+
+/**
+ * 批量更新内容：updates 对每个词汇生效，标签增删与各自现有的 tagIds 合并
+ */
+export interface BatchWordChanges {
+  updates?: Partial<Omit<WordRecord, 'id' | 'createdAt' | 'tagIds'>>;
+  addTagIds?: string[];
+  removeTagIds?: string[];
+}
+
+/**
+ * 批量更新词汇
+ * 每 BATCH_CHUNK_SIZE 个词汇一个 readwrite 事务（读取、合并、写入与检索索引维护都在事务内），
+ * 替代逐个 UPDATE_WORD 的“一次读事务 + 一次写事务 + 一次消息往返”
+ *
+ * @param ids 词汇 ID 列表
+ * @param changes 更新内容
+ * @param onProgress 每个分块提交后回调
+ * @returns Promise<Response<BatchWordsResult>> 每个 ID 的结果（与 ids 顺序一致）
+ */
+export async function batchUpdateWords(
+  ids: string[],
+  changes: BatchWordChanges,
+  onProgress?: (progress: BatchProgress) => void
+): Promise<Response<BatchWordsResult>> {
+  const updates = changes.updates ?? {};
+  const addTagIds = changes.addTagIds ?? [];
+  const removeTagIds = new Set(changes.removeTagIds ?? []);
+  const reindex = affectsSearchIndex(updates);
+
+  return runBatch(ids, onProgress, (tx, id, done) => {
+    const store = tx.objectStore(STORES.words);
+    const request = store.get(id);
+
+    request.onsuccess = () => {
+      const existing = request.result as WordSummary | undefined;
+      if (!existing) {
+        done({ id, success: false, error: { code: ErrorCode.NOT_FOUND, message: '词汇不存在' } });
+        return;
+      }
+
+      const tagIds = [...new Set([...(existing.tagIds || []), ...addTagIds])].filter(
+        (tagId) => !removeTagIds.has(tagId)
+      );
+      const updated = withWordIndexKeys({
+        ...existing,
+        ...updates,
+        id: existing.id,
+        createdAt: existing.createdAt,
+        tagIds,
+      });
+      const summary = toWordSummary(updated);
+      store.put(summary);
+
+      // 只改标签等摘要字段时不读写 wordDetails
+      if (shouldWriteDetail(existing, updates)) {
+        const detailStore = tx.objectStore(STORES.wordDetails);
+        const detailRequest = detailStore.get(id);
+        detailRequest.onsuccess = () => {
+          const current = mergeWordDetail(existing, detailRequest.result as WordDetail | undefined);
+          detailStore.put(toWordDetail({ ...current, ...updates, id }));
+        };
+      }
+
+      if (reindex) {
+        const indexStore = tx.objectStore(STORES.searchIndex);
+        removeWordTerms(indexStore, existing);
+        indexWordTerms(indexStore, updated);
+      }
+      trackReviewChange(tx, existing.nextReviewAt, updated.nextReviewAt);
+
+      done(
+        { id, success: true },
+        { type: 'word:update', word: summary, previousNextReviewAt: existing.nextReviewAt }
+      );
+    };
+  });
+}
+
+/**
+ * 批量删除词汇
+ * 与 deleteWord 相同，不存在的 ID 视为删除成功
+ *
+ * @param ids 词汇 ID 列表
+ * @param onProgress 每个分块提交后回调
+ * @returns Promise<Response<BatchWordsResult>> 每个 ID 的结果（与 ids 顺序一致）
+ */
+export async function batchDeleteWords(
+  ids: string[],
+  onProgress?: (progress: BatchProgress) => void
+): Promise<Response<BatchWordsResult>> {
+  return runBatch(ids, onProgress, (tx, id, done) => {
+    const store = tx.objectStore(STORES.words);
+    const request = store.get(id);
+
+    request.onsuccess = () => {
+      const existing = request.result as WordSummary | undefined;
+      if (existing) {
+        removeWordTerms(tx.objectStore(STORES.searchIndex), existing);
+        trackReviewChange(tx, existing.nextReviewAt, undefined);
+        store.delete(id);
+        tx.objectStore(STORES.wordDetails).delete(id);
+        done({ id, success: true }, { type: 'word:delete', id, nextReviewAt: existing.nextReviewAt });
+        return;
+      }
+      done({ id, success: true });
+    };
+  });
+}
+
+/**
+ * 分块执行批量操作
+ * 分块内的结果在事务提交后才生效；事务失败时整块标记为失败，已提交的分块不受影响。
+ * 每个分块提交后发布一次该分块的变更。
+ */
+async function runBatch(
+  ids: string[],
+  onProgress: ((progress: BatchProgress) => void) | undefined,
+  apply: (
+    tx: IDBTransaction,
+    id: string,
+    done: (result: BatchWordResult, change?: StorageChange) => void
+  ) => void
+): Promise<Response<BatchWordsResult>> {
+  const uniqueIds = [...new Set(ids)];
+  const results: BatchWordResult[] = [];
+
+  try {
+    const db = await getDatabase();
+
+    for (let start = 0; start < uniqueIds.length; start += BATCH_CHUNK_SIZE) {
+      const chunk = uniqueIds.slice(start, start + BATCH_CHUNK_SIZE);
+      const chunkResults = await new Promise<BatchWordResult[]>((resolve) => {
+        const tx = db.transaction(
+          [STORES.words, STORES.wordDetails, STORES.searchIndex, STORES.meta],
+          'readwrite'
+        );
+        const pending: BatchWordResult[] = [];
+        const changes: StorageChange[] = [];
+
+        for (const id of chunk) {
+          apply(tx, id, (result, change) => {
+            pending.push(result);
+            if (change) {
+              changes.push(change);
+            }
+          });
+        }
+
+        tx.oncomplete = () => {
+          publishChanges(changes);
+          resolve(pending);
+        };
+        tx.onabort = () => {
+          console.error('[LingoRecall] Batch chunk aborted:', tx.error);
+          const error = {
+            code: ErrorCode.STORAGE_ERROR,
+            message: tx.error?.message || '批量操作失败',
+          };
+          resolve(chunk.map((id) => ({ id, success: false, error })));
+        };
+      });
+
+      results.push(...chunkResults);
+      onProgress?.({ processed: results.length, total: uniqueIds.length });
+    }
+  } catch (error) {
+    console.error('[LingoRecall] Batch operation error:', error);
+    return {
+      success: false,
+      error: {
+        code: ErrorCode.STORAGE_ERROR,
+        message: error instanceof Error ? error.message : '未知错误',
+      },
+    };
+  }
+
+  // 按请求顺序返回（重复 ID 共用同一结果）
+  const byId = new Map(results.map((result) => [result.id, result]));
+  const ordered = ids.map((id) => byId.get(id)!);
+  const succeeded = ordered.filter((result) => result.success).length;
+
+  return {
+    success: true,
+    data: {
+      results: ordered,
+      succeeded,
+      failed: ordered.length - succeeded,
+    },
+  };
+}
+
 /**
  * 获取词汇总数
  *
@@ -493,63 +1097,97 @@ export async function getWordCount(): Promise<Response<number>> {
 
 /**
  * 搜索词汇
- * Story 2.5 会用到
+ * Story 2.5 实现
+ *
+ * 有关键词时通过倒排索引取候选（不再全表扫描），子串校验后按相关性排序；
+ * 旧版本升级后倒排索引回填完成前退回全表扫描。空关键词返回全部词汇。
  *
  * @param query 搜索关键词
- * @param options 搜索选项
- * @returns Promise<Response<{ words: WordRecord[]; matchCount: number; totalCount: number }>>
+ * @param options 搜索选项（有关键词时默认按相关性排序；details 为 false 时只返回摘要）
+ * @returns Promise<Response<{ words: WordSummary[]; matchCount: number; totalCount: number }>>
  */
 export async function searchWords(
   query: string,
   options?: {
-    sortBy?: 'createdAt' | 'text';
+    sortBy?: 'relevance' | 'createdAt' | 'text';
     sortOrder?: 'asc' | 'desc';
+    details?: boolean;
   }
-): Promise<Response<{ words: WordRecord[]; matchCount: number; totalCount: number }>> {
+): Promise<Response<{ words: WordSummary[]; matchCount: number; totalCount: number }>> {
   try {
-    // 获取所有词汇
-    const result = await getAllWords();
-    if (!result.success || !result.data) {
+    const trimmedQuery = query.trim();
+    const sortOrder = options?.sortOrder || 'desc';
+    const details = options?.details ?? true;
+
+    if (!trimmedQuery) {
+      const sortBy = options?.sortBy === 'text' ? 'text' : 'createdAt';
+      const result = await getWordsPage({ sortBy, sortOrder, details });
+      if (!result.success || !result.data) {
+        return {
+          success: false,
+          error: result.error,
+        };
+      }
+
+      // 未指定 fields 时返回的是摘要或完整记录
+      const words = result.data.words as WordSummary[];
+      if (sortBy === 'text') {
+        words.sort((a, b) =>
+          sortOrder === 'asc' ? a.text.localeCompare(b.text) : b.text.localeCompare(a.text)
+        );
+      }
+
       return {
-        success: false,
-        error: result.error,
+        success: true,
+        data: {
+          words,
+          matchCount: words.length,
+          totalCount: words.length,
+        },
       };
     }
 
-    const allWords = result.data;
-    const totalCount = allWords.length;
-
-    // 过滤匹配的词汇
-    const normalizedQuery = query.toLowerCase().trim();
-    const matchingWords = normalizedQuery
-      ? allWords.filter(
-          (word) =>
-            word.text.toLowerCase().includes(normalizedQuery) ||
-            word.meaning.toLowerCase().includes(normalizedQuery)
-        )
-      : allWords;
-
-    // 排序
-    const sortBy = options?.sortBy || 'createdAt';
-    const sortOrder = options?.sortOrder || 'desc';
+    const startTime = performance.now();
+    // 索引回填完成前退回全表扫描
+    const candidateIds = (await isBackfillComplete('searchIndex'))
+      ? await findCandidateWordIds(buildQueryTerms(trimmedQuery))
+      : null;
+    const { words: candidates, totalCount } = candidateIds
+      ? await getWordsByIds(candidateIds, details)
+      : await scanAllWords(details);
 
-    matchingWords.sort((a, b) => {
+    // n-gram 交集可能有误报，逐条校验并打分
+    const scored = candidates
+      .map((word) => ({ word, score: scoreMatch(word, trimmedQuery) }))
+      .filter((entry) => entry.score > 0);
+
+    const sortBy = options?.sortBy || 'relevance';
+    scored.sort((a, b) => {
       if (sortBy === 'text') {
         return sortOrder === 'asc'
-          ? a.text.localeCompare(b.text)
-          : b.text.localeCompare(a.text);
+          ? a.word.text.localeCompare(b.word.text)
+          : b.word.text.localeCompare(a.word.text);
       }
-      // createdAt
-      return sortOrder === 'asc'
-        ? a.createdAt - b.createdAt
-        : b.createdAt - a.createdAt;
+      if (sortBy === 'createdAt') {
+        return sortOrder === 'asc'
+          ? a.word.createdAt - b.word.createdAt
+          : b.word.createdAt - a.word.createdAt;
+      }
+      // relevance：分数高的在前，同分按创建时间倒序
+      return b.score - a.score || b.word.createdAt - a.word.createdAt;
     });
 
+    const words = scored.map((entry) => entry.word);
+    console.log(
+      `[LingoRecall] searchWords "${trimmedQuery}": ${words.length}/${candidates.length} candidates ` +
+      `of ${totalCount} words in ${(performance.now() - startTime).toFixed(1)}ms`
+    );
+
     return {
       success: true,
       data: {
-        words: matchingWords,
-        matchCount: matchingWords.length,
+        words,
+        matchCount: words.length,
         totalCount,
       },
     };
@@ -564,3 +1202,150 @@ export async function searchWords(
     };
   }
 }
+
+/**
+ * 读取全部词汇作为搜索候选（倒排索引回填完成前，旧词汇尚未进入索引）
+ */
+async function scanAllWords(details: boolean): Promise<{ words: WordSummary[]; totalCount: number }> {
+  const result = await getWordsPage({ details });
+  if (!result.success || !result.data) {
+    throw new Error(result.error?.message || '查询失败');
+  }
+  const words = result.data.words as WordSummary[];
+  return { words, totalCount: words.length };
+}
+
+/**
+ * 在同一事务内按 ID 批量读取词汇（details 为 true 时补齐冷字段），并统计词汇总数
+ */
+async function getWordsByIds(
+  ids: string[],
+  details: boolean
+): Promise<{ words: WordSummary[]; totalCount: number }> {
+  const hiddenTagIds = await getHiddenTagIds();
+  const db = await getDatabase();
+
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(details ? [STORES.words, STORES.wordDetails] : STORES.words, 'readonly');
+    const store = tx.objectStore(STORES.words);
+    const slots: (WordSummary | undefined)[] = new Array(ids.length);
+    let totalCount = 0;
+
+    ids.forEach((id, i) => {
+      const request = store.get(id);
+      request.onsuccess = () => {
+        const summary = request.result as WordSummary | undefined;
+        if (!summary) {
+          return;
+        }
+        slots[i] = summary;
+        if (details) {
+          const detailRequest = tx.objectStore(STORES.wordDetails).get(id);
+          detailRequest.onsuccess = () => {
+            slots[i] = mergeWordDetail(summary, detailRequest.result as WordDetail | undefined);
+          };
+        }
+      };
+    });
+
+    const countRequest = store.count();
+    countRequest.onsuccess = () => {
+      totalCount = countRequest.result;
+    };
+
+    tx.oncomplete = () =>
+      resolve({
+        words: slots
+          .filter((word): word is WordSummary => word !== undefined)
+          .map((word) => withoutHiddenTags(word, hiddenTagIds)),
+        totalCount,
+      });
+    tx.onerror = () => {
+      console.error('[LingoRecall] getWordsByIds error:', tx.error);
+      reject(tx.error);
+    };
+  });
+}
+
+// ============================================================
+// Page Cursor
+// ============================================================
+
+/**
+ * 分页游标内容：排序方式、遍历来源 + 最后一条记录的排序键与 ID
+ */
+interface WordCursor {
+  sortBy: WordSortField;
+  sortOrder: 'asc' | 'desc';
+  /** 索引名，或 PRIMARY_KEY_SOURCE */
+  source: string;
+  key: IDBValidKey;
+  id: string;
+}
+
+/**
+ * 按可选的上下界构造键范围
+ */
+function buildKeyRange(
+  lower: IDBValidKey | undefined,
+  upper: IDBValidKey | undefined,
+  lowerOpen: boolean,
+  upperOpen: boolean
+): IDBKeyRange | null {
+  if (lower !== undefined && upper !== undefined) {
+    return IDBKeyRange.bound(lower, upper, lowerOpen, upperOpen);
+  }
+  if (lower !== undefined) {
+    return IDBKeyRange.lowerBound(lower, lowerOpen);
+  }
+  if (upper !== undefined) {
+    return IDBKeyRange.upperBound(upper, upperOpen);
+  }
+  return null;
+}
+
+/**
+ * 编码为不透明的游标字符串
+ */
+function encodeWordCursor(cursor: WordCursor): string {
+  return btoa(
+    encodeURIComponent(JSON.stringify([cursor.sortBy, cursor.sortOrder, cursor.source, cursor.key, cursor.id]))
+  );
+}
+
+/**
+ * 游标中的排序键只可能是数字、字符串或 [tagId, createdAt]
+ */
+function isCursorKey(key: unknown): key is IDBValidKey {
+  if (typeof key === 'number' || typeof key === 'string') {
+    return true;
+  }
+  return Array.isArray(key) && key.length === 2 && typeof key[0] === 'string' && typeof key[1] === 'number';
+}
+
+/**
+ * 解码游标字符串，格式不合法时返回 null
+ */
+function decodeWordCursor(value: string): WordCursor | null {
+  try {
+    const parsed: unknown = JSON.parse(decodeURIComponent(atob(value)));
+    if (!Array.isArray(parsed) || parsed.length !== 5) {
+      return null;
+    }
+
+    const [sortBy, sortOrder, source, key, id] = parsed;
+    if (
+      !Object.keys(SORT_INDEXES).includes(sortBy) ||
+      (sortOrder !== 'asc' && sortOrder !== 'desc') ||
+      typeof source !== 'string' ||
+      !isCursorKey(key) ||
+      typeof id !== 'string'
+    ) {
+      return null;
+    }
+
+    return { sortBy, sortOrder, source, key, id };
+  } catch {
+    return null;
+  }
+}
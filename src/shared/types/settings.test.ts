@@ -10,7 +10,10 @@ import {
   type Settings,
   type ThemeType,
   DEFAULT_SETTINGS,
+  DEFAULT_RATE_LIMITS,
   THEME_OPTIONS,
+  mergeRateLimits,
+  mergeWithDefaults,
 } from './settings';
 
 describe('Settings Types', () => {
@@ -168,3 +171,40 @@ describe('Settings Type Utilities', () => {
     expect(newSettings.enableDoubleClick).toBe(DEFAULT_SETTINGS.enableDoubleClick);
   });
 });
+
+describe('mergeRateLimits', () => {
+  it('keeps valid provider limits and falls back to defaults for the rest', () => {
+    const limits = mergeRateLimits({
+      gemini: { rpm: 1000, tpm: 4_000_000 },
+      localhost: { rpm: -1, tpm: 0 },
+    });
+
+    expect(limits.gemini).toEqual({ rpm: 1000, tpm: 4_000_000 });
+    expect(limits['openai-compatible']).toEqual(DEFAULT_RATE_LIMITS['openai-compatible']);
+    expect(limits.localhost).toEqual(DEFAULT_RATE_LIMITS.localhost);
+  });
+
+  it('is applied by mergeWithDefaults', () => {
+    expect(mergeWithDefaults({}).rateLimits).toEqual(mergeRateLimits(null));
+    expect(DEFAULT_SETTINGS.rateLimits).toEqual(mergeRateLimits(null));
+  });
+});
+
+describe('fallbackProvider', () => {
+  it('defaults to none and drops invalid values', () => {
+    expect(DEFAULT_SETTINGS.fallbackProvider).toBe('none');
+    expect(mergeWithDefaults({ fallbackProvider: 'localhost' }).fallbackProvider).toBe('localhost');
+    expect(
+      mergeWithDefaults({ fallbackProvider: 'anthropic' as Settings['fallbackProvider'] }).fallbackProvider
+    ).toBe('none');
+  });
+
+  it('drops providers that would need the primary API key', () => {
+    expect(
+      mergeWithDefaults({ fallbackProvider: 'gemini' as Settings['fallbackProvider'] }).fallbackProvider
+    ).toBe('none');
+    expect(
+      mergeWithDefaults({ fallbackProvider: 'openai-compatible' as Settings['fallbackProvider'] }).fallbackProvider
+    ).toBe('none');
+  });
+});
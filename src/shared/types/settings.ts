@@ -27,6 +27,15 @@ export type ThemeType = 'light' | 'dark' | 'system';
  */
 export type AIProviderType = 'gemini' | 'openai-compatible' | 'localhost';
 
+/**
+ * 备用 Provider 设置
+ * 'none' 表示不启用对冲请求与故障切换
+ *
+ * 只支持不需要 API Key 的本地模型：存储中只有主 Provider 的一个 API Key，
+ * 把它发给另一个 Provider 会泄露凭据且必然认证失败
+ */
+export type FallbackProviderSetting = 'localhost' | 'none';
+
 /**
  * 本地模型工具类型
  * - ollama: Ollama (推荐，最易用)
@@ -68,6 +77,37 @@ export interface GeminiConfig {
   modelName: string;
 }
 
+/**
+ * 全页翻译单次请求的 token 预算
+ */
+export interface BatchTokenBudget {
+  /** 单批原文的最大输入 token 数（估算） */
+  maxInputTokens: number;
+  /** 单批最大输出 token 数（同时作为请求的 max_tokens） */
+  maxOutputTokens: number;
+}
+
+/**
+ * 各 Provider 的批量翻译 token 预算
+ */
+export type BatchTokenBudgets = Record<AIProviderType, BatchTokenBudget>;
+
+/**
+ * AI 请求速率额度（按 Provider + 端点 + 模型分别计）
+ * 0 表示该维度不限
+ */
+export interface ProviderRateLimit {
+  /** 每分钟请求数 */
+  rpm: number;
+  /** 每分钟 token 数（输入 + 输出） */
+  tpm: number;
+}
+
+/**
+ * 各 Provider 的速率额度
+ */
+export type ProviderRateLimits = Record<AIProviderType, ProviderRateLimit>;
+
 /**
  * 各 Provider 的配置存储
  * 切换 Provider 时保留之前的配置，方便用户切换回来时恢复
@@ -202,6 +242,26 @@ export const DEFAULT_LOCAL_MODEL_CONFIG: Readonly<LocalModelConfig> = Object.fre
   modelName: 'translategemma:12b', // 推荐：Google 翻译专用模型，速度快质量高
 });
 
+/**
+ * 默认批量翻译 token 预算
+ * 本地模型上下文较小且生成慢，预算最保守
+ */
+export const DEFAULT_BATCH_TOKEN_BUDGETS: Readonly<BatchTokenBudgets> = Object.freeze({
+  gemini: Object.freeze({ maxInputTokens: 6000, maxOutputTokens: 8192 }),
+  'openai-compatible': Object.freeze({ maxInputTokens: 3000, maxOutputTokens: 4096 }),
+  localhost: Object.freeze({ maxInputTokens: 1500, maxOutputTokens: 2048 }),
+});
+
+/**
+ * 默认速率额度
+ * Gemini 按免费层额度；本地模型不限 token，只限制请求频率
+ */
+export const DEFAULT_RATE_LIMITS: Readonly<ProviderRateLimits> = Object.freeze({
+  gemini: Object.freeze({ rpm: 15, tpm: 1_000_000 }),
+  'openai-compatible': Object.freeze({ rpm: 60, tpm: 150_000 }),
+  localhost: Object.freeze({ rpm: 60, tpm: 0 }),
+});
+
 /**
  * 默认 Provider 配置集合
  * 注意：必须在 DEFAULT_LOCAL_MODEL_CONFIG 之后定义
@@ -312,6 +372,32 @@ export interface Settings {
    * @since 1.1.0
    */
   providerConfigs: ProviderConfigs;
+
+  /**
+   * 各 Provider 的全页翻译 token 预算
+   * 决定每批装入多少文本以及请求的 max_tokens
+   */
+  batchTokenBudgets: BatchTokenBudgets;
+
+  /**
+   * 各 Provider 的请求速率额度（RPM / TPM）
+   * 决定 AI 请求的并发放行与排队
+   */
+  rateLimits: ProviderRateLimits;
+
+  /**
+   * 单词分析的备用 Provider（使用 providerConfigs 中保存的本地模型配置）
+   * 主 Provider 超过其 p90 延迟仍未返回时向备用 Provider 发起对冲请求，先返回者胜出
+   * @default 'none'
+   */
+  fallbackProvider: FallbackProviderSetting;
+
+  /**
+   * 分析已保存的单词时，在直接返回保存的释义之后于后台重新请求 AI 刷新缓存
+   * 关闭时已保存的单词不再调用 AI
+   * @default false
+   */
+  refreshSavedAnalyses: boolean;
 }
 
 // ============================================================
@@ -344,6 +430,10 @@ export const DEFAULT_SETTINGS: Readonly<Settings> = Object.freeze({
     openaiCompatible: { ...DEFAULT_OPENAI_COMPATIBLE_CONFIG },
     localhost: { ...DEFAULT_LOCAL_MODEL_CONFIG },
   },
+  batchTokenBudgets: mergeBatchTokenBudgets(null),
+  rateLimits: mergeRateLimits(null),
+  fallbackProvider: 'none' as FallbackProviderSetting,
+  refreshSavedAnalyses: false,
 });
 
 // ============================================================
@@ -368,6 +458,15 @@ export function isValidAIProvider(value: unknown): value is AIProviderType {
   return value === 'gemini' || value === 'openai-compatible' || value === 'localhost';
 }
 
+/**
+ * 检查是否为有效的备用 Provider 设置
+ * @param value - 待检查的值
+ * @returns 是否为有效的 FallbackProviderSetting
+ */
+export function isValidFallbackProvider(value: unknown): value is FallbackProviderSetting {
+  return value === 'none' || value === 'localhost';
+}
+
 /**
  * 检查是否为有效的本地模型工具类型
  * @param value - 待检查的值
@@ -467,6 +566,82 @@ export function mergeProviderConfigs(partial: Partial<ProviderConfigs> | null |
   };
 }
 
+/**
+ * 检查是否为有效的 token 预算
+ * @param value - 待检查的值
+ * @returns 是否为有效的 BatchTokenBudget
+ */
+export function isValidBatchTokenBudget(value: unknown): value is BatchTokenBudget {
+  if (!value || typeof value !== 'object') {
+    return false;
+  }
+  const budget = value as Record<string, unknown>;
+  return (
+    typeof budget.maxInputTokens === 'number' &&
+    budget.maxInputTokens > 0 &&
+    typeof budget.maxOutputTokens === 'number' &&
+    budget.maxOutputTokens > 0
+  );
+}
+
+/**
+ * 合并 token 预算，无效的 Provider 预算回退到默认值
+ * @param partial - 部分预算
+ * @returns 完整的预算集合
+ */
+export function mergeBatchTokenBudgets(
+  partial: Partial<BatchTokenBudgets> | null | undefined
+): BatchTokenBudgets {
+  const pick = (provider: AIProviderType): BatchTokenBudget => {
+    const budget = partial?.[provider];
+    return isValidBatchTokenBudget(budget) ? budget : { ...DEFAULT_BATCH_TOKEN_BUDGETS[provider] };
+  };
+
+  return {
+    gemini: pick('gemini'),
+    'openai-compatible': pick('openai-compatible'),
+    localhost: pick('localhost'),
+  };
+}
+
+/**
+ * 检查是否为有效的速率额度
+ * @param value - 待检查的值
+ * @returns 是否为有效的 ProviderRateLimit
+ */
+export function isValidProviderRateLimit(value: unknown): value is ProviderRateLimit {
+  if (!value || typeof value !== 'object') {
+    return false;
+  }
+  const limit = value as Record<string, unknown>;
+  return (
+    typeof limit.rpm === 'number' &&
+    Number.isFinite(limit.rpm) &&
+    limit.rpm >= 0 &&
+    typeof limit.tpm === 'number' &&
+    Number.isFinite(limit.tpm) &&
+    limit.tpm >= 0
+  );
+}
+
+/**
+ * 合并速率额度，无效的 Provider 额度回退到默认值
+ * @param partial - 部分额度
+ * @returns 完整的额度集合
+ */
+export function mergeRateLimits(partial: Partial<ProviderRateLimits> | null | undefined): ProviderRateLimits {
+  const pick = (provider: AIProviderType): ProviderRateLimit => {
+    const limit = partial?.[provider];
+    return isValidProviderRateLimit(limit) ? limit : { ...DEFAULT_RATE_LIMITS[provider] };
+  };
+
+  return {
+    gemini: pick('gemini'),
+    'openai-compatible': pick('openai-compatible'),
+    localhost: pick('localhost'),
+  };
+}
+
 /**
  * 有效的 UI 语言列表
  */
@@ -557,6 +732,8 @@ export function mergeWithDefaults(partial: Partial<Settings> | null | undefined)
       ...DEFAULT_SETTINGS,
       blacklistUrls: [...DEFAULT_SETTINGS.blacklistUrls],
       providerConfigs: mergeProviderConfigs(null),
+      batchTokenBudgets: mergeBatchTokenBudgets(null),
+      rateLimits: mergeRateLimits(null),
     };
   }
 
@@ -578,5 +755,11 @@ export function mergeWithDefaults(partial: Partial<Settings> | null | undefined)
       ? partial.localModelConfig
       : { ...DEFAULT_LOCAL_MODEL_CONFIG },
     providerConfigs: mergeProviderConfigs(partial.providerConfigs),
+    batchTokenBudgets: mergeBatchTokenBudgets(partial.batchTokenBudgets),
+    rateLimits: mergeRateLimits(partial.rateLimits),
+    fallbackProvider: isValidFallbackProvider(partial.fallbackProvider)
+      ? partial.fallbackProvider
+      : DEFAULT_SETTINGS.fallbackProvider,
+    refreshSavedAnalyses: partial.refreshSavedAnalyses ?? DEFAULT_SETTINGS.refreshSavedAnalyses,
   };
 }
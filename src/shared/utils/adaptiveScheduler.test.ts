@@ -0,0 +1,112 @@
+/**
+ * LingoRecall AI - Adaptive Scheduler Tests
+ *
+ * @module shared/utils/adaptiveScheduler.test
+ */
+
+import { describe, it, expect } from 'vitest';
+import { runAdaptiveSchedule, type AdaptiveSchedulerOptions, type TaskErrorKind } from './adaptiveScheduler';
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+function baseOptions<T>(overrides: Partial<AdaptiveSchedulerOptions<T>> = {}): AdaptiveSchedulerOptions<T> {
+  return {
+    initialConcurrency: 1,
+    minConcurrency: 1,
+    maxConcurrency: 4,
+    targetLatencyMs: 1000,
+    maxRetries: 2,
+    classifyError: (error): TaskErrorKind =>
+      String(error instanceof Error ? error.message : error).includes('429') ? 'rate_limit' : 'transient',
+    getRetryDelayMs: () => 1,
+    ...overrides,
+  };
+}
+
+describe('runAdaptiveSchedule', () => {
+  it('runs every task and grows concurrency while latency is healthy', async () => {
+    const tasks = Array.from({ length: 12 }, (_, i) => i);
+    const done: number[] = [];
+
+    const result = await runAdaptiveSchedule(
+      tasks,
+      async (task) => {
+        await sleep(2);
+        done.push(task);
+      },
+      baseOptions()
+    );
+
+    expect(result.completed).toBe(12);
+    expect(result.failed).toBe(0);
+    expect(done.sort((a, b) => a - b)).toEqual(tasks);
+    expect(result.peakConcurrency).toBeGreaterThan(1);
+  });
+
+  it('does not wait for a slow task before starting the next one', async () => {
+    let slowFinished = false;
+    let slowFinishedWhenLastStarted: boolean | null = null;
+
+    await runAdaptiveSchedule(
+      [0, 1, 2, 3],
+      async (task) => {
+        if (task === 3) {
+          slowFinishedWhenLastStarted = slowFinished;
+        }
+        await sleep(task === 0 ? 50 : 1);
+        if (task === 0) {
+          slowFinished = true;
+        }
+      },
+      baseOptions({ initialConcurrency: 2 })
+    );
+
+    expect(slowFinishedWhenLastStarted).toBe(false);
+  });
+
+  it('retries a failed task individually', async () => {
+    const attempts = new Map<number, number>();
+
+    const result = await runAdaptiveSchedule(
+      [0, 1, 2],
+      async (task) => {
+        const count = (attempts.get(task) ?? 0) + 1;
+        attempts.set(task, count);
+        if (task === 1 && count === 1) {
+          throw new Error('TIMEOUT');
+        }
+      },
+      baseOptions()
+    );
+
+    expect(result.completed).toBe(3);
+    expect(result.retries).toBe(1);
+    expect(attempts.get(0)).toBe(1);
+    expect(attempts.get(1)).toBe(2);
+    expect(attempts.get(2)).toBe(1);
+  });
+
+  it('reports exhausted tasks and stops when onTaskFailed returns a reason', async () => {
+    const ran: number[] = [];
+
+    const result = await runAdaptiveSchedule(
+      [0, 1, 2, 3],
+      async (task) => {
+        ran.push(task);
+        throw new Error('429 Too Many Requests');
+      },
+      baseOptions({ maxRetries: 1, onTaskFailed: () => 'RATE_LIMITED' })
+    );
+
+    expect(result.abortedReason).toBe('RATE_LIMITED');
+    expect(result.failed).toBe(1);
+    expect(ran).not.toContain(3);
+  });
+
+  it('resolves immediately with no tasks', async () => {
+    await expect(runAdaptiveSchedule([], async () => {}, baseOptions())).resolves.toMatchObject({
+      completed: 0,
+      failed: 0,
+    });
+  });
+});
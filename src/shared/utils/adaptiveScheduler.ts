@@ -0,0 +1,226 @@
+/**
+ * LingoRecall AI - Adaptive Sliding-Window Scheduler
+ * 滑动窗口 + AIMD 自适应并发的任务调度器
+ *
+ * 与"按组齐步走"的批处理相比：
+ * - 任一槽位空出立即派发下一个任务，不等待同组最慢的任务
+ * - 并发窗口按 AIMD 调整：成功且延迟达标时加法增长（每满一个窗口 +1），
+ *   遇到速率限制时乘法减半，延迟超标时温和收缩
+ * - 失败的任务单独重试，放回队首并设置最早可执行时间，其余任务继续进行
+ * - 速率限制时全局暂停派发，直到冷却结束
+ *
+ * @module shared/utils/adaptiveScheduler
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/**
+ * 任务错误分类
+ * - rate_limit: 速率限制 / 熔断，重试并收缩窗口
+ * - transient: 超时 / 网络抖动，重试
+ * - fatal: 不可恢复（如扩展上下文失效），不重试
+ * - permanent: 其他错误，不重试
+ */
+export type TaskErrorKind = 'rate_limit' | 'transient' | 'fatal' | 'permanent';
+
+/** 调度器配置 */
+export interface AdaptiveSchedulerOptions<T> {
+  /** 初始并发窗口 */
+  initialConcurrency: number;
+  /** 最小并发窗口 */
+  minConcurrency: number;
+  /** 最大并发窗口 */
+  maxConcurrency: number;
+  /** 目标延迟：超过该值视为拥塞信号 */
+  targetLatencyMs: number;
+  /** 单个任务的最大重试次数 */
+  maxRetries: number;
+  /** 两次派发之间的最小间隔（毫秒） */
+  minDispatchIntervalMs?: number;
+  /** 错误分类 */
+  classifyError: (error: unknown) => TaskErrorKind;
+  /** 重试延迟 */
+  getRetryDelayMs: (kind: TaskErrorKind, attempt: number) => number;
+  /** 任务成功回调 */
+  onTaskComplete?: (task: T, latencyMs: number) => void;
+  /** 任务最终失败回调；返回字符串表示中止原因，调度器停止派发新任务 */
+  onTaskFailed?: (task: T, error: unknown, kind: TaskErrorKind) => string | void;
+}
+
+/** 调度结果 */
+export interface AdaptiveScheduleResult {
+  /** 成功的任务数 */
+  completed: number;
+  /** 最终失败的任务数 */
+  failed: number;
+  /** 重试次数 */
+  retries: number;
+  /** 达到的最大并发数 */
+  peakConcurrency: number;
+  /** 结束时的并发窗口（可作为下一轮的初始窗口） */
+  finalConcurrency: number;
+  /** 中止原因（未中止为 undefined） */
+  abortedReason?: string;
+}
+
+/** 队列中的任务 */
+interface QueuedTask<T> {
+  task: T;
+  attempt: number;
+  /** 最早可执行时间 */
+  readyAt: number;
+}
+
+/** 延迟超标时的窗口收缩系数 */
+const LATENCY_BACKOFF_FACTOR = 0.75;
+
+// ============================================================
+// Scheduler
+// ============================================================
+
+/**
+ * 以自适应滑动窗口执行任务
+ *
+ * @param tasks - 任务列表（按顺序派发，重试任务优先）
+ * @param run - 执行单个任务
+ * @param options - 调度配置
+ * @returns 调度结果（所有在途任务结束后才 resolve）
+ */
+export function runAdaptiveSchedule<T>(
+  tasks: T[],
+  run: (task: T) => Promise<void>,
+  options: AdaptiveSchedulerOptions<T>
+): Promise<AdaptiveScheduleResult> {
+  const minInterval = options.minDispatchIntervalMs ?? 0;
+  const queue: QueuedTask<T>[] = tasks.map((task) => ({ task, attempt: 0, readyAt: 0 }));
+
+  let windowSize = Math.min(options.maxConcurrency, Math.max(options.minConcurrency, options.initialConcurrency));
+  let active = 0;
+  let pausedUntil = 0;
+  let lastDispatchAt = -Infinity;
+  let wakeTimer: ReturnType<typeof setTimeout> | null = null;
+  let resolved = false;
+
+  const result: AdaptiveScheduleResult = {
+    completed: 0,
+    failed: 0,
+    retries: 0,
+    peakConcurrency: 0,
+    finalConcurrency: 0,
+  };
+
+  return new Promise((resolve) => {
+    function finishIfDone(): boolean {
+      if (active > 0 || (queue.length > 0 && !result.abortedReason)) {
+        return false;
+      }
+      if (!resolved) {
+        resolved = true;
+        result.finalConcurrency = windowSize;
+        if (wakeTimer) {
+          clearTimeout(wakeTimer);
+          wakeTimer = null;
+        }
+        resolve(result);
+      }
+      return true;
+    }
+
+    function wakeAfter(delayMs: number): void {
+      if (wakeTimer) {
+        clearTimeout(wakeTimer);
+      }
+      wakeTimer = setTimeout(() => {
+        wakeTimer = null;
+        pump();
+      }, Math.max(0, delayMs));
+    }
+
+    function pump(): void {
+      if (finishIfDone() || result.abortedReason) {
+        return;
+      }
+
+      while (active < Math.floor(windowSize) && queue.length > 0) {
+        const now = Date.now();
+        const gateAt = Math.max(pausedUntil, lastDispatchAt + minInterval);
+
+        let readyIndex = -1;
+        let earliestReadyAt = Infinity;
+        for (let i = 0; i < queue.length; i++) {
+          if (queue[i].readyAt <= now) {
+            readyIndex = i;
+            break;
+          }
+          earliestReadyAt = Math.min(earliestReadyAt, queue[i].readyAt);
+        }
+
+        if (now < gateAt || readyIndex === -1) {
+          const wakeAt = readyIndex === -1 ? Math.max(gateAt, earliestReadyAt) : gateAt;
+          wakeAfter(wakeAt - now);
+          return;
+        }
+
+        const [entry] = queue.splice(readyIndex, 1);
+        lastDispatchAt = now;
+        dispatch(entry);
+      }
+    }
+
+    function dispatch(entry: QueuedTask<T>): void {
+      active++;
+      result.peakConcurrency = Math.max(result.peakConcurrency, active);
+      const startedAt = Date.now();
+
+      run(entry.task).then(
+        () => {
+          active--;
+          result.completed++;
+          const latencyMs = Date.now() - startedAt;
+
+          if (latencyMs > options.targetLatencyMs) {
+            windowSize = Math.max(options.minConcurrency, windowSize * LATENCY_BACKOFF_FACTOR);
+          } else {
+            // 加法增长：每成功一个完整窗口 +1
+            windowSize = Math.min(options.maxConcurrency, windowSize + 1 / Math.max(1, windowSize));
+          }
+
+          options.onTaskComplete?.(entry.task, latencyMs);
+          pump();
+        },
+        (error: unknown) => {
+          active--;
+          const kind = options.classifyError(error);
+
+          if (kind === 'rate_limit') {
+            windowSize = Math.max(options.minConcurrency, windowSize / 2);
+          }
+
+          const retryable = kind === 'rate_limit' || kind === 'transient';
+          if (retryable && entry.attempt < options.maxRetries && !result.abortedReason) {
+            entry.attempt++;
+            result.retries++;
+            entry.readyAt = Date.now() + options.getRetryDelayMs(kind, entry.attempt);
+            if (kind === 'rate_limit') {
+              // 冷却期间暂停所有派发，避免继续撞限流
+              pausedUntil = Math.max(pausedUntil, entry.readyAt);
+            }
+            queue.unshift(entry);
+          } else {
+            result.failed++;
+            const abortReason = options.onTaskFailed?.(entry.task, error, kind);
+            if (abortReason && !result.abortedReason) {
+              result.abortedReason = abortReason;
+            }
+          }
+
+          pump();
+        }
+      );
+    }
+
+    pump();
+  });
+}
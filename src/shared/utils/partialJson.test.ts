@@ -0,0 +1,109 @@
+/**
+ * LingoRecall AI - Partial JSON Parser Tests
+ *
+ * @module shared/utils/partialJson.test
+ */
+
+import { describe, it, expect } from 'vitest';
+import { createPartialJsonParser, createJsonArrayStreamParser } from './partialJson';
+
+function parseInChunks(text: string, chunkSize: number) {
+  const parser = createPartialJsonParser();
+  for (let i = 0; i < text.length; i += chunkSize) {
+    parser.push(text.slice(i, i + chunkSize));
+  }
+  return parser;
+}
+
+describe('createPartialJsonParser', () => {
+  it('exposes a string field while it is still streaming', () => {
+    const parser = createPartialJsonParser();
+    parser.push('{"meaning": "雄辩');
+
+    expect(parser.getFields()).toEqual({ meaning: '雄辩' });
+    expect(parser.isFieldComplete('meaning')).toBe(false);
+
+    parser.push('的", "pronunciation": "/ˈel');
+
+    expect(parser.getFields()).toEqual({ meaning: '雄辩的', pronunciation: '/ˈel' });
+    expect(parser.isFieldComplete('meaning')).toBe(true);
+    expect(parser.isDone()).toBe(false);
+  });
+
+  it('matches JSON.parse regardless of chunk boundaries', () => {
+    const value = {
+      meaning: 'line one\nline "two"',
+      pronunciation: '/ɪˈləʊ/',
+      partOfSpeech: 'adj.',
+      usage: 'He said \\ "hi" é 😀',
+    };
+    const text = '```json\n' + JSON.stringify(value, null, 2) + '\n```';
+
+    for (const chunkSize of [1, 2, 3, 7, text.length]) {
+      const parser = parseInChunks(text, chunkSize);
+      expect(parser.getFields()).toEqual(value);
+      expect(parser.isDone()).toBe(true);
+    }
+  });
+
+  it('decodes \\u escapes split across chunks', () => {
+    const parser = parseInChunks('{"meaning":"caf\\u00e9"}', 1);
+    expect(parser.getFields().meaning).toBe('café');
+  });
+
+  it('skips non-string values without losing later fields', () => {
+    const parser = createPartialJsonParser();
+    parser.push('{"score": 0.9, "tags": ["a", "b}"], "meta": {"x": {"y": 1}}, "meaning": "ok"}');
+
+    expect(parser.getFields()).toEqual({ meaning: 'ok' });
+    expect(parser.isDone()).toBe(true);
+  });
+
+  it('has not started before the opening brace arrives', () => {
+    const parser = createPartialJsonParser();
+    parser.push('```js');
+    expect(parser.hasStarted()).toBe(false);
+    parser.push('on\n{');
+    expect(parser.hasStarted()).toBe(true);
+  });
+});
+
+describe('createJsonArrayStreamParser', () => {
+  it('emits each string element as soon as it closes', () => {
+    const parser = createJsonArrayStreamParser();
+
+    expect(parser.push('```json\n["你好", "世')).toEqual([{ index: 0, value: '你好' }]);
+    expect(parser.push('界", "')).toEqual([{ index: 1, value: '世界' }]);
+    expect(parser.isDone()).toBe(false);
+    expect(parser.push('!"]\n```')).toEqual([{ index: 2, value: '!' }]);
+    expect(parser.isDone()).toBe(true);
+  });
+
+  it('matches JSON.parse regardless of chunk boundaries', () => {
+    const value = ['line one\nline "two"', 'caf\u00e9 😀', '', 'a, b] c'];
+    const text = JSON.stringify(value, null, 2);
+
+    for (const chunkSize of [1, 2, 5, text.length]) {
+      const parser = createJsonArrayStreamParser();
+      const items: string[] = [];
+      for (let i = 0; i < text.length; i += chunkSize) {
+        for (const item of parser.push(text.slice(i, i + chunkSize))) {
+          items[item.index] = item.value;
+        }
+      }
+      expect(items).toEqual(value);
+      expect(parser.getCount()).toBe(value.length);
+    }
+  });
+
+  it('skips non-string elements while keeping indexes aligned', () => {
+    const parser = createJsonArrayStreamParser();
+    const items = parser.push('["a", null, {"x": "]"}, [1, 2], 3, "b"]');
+
+    expect(items).toEqual([
+      { index: 0, value: 'a' },
+      { index: 5, value: 'b' },
+    ]);
+    expect(parser.getCount()).toBe(6);
+  });
+});
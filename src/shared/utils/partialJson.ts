@@ -0,0 +1,405 @@
+/**
+ * LingoRecall AI - Incremental Partial JSON Parser
+ * 流式响应的增量 JSON 解析器
+ *
+ * 模型按 token 流式输出 JSON，完整响应到达之前无法 JSON.parse。
+ * 这里的解析器逐字符推进状态机，每个字符只处理一次，整体开销与响应长度成线性：
+ * - 对象解析器：提取顶层对象的字符串字段，进行中的字段也返回已到达的部分
+ *   （单词分析 `{"meaning": "...", "pronunciation": "...", ...}`、批量翻译 `{"01": "译文1", "02": "译文2", ...}`）
+ * - 数组解析器：顶层数组的字符串元素一结束就返回（未遵循结构化输出的模型返回的 `["译文1", "译文2", ...]`）
+ *
+ * 两者都会跳过 JSON 之前的任意前缀（如 ```json 代码块标记），
+ * 非字符串值（数字、嵌套对象/数组）被跳过，不影响后续字段或元素。
+ *
+ * @module shared/utils/partialJson
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 增量对象解析器 */
+export interface PartialJsonParser {
+  /** 追加一段响应文本 */
+  push(chunk: string): void;
+  /** 当前已解析出的字符串字段（包括仍在输出中的字段） */
+  getFields(): Record<string, string>;
+  /** 字段是否已完整结束 */
+  isFieldComplete(key: string): boolean;
+  /** 是否已读到顶层对象的结束括号 */
+  isDone(): boolean;
+  /** 是否已进入顶层对象（用于判断响应是否为 JSON） */
+  hasStarted(): boolean;
+}
+
+/** 数组中已完整结束的字符串元素 */
+export interface CompletedArrayItem {
+  /** 元素下标（非字符串元素也占用下标） */
+  index: number;
+  value: string;
+}
+
+/** 增量数组解析器 */
+export interface JsonArrayStreamParser {
+  /** 追加一段响应文本，返回本次新完成的字符串元素 */
+  push(chunk: string): CompletedArrayItem[];
+  /** 已结束的元素个数（含非字符串元素） */
+  getCount(): number;
+  /** 是否已读到顶层数组的结束括号 */
+  isDone(): boolean;
+}
+
+const ESCAPES: Record<string, string> = {
+  '"': '"',
+  '\\': '\\',
+  '/': '/',
+  b: '\b',
+  f: '\f',
+  n: '\n',
+  r: '\r',
+  t: '\t',
+};
+
+// ============================================================
+// Shared Readers
+// ============================================================
+
+/** JSON 字符串读取器（开头的引号由调用方消费） */
+interface StringReader {
+  reset(): void;
+  /** 消费一个字符，读到结束引号时返回 true */
+  consume(char: string): boolean;
+  value(): string;
+}
+
+function createStringReader(): StringReader {
+  let buffer = '';
+  /** 上一个字符是反斜杠 */
+  let escaping = false;
+  /** \uXXXX 转义中已读到的十六进制位 */
+  let unicodeDigits: string | null = null;
+
+  return {
+    reset(): void {
+      buffer = '';
+      escaping = false;
+      unicodeDigits = null;
+    },
+
+    consume(char: string): boolean {
+      if (unicodeDigits !== null) {
+        unicodeDigits += char;
+        if (unicodeDigits.length === 4) {
+          const code = parseInt(unicodeDigits, 16);
+          unicodeDigits = null;
+          if (!Number.isNaN(code)) {
+            // 代理对的两个半部分依次追加后自然组成完整字符
+            buffer += String.fromCharCode(code);
+          }
+        }
+        return false;
+      }
+
+      if (escaping) {
+        escaping = false;
+        if (char === 'u') {
+          unicodeDigits = '';
+        } else {
+          buffer += ESCAPES[char] ?? char;
+        }
+        return false;
+      }
+
+      if (char === '\\') {
+        escaping = true;
+        return false;
+      }
+      if (char === '"') {
+        return true;
+      }
+      buffer += char;
+      return false;
+    },
+
+    value: () => buffer,
+  };
+}
+
+/**
+ * 非字符串值跳过器
+ * - 'more': 值尚未结束
+ * - 'end': 值已结束，当前字符已被消费（容器的结束括号）
+ * - 'endBefore': 值在当前字符之前结束（基本类型遇到 `,` / `}` / `]`），当前字符需交还上层处理
+ */
+type SkipResult = 'more' | 'end' | 'endBefore';
+
+interface ValueSkipper {
+  /** 以值的第一个字符开始跳过 */
+  start(char: string): void;
+  consume(char: string): SkipResult;
+}
+
+function createValueSkipper(): ValueSkipper {
+  let depth = 0;
+  let inString = false;
+  let escaping = false;
+
+  return {
+    start(char: string): void {
+      depth = char === '{' || char === '[' ? 1 : 0;
+      inString = false;
+      escaping = false;
+    },
+
+    consume(char: string): SkipResult {
+      if (inString) {
+        if (escaping) {
+          escaping = false;
+        } else if (char === '\\') {
+          escaping = true;
+        } else if (char === '"') {
+          inString = false;
+        }
+        return 'more';
+      }
+
+      if (char === '"') {
+        inString = true;
+      } else if (char === '{' || char === '[') {
+        depth++;
+      } else if (char === '}' || char === ']') {
+        if (depth === 0) {
+          return 'endBefore';
+        }
+        depth--;
+        if (depth === 0) {
+          return 'end';
+        }
+      } else if (char === ',' && depth === 0) {
+        return 'endBefore';
+      }
+      return 'more';
+    },
+  };
+}
+
+// ============================================================
+// Object Parser
+// ============================================================
+
+type ObjectState =
+  | 'seekObject'
+  | 'seekKey'
+  | 'inKey'
+  | 'seekColon'
+  | 'seekValue'
+  | 'inString'
+  | 'inOther'
+  | 'afterValue'
+  | 'done';
+
+/**
+ * 创建增量对象解析器
+ *
+ * @example
+ * const parser = createPartialJsonParser();
+ * parser.push('{"meaning": "雄辩');
+ * parser.getFields(); // { meaning: '雄辩' }
+ * parser.push('的", "usage": "');
+ * parser.isFieldComplete('meaning'); // true
+ */
+export function createPartialJsonParser(): PartialJsonParser {
+  const fields: Record<string, string> = {};
+  const completed = new Set<string>();
+  const reader = createStringReader();
+  const skipper = createValueSkipper();
+
+  let state: ObjectState = 'seekObject';
+  let key = '';
+
+  function consume(char: string): void {
+    switch (state) {
+      case 'seekObject':
+        if (char === '{') {
+          state = 'seekKey';
+        }
+        return;
+
+      case 'seekKey':
+        if (char === '"') {
+          reader.reset();
+          state = 'inKey';
+        } else if (char === '}') {
+          state = 'done';
+        }
+        return;
+
+      case 'inKey':
+        if (reader.consume(char)) {
+          key = reader.value();
+          state = 'seekColon';
+        }
+        return;
+
+      case 'seekColon':
+        if (char === ':') {
+          state = 'seekValue';
+        }
+        return;
+
+      case 'seekValue':
+        if (char === '"') {
+          reader.reset();
+          fields[key] = '';
+          state = 'inString';
+        } else if (!/\s/.test(char)) {
+          skipper.start(char);
+          state = 'inOther';
+        }
+        return;
+
+      case 'inString': {
+        const ended = reader.consume(char);
+        fields[key] = reader.value();
+        if (ended) {
+          completed.add(key);
+          state = 'afterValue';
+        }
+        return;
+      }
+
+      case 'inOther': {
+        const result = skipper.consume(char);
+        if (result === 'end') {
+          state = 'afterValue';
+        } else if (result === 'endBefore') {
+          state = 'afterValue';
+          consume(char);
+        }
+        return;
+      }
+
+      case 'afterValue':
+        if (char === ',') {
+          state = 'seekKey';
+        } else if (char === '}') {
+          state = 'done';
+        }
+        return;
+
+      case 'done':
+        return;
+    }
+  }
+
+  return {
+    push(chunk: string): void {
+      for (const char of chunk) {
+        if (state === 'done') {
+          return;
+        }
+        consume(char);
+      }
+    },
+
+    getFields: () => ({ ...fields }),
+
+    isFieldComplete: (field: string) => completed.has(field),
+
+    isDone: () => state === 'done',
+
+    hasStarted: () => state !== 'seekObject',
+  };
+}
+
+// ============================================================
+// Array Parser
+// ============================================================
+
+type ArrayState = 'seekArray' | 'seekElement' | 'inString' | 'inOther' | 'afterElement' | 'done';
+
+/**
+ * 创建增量数组解析器
+ *
+ * @example
+ * const parser = createJsonArrayStreamParser();
+ * parser.push('["你好", "世');  // [{ index: 0, value: '你好' }]
+ * parser.push('界"]');          // [{ index: 1, value: '世界' }]
+ */
+export function createJsonArrayStreamParser(): JsonArrayStreamParser {
+  const reader = createStringReader();
+  const skipper = createValueSkipper();
+
+  let state: ArrayState = 'seekArray';
+  let count = 0;
+
+  function consume(char: string, completedItems: CompletedArrayItem[]): void {
+    switch (state) {
+      case 'seekArray':
+        if (char === '[') {
+          state = 'seekElement';
+        }
+        return;
+
+      case 'seekElement':
+        if (char === '"') {
+          reader.reset();
+          state = 'inString';
+        } else if (char === ']') {
+          state = 'done';
+        } else if (char !== ',' && !/\s/.test(char)) {
+          skipper.start(char);
+          state = 'inOther';
+        }
+        return;
+
+      case 'inString':
+        if (reader.consume(char)) {
+          completedItems.push({ index: count, value: reader.value() });
+          count++;
+          state = 'afterElement';
+        }
+        return;
+
+      case 'inOther': {
+        const result = skipper.consume(char);
+        if (result === 'end' || result === 'endBefore') {
+          count++;
+          state = 'afterElement';
+          if (result === 'endBefore') {
+            consume(char, completedItems);
+          }
+        }
+        return;
+      }
+
+      case 'afterElement':
+        if (char === ',') {
+          state = 'seekElement';
+        } else if (char === ']') {
+          state = 'done';
+        }
+        return;
+
+      case 'done':
+        return;
+    }
+  }
+
+  return {
+    push(chunk: string): CompletedArrayItem[] {
+      const completedItems: CompletedArrayItem[] = [];
+      for (const char of chunk) {
+        if (state === 'done') {
+          break;
+        }
+        consume(char, completedItems);
+      }
+      return completedItems;
+    },
+
+    getCount: () => count,
+
+    isDone: () => state === 'done',
+  };
+}
@@ -0,0 +1,91 @@
+/**
+ * LingoRecall AI - Segmented LRU Benchmark
+ * 对比 SLRU 与旧版"排序淘汰"实现在 500 / 5k / 50k 条目下的 set/get 延迟
+ *
+ * 运行: npm run bench
+ *
+ * @module shared/utils/segmentedLru.bench
+ */
+
+import { bench, describe } from 'vitest';
+import { createSegmentedLru } from './segmentedLru';
+
+interface BenchEntry {
+  value: string;
+  timestamp: number;
+  hitCount: number;
+}
+
+const SIZES = [500, 5_000, 50_000];
+const sizeOf = (key: string, entry: BenchEntry) => (key.length + entry.value.length) * 2 + 64;
+
+/**
+ * 旧版实现：缓存满时复制整个 Map 并按 hitCount/timestamp 排序，淘汰 10%
+ */
+function createLegacySortCache(maxEntries: number) {
+  const cache = new Map<string, BenchEntry>();
+
+  function evictOldestEntries(): void {
+    const entries = Array.from(cache.entries());
+    entries.sort((a, b) => {
+      if (a[1].hitCount !== b[1].hitCount) {
+        return a[1].hitCount - b[1].hitCount;
+      }
+      return a[1].timestamp - b[1].timestamp;
+    });
+    const toRemove = Math.ceil(maxEntries * 0.1);
+    for (let i = 0; i < toRemove && i < entries.length; i++) {
+      cache.delete(entries[i][0]);
+    }
+  }
+
+  return {
+    get(key: string): BenchEntry | undefined {
+      const entry = cache.get(key);
+      if (entry) {
+        entry.hitCount++;
+      }
+      return entry;
+    },
+    set(key: string, entry: BenchEntry): void {
+      if (cache.size >= maxEntries) {
+        evictOldestEntries();
+      }
+      cache.set(key, entry);
+    },
+  };
+}
+
+function makeEntry(i: number): BenchEntry {
+  return { value: `meaning of word ${i}`, timestamp: i, hitCount: 0 };
+}
+
+for (const size of SIZES) {
+  describe(`${size} entries (full cache, steady-state writes + reads)`, () => {
+    const slru = createSegmentedLru<BenchEntry>({
+      maxEntries: size,
+      maxBytes: Number.MAX_SAFE_INTEGER,
+      sizeOf,
+    });
+    const legacy = createLegacySortCache(size);
+    for (let i = 0; i < size; i++) {
+      slru.set(`word-${i}`, makeEntry(i));
+      legacy.set(`word-${i}`, makeEntry(i));
+    }
+
+    let slruCounter = size;
+    let legacyCounter = size;
+
+    bench('segmented LRU', () => {
+      const i = slruCounter++;
+      slru.set(`word-${i}`, makeEntry(i));
+      slru.get(`word-${i - Math.floor((i % size) / 2)}`);
+    });
+
+    bench('legacy sort eviction', () => {
+      const i = legacyCounter++;
+      legacy.set(`word-${i}`, makeEntry(i));
+      legacy.get(`word-${i - Math.floor((i % size) / 2)}`);
+    });
+  });
+}
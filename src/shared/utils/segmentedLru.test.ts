@@ -0,0 +1,102 @@
+/**
+ * LingoRecall AI - Segmented LRU Tests
+ *
+ * @module shared/utils/segmentedLru.test
+ */
+
+import { describe, it, expect, vi } from 'vitest';
+import { createSegmentedLru } from './segmentedLru';
+
+const sizeOf = (key: string, value: string) => key.length + value.length;
+
+describe('createSegmentedLru', () => {
+  it('stores and returns values', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 3, maxBytes: 1000, sizeOf });
+    lru.set('a', 'apple');
+
+    expect(lru.get('a')).toBe('apple');
+    expect(lru.has('a')).toBe(true);
+    expect(lru.size).toBe(1);
+    expect(lru.bytes).toBe(6);
+  });
+
+  it('evicts the least recently used probation entry when the entry budget is exceeded', () => {
+    const onEvict = vi.fn();
+    const lru = createSegmentedLru<string>({ maxEntries: 3, maxBytes: 1000, sizeOf, onEvict });
+    lru.set('a', '1');
+    lru.set('b', '2');
+    lru.set('c', '3');
+    lru.set('d', '4');
+
+    expect(lru.has('a')).toBe(false);
+    expect(lru.size).toBe(3);
+    expect(onEvict).toHaveBeenCalledWith('a', '1');
+  });
+
+  it('protects entries that were hit again from one-off insertions', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 3, maxBytes: 1000, sizeOf });
+    lru.set('hot', '1');
+    lru.get('hot');
+
+    lru.set('x', '2');
+    lru.set('y', '3');
+    lru.set('z', '4');
+
+    expect(lru.has('hot')).toBe(true);
+    expect(lru.has('x')).toBe(false);
+  });
+
+  it('evicts until the byte budget is respected', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 100, maxBytes: 10, sizeOf });
+    lru.set('a', '1234');
+    lru.set('b', '1234');
+    lru.set('c', '1234');
+
+    expect(lru.has('a')).toBe(false);
+    expect(lru.bytes).toBeLessThanOrEqual(10);
+  });
+
+  it('refuses entries larger than the byte budget', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 10, maxBytes: 5, sizeOf });
+    lru.set('a', '1');
+    lru.set('big', 'too large');
+
+    expect(lru.has('big')).toBe(false);
+    expect(lru.has('a')).toBe(true);
+  });
+
+  it('admits new entries even when the protected segment fills the byte budget', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 10, maxBytes: 8, sizeOf });
+    lru.set('a', '123');
+    lru.get('a');
+    lru.set('b', '123');
+    lru.get('b');
+
+    lru.set('c', '123');
+
+    expect(lru.has('c')).toBe(true);
+    expect(lru.bytes).toBeLessThanOrEqual(8);
+  });
+
+  it('updates bytes when overwriting and deleting', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 10, maxBytes: 1000, sizeOf });
+    lru.set('a', '1');
+    lru.set('a', '12345');
+    expect(lru.bytes).toBe(6);
+
+    expect(lru.delete('a')).toBe(true);
+    expect(lru.bytes).toBe(0);
+    expect(lru.size).toBe(0);
+  });
+
+  it('peek does not change eviction order', () => {
+    const lru = createSegmentedLru<string>({ maxEntries: 2, maxBytes: 1000, sizeOf });
+    lru.set('a', '1');
+    lru.set('b', '2');
+    lru.peek('a');
+    lru.set('c', '3');
+
+    expect(lru.has('a')).toBe(false);
+    expect(lru.has('b')).toBe(true);
+  });
+});
@@ -0,0 +1,218 @@
+/**
+ * LingoRecall AI - Segmented LRU Cache
+ * 分段 LRU（SLRU）缓存，所有操作均为 O(1)
+ *
+ * 结构：
+ * - probation（试用段）：新写入的条目先进入这里
+ * - protected（保护段）：在试用段中再次命中的条目晋升到这里
+ *
+ * 淘汰时优先移除试用段最久未访问的条目，只被访问过一次的"过客"不会挤掉热点条目。
+ * 两个段都基于 Map 的插入顺序实现双向链表语义：
+ * delete + set 即"移到队尾"，keys().next() 即"队头"。
+ *
+ * 同时支持条目数预算和字节预算，任一超限都会触发淘汰。
+ *
+ * @module shared/utils/segmentedLru
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** SLRU 配置 */
+export interface SegmentedLruOptions<V> {
+  /** 最大条目数 */
+  maxEntries: number;
+  /** 最大字节数（估算值） */
+  maxBytes: number;
+  /** 保护段占 maxEntries 的比例，默认 0.8 */
+  protectedRatio?: number;
+  /** 估算单个条目占用的字节数 */
+  sizeOf: (key: string, value: V) => number;
+  /** 条目因预算超限被淘汰时回调（显式 delete / clear 不触发） */
+  onEvict?: (key: string, value: V) => void;
+}
+
+/** SLRU 缓存实例 */
+export interface SegmentedLru<V> {
+  /** 读取并标记为最近访问 */
+  get(key: string): V | undefined;
+  /** 读取但不改变访问顺序 */
+  peek(key: string): V | undefined;
+  /** 写入（已存在则覆盖并视为一次访问） */
+  set(key: string, value: V): void;
+  /** 删除 */
+  delete(key: string): boolean;
+  /** 是否存在 */
+  has(key: string): boolean;
+  /** 清空 */
+  clear(): void;
+  /** 当前条目数 */
+  readonly size: number;
+  /** 当前估算字节数 */
+  readonly bytes: number;
+}
+
+/** 内部节点 */
+interface LruNode<V> {
+  value: V;
+  bytes: number;
+}
+
+/** 默认保护段比例 */
+const DEFAULT_PROTECTED_RATIO = 0.8;
+
+// ============================================================
+// Factory
+// ============================================================
+
+/**
+ * 创建分段 LRU 缓存
+ *
+ * @param options - 缓存配置
+ * @returns SLRU 实例
+ *
+ * @example
+ * const lru = createSegmentedLru<string>({
+ *   maxEntries: 500,
+ *   maxBytes: 1024 * 1024,
+ *   sizeOf: (key, value) => (key.length + value.length) * 2,
+ * });
+ * lru.set('a', 'apple');
+ * lru.get('a'); // 'apple'
+ */
+export function createSegmentedLru<V>(options: SegmentedLruOptions<V>): SegmentedLru<V> {
+  const { maxEntries, maxBytes, sizeOf, onEvict } = options;
+  const protectedCapacity = Math.max(
+    1,
+    Math.floor(maxEntries * (options.protectedRatio ?? DEFAULT_PROTECTED_RATIO))
+  );
+
+  const probation = new Map<string, LruNode<V>>();
+  const protectedSegment = new Map<string, LruNode<V>>();
+  let totalBytes = 0;
+
+  /**
+   * 保护段超出容量时，把其最久未访问的条目降级回试用段队尾
+   */
+  function demoteOverflow(): void {
+    while (protectedSegment.size > protectedCapacity) {
+      const oldestKey = protectedSegment.keys().next().value as string;
+      const node = protectedSegment.get(oldestKey)!;
+      protectedSegment.delete(oldestKey);
+      probation.set(oldestKey, node);
+    }
+  }
+
+  /**
+   * 移除一个最久未访问的条目（试用段优先）
+   * keepKey 为刚写入的条目：试用段只剩它时改为淘汰保护段，避免新条目永远无法入驻
+   */
+  function evictOne(keepKey?: string): boolean {
+    const onlyKeepKeyInProbation = probation.size === 1 && keepKey !== undefined && probation.has(keepKey);
+    let segment = probation.size > 0 && !onlyKeepKeyInProbation ? probation : protectedSegment;
+    if (segment.size === 0) {
+      segment = probation;
+    }
+    if (segment.size === 0) {
+      return false;
+    }
+
+    const oldestKey = segment.keys().next().value as string;
+    const node = segment.get(oldestKey)!;
+    segment.delete(oldestKey);
+    totalBytes -= node.bytes;
+    onEvict?.(oldestKey, node.value);
+    return true;
+  }
+
+  /**
+   * 把命中的条目移到保护段队尾
+   */
+  function promote(key: string, node: LruNode<V>): void {
+    if (protectedSegment.has(key)) {
+      protectedSegment.delete(key);
+    } else {
+      probation.delete(key);
+    }
+    protectedSegment.set(key, node);
+    demoteOverflow();
+  }
+
+  function findNode(key: string): LruNode<V> | undefined {
+    return protectedSegment.get(key) ?? probation.get(key);
+  }
+
+  function deleteKey(key: string): boolean {
+    const node = findNode(key);
+    if (!node) {
+      return false;
+    }
+    protectedSegment.delete(key);
+    probation.delete(key);
+    totalBytes -= node.bytes;
+    return true;
+  }
+
+  return {
+    get(key: string): V | undefined {
+      const node = findNode(key);
+      if (!node) {
+        return undefined;
+      }
+      promote(key, node);
+      return node.value;
+    },
+
+    peek(key: string): V | undefined {
+      return findNode(key)?.value;
+    },
+
+    set(key: string, value: V): void {
+      const bytes = sizeOf(key, value);
+
+      // 单个条目超过字节预算，不缓存
+      if (bytes > maxBytes) {
+        deleteKey(key);
+        return;
+      }
+
+      const existing = findNode(key);
+      if (existing) {
+        totalBytes += bytes - existing.bytes;
+        existing.value = value;
+        existing.bytes = bytes;
+        promote(key, existing);
+      } else {
+        probation.set(key, { value, bytes });
+        totalBytes += bytes;
+      }
+
+      while (probation.size + protectedSegment.size > maxEntries || totalBytes > maxBytes) {
+        if (!evictOne(key)) {
+          break;
+        }
+      }
+    },
+
+    delete: deleteKey,
+
+    has(key: string): boolean {
+      return protectedSegment.has(key) || probation.has(key);
+    },
+
+    clear(): void {
+      probation.clear();
+      protectedSegment.clear();
+      totalBytes = 0;
+    },
+
+    get size(): number {
+      return probation.size + protectedSegment.size;
+    },
+
+    get bytes(): number {
+      return totalBytes;
+    },
+  };
+}
@@ -0,0 +1,126 @@
+/**
+ * LingoRecall AI - Vocabulary Search Benchmark
+ * 对比旧版“全量加载 + includes 线性扫描”与 n-gram 倒排索引在 1k / 10k / 100k 词库下的单次查询耗时
+ *
+ * 倒排列表用内存 Map 模拟 searchIndex Object Store（主键 [term, wordId] 的范围扫描），
+ * 衡量的是检索算法本身；IndexedDB 的读取开销两者同样存在（旧版还需读出全部记录）。
+ *
+ * 运行: npm run bench
+ *
+ * @module shared/utils/textSearch.bench
+ */
+
+import { bench, describe } from 'vitest';
+import { buildIndexTerms, buildQueryTerms, scoreMatch, type SearchableFields } from './textSearch';
+
+interface BenchWord extends SearchableFields {
+  id: string;
+  createdAt: number;
+}
+
+const SIZES = [1_000, 10_000, 100_000];
+const QUERIES = ['eloq', 'tion', '水果', 'r'];
+
+const SYLLABLES = ['el', 'o', 'quent', 'ra', 'tion', 'ver', 'sa', 'tile', 'con', 'text', 'pre', 'dict', 'an', 'ly', 'sis'];
+const HANZI = '水果语境雄辩说服力的一种热带樱桃苹果香蕉分析预测版本多用途文本上下';
+
+/** 确定性伪随机数（LCG），保证每次运行的数据集一致 */
+function createRandom(seed: number) {
+  let state = seed;
+  return (max: number) => {
+    state = (state * 1664525 + 1013904223) % 4294967296;
+    return state % max;
+  };
+}
+
+function createWords(count: number): BenchWord[] {
+  const random = createRandom(count);
+  return Array.from({ length: count }, (_, i) => {
+    const text = Array.from({ length: 2 + random(3) }, () => SYLLABLES[random(SYLLABLES.length)]).join('');
+    const meaning = Array.from({ length: 3 + random(6) }, () => HANZI[random(HANZI.length)]).join('');
+    return { id: `w${i}`, text, meaning, createdAt: i };
+  });
+}
+
+function buildPostings(words: BenchWord[]): Map<string, string[]> {
+  const postings = new Map<string, string[]>();
+  for (const word of words) {
+    for (const term of buildIndexTerms(word)) {
+      const list = postings.get(term);
+      if (list) {
+        list.push(word.id);
+      } else {
+        postings.set(term, [word.id]);
+      }
+    }
+  }
+  return postings;
+}
+
+/**
+ * 旧版 searchWords：遍历全部词汇做 includes 匹配，再按创建时间排序
+ */
+function legacySearch(words: BenchWord[], query: string): BenchWord[] {
+  const normalizedQuery = query.toLowerCase().trim();
+  return words
+    .filter(
+      (word) =>
+        word.text.toLowerCase().includes(normalizedQuery) ||
+        word.meaning.toLowerCase().includes(normalizedQuery)
+    )
+    .sort((a, b) => b.createdAt - a.createdAt);
+}
+
+/**
+ * 新版 searchWords：倒排列表求交集 → 按 ID 取记录 → 子串校验与相关性排序
+ */
+function indexedSearch(
+  postings: Map<string, string[]>,
+  byId: Map<string, BenchWord>,
+  query: string
+): BenchWord[] {
+  const lists = buildQueryTerms(query)
+    .map((term) => postings.get(term) ?? [])
+    .sort((a, b) => a.length - b.length);
+  if (lists.length === 0) {
+    return [];
+  }
+
+  let candidates = new Set(lists[0]);
+  for (let i = 1; i < lists.length && candidates.size > 0; i++) {
+    const next = new Set<string>();
+    for (const id of lists[i]) {
+      if (candidates.has(id)) {
+        next.add(id);
+      }
+    }
+    candidates = next;
+  }
+
+  return Array.from(candidates)
+    .map((id) => byId.get(id)!)
+    .map((word) => ({ word, score: scoreMatch(word, query) }))
+    .filter((entry) => entry.score > 0)
+    .sort((a, b) => b.score - a.score || b.word.createdAt - a.word.createdAt)
+    .map((entry) => entry.word);
+}
+
+for (const size of SIZES) {
+  const words = createWords(size);
+  const byId = new Map(words.map((word) => [word.id, word]));
+  const postings = buildPostings(words);
+
+  describe(`search ${size} words (${QUERIES.join(' / ')})`, () => {
+    bench('legacy: linear includes scan', () => {
+      for (const query of QUERIES) {
+        legacySearch(words, query);
+      }
+    });
+
+    bench('n-gram inverted index + ranking', () => {
+      for (const query of QUERIES) {
+        indexedSearch(postings, byId, query);
+      }
+    });
+  });
+}
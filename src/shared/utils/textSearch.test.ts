@@ -0,0 +1,78 @@
+/**
+ * LingoRecall AI - Full-Text Search Primitives Tests
+ *
+ * @module shared/utils/textSearch.test
+ */
+
+import { describe, it, expect } from 'vitest';
+import { tokenize, buildIndexTerms, buildQueryTerms, scoreMatch } from './textSearch';
+
+describe('textSearch', () => {
+  describe('tokenize', () => {
+    it('splits latin words and CJK runs, dropping punctuation', () => {
+      expect(tokenize('Hello, 世界！ＡＢＣ-123 日本語です')).toEqual([
+        { value: 'hello', cjk: false },
+        { value: '世界', cjk: true },
+        { value: 'abc', cjk: false },
+        { value: '123', cjk: false },
+        { value: '日本語です', cjk: true },
+      ]);
+    });
+
+    it('separates adjacent latin and CJK characters', () => {
+      expect(tokenize('API接口v2')).toEqual([
+        { value: 'api', cjk: false },
+        { value: '接口', cjk: true },
+        { value: 'v2', cjk: false },
+      ]);
+    });
+  });
+
+  describe('query terms', () => {
+    const word = { text: 'Eloquent', meaning: '雄辩的，有说服力的' };
+    const indexTerms = new Set(buildIndexTerms(word));
+
+    it.each(['elo', 'QUENT', 'qu', 'e', '说服', '雄', '雄辩的 eloq'])(
+      'are a subset of the index terms of a matching word (%s)',
+      (query) => {
+        const terms = buildQueryTerms(query);
+        expect(terms.length).toBeGreaterThan(0);
+        expect(terms.every((term) => indexTerms.has(term))).toBe(true);
+      }
+    );
+
+    it('uses prefix semantics for single latin letters', () => {
+      expect(buildQueryTerms('q').some((term) => indexTerms.has(term))).toBe(false);
+    });
+
+    it('returns no terms for punctuation-only queries', () => {
+      expect(buildQueryTerms(' ,.! ')).toEqual([]);
+    });
+  });
+
+  describe('scoreMatch', () => {
+    it('rejects candidates that only share scattered n-grams', () => {
+      // "bcabc" 的 3-gram（bca、cab、abc）都出现在 "abcab" 中，但它并不是 "abcab" 的子串
+      expect(scoreMatch({ text: 'abcab', meaning: '' }, 'bcabc')).toBe(0);
+    });
+
+    it('ranks exact > prefix > infix text matches > meaning matches', () => {
+      const query = 'run';
+      const scores = [
+        scoreMatch({ text: 'run', meaning: '跑' }, query),
+        scoreMatch({ text: 'running', meaning: '跑步' }, query),
+        scoreMatch({ text: 'outrun', meaning: '超过' }, query),
+        scoreMatch({ text: 'sprint', meaning: 'to run fast' }, query),
+      ];
+
+      expect(scores.every((score) => score > 0)).toBe(true);
+      expect([...scores].sort((a, b) => b - a)).toEqual(scores);
+    });
+
+    it('prefers shorter entries when matches are otherwise equal', () => {
+      expect(scoreMatch({ text: 'play', meaning: '' }, 'pla')).toBeGreaterThan(
+        scoreMatch({ text: 'player', meaning: '' }, 'pla')
+      );
+    });
+  });
+});
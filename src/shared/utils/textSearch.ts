@@ -0,0 +1,200 @@
+/**
+ * LingoRecall AI - Full-Text Search Primitives
+ * 词库全文检索的分词、索引词项生成与相关性打分（纯函数，不依赖存储）
+ *
+ * 索引方案（n-gram 倒排索引）：
+ * - 拉丁/数字词：词内所有 2-gram、3-gram，外加词首字符前缀项（支持单字母前缀查询）
+ * - CJK（汉字、假名、谚文）：连续片段内每个字符的 1-gram 与相邻 2-gram，不依赖分词词典
+ *
+ * 查询时把关键词拆成同样的词项求交集得到候选，再用子串校验排除 n-gram 拼接造成的误报，
+ * 因此命中结果与旧版 `includes()` 的子串语义一致，只是不再需要全表扫描。
+ *
+ * @module shared/utils/textSearch
+ */
+
+// ============================================================
+// Types
+// ============================================================
+
+/** 文本片段：拉丁词或 CJK 连续片段 */
+export interface TextToken {
+  value: string;
+  cjk: boolean;
+}
+
+/** 可被检索的词汇字段 */
+export interface SearchableFields {
+  text: string;
+  meaning: string;
+}
+
+// ============================================================
+// Constants
+// ============================================================
+
+/** 单字母前缀项的标记，避免与 CJK 单字词项冲突 */
+const PREFIX_MARKER = '^';
+
+const CJK_CHAR = /[\p{Script=Han}\p{Script=Hiragana}\p{Script=Katakana}\p{Script=Hangul}]/u;
+const WORD_CHAR = /[\p{L}\p{N}]/u;
+
+/** 相关性分值 */
+const SCORE = {
+  exactText: 100,
+  textPrefix: 40,
+  tokenPrefixInText: 30,
+  substringInText: 20,
+  substringInMeaning: 8,
+} as const;
+
+// ============================================================
+// Tokenization
+// ============================================================
+
+/**
+ * 规范化文本：NFKC（全角转半角等）+ 小写
+ */
+export function normalizeSearchText(text: string): string {
+  return text.normalize('NFKC').toLowerCase();
+}
+
+/**
+ * 分词：按字符类别切分为拉丁词与 CJK 连续片段，标点和空白作为分隔符
+ */
+export function tokenize(text: string): TextToken[] {
+  const tokens: TextToken[] = [];
+  let current = '';
+  let currentCjk = false;
+
+  const flush = () => {
+    if (current) {
+      tokens.push({ value: current, cjk: currentCjk });
+      current = '';
+    }
+  };
+
+  for (const char of normalizeSearchText(text)) {
+    if (CJK_CHAR.test(char)) {
+      if (!currentCjk) {
+        flush();
+        currentCjk = true;
+      }
+      current += char;
+    } else if (WORD_CHAR.test(char)) {
+      if (currentCjk) {
+        flush();
+        currentCjk = false;
+      }
+      current += char;
+    } else {
+      flush();
+    }
+  }
+  flush();
+
+  return tokens;
+}
+
+function addGrams(chars: string[], size: number, terms: Set<string>): void {
+  for (let i = 0; i + size <= chars.length; i++) {
+    terms.add(chars.slice(i, i + size).join(''));
+  }
+}
+
+/**
+ * 生成一个词汇需要写入倒排索引的全部词项（已去重）
+ */
+export function buildIndexTerms(fields: SearchableFields): string[] {
+  const terms = new Set<string>();
+
+  for (const token of [...tokenize(fields.text), ...tokenize(fields.meaning)]) {
+    const chars = Array.from(token.value);
+    if (token.cjk) {
+      addGrams(chars, 1, terms);
+      addGrams(chars, 2, terms);
+    } else {
+      terms.add(PREFIX_MARKER + chars[0]);
+      addGrams(chars, 2, terms);
+      addGrams(chars, 3, terms);
+    }
+  }
+
+  return Array.from(terms);
+}
+
+/**
+ * 把查询拆成必须全部命中的词项（AND 语义）
+ * 查询与索引使用同一套规则，保证查询词项一定是匹配文本的索引词项子集
+ */
+export function buildQueryTerms(query: string): string[] {
+  const terms = new Set<string>();
+
+  for (const token of tokenize(query)) {
+    const chars = Array.from(token.value);
+    if (token.cjk) {
+      addGrams(chars, chars.length === 1 ? 1 : 2, terms);
+    } else if (chars.length === 1) {
+      terms.add(PREFIX_MARKER + chars[0]);
+    } else {
+      addGrams(chars, chars.length === 2 ? 2 : 3, terms);
+    }
+  }
+
+  return Array.from(terms);
+}
+
+// ============================================================
+// Matching & Ranking
+// ============================================================
+
+/**
+ * 校验候选并计算相关性分值
+ * 每个查询片段都必须出现在 text 或 meaning 中（单字母拉丁片段要求是某个词的开头），否则返回 0
+ *
+ * 排序依据：text 完全相等 > text 以查询开头 > 片段是 text 中某词的开头 > text 子串 > meaning 子串，
+ * 同分时 text 越短越靠前
+ */
+export function scoreMatch(fields: SearchableFields, query: string): number {
+  const queryTokens = tokenize(query);
+  if (queryTokens.length === 0) {
+    return 0;
+  }
+
+  const text = normalizeSearchText(fields.text);
+  const meaning = normalizeSearchText(fields.meaning);
+  const textTokens = tokenize(fields.text).map((token) => token.value);
+  const meaningTokens = tokenize(fields.meaning).map((token) => token.value);
+
+  let score = 0;
+  for (const { value, cjk } of queryTokens) {
+    const prefixOnly = !cjk && Array.from(value).length === 1;
+    const isTokenPrefix = textTokens.some((token) => token.startsWith(value));
+
+    if (prefixOnly) {
+      if (isTokenPrefix) {
+        score += SCORE.tokenPrefixInText;
+      } else if (meaningTokens.some((token) => token.startsWith(value))) {
+        score += SCORE.substringInMeaning;
+      } else {
+        return 0;
+      }
+    } else if (text.includes(value)) {
+      score += isTokenPrefix ? SCORE.tokenPrefixInText : SCORE.substringInText;
+    } else if (meaning.includes(value)) {
+      score += SCORE.substringInMeaning;
+    } else {
+      return 0;
+    }
+  }
+
+  const normalizedQuery = queryTokens.map((token) => token.value).join(' ');
+  const normalizedText = textTokens.join(' ');
+  if (normalizedText === normalizedQuery) {
+    score += SCORE.exactText;
+  } else if (normalizedText.startsWith(normalizedQuery)) {
+    score += SCORE.textPrefix;
+  }
+
+  // 同分时偏向更短的词条（更接近查询本身）
+  return score + 1 / (1 + normalizedText.length);
+}
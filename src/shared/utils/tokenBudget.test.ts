@@ -0,0 +1,78 @@
+/**
+ * LingoRecall AI - Token Budget Tests
+ *
+ * @module shared/utils/tokenBudget.test
+ */
+
+import { describe, it, expect } from 'vitest';
+import { estimateTokens, estimateTranslationTokens, packByTokenBudget } from './tokenBudget';
+
+describe('estimateTokens', () => {
+  it('counts roughly four latin characters per token', () => {
+    expect(estimateTokens('abcdefgh')).toBe(2);
+  });
+
+  it('counts one token per CJK character', () => {
+    expect(estimateTokens('你好世界')).toBe(4);
+    expect(estimateTokens('こんにちは')).toBe(5);
+  });
+
+  it('never returns zero', () => {
+    expect(estimateTokens('')).toBe(1);
+  });
+});
+
+describe('estimateTranslationTokens', () => {
+  it('expands output for CJK targets more than for the default', () => {
+    const text = 'The quick brown fox jumps over the lazy dog. '.repeat(10);
+    expect(estimateTranslationTokens(text, 'ja').output).toBeGreaterThan(
+      estimateTranslationTokens(text, 'fr').output
+    );
+  });
+});
+
+describe('packByTokenBudget', () => {
+  const identity = (text: string) => text;
+
+  it('packs many short texts into a single batch', () => {
+    const texts = Array.from({ length: 30 }, (_, i) => `Menu item ${i}`);
+    const batches = packByTokenBudget(texts, identity, { maxInputTokens: 3000, maxOutputTokens: 4096 }, {
+      maxItems: 40,
+      targetLanguage: 'zh-CN',
+    });
+
+    expect(batches).toHaveLength(1);
+    expect(batches[0]).toHaveLength(30);
+  });
+
+  it('splits long texts so each batch fits the output budget', () => {
+    const paragraph = 'word '.repeat(400);
+    const texts = Array.from({ length: 6 }, () => paragraph);
+    const budget = { maxInputTokens: 100000, maxOutputTokens: 1000 };
+    const batches = packByTokenBudget(texts, identity, budget, { maxItems: 40, targetLanguage: 'zh-CN' });
+
+    expect(batches.length).toBeGreaterThan(1);
+    batches.forEach((batch) => {
+      const output = batch.reduce((sum, text) => sum + estimateTranslationTokens(text, 'zh-CN').output, 0);
+      expect(batch.length === 1 || output <= budget.maxOutputTokens).toBe(true);
+    });
+  });
+
+  it('respects the item cap and preserves order', () => {
+    const texts = Array.from({ length: 5 }, (_, i) => `t${i}`);
+    const batches = packByTokenBudget(texts, identity, { maxInputTokens: 3000, maxOutputTokens: 4096 }, {
+      maxItems: 2,
+    });
+
+    expect(batches).toEqual([['t0', 't1'], ['t2', 't3'], ['t4']]);
+  });
+
+  it('gives an oversized item its own batch', () => {
+    const huge = 'x'.repeat(10000);
+    const batches = packByTokenBudget(['a', huge, 'b'], identity, { maxInputTokens: 100, maxOutputTokens: 100 }, {
+      maxItems: 40,
+    });
+
+    expect(batches).toEqual([['a'], [huge], ['b']]);
+  });
+});
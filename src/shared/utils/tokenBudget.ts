@@ -0,0 +1,135 @@
+/**
+ * LingoRecall AI - Token Budget Utilities
+ * 全页翻译的 token 估算与批次装箱
+ *
+ * 固定条数分批会导致：短文本批次过小浪费请求，长文本批次超出 max_tokens 被截断后整批回退原文。
+ * 这里按每个翻译单元估算输入/输出 token，再按 Provider 的 token 预算顺序装箱。
+ *
+ * 估算规则（无需分词器，误差由安全系数兜底）：
+ * - CJK / 假名 / 韩文：每个字符约 1 token
+ * - 其他文字：每 4 个字符约 1 token
+ *
+ * @module shared/utils/tokenBudget
+ */
+
+import type { BatchTokenBudget, TargetLanguage } from '../types/settings';
+
+// ============================================================
+// Constants
+// ============================================================
+
+/** 匹配 CJK 统一表意文字、假名、韩文音节 */
+const CJK_CHAR_REGEX = /[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]/g;
+
+/** 每个条目在 JSON 数组中的结构开销（引号、逗号、转义） */
+const PER_ITEM_OVERHEAD_TOKENS = 4;
+
+/** 输出预算安全系数：估算偏差留出余量，避免触顶截断 */
+const OUTPUT_SAFETY_RATIO = 0.8;
+
+/**
+ * 译文相对原文的 token 膨胀系数
+ * 英文译为 CJK 时字符数减少但每字符 token 更多；译为德语/俄语等通常更长
+ */
+const OUTPUT_EXPANSION: Partial<Record<TargetLanguage, number>> = {
+  'zh-CN': 1.3,
+  'zh-TW': 1.3,
+  ja: 1.5,
+  ko: 1.5,
+  th: 2.0,
+  hi: 2.0,
+  ar: 1.6,
+  ru: 1.6,
+  uk: 1.6,
+  de: 1.3,
+};
+
+/** 未列出语言的默认膨胀系数 */
+const DEFAULT_OUTPUT_EXPANSION = 1.2;
+
+// ============================================================
+// Estimation
+// ============================================================
+
+/**
+ * 估算文本的 token 数
+ *
+ * @param text - 文本
+ * @returns 估算的 token 数（至少为 1）
+ */
+export function estimateTokens(text: string): number {
+  const cjkCount = text.match(CJK_CHAR_REGEX)?.length ?? 0;
+  const otherCount = text.length - cjkCount;
+  return Math.max(1, cjkCount + Math.ceil(otherCount / 4));
+}
+
+/**
+ * 估算翻译单元的输入/输出 token 数
+ *
+ * @param text - 原文
+ * @param targetLanguage - 目标语言
+ */
+export function estimateTranslationTokens(
+  text: string,
+  targetLanguage?: TargetLanguage
+): { input: number; output: number } {
+  const input = estimateTokens(text) + PER_ITEM_OVERHEAD_TOKENS;
+  const expansion = (targetLanguage && OUTPUT_EXPANSION[targetLanguage]) || DEFAULT_OUTPUT_EXPANSION;
+  const output = Math.ceil(estimateTokens(text) * expansion) + PER_ITEM_OVERHEAD_TOKENS;
+  return { input, output };
+}
+
+// ============================================================
+// Packing
+// ============================================================
+
+/**
+ * 按 token 预算把条目顺序装箱（next-fit）
+ *
+ * 保持原始顺序，使页面上相邻的文本落在同一批次，进度也按阅读顺序推进。
+ * 单个条目超出预算时独占一个批次（长文本在上游已被拆分，这里不再切割）。
+ *
+ * @param items - 待装箱条目
+ * @param getText - 取条目原文
+ * @param budget - 单次请求的 token 预算
+ * @param options.maxItems - 每批最大条目数
+ * @param options.targetLanguage - 目标语言（决定输出膨胀系数）
+ * @returns 批次列表
+ */
+export function packByTokenBudget<T>(
+  items: T[],
+  getText: (item: T) => string,
+  budget: BatchTokenBudget,
+  options: { maxItems: number; targetLanguage?: TargetLanguage }
+): T[][] {
+  const maxOutput = Math.floor(budget.maxOutputTokens * OUTPUT_SAFETY_RATIO);
+  const batches: T[][] = [];
+  let current: T[] = [];
+  let inputTokens = 0;
+  let outputTokens = 0;
+
+  for (const item of items) {
+    const estimate = estimateTranslationTokens(getText(item), options.targetLanguage);
+    const exceeds =
+      current.length >= options.maxItems ||
+      inputTokens + estimate.input > budget.maxInputTokens ||
+      outputTokens + estimate.output > maxOutput;
+
+    if (current.length > 0 && exceeds) {
+      batches.push(current);
+      current = [];
+      inputTokens = 0;
+      outputTokens = 0;
+    }
+
+    current.push(item);
+    inputTokens += estimate.input;
+    outputTokens += estimate.output;
+  }
+
+  if (current.length > 0) {
+    batches.push(current);
+  }
+
+  return batches;
+}